@@ -0,0 +1,161 @@
+"""
+CLI commands for maintaining artifact storage.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import click
+
+from cli.utils import error_exit
+
+
+class _ConfigComponent:
+    """Stand-in for the component an artifact service is initialized for."""
+
+    def __init__(self, app_name: str, app_config: Dict[str, Any]):
+        self.app_config = app_config
+        self.namespace = app_config.get("namespace")
+        self.log_identifier = f"[{app_name}]"
+
+    def get_config(self, key: str, default: Any = None) -> Any:
+        return self.app_config.get(key, default)
+
+
+def _load_app_config(config_files: Tuple[str, ...], app_name: str) -> Dict[str, Any]:
+    """Loads and merges the config files and returns the app_config of an app."""
+    from solace_ai_connector.main import load_config, merge_config
+
+    full_config: Dict[str, Any] = {}
+    for config_file in config_files:
+        full_config = merge_config(full_config, load_config(config_file))
+
+    for app in full_config.get("apps") or []:
+        if app.get("name") == app_name:
+            return app.get("app_config") or {}
+    error_exit(f"App '{app_name}' not found in the given configuration files.")
+
+
+def _gateway_scopes(database_url: str) -> Set[Tuple[str, str]]:
+    """Returns the (user_id, session_id) of live gateway sessions and projects."""
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine(database_url)
+    try:
+        with engine.connect() as conn:
+            sessions = conn.execute(
+                text("SELECT user_id, id FROM sessions WHERE deleted_at IS NULL")
+            ).fetchall()
+            projects = conn.execute(
+                text("SELECT user_id, id FROM projects WHERE deleted_at IS NULL")
+            ).fetchall()
+    finally:
+        engine.dispose()
+    return {(user_id, session_id) for user_id, session_id in sessions} | {
+        (user_id, f"project-{project_id}") for user_id, project_id in projects
+    }
+
+
+async def _reconcile(
+    artifact_service, app_name: str, scopes: List[Tuple[str, str]]
+) -> Tuple[int, int, int]:
+    from solace_agent_mesh.agent.utils.artifact_helpers import (
+        reconcile_artifact_catalog,
+    )
+
+    upserted = removed = failed = 0
+    for user_id, session_id in scopes:
+        try:
+            result = await reconcile_artifact_catalog(
+                artifact_service, app_name, user_id, session_id
+            )
+        except Exception as e:
+            failed += 1
+            click.echo(
+                click.style(f"  {user_id}/{session_id}: failed ({e})", fg="red"),
+                err=True,
+            )
+            continue
+        upserted += result["upserted"]
+        removed += result["removed"]
+        click.echo(
+            f"  {user_id}/{session_id}: {result['upserted']} artifacts, "
+            f"{result['removed']} stale rows removed"
+        )
+    return upserted, removed, failed
+
+
+@click.group("artifacts")
+def artifacts():
+    """Maintain artifact storage."""
+    pass
+
+
+@artifacts.command("reconcile")
+@click.argument("config_files", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--app",
+    "app",
+    required=True,
+    help="Name of the app in the config whose artifact_service catalog is reconciled.",
+)
+@click.option(
+    "--session",
+    "sessions",
+    multiple=True,
+    help="USER_ID/SESSION_ID to reconcile (can be used multiple times).",
+)
+@click.option(
+    "--gateway-db-url",
+    default=None,
+    help="WebUI gateway database; reconciles every live session and project in it.",
+)
+def reconcile(
+    config_files: Tuple[str, ...],
+    app: str,
+    sessions: Tuple[str, ...],
+    gateway_db_url: Optional[str],
+):
+    """
+    Rebuild artifact catalog rows from the artifact store.
+
+    Reconciles the sessions given with --session and those of the gateway
+    database, plus every session that already has catalog rows. Run it once
+    after enabling artifact_service.catalog to backfill existing artifacts.
+    """
+    from solace_agent_mesh.agent.adk.services import initialize_artifact_service
+
+    app_config = _load_app_config(config_files, app)
+    if not (app_config.get("artifact_service") or {}).get("catalog"):
+        error_exit(f"App '{app}' has no artifact_service.catalog configured.")
+
+    component = _ConfigComponent(app, app_config)
+    artifact_service = initialize_artifact_service(component)
+    artifact_app_name = app_config.get("agent_name") or app_config.get("gateway_id") or app
+
+    scopes: Set[Tuple[str, str]] = set()
+    for value in sessions:
+        user_id, sep, session_id = value.partition("/")
+        if not sep or not user_id or not session_id:
+            error_exit(f"Invalid --session '{value}'; expected USER_ID/SESSION_ID.")
+        scopes.add((user_id, session_id))
+    if gateway_db_url:
+        scopes |= _gateway_scopes(gateway_db_url)
+    scopes |= set(
+        artifact_service.artifact_catalog.list_scopes(
+            artifact_service.scoped_app_name(artifact_app_name)
+        )
+    )
+
+    click.echo(f"Reconciling {len(scopes)} sessions...")
+    upserted, removed, failed = asyncio.run(
+        _reconcile(artifact_service, artifact_app_name, sorted(scopes))
+    )
+    click.echo(
+        click.style(
+            f"Done: {upserted} artifacts cataloged, {removed} stale rows removed, "
+            f"{failed} sessions failed.",
+            fg="red" if failed else "green",
+        )
+    )
+    if failed:
+        error_exit(exit_code=1)
@@ -22,6 +22,7 @@ from cli.commands.eval_cmd import eval_cmd
 from cli.commands.docs_cmd import docs
 from cli.commands.tools_cmd import tools
 from cli.commands.task_cmd import task
+from cli.commands.artifacts_cmd import artifacts
 
 
 def _get_version_info():
@@ -75,6 +76,7 @@ cli.add_command(eval_cmd)
 cli.add_command(docs)
 cli.add_command(tools)
 cli.add_command(task)
+cli.add_command(artifacts)
 
 
 def main():
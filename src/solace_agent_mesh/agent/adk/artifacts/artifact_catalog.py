@@ -0,0 +1,344 @@
+"""
+Database-backed catalog of artifact metadata.
+
+The catalog mirrors, per (app, user, session), the latest version and the
+metadata companion of every artifact so listings and counts can be served by
+one indexed query instead of listing storage and loading each
+`.metadata.json`. It is written through by `save_artifact_with_metadata`,
+`copy_artifact_with_metadata` and artifact deletes; `reconcile_artifact_catalog`
+rebuilds a session's rows from storage.
+
+Configured under `artifact_service.catalog`:
+
+    artifact_service:
+      type: s3
+      ...
+      catalog:
+        database_url: postgresql://...
+        serve_listings: true
+
+Every component that writes artifacts to the same storage should point at the
+same catalog database; listings are only served from it when
+`serve_listings` is enabled.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    Column,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    and_,
+    create_engine,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import StaticPool
+
+log = logging.getLogger(__name__)
+
+catalog_metadata = MetaData()
+
+artifact_catalog_table = Table(
+    "artifact_catalog",
+    catalog_metadata,
+    # The primary key doubles as the session listing index. Its columns total
+    # 766 characters, which keeps it within MySQL's 3072-byte key limit in utf8mb4.
+    Column("app_name", String(128), primary_key=True),
+    Column("user_id", String(255), primary_key=True),
+    Column("session_id", String(128), primary_key=True),
+    Column("filename", String(255), primary_key=True),
+    Column("latest_version", Integer, nullable=False),
+    Column("version_count", Integer, nullable=False),
+    Column("mime_type", String(255), nullable=True),
+    Column("size_bytes", BigInteger, nullable=True),
+    Column("description", Text, nullable=True),
+    Column("schema_summary", JSON, nullable=True),
+    Column("source", String(255), nullable=True),
+    Column("tags", JSON, nullable=True),
+    Column("source_project_id", String(36), nullable=True),
+    # timestamp_utc of the metadata companion (epoch seconds)
+    Column("last_modified", Float, nullable=True),
+    Column("is_internal", Boolean, nullable=False, default=False),
+    Column("updated_at", BigInteger, nullable=False),
+    # Per-session counts of user-visible artifacts
+    Index(
+        "ix_artifact_catalog_session_internal",
+        "app_name",
+        "user_id",
+        "session_id",
+        "is_internal",
+    ),
+)
+
+
+@dataclass
+class ArtifactCatalogEntry:
+    """One catalog row: the latest version of an artifact and its metadata."""
+
+    filename: str
+    latest_version: int
+    version_count: int
+    mime_type: Optional[str] = None
+    size_bytes: Optional[int] = None
+    description: Optional[str] = None
+    schema_summary: Optional[Dict[str, Any]] = None
+    source: Optional[str] = None
+    tags: Optional[List[str]] = None
+    source_project_id: Optional[str] = None
+    last_modified: Optional[float] = None
+    is_internal: bool = False
+
+    @classmethod
+    def from_metadata(
+        cls,
+        filename: str,
+        version: int,
+        metadata: Dict[str, Any],
+        *,
+        version_count: Optional[int] = None,
+        is_internal: bool = False,
+    ) -> "ArtifactCatalogEntry":
+        """Builds an entry from a `.metadata.json` companion dictionary."""
+        timestamp = metadata.get("timestamp_utc")
+        size = metadata.get("size_bytes")
+        return cls(
+            filename=filename,
+            latest_version=version,
+            version_count=version_count if version_count is not None else version + 1,
+            mime_type=metadata.get("mime_type"),
+            size_bytes=size if isinstance(size, int) else None,
+            description=metadata.get("description"),
+            schema_summary=metadata.get("schema"),
+            source=metadata.get("source"),
+            tags=metadata.get("tags"),
+            source_project_id=metadata.get("source_project_id"),
+            last_modified=timestamp if isinstance(timestamp, (int, float)) else None,
+            is_internal=is_internal,
+        )
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """Returns the entry in the shape of a `.metadata.json` companion."""
+        metadata: Dict[str, Any] = {}
+        for key, value in (
+            ("mime_type", self.mime_type),
+            ("size_bytes", self.size_bytes),
+            ("description", self.description),
+            ("schema", self.schema_summary),
+            ("source", self.source),
+            ("tags", self.tags),
+            ("source_project_id", self.source_project_id),
+            ("timestamp_utc", self.last_modified),
+        ):
+            if value is not None:
+                metadata[key] = value
+        return metadata
+
+
+_ENTRY_COLUMNS = (
+    "latest_version",
+    "version_count",
+    "mime_type",
+    "size_bytes",
+    "description",
+    "schema_summary",
+    "source",
+    "tags",
+    "source_project_id",
+    "last_modified",
+    "is_internal",
+)
+
+
+class ArtifactCatalog:
+    """
+    Synchronous access to the artifact catalog table.
+
+    Methods block on the database; async callers should run them in a thread
+    (the artifact helpers do).
+    """
+
+    def __init__(self, engine: Engine, serve_listings: bool = False):
+        self.engine = engine
+        self.serve_listings = serve_listings
+        self._create_lock = threading.Lock()
+        self._tables_created = False
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ArtifactCatalog":
+        """Creates a catalog from an `artifact_service.catalog` config block."""
+        database_url = config.get("database_url")
+        if not database_url:
+            raise ValueError("'database_url' is required for the artifact catalog.")
+
+        engine_kwargs: Dict[str, Any] = {}
+        if database_url.startswith("sqlite"):
+            engine_kwargs["connect_args"] = {"check_same_thread": False}
+            if database_url in ("sqlite://", "sqlite:///:memory:"):
+                engine_kwargs["poolclass"] = StaticPool
+        else:
+            engine_kwargs["pool_pre_ping"] = True
+
+        return cls(
+            create_engine(database_url, **engine_kwargs),
+            serve_listings=bool(config.get("serve_listings", False)),
+        )
+
+    def _ensure_tables(self) -> None:
+        # Components without Alembic migrations (agents) create the table on
+        # first use; the gateway's migrations create the identical table.
+        if self._tables_created:
+            return
+        with self._create_lock:
+            if not self._tables_created:
+                catalog_metadata.create_all(self.engine, checkfirst=True)
+                self._tables_created = True
+
+    @staticmethod
+    def _key(app_name: str, user_id: str, session_id: str, filename: str):
+        table = artifact_catalog_table
+        return and_(
+            table.c.app_name == app_name,
+            table.c.user_id == user_id,
+            table.c.session_id == session_id,
+            table.c.filename == filename,
+        )
+
+    @staticmethod
+    def _session(app_name: str, user_id: str, session_id: str):
+        table = artifact_catalog_table
+        return and_(
+            table.c.app_name == app_name,
+            table.c.user_id == user_id,
+            table.c.session_id == session_id,
+        )
+
+    def upsert(
+        self, app_name: str, user_id: str, session_id: str, entry: ArtifactCatalogEntry
+    ) -> None:
+        """Inserts or replaces the row of one artifact."""
+        self._ensure_tables()
+        values = {name: getattr(entry, name) for name in _ENTRY_COLUMNS}
+        values["updated_at"] = int(time.time() * 1000)
+        key = self._key(app_name, user_id, session_id, entry.filename)
+
+        with self.engine.begin() as conn:
+            result = conn.execute(
+                update(artifact_catalog_table).where(key).values(**values)
+            )
+            if result.rowcount:
+                return
+            try:
+                with conn.begin_nested():
+                    conn.execute(
+                        insert(artifact_catalog_table).values(
+                            app_name=app_name,
+                            user_id=user_id,
+                            session_id=session_id,
+                            filename=entry.filename,
+                            **values,
+                        )
+                    )
+            except IntegrityError:
+                # A concurrent writer inserted the row first
+                conn.execute(update(artifact_catalog_table).where(key).values(**values))
+
+    def delete(self, app_name: str, user_id: str, session_id: str, filename: str) -> None:
+        """Removes the row of one artifact, if present."""
+        self._ensure_tables()
+        with self.engine.begin() as conn:
+            conn.execute(
+                delete(artifact_catalog_table).where(
+                    self._key(app_name, user_id, session_id, filename)
+                )
+            )
+
+    def list_session(
+        self, app_name: str, user_id: str, session_id: str
+    ) -> List[ArtifactCatalogEntry]:
+        """Returns the entries of a session ordered by filename."""
+        self._ensure_tables()
+        table = artifact_catalog_table
+        stmt = (
+            select(table.c.filename, *(table.c[name] for name in _ENTRY_COLUMNS))
+            .where(self._session(app_name, user_id, session_id))
+            .order_by(table.c.filename)
+        )
+        with self.engine.connect() as conn:
+            rows = conn.execute(stmt).mappings().all()
+        return [ArtifactCatalogEntry(**row) for row in rows]
+
+    def count_sessions(
+        self, app_name: str, user_id: str, session_ids: Iterable[str]
+    ) -> Dict[str, int]:
+        """Returns the number of user-visible artifacts of each session."""
+        session_ids = list(session_ids)
+        counts = {session_id: 0 for session_id in session_ids}
+        if not session_ids:
+            return counts
+
+        self._ensure_tables()
+        table = artifact_catalog_table
+        stmt = (
+            select(table.c.session_id, func.count())
+            .where(
+                table.c.app_name == app_name,
+                table.c.user_id == user_id,
+                table.c.session_id.in_(session_ids),
+                table.c.is_internal.is_(False),
+            )
+            .group_by(table.c.session_id)
+        )
+        with self.engine.connect() as conn:
+            counts.update({session_id: count for session_id, count in conn.execute(stmt)})
+        return counts
+
+    def list_scopes(self, app_name: str) -> List[Tuple[str, str]]:
+        """Returns every (user_id, session_id) with rows for an app."""
+        self._ensure_tables()
+        table = artifact_catalog_table
+        stmt = (
+            select(table.c.user_id, table.c.session_id)
+            .where(table.c.app_name == app_name)
+            .distinct()
+        )
+        with self.engine.connect() as conn:
+            return [(user_id, session_id) for user_id, session_id in conn.execute(stmt)]
+
+    def replace_session(
+        self,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        entries: List[ArtifactCatalogEntry],
+    ) -> int:
+        """
+        Makes the rows of a session match `entries`, removing rows of artifacts
+        that no longer exist. Returns the number of removed rows.
+        """
+        for entry in entries:
+            self.upsert(app_name, user_id, session_id, entry)
+
+        table = artifact_catalog_table
+        stale = self._session(app_name, user_id, session_id)
+        if entries:
+            stale = and_(stale, table.c.filename.not_in([e.filename for e in entries]))
+        with self.engine.begin() as conn:
+            return conn.execute(delete(table).where(stale)).rowcount
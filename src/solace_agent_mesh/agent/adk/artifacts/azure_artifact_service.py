@@ -5,6 +5,7 @@ An ADK ArtifactService implementation using Azure Blob Storage.
 import asyncio
 import logging
 import unicodedata
+from urllib.parse import quote, unquote
 
 from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
 from azure.storage.blob import BlobServiceClient, ContentSettings
@@ -15,6 +16,13 @@ from typing_extensions import override
 
 logger = logging.getLogger(__name__)
 
+# Metadata key of a reference blob, holding the (URL-quoted) name of the blob
+# whose content it stands for. See copy_artifact.
+REFERENCE_METADATA_KEY = "reference_key"
+
+# Interval between copy status checks while a server-side copy is pending
+_COPY_POLL_INTERVAL_SECONDS = 0.5
+
 
 class AzureArtifactService(BaseArtifactService):
     """
@@ -145,6 +153,14 @@ class AzureArtifactService(BaseArtifactService):
         """
         return value.encode("ascii", errors="backslashreplace").decode("ascii")
 
+    @staticmethod
+    def _reference_target(properties) -> str | None:
+        """Returns the blob a reference blob points to, or None for a regular blob."""
+        metadata = getattr(properties, "metadata", None)
+        if not isinstance(metadata, dict) or not metadata.get(REFERENCE_METADATA_KEY):
+            return None
+        return unquote(metadata[REFERENCE_METADATA_KEY])
+
     @override
     async def save_artifact(
         self,
@@ -255,6 +271,10 @@ class AzureArtifactService(BaseArtifactService):
             def _download_blob():
                 blob_client = self.container_client.get_blob_client(object_key)
                 downloader = blob_client.download_blob()
+                target_key = self._reference_target(downloader.properties)
+                if target_key:
+                    blob_client = self.container_client.get_blob_client(target_key)
+                    downloader = blob_client.download_blob()
                 data = downloader.readall()
                 content_type = downloader.properties.content_settings.content_type
                 return data, content_type
@@ -289,6 +309,205 @@ class AzureArtifactService(BaseArtifactService):
                 f"Failed to load artifact version {load_version} from Azure: {e}"
             ) from e
 
+    async def load_artifact_range(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        version: int,
+        offset: int,
+        length: int | None = None,
+    ) -> tuple[bytes, int, str] | None:
+        """Reads a byte range of one artifact version with a ranged blob download.
+
+        A non-negative offset reads up to `length` bytes from that position (to
+        the end when length is None); a negative offset reads the last
+        `-offset` bytes.
+
+        Returns:
+            (data, total_size, mime_type), or None if the version does not exist.
+        """
+        log_prefix = f"[AzureArtifact:LoadRange:{filename}] "
+        filename = self._normalize_filename_unicode(filename)
+        app_name = app_name.strip("/")
+        object_key = self._get_object_key(
+            app_name, user_id, session_id, filename, version
+        )
+
+        try:
+
+            def _download_range():
+                blob_client = self.container_client.get_blob_client(object_key)
+                properties = blob_client.get_blob_properties()
+                target_key = self._reference_target(properties)
+                if target_key:
+                    blob_client = self.container_client.get_blob_client(target_key)
+                    properties = blob_client.get_blob_properties()
+                total_size = properties.size
+                mime_type = (
+                    properties.content_settings.content_type
+                    or "application/octet-stream"
+                )
+                start = max(0, total_size + offset) if offset < 0 else offset
+                count = total_size - start if length is None or offset < 0 else length
+                count = min(count, total_size - start)
+                if count <= 0:
+                    return b"", total_size, mime_type
+                downloader = blob_client.download_blob(offset=start, length=count)
+                return downloader.readall(), total_size, mime_type
+
+            return await asyncio.to_thread(_download_range)
+
+        except ResourceNotFoundError:
+            logger.debug("%sArtifact not found: %s", log_prefix, object_key)
+            return None
+        except HttpResponseError as e:
+            logger.error(
+                "%sFailed to read range of artifact '%s' version %d from Azure: %s",
+                log_prefix,
+                filename,
+                version,
+                e,
+            )
+            raise OSError(
+                f"Failed to read artifact version {version} range from Azure: {e}"
+            ) from e
+
+    async def copy_artifact(
+        self,
+        *,
+        app_name: str,
+        source_user_id: str,
+        source_session_id: str,
+        source_filename: str,
+        source_version: int | None = None,
+        user_id: str,
+        session_id: str,
+        filename: str | None = None,
+        reference: bool = False,
+    ) -> int | None:
+        """Copies one artifact version to a new version of another artifact.
+
+        The content is copied by the storage service (Copy Blob) without
+        passing through this process. With `reference`, an empty blob pointing
+        at the source's content is written instead and reads follow it; since
+        versions are never rewritten, the reference stays equivalent to a copy
+        until the source version is deleted, after which it can no longer be
+        loaded.
+
+        Returns:
+            The new version number, or None if the source version does not exist.
+        """
+        log_prefix = f"[AzureArtifact:Copy:{source_filename}] "
+        source_filename = self._normalize_filename_unicode(source_filename)
+        filename = self._normalize_filename_unicode(filename or source_filename)
+        app_name = app_name.strip("/")
+
+        if source_version is None:
+            versions = await self.list_versions(
+                app_name=app_name,
+                user_id=source_user_id,
+                session_id=source_session_id,
+                filename=source_filename,
+            )
+            if not versions:
+                logger.debug("%sNo versions found for source artifact.", log_prefix)
+                return None
+            source_version = max(versions)
+
+        source_key = self._get_object_key(
+            app_name, source_user_id, source_session_id, source_filename, source_version
+        )
+
+        def _get_source_properties():
+            properties = self.container_client.get_blob_client(
+                source_key
+            ).get_blob_properties()
+            # Copies of a reference point at (or copy) the content it stands for
+            return self._reference_target(properties) or source_key, properties
+
+        try:
+            content_key, properties = await asyncio.to_thread(_get_source_properties)
+        except ResourceNotFoundError:
+            logger.debug("%sSource artifact not found: %s", log_prefix, source_key)
+            return None
+        except HttpResponseError as e:
+            raise OSError(f"Failed to read source artifact from Azure: {e}") from e
+
+        versions = await self.list_versions(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+        )
+        version = 0 if not versions else max(versions) + 1
+        object_key = self._get_object_key(
+            app_name, user_id, session_id, filename, version
+        )
+        metadata = {
+            "original_filename": self._sanitize_metadata_value(filename),
+            "user_id": self._sanitize_metadata_value(user_id),
+            "session_id": self._sanitize_metadata_value(session_id),
+            "version": str(version),
+        }
+        blob_client = self.container_client.get_blob_client(object_key)
+
+        try:
+            if reference:
+
+                def _upload_reference():
+                    blob_client.upload_blob(
+                        data=b"",
+                        overwrite=True,
+                        content_settings=ContentSettings(
+                            content_type=properties.content_settings.content_type,
+                        ),
+                        metadata={
+                            **metadata,
+                            REFERENCE_METADATA_KEY: quote(content_key),
+                        },
+                    )
+
+                await asyncio.to_thread(_upload_reference)
+            else:
+                source_url = self.container_client.get_blob_client(content_key).url
+                copy = await asyncio.to_thread(
+                    blob_client.start_copy_from_url, source_url, metadata=metadata
+                )
+                status = copy.get("copy_status")
+                # Copies within an account usually complete synchronously
+                while status == "pending":
+                    await asyncio.sleep(_COPY_POLL_INTERVAL_SECONDS)
+                    copy_properties = await asyncio.to_thread(
+                        blob_client.get_blob_properties
+                    )
+                    status = copy_properties.copy.status
+                if status != "success":
+                    raise OSError(f"Blob copy ended with status '{status}'")
+
+        except (HttpResponseError, OSError) as e:
+            logger.error(
+                "%sFailed to copy artifact '%s' version %d in Azure: %s",
+                log_prefix,
+                source_filename,
+                source_version,
+                e,
+            )
+            raise OSError(
+                f"Failed to copy artifact version {source_version} in Azure: {e}"
+            ) from e
+
+        logger.info(
+            "%s%s artifact version %d to blob key: %s",
+            log_prefix,
+            "Referenced" if reference else "Copied",
+            source_version,
+            object_key,
+        )
+        return version
+
     @override
     async def list_artifact_keys(
         self, *, app_name: str, user_id: str, session_id: str
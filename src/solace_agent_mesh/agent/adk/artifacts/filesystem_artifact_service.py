@@ -271,6 +271,155 @@ class FilesystemArtifactService(BaseArtifactService):
             )
             return None
 
+    async def load_artifact_range(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        version: int,
+        offset: int,
+        length: int | None = None,
+    ) -> tuple[bytes, int, str] | None:
+        """Reads a byte range of one artifact version without loading the rest.
+
+        A non-negative offset reads up to `length` bytes from that position (to
+        the end when length is None); a negative offset reads the last
+        `-offset` bytes.
+
+        Returns:
+            (data, total_size, mime_type), or None if the version does not exist.
+        """
+        log_prefix = f"[FSArtifact:LoadRange:{filename}] "
+        filename = self._normalize_filename_unicode(filename)
+        artifact_dir = self._get_artifact_dir(app_name, user_id, session_id, filename)
+        version_path = self._get_version_path(artifact_dir, version)
+        metadata_path = self._get_metadata_path(artifact_dir, version)
+
+        def _read_range():
+            with open(metadata_path, encoding="utf-8") as f:
+                mime_type = json.load(f).get("mime_type", "application/octet-stream")
+            with open(version_path, "rb") as f:
+                total_size = os.fstat(f.fileno()).st_size
+                start = max(0, total_size + offset) if offset < 0 else offset
+                f.seek(start)
+                data = f.read(-1 if length is None or offset < 0 else length)
+            return data, total_size, mime_type
+
+        try:
+            return await asyncio.to_thread(_read_range)
+        except FileNotFoundError:
+            logger.debug("%sVersion %d not found.", log_prefix, version)
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(
+                "%sFailed to read range of artifact '%s' version %d: %s",
+                log_prefix,
+                filename,
+                version,
+                e,
+            )
+            return None
+
+    async def copy_artifact(
+        self,
+        *,
+        app_name: str,
+        source_user_id: str,
+        source_session_id: str,
+        source_filename: str,
+        source_version: int | None = None,
+        user_id: str,
+        session_id: str,
+        filename: str | None = None,
+        reference: bool = False,
+    ) -> int | None:
+        """Copies one artifact version to a new version of another artifact.
+
+        Version files are never modified after they are written, so the copy
+        is a hard link sharing the source's storage; it falls back to a file
+        copy when the destination is on another filesystem. `reference` is
+        accepted for interface parity, as a hard link already is one.
+
+        Returns:
+            The new version number, or None if the source version does not exist.
+        """
+        log_prefix = f"[FSArtifact:Copy:{source_filename}] "
+        source_filename = self._normalize_filename_unicode(source_filename)
+        filename = self._normalize_filename_unicode(filename or source_filename)
+
+        if source_version is None:
+            versions = await self.list_versions(
+                app_name=app_name,
+                user_id=source_user_id,
+                session_id=source_session_id,
+                filename=source_filename,
+            )
+            if not versions:
+                logger.debug("%sNo versions found for source artifact.", log_prefix)
+                return None
+            source_version = max(versions)
+
+        source_dir = self._get_artifact_dir(
+            app_name, source_user_id, source_session_id, source_filename
+        )
+        source_path = self._get_version_path(source_dir, source_version)
+        source_metadata_path = self._get_metadata_path(source_dir, source_version)
+        if not await asyncio.to_thread(
+            os.path.exists, source_path
+        ) or not await asyncio.to_thread(os.path.exists, source_metadata_path):
+            logger.debug(
+                "%sSource version %d not found.", log_prefix, source_version
+            )
+            return None
+
+        artifact_dir = self._get_artifact_dir(app_name, user_id, session_id, filename)
+        await asyncio.to_thread(os.makedirs, artifact_dir, exist_ok=True)
+        versions = await self.list_versions(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+        )
+        version = 0 if not versions else max(versions) + 1
+        version_path = self._get_version_path(artifact_dir, version)
+        metadata_path = self._get_metadata_path(artifact_dir, version)
+
+        def _link_files():
+            shutil.copyfile(source_metadata_path, metadata_path)
+            try:
+                os.link(source_path, version_path)
+                return True
+            except OSError:
+                shutil.copyfile(source_path, version_path)
+                return False
+
+        try:
+            linked = await asyncio.to_thread(_link_files)
+        except OSError as e:
+            logger.error(
+                "%sFailed to copy artifact '%s' version %d: %s",
+                log_prefix,
+                source_filename,
+                source_version,
+                e,
+            )
+            for path in (version_path, metadata_path):
+                if await asyncio.to_thread(os.path.exists, path):
+                    await asyncio.to_thread(os.remove, path)
+            raise OSError(f"Failed to copy artifact version {source_version}: {e}") from e
+
+        logger.info(
+            "%s%s artifact version %d to '%s' version %d.",
+            log_prefix,
+            "Linked" if linked else "Copied",
+            source_version,
+            filename,
+            version,
+        )
+        return version
+
     @override
     async def list_artifact_keys(
         self, *, app_name: str, user_id: str, session_id: str
@@ -284,36 +433,32 @@ class FilesystemArtifactService(BaseArtifactService):
         session_base_dir = os.path.join(
             self.base_path, app_name_sanitized, user_id_sanitized, session_id_sanitized
         )
-        if await asyncio.to_thread(os.path.isdir, session_base_dir):
-            try:
-                for item in await asyncio.to_thread(os.listdir, session_base_dir):
-                    item_path = os.path.join(session_base_dir, item)
-                    if await asyncio.to_thread(os.path.isdir, item_path):
-                        filenames.add(item)
-            except OSError as e:
-                logger.warning(
-                    "%sError listing session directory '%s': %s",
-                    log_prefix,
-                    session_base_dir,
-                    e,
-                )
-
         user_base_dir = os.path.join(
             self.base_path, app_name_sanitized, user_id_sanitized, "user"
         )
-        if await asyncio.to_thread(os.path.isdir, user_base_dir):
+
+        def _list_dirs(base_dir: str) -> list[str]:
+            # One thread hop per directory: scandir reports entry types
+            # without a stat call per entry on most platforms.
             try:
-                for item in await asyncio.to_thread(os.listdir, user_base_dir):
-                    item_path = os.path.join(user_base_dir, item)
-                    if await asyncio.to_thread(os.path.isdir, item_path):
-                        filenames.add(f"user:{item}")
+                with os.scandir(base_dir) as entries:
+                    return [entry.name for entry in entries if entry.is_dir()]
+            except FileNotFoundError:
+                return []
             except OSError as e:
                 logger.warning(
-                    "%sError listing user directory '%s': %s",
+                    "%sError listing directory '%s': %s",
                     log_prefix,
-                    user_base_dir,
+                    base_dir,
                     e,
                 )
+                return []
+
+        filenames.update(await asyncio.to_thread(_list_dirs, session_base_dir))
+        filenames.update(
+            f"user:{item}"
+            for item in await asyncio.to_thread(_list_dirs, user_base_dir)
+        )
 
         sorted_filenames = sorted(list(filenames))
         logger.debug("%sFound %d artifact keys.", log_prefix, len(sorted_filenames))
@@ -5,6 +5,7 @@ An ADK ArtifactService implementation using Amazon S3 compatible storage.
 import asyncio
 import logging
 import unicodedata
+from urllib.parse import quote, unquote
 
 import boto3
 from botocore.client import BaseClient
@@ -23,6 +24,14 @@ logger = logging.getLogger(__name__)
 # high-concurrency gateway, not a CLI tool.
 _DEFAULT_S3_POOL_SIZE = 200
 
+# A single CopyObject request copies at most 5 GiB; larger objects are copied
+# part by part with the managed transfer.
+_MAX_COPY_OBJECT_BYTES = 5 * 1024**3
+
+# User metadata key of a reference object, holding the (URL-quoted) key of the
+# object whose content it stands for. See copy_artifact.
+REFERENCE_METADATA_KEY = "reference_key"
+
 
 class S3ArtifactService(BaseArtifactService):
     """
@@ -155,6 +164,12 @@ class S3ArtifactService(BaseArtifactService):
         """
         return value.encode("ascii", errors="backslashreplace").decode("ascii")
 
+    @staticmethod
+    def _reference_target(response: dict) -> str | None:
+        """Returns the key a reference object points to, or None for a regular object."""
+        target = (response.get("Metadata") or {}).get(REFERENCE_METADATA_KEY)
+        return unquote(target) if target else None
+
     @override
     async def save_artifact(
         self,
@@ -273,7 +288,11 @@ class S3ArtifactService(BaseArtifactService):
         try:
 
             def _get_object():
-                return self.s3.get_object(Bucket=self.bucket_name, Key=object_key)
+                response = self.s3.get_object(Bucket=self.bucket_name, Key=object_key)
+                target_key = self._reference_target(response)
+                if target_key:
+                    return self.s3.get_object(Bucket=self.bucket_name, Key=target_key)
+                return response
 
             response = await asyncio.to_thread(_get_object)
             data = response["Body"].read()
@@ -319,6 +338,248 @@ class S3ArtifactService(BaseArtifactService):
                 f"BotoCore error loading artifact version {load_version}: {e}"
             ) from e
 
+    async def load_artifact_range(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        version: int,
+        offset: int,
+        length: int | None = None,
+    ) -> tuple[bytes, int, str] | None:
+        """Reads a byte range of one artifact version with a ranged GetObject.
+
+        A non-negative offset reads up to `length` bytes from that position (to
+        the end when length is None); a negative offset reads the last
+        `-offset` bytes.
+
+        Returns:
+            (data, total_size, mime_type), or None if the version does not exist.
+        """
+        log_prefix = f"[S3Artifact:LoadRange:{filename}] "
+        filename = self._normalize_filename_unicode(filename)
+        app_name = app_name.strip('/')
+        object_key = self._get_object_key(
+            app_name, user_id, session_id, filename, version
+        )
+
+        if offset < 0:
+            byte_range = f"bytes={offset}"
+        elif length is None:
+            byte_range = f"bytes={offset}-"
+        else:
+            byte_range = f"bytes={offset}-{offset + max(length, 1) - 1}"
+
+        try:
+
+            def _get_range(key):
+                try:
+                    response = self.s3.get_object(
+                        Bucket=self.bucket_name, Key=key, Range=byte_range
+                    )
+                except ClientError as e:
+                    if e.response.get("Error", {}).get("Code") != "InvalidRange":
+                        raise
+                    # The range starts at or past the end of the object, which
+                    # for an empty reference object is any range
+                    head = self.s3.head_object(Bucket=self.bucket_name, Key=key)
+                    target_key = self._reference_target(head)
+                    if target_key:
+                        return _get_range(target_key)
+                    return (
+                        b"",
+                        head.get("ContentLength", 0),
+                        head.get("ContentType", "application/octet-stream"),
+                    )
+
+                target_key = self._reference_target(response)
+                if target_key:
+                    return _get_range(target_key)
+                data = response["Body"].read()
+                mime_type = response.get("ContentType", "application/octet-stream")
+                content_range = response.get("ContentRange")
+                if content_range:
+                    return data, int(content_range.rsplit("/", 1)[1]), mime_type
+                # The store ignored the Range header and returned the whole object
+                total_size = len(data)
+                if offset < 0:
+                    return data[offset:], total_size, mime_type
+                end = None if length is None else offset + length
+                return data[offset:end], total_size, mime_type
+
+            data, total_size, mime_type = await asyncio.to_thread(
+                _get_range, object_key
+            )
+            if length == 0:
+                data = b""
+            return data, total_size, mime_type
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            if error_code in ("NoSuchKey", "404"):
+                logger.debug("%sArtifact not found: %s", log_prefix, object_key)
+                return None
+            logger.error(
+                "%sFailed to read range of artifact '%s' version %d from S3: %s",
+                log_prefix,
+                filename,
+                version,
+                e,
+            )
+            raise OSError(
+                f"Failed to read artifact version {version} range from S3: {e}"
+            ) from e
+        except BotoCoreError as e:
+            logger.error(
+                "%sBotoCore error reading range of artifact '%s' version %d: %s",
+                log_prefix,
+                filename,
+                version,
+                e,
+            )
+            raise OSError(
+                f"BotoCore error reading artifact version {version} range: {e}"
+            ) from e
+
+    async def copy_artifact(
+        self,
+        *,
+        app_name: str,
+        source_user_id: str,
+        source_session_id: str,
+        source_filename: str,
+        source_version: int | None = None,
+        user_id: str,
+        session_id: str,
+        filename: str | None = None,
+        reference: bool = False,
+    ) -> int | None:
+        """Copies one artifact version to a new version of another artifact.
+
+        The content is copied inside the bucket (CopyObject, or a multipart
+        copy above 5 GiB) without passing through this process. With
+        `reference`, an empty object pointing at the source's content is written
+        instead and reads follow it; since versions are never rewritten, the
+        reference stays equivalent to a copy until the source version is
+        deleted, after which it can no longer be loaded.
+
+        Returns:
+            The new version number, or None if the source version does not exist.
+        """
+        log_prefix = f"[S3Artifact:Copy:{source_filename}] "
+        source_filename = self._normalize_filename_unicode(source_filename)
+        filename = self._normalize_filename_unicode(filename or source_filename)
+        app_name = app_name.strip('/')
+
+        if source_version is None:
+            versions = await self.list_versions(
+                app_name=app_name,
+                user_id=source_user_id,
+                session_id=source_session_id,
+                filename=source_filename,
+            )
+            if not versions:
+                logger.debug("%sNo versions found for source artifact.", log_prefix)
+                return None
+            source_version = max(versions)
+
+        source_key = self._get_object_key(
+            app_name, source_user_id, source_session_id, source_filename, source_version
+        )
+
+        def _head_source():
+            head = self.s3.head_object(Bucket=self.bucket_name, Key=source_key)
+            # Copies of a reference point at (or copy) the content it stands for
+            target_key = self._reference_target(head)
+            if target_key and not reference:
+                return target_key, self.s3.head_object(
+                    Bucket=self.bucket_name, Key=target_key
+                )
+            return target_key or source_key, head
+
+        try:
+            content_key, head = await asyncio.to_thread(_head_source)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            if error_code in ("NoSuchKey", "404"):
+                logger.debug("%sSource artifact not found: %s", log_prefix, source_key)
+                return None
+            raise OSError(f"Failed to read source artifact from S3: {e}") from e
+
+        versions = await self.list_versions(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+        )
+        version = 0 if not versions else max(versions) + 1
+        object_key = self._get_object_key(
+            app_name, user_id, session_id, filename, version
+        )
+        content_type = head.get("ContentType", "application/octet-stream")
+        metadata = {
+            "original_filename": self._sanitize_metadata_value(filename),
+            "user_id": self._sanitize_metadata_value(user_id),
+            "session_id": self._sanitize_metadata_value(session_id),
+            "version": str(version),
+        }
+
+        try:
+
+            def _copy_object():
+                if reference:
+                    return self.s3.put_object(
+                        Bucket=self.bucket_name,
+                        Key=object_key,
+                        Body=b"",
+                        ContentType=content_type,
+                        Metadata={
+                            **metadata,
+                            REFERENCE_METADATA_KEY: quote(content_key),
+                        },
+                    )
+                copy_source = {"Bucket": self.bucket_name, "Key": content_key}
+                extra_args = {
+                    "ContentType": content_type,
+                    "Metadata": metadata,
+                    "MetadataDirective": "REPLACE",
+                }
+                if head.get("ContentLength", 0) > _MAX_COPY_OBJECT_BYTES:
+                    return self.s3.copy(
+                        copy_source, self.bucket_name, object_key, ExtraArgs=extra_args
+                    )
+                return self.s3.copy_object(
+                    Bucket=self.bucket_name,
+                    Key=object_key,
+                    CopySource=copy_source,
+                    **extra_args,
+                )
+
+            await asyncio.to_thread(_copy_object)
+
+        except (ClientError, BotoCoreError) as e:
+            logger.error(
+                "%sFailed to copy artifact '%s' version %d in S3: %s",
+                log_prefix,
+                source_filename,
+                source_version,
+                e,
+            )
+            raise OSError(
+                f"Failed to copy artifact version {source_version} in S3: {e}"
+            ) from e
+
+        logger.info(
+            "%s%s artifact version %d to S3 key: %s",
+            log_prefix,
+            "Referenced" if reference else "Copied",
+            source_version,
+            object_key,
+        )
+        return version
+
     @override
     async def list_artifact_keys(
         self, *, app_name: str, user_id: str, session_id: str
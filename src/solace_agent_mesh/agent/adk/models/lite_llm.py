@@ -20,6 +20,7 @@ import copy
 import hashlib
 import json
 import logging
+import re
 from typing import (
     Any,
     AsyncGenerator,
@@ -167,6 +168,107 @@ class FunctionChunk(BaseModel):
     index: Optional[int] = 0
 
 
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_STRING_SPECIAL = re.compile(r'["\\]')
+_JSON_STRUCTURAL = re.compile(r'["\[\]{}]')
+
+
+class _StreamedToolArgs:
+    """Accumulates streamed tool-call arguments and tracks JSON completeness.
+
+    Chunks are kept in a list and only bracket and string state is scanned for
+    each new chunk, so assembling an argument string of n characters costs
+    O(n) rather than re-parsing the whole buffer on every chunk. ``append``
+    returns True exactly when ``json.loads`` would accept the buffer.
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._kind: Optional[str] = None  # "value" for objects/arrays/strings
+        self._closed = False
+        self._verified = False
+        self._invalid = False
+
+    @property
+    def text(self) -> str:
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def append(self, chunk: str) -> bool:
+        """Adds a chunk and returns whether the buffer is now complete JSON."""
+        self._parts.append(chunk)
+        if self._invalid:
+            return False
+        self._scan(chunk)
+        if self._kind == "scalar":
+            # Numbers and literals can keep growing; they are short enough to
+            # simply re-parse.
+            return self._parses()
+        if self._closed and not self._invalid and not self._verified:
+            # Balanced brackets do not guarantee valid content. Once the
+            # top-level value is closed the result cannot change, except
+            # that trailing non-whitespace makes it invalid.
+            self._verified = True
+            self._invalid = not self._parses()
+        return self._closed and not self._invalid
+
+    def _parses(self) -> bool:
+        try:
+            json.loads(self.text)
+            return True
+        except json.JSONDecodeError:
+            return False
+
+    def _scan(self, chunk: str):
+        pos = 0
+        while pos < len(chunk):
+            if self._closed:
+                if chunk[pos:].strip(_JSON_WHITESPACE):
+                    self._invalid = True
+                return
+            if self._escaped:
+                self._escaped = False
+                pos += 1
+                continue
+            if self._in_string:
+                match = _JSON_STRING_SPECIAL.search(chunk, pos)
+                if not match:
+                    return
+                pos = match.end()
+                if match.group() == "\\":
+                    self._escaped = True
+                else:
+                    self._in_string = False
+                    self._closed = self._depth == 0
+                continue
+            if self._kind is None:
+                rest = chunk[pos:].lstrip(_JSON_WHITESPACE)
+                if not rest:
+                    return
+                self._kind = "value" if rest[0] in '{["' else "scalar"
+            if self._kind == "scalar":
+                return
+            match = _JSON_STRUCTURAL.search(chunk, pos)
+            if not match:
+                return
+            pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth < 0:
+                    self._invalid = True
+                    return
+                self._closed = self._depth == 0
+
+
 class TextChunk(BaseModel):
     text: str
 
@@ -1451,20 +1553,19 @@ class LiteLlm(BaseLlm):
                         if isinstance(chunk, FunctionChunk):
                             index = chunk.index or fallback_index
                             if index not in function_calls:
-                                function_calls[index] = {"name": "", "args": "", "id": None}
+                                function_calls[index] = {
+                                    "name": "",
+                                    "args": _StreamedToolArgs(),
+                                    "id": None,
+                                }
 
                             if chunk.name:
                                 function_calls[index]["name"] += chunk.name
                             if chunk.args:
-                                function_calls[index]["args"] += chunk.args
-
                                 # check if args is completed (workaround for improper chunk
                                 # indexing)
-                                try:
-                                    json.loads(function_calls[index]["args"])
+                                if function_calls[index]["args"].append(chunk.args):
                                     fallback_index += 1
-                                except json.JSONDecodeError:
-                                    pass
 
                             function_calls[index]["id"] = (
                                 chunk.id or function_calls[index]["id"] or str(index)
@@ -1525,7 +1626,7 @@ class LiteLlm(BaseLlm):
                                         id=_truncate_tool_call_id(func_data["id"]),
                                         function=Function(
                                             name=func_data["name"],
-                                            arguments=func_data["args"],
+                                            arguments=func_data["args"].text,
                                             index=index,
                                         ),
                                     )
@@ -1554,7 +1655,7 @@ class LiteLlm(BaseLlm):
                                         id=_truncate_tool_call_id(func_data["id"]),
                                         function=Function(
                                             name=func_data["name"],
-                                            arguments=func_data["args"],
+                                            arguments=func_data["args"].text,
                                             index=index,
                                         ),
                                     )
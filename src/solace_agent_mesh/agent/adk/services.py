@@ -2,6 +2,7 @@
 Initializes ADK Services based on configuration.
 """
 
+import asyncio
 import logging
 import os
 import re
@@ -38,6 +39,7 @@ from google.adk.sessions import (
 from google.genai import types as adk_types
 from typing_extensions import override
 
+from .artifacts.artifact_catalog import ArtifactCatalog
 from .artifacts.filesystem_artifact_service import FilesystemArtifactService
 from .schema_migration import run_migrations
 
@@ -63,6 +65,7 @@ class ScopedArtifactServiceWrapper(BaseArtifactService):
         self,
         wrapped_service: BaseArtifactService,
         component: Any,
+        artifact_catalog: Optional[ArtifactCatalog] = None,
     ):
         """
         Initializes the ScopedArtifactServiceWrapper.
@@ -70,9 +73,15 @@ class ScopedArtifactServiceWrapper(BaseArtifactService):
         Args:
             wrapped_service: The concrete artifact service instance (e.g., InMemory, GCS).
             component: The component instance (agent or gateway) that owns this service.
+            artifact_catalog: Optional metadata catalog kept in sync with the store.
         """
         self.wrapped_service = wrapped_service
         self.component = component
+        self.artifact_catalog = artifact_catalog
+
+    def scoped_app_name(self, app_name: str) -> str:
+        """Returns the app_name under which artifacts of `app_name` are stored."""
+        return self._get_scoped_app_name(app_name)
 
     def _get_scoped_app_name(self, app_name: str) -> str:
         """
@@ -131,6 +140,78 @@ class ScopedArtifactServiceWrapper(BaseArtifactService):
                 version=version,
             )
 
+    async def load_artifact_range(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        version: int,
+        offset: int,
+        length: Optional[int] = None,
+    ) -> Optional[tuple]:
+        """
+        Forwards a ranged read to the wrapped service.
+
+        Raises:
+            NotImplementedError: If the wrapped service has no ranged reads.
+        """
+        load_range = getattr(self.wrapped_service, "load_artifact_range", None)
+        if load_range is None:
+            raise NotImplementedError(
+                f"{type(self.wrapped_service).__name__} does not support ranged reads"
+            )
+        scoped_app_name = self._get_scoped_app_name(app_name)
+        with MonitorLatency(ArtifactMonitor.load()):
+            return await load_range(
+                app_name=scoped_app_name,
+                user_id=user_id,
+                session_id=session_id,
+                filename=filename,
+                version=version,
+                offset=offset,
+                length=length,
+            )
+
+    async def copy_artifact(
+        self,
+        *,
+        app_name: str,
+        source_user_id: str,
+        source_session_id: str,
+        source_filename: str,
+        source_version: Optional[int] = None,
+        user_id: str,
+        session_id: str,
+        filename: Optional[str] = None,
+        reference: bool = False,
+    ) -> Optional[int]:
+        """
+        Forwards a server-side copy to the wrapped service.
+
+        Raises:
+            NotImplementedError: If the wrapped service cannot copy artifacts.
+        """
+        copy = getattr(self.wrapped_service, "copy_artifact", None)
+        if copy is None:
+            raise NotImplementedError(
+                f"{type(self.wrapped_service).__name__} does not support artifact copies"
+            )
+        scoped_app_name = self._get_scoped_app_name(app_name)
+        with MonitorLatency(ArtifactMonitor.save()):
+            return await copy(
+                app_name=scoped_app_name,
+                source_user_id=source_user_id,
+                source_session_id=source_session_id,
+                source_filename=source_filename,
+                source_version=source_version,
+                user_id=user_id,
+                session_id=session_id,
+                filename=filename,
+                reference=reference,
+            )
+
     @override
     async def list_artifact_keys(
         self, *, app_name: str, user_id: str, session_id: str
@@ -153,6 +234,19 @@ class ScopedArtifactServiceWrapper(BaseArtifactService):
                 session_id=session_id,
                 filename=filename,
             )
+        if self.artifact_catalog is not None:
+            try:
+                await asyncio.to_thread(
+                    self.artifact_catalog.delete,
+                    scoped_app_name,
+                    user_id,
+                    session_id,
+                    filename,
+                )
+            except Exception as e:
+                log.warning(
+                    "Failed to remove '%s' from the artifact catalog: %s", filename, e
+                )
 
     @override
     async def list_versions(
@@ -970,6 +1064,16 @@ def initialize_artifact_service(component) -> BaseArtifactService:
             f"{component.log_identifier} Unsupported artifact service type: {service_type}"
         )
 
+    artifact_catalog = None
+    catalog_config = config.get("catalog")
+    if catalog_config:
+        artifact_catalog = ArtifactCatalog.from_config(catalog_config)
+        log.info(
+            "%s Artifact metadata catalog enabled (serve_listings=%s).",
+            component.log_identifier,
+            artifact_catalog.serve_listings,
+        )
+
     # Wrap the concrete service to enforce scoping dynamically.
     # The wrapper will query the component's config at runtime.
     log.info(
@@ -979,6 +1083,7 @@ def initialize_artifact_service(component) -> BaseArtifactService:
     return ScopedArtifactServiceWrapper(
         wrapped_service=concrete_service,
         component=component,
+        artifact_catalog=artifact_catalog,
     )
 
 
@@ -241,6 +241,7 @@ async def _load_python_tool(component: "SamAgentComponent", tool_config: Dict) -
         tool_description=tool_config_model.tool_description,
         raw_string_args=tool_config_model.raw_string_args,
         base_path=tool_config_model.component_base_path,
+        executor=tool_config_model.executor,
     )
 
     # Initialize the loader (imports module and creates tools)
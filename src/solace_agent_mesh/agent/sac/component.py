@@ -3989,34 +3989,29 @@ class SamAgentComponent(SamComponentBase):
                 f"Invalid health check configuration. agent_health_check_ttl_seconds ({ttl_seconds}) and agent_health_check_interval_seconds ({health_check_interval}) must be positive and TTL must be greater than interval."
             )
 
-        # Get all agent names from the registry
-        agent_names = self.agent_registry.get_agent_names()
-        total_agents = len(agent_names)
+        total_agents = len(self.agent_registry)
         agents_to_deregister = []
 
         log.debug(
             "%s Checking health of %d peer agents", self.log_identifier, total_agents
         )
 
-        for agent_name in agent_names:
+        # Only agents whose TTL has expired are visited
+        for agent_name, time_since_last_seen in self.agent_registry.get_expired(
+            ttl_seconds
+        ):
             # Skip our own agent
             if agent_name == self.agent_name:
                 continue
 
-            # Check if the agent's TTL has expired
-            is_expired, time_since_last_seen = self.agent_registry.check_ttl_expired(
-                agent_name, ttl_seconds
+            log.warning(
+                "%s Agent '%s' TTL has expired. De-registering. Time since last seen: %d seconds (TTL: %d seconds)",
+                self.log_identifier,
+                agent_name,
+                time_since_last_seen,
+                ttl_seconds,
             )
-
-            if is_expired:
-                log.warning(
-                    "%s Agent '%s' TTL has expired. De-registering. Time since last seen: %d seconds (TTL: %d seconds)",
-                    self.log_identifier,
-                    agent_name,
-                    time_since_last_seen,
-                    ttl_seconds,
-                )
-                agents_to_deregister.append(agent_name)
+            agents_to_deregister.append(agent_name)
 
         # De-register unresponsive agents
         for agent_name in agents_to_deregister:
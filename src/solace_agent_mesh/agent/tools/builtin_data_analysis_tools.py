@@ -2,10 +2,10 @@
 Built-in ADK Tools for Data Analysis (SQL, JQ, Plotly).
 """
 
+import asyncio
 import logging
 import json
-import os
-from typing import Dict, Optional, Literal
+from typing import Any, Dict, Optional, Literal
 from datetime import datetime, timezone
 
 try:
@@ -16,7 +16,6 @@ except ImportError:
     PYYAML_AVAILABLE = False
 
 try:
-    import plotly.io as pio
     import plotly.graph_objects as go
 
     PLOTLY_AVAILABLE = True
@@ -35,6 +34,12 @@ from google.adk.tools import ToolContext
 from google.genai import types as adk_types
 
 from ...agent.utils.artifact_helpers import ensure_correct_extension
+from ...common.utils.chart_renderer import (
+    cleanup_kaleido_scope,
+    get_chart_renderer,
+    reap_zombie_processes,
+    render_figure,
+)
 
 from .tool_definition import BuiltinTool
 from .tool_result import ToolResult, DataObject, DataDisposition
@@ -46,51 +51,15 @@ CATEGORY_NAME = "Data Analysis"
 CATEGORY_DESCRIPTION = "Create static chart images from data in JSON or YAML format."
 
 
-def _reap_zombie_processes():
-    """Reap any zombie child processes to prevent accumulation.
-
-    In containerized environments where PID 1 is the Python process (not init),
-    zombie child processes from Kaleido/Chromium are not automatically reaped.
-    This function calls os.waitpid() in a non-blocking loop to clean them up.
-    """
-    reaped = 0
-    while True:
-        try:
-            pid, _ = os.waitpid(-1, os.WNOHANG)
-            if pid == 0:
-                break
-            reaped += 1
-        except ChildProcessError:
-            # No child processes exist
-            break
-    if reaped > 0:
-        log.debug("Reaped %d zombie child process(es).", reaped)
-
-
-def _cleanup_kaleido_scope():
-    """Shut down the Kaleido Chromium subprocess scope to free resources.
-
-    Kaleido 0.2.x maintains a persistent Chromium subprocess (PlotlyScope)
-    that spawns child renderer processes.
-    """
+def _render_in_process(fig: "go.Figure", output_format: str) -> bytes:
+    """Render with a one-off Kaleido scope when the renderer pool is disabled."""
     try:
-        if hasattr(pio, "_kaleido") and pio._kaleido is not None:
-            scope = pio._kaleido
-            if hasattr(scope, "_shutdown"):
-                scope._shutdown()
-                log.debug("Kaleido scope shut down successfully.")
-            elif hasattr(scope, "_proc") and scope._proc is not None:
-                scope._proc.kill()
-                scope._proc.wait()
-                scope._proc = None
-                log.debug("Kaleido subprocess terminated successfully.")
-        elif hasattr(pio, "kaleido") and hasattr(pio.kaleido, "scope"):
-            scope = pio.kaleido.scope
-            if hasattr(scope, "_shutdown"):
-                scope._shutdown()
-                log.debug("Kaleido scope shut down successfully.")
-    except Exception as e:
-        log.debug("Non-critical: Failed to clean up Kaleido scope: %s", e)
+        return render_figure(fig.to_dict(), output_format)
+    finally:
+        # Clean up Kaleido's Chromium subprocess to prevent zombie process
+        # accumulation.
+        cleanup_kaleido_scope()
+        reap_zombie_processes()
 
 
 async def create_chart_from_plotly_config(
@@ -99,16 +68,23 @@ async def create_chart_from_plotly_config(
     output_filename: str,
     output_format: Optional[str] = "png",
     tool_context: ToolContext = None,
+    tool_config: Optional[Dict[str, Any]] = None,
 ) -> ToolResult:
     """
     Generates a static chart image from a Plotly configuration provided as a string.
 
+    Rendering runs in a shared pool of warm Kaleido worker processes; set
+    `renderer: {enabled: false}` in tool_config to render in-process instead.
+
     Args:
         config_content: The Plotly configuration (JSON or YAML) as a string.
         config_format: The format of the config_content ('json' or 'yaml').
         output_filename: The desired filename for the output image artifact.
         output_format: The desired image format ('png', 'jpg', 'svg', 'pdf', etc.). Default 'png'.
         tool_context: The context provided by the ADK framework.
+        tool_config: Optional configuration; `renderer` holds ChartRenderer
+            settings (enabled, workers, timeout_seconds, max_calls_per_worker,
+            max_memory_growth_mb).
 
     Returns:
         ToolResult with output artifact details.
@@ -162,8 +138,14 @@ async def create_chart_from_plotly_config(
                 f"Failed to create Plotly figure from config: {fig_err}"
             ) from fig_err
 
+        renderer = get_chart_renderer((tool_config or {}).get("renderer"))
         try:
-            image_bytes = pio.to_image(fig, format=output_format, engine="kaleido")
+            if renderer is not None:
+                image_bytes = await renderer.render(fig.to_dict(), output_format)
+            else:
+                image_bytes = await asyncio.to_thread(
+                    _render_in_process, fig, output_format
+                )
             log.info(
                 "%s Successfully generated %s image bytes using Kaleido.",
                 log_identifier,
@@ -173,11 +155,6 @@ async def create_chart_from_plotly_config(
             raise ValueError(
                 f"Failed to generate {output_format} image using Plotly/Kaleido: {img_err}. Ensure 'kaleido' package is installed and functional."
             ) from img_err
-        finally:
-            # Clean up Kaleido's Chromium subprocess to prevent zombie process
-            # accumulation. 
-            _cleanup_kaleido_scope()
-            _reap_zombie_processes()
 
         mime_map = {
             "png": "image/png",
@@ -3,6 +3,7 @@ Tool executors for running tools on different backends.
 
 This package provides an abstraction layer that allows tools to run on:
 - Local Python: Execute functions in the same process
+- Process pool: Execute CPU-bound functions in warm worker processes
 
 The PythonToolLoader handles all Python tool loading patterns:
 - Simple functions (module + function_name)
@@ -35,6 +36,8 @@ from .base import (
 
 from .unified_python_executor import PythonToolLoader
 
+from .process_executor import ProcessToolExecutor
+
 from .executor_tool import (
     ExecutorBasedTool,
 )
@@ -53,6 +56,8 @@ __all__ = [
     "list_executor_types",
     # Tool loader
     "PythonToolLoader",
+    # Executors
+    "ProcessToolExecutor",
     # Tool class
     "ExecutorBasedTool",
     # Deprecated aliases
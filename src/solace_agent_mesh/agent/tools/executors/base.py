@@ -148,6 +148,29 @@ class ToolExecutor(ABC):
         pass
 
 
+def normalize_function_result(
+    result: Any,
+) -> Union[ToolExecutionResult, ToolResult]:
+    """
+    Convert the return value of a tool function into an executor result.
+
+    ToolExecutionResult and ToolResult pass through unchanged, a dict with
+    status "error" becomes a failure, and anything else is successful data.
+    """
+    if isinstance(result, ToolExecutionResult):
+        return result
+    # Pass ToolResult through directly so ExecutorBasedTool._run_async_impl
+    # can forward it to the ToolResultProcessor for proper handling
+    if isinstance(result, ToolResult):
+        return result
+    if isinstance(result, dict) and result.get("status") == "error":
+        return ToolExecutionResult.fail(
+            error=result.get("message", "Unknown error"),
+            error_code=result.get("error_code"),
+        )
+    return ToolExecutionResult.ok(data=result)
+
+
 # Registry for executor types
 _EXECUTOR_REGISTRY: Dict[str, type] = {}
 
@@ -0,0 +1,157 @@
+"""
+Process-pool executor for CPU-bound Python tool functions.
+
+Sync tool functions normally run on the event loop's default thread pool,
+where CPU-heavy work (pandas transforms, parsing, crypto) holds the GIL and
+stalls the agent's loop and every concurrent task. This executor runs the
+function in a warm pool of worker processes instead.
+
+Enable it per tool in the agent YAML:
+
+    tools:
+      - tool_type: python
+        component_module: my_tools
+        function_name: crunch_numbers
+        executor:
+          type: process
+          max_workers: 2
+          timeout_seconds: 120
+          preload_modules: [pandas]
+          max_calls_per_worker: 500
+          max_memory_growth_mb: 1024
+
+The function receives only its (picklable) arguments and, if it declares the
+parameter, tool_config. ToolContext cannot cross the process boundary.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from google.adk.tools import ToolContext
+
+from ....common.utils.process_pool import (
+    DEFAULT_SHARED_MEMORY_THRESHOLD_BYTES,
+    WarmProcessPool,
+    WorkerCallError,
+)
+from .base import (
+    ToolExecutor,
+    ToolExecutionResult,
+    normalize_function_result,
+    register_executor,
+)
+
+if TYPE_CHECKING:
+    from ...sac.component import SamAgentComponent
+
+log = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 300
+
+
+@register_executor("process")
+class ProcessToolExecutor(ToolExecutor):
+    """
+    Executor that calls a module-level function in worker processes.
+
+    Workers import the function's module (and any preload modules) once at
+    start-up, and are recycled after a number of calls or once their memory
+    has grown past a limit. Bytes values above the shared memory threshold in
+    arguments and results are transferred through shared memory.
+    """
+
+    def __init__(
+        self,
+        module: str,
+        function_name: str,
+        base_path: Optional[str] = None,
+        pass_tool_config: bool = False,
+        max_workers: int = 2,
+        timeout_seconds: Optional[float] = DEFAULT_TIMEOUT_SECONDS,
+        preload_modules: Optional[List[str]] = None,
+        max_calls_per_worker: int = 0,
+        max_memory_growth_mb: int = 0,
+        shared_memory_threshold_bytes: int = DEFAULT_SHARED_MEMORY_THRESHOLD_BYTES,
+        start_method: Optional[str] = None,
+    ):
+        self._function_name = function_name
+        self._pass_tool_config = pass_tool_config
+        self._timeout_seconds = timeout_seconds or None
+        self._pool = WarmProcessPool(
+            target=f"{module}:{function_name}",
+            max_workers=max_workers,
+            base_path=base_path,
+            preload_modules=preload_modules,
+            max_calls_per_worker=max_calls_per_worker,
+            max_memory_growth_mb=max_memory_growth_mb,
+            shared_memory_threshold_bytes=shared_memory_threshold_bytes,
+            start_method=start_method,
+        )
+
+    @property
+    def executor_type(self) -> str:
+        return "process"
+
+    @property
+    def pool_stats(self) -> Dict[str, int]:
+        """Counters for calls, worker starts, recycles, timeouts and crashes."""
+        return dict(self._pool.stats)
+
+    async def initialize(
+        self,
+        component: "SamAgentComponent",
+        executor_config: Dict[str, Any],
+    ) -> None:
+        """Start the worker processes so the first calls are warm."""
+        await self._pool.start()
+
+    async def execute(
+        self,
+        args: Dict[str, Any],
+        tool_context: ToolContext,
+        tool_config: Dict[str, Any],
+    ) -> ToolExecutionResult:
+        """Execute the function in a worker process."""
+        kwargs = dict(args)
+        if self._pass_tool_config:
+            kwargs["tool_config"] = tool_config
+
+        try:
+            result = await self._pool.call(kwargs, timeout=self._timeout_seconds)
+        except TimeoutError:
+            log.warning(
+                "Process execution of '%s' timed out after %ss",
+                self._function_name,
+                self._timeout_seconds,
+            )
+            return ToolExecutionResult.fail(
+                error=f"Execution timed out after {self._timeout_seconds} seconds",
+                error_code="TIMEOUT",
+            )
+        except WorkerCallError as e:
+            log.error(
+                "Process execution of '%s' failed: %s\n%s",
+                self._function_name,
+                e,
+                e.remote_traceback,
+            )
+            return ToolExecutionResult.fail(
+                error=f"Execution failed: {str(e)}",
+                error_code="EXECUTION_ERROR",
+            )
+        except Exception as e:
+            log.exception("Process execution of '%s' failed: %s", self._function_name, e)
+            return ToolExecutionResult.fail(
+                error=f"Execution failed: {str(e)}",
+                error_code="EXECUTION_ERROR",
+            )
+
+        return normalize_function_result(result)
+
+    async def cleanup(
+        self,
+        component: "SamAgentComponent",
+        executor_config: Dict[str, Any],
+    ) -> None:
+        """Stop the worker processes."""
+        await self._pool.shutdown()
@@ -17,8 +17,12 @@ from typing import Any, Callable, Dict, List, Optional, Type, Union, TYPE_CHECKI
 from google.adk.tools import BaseTool, ToolContext
 from pydantic import BaseModel
 
-from .base import ToolExecutor, ToolExecutionResult
-from ..tool_result import ToolResult
+from .base import (
+    ToolExecutor,
+    ToolExecutionResult,
+    create_executor,
+    normalize_function_result,
+)
 from .executor_tool import ExecutorBasedTool
 from ..dynamic_tool import (
     DynamicTool,
@@ -153,18 +157,7 @@ class _FunctionExecutor(ToolExecutor):
                     None, functools.partial(self._func, **kwargs)
                 )
 
-            if isinstance(result, ToolExecutionResult):
-                return result
-            # Pass ToolResult through directly so ExecutorBasedTool._run_async_impl
-            # can forward it to the ToolResultProcessor for proper handling
-            if isinstance(result, ToolResult):
-                return result
-            elif isinstance(result, dict) and result.get("status") == "error":
-                return ToolExecutionResult.fail(
-                    error=result.get("message", "Unknown error"),
-                    error_code=result.get("error_code"),
-                )
-            return ToolExecutionResult.ok(data=result)
+            return normalize_function_result(result)
 
         except Exception as e:
             log.exception("Function execution failed: %s", e)
@@ -213,6 +206,8 @@ class PythonToolLoader:
         raw_string_args: List of args that should not have embeds resolved
         pass_tool_context: Whether to inject tool_context (default: True)
         pass_tool_config: Whether to inject tool_config (default: True)
+        executor: Executor settings for function tools; {"type": "process", ...}
+            runs the function in a worker process pool (see ProcessToolExecutor)
     """
 
     def __init__(
@@ -227,6 +222,7 @@ class PythonToolLoader:
         pass_tool_context: bool = True,
         pass_tool_config: bool = True,
         base_path: Optional[str] = None,
+        executor: Optional[Dict[str, Any]] = None,
     ):
         self._module_path = module
         self._function_name = function_name
@@ -238,6 +234,7 @@ class PythonToolLoader:
         self._pass_tool_context = pass_tool_context
         self._pass_tool_config = pass_tool_config
         self._base_path = base_path
+        self._executor_config = dict(executor or {})
 
         # Loaded state
         self._module: Any = None
@@ -268,6 +265,11 @@ class PythonToolLoader:
             # Pattern 1: Simple function
             tools = self._load_function_tool()
         else:
+            if self._executor_config.get("type", "function") != "function":
+                raise ValueError(
+                    f"{log_id} 'executor' can only be configured for function tools "
+                    f"(module + function_name)."
+                )
             # Pattern 2/3: Class-based (DynamicTool or DynamicToolProvider)
             tools = self._load_class_based_tools(component)
 
@@ -306,12 +308,7 @@ class PythonToolLoader:
         tool_name = self._tool_name or self._function_name
         tool_description = self._tool_description or (func.__doc__ or f"Execute {tool_name}")
 
-        # Create internal executor for this function
-        func_executor = _FunctionExecutor(
-            func,
-            pass_tool_context=self._pass_tool_context,
-            pass_tool_config=self._pass_tool_config,
-        )
+        func_executor = self._create_function_executor(func, detection_result)
 
         # Create ExecutorBasedTool
         tool = ExecutorBasedTool(
@@ -334,6 +331,54 @@ class PythonToolLoader:
 
         return [tool]
 
+    def _create_function_executor(
+        self, func: Callable, detection_result: _SchemaDetectionResult
+    ) -> ToolExecutor:
+        """Create the executor configured for a function tool."""
+        executor_options = dict(self._executor_config)
+        executor_type = executor_options.pop("type", "function")
+
+        if executor_type == "function":
+            return _FunctionExecutor(
+                func,
+                pass_tool_context=self._pass_tool_context,
+                pass_tool_config=self._pass_tool_config,
+            )
+
+        if executor_type != "process":
+            raise ValueError(
+                f"Unsupported executor type '{executor_type}' for function tool "
+                f"'{self._function_name}'. Supported types: ['function', 'process']"
+            )
+
+        # Worker processes only receive picklable arguments
+        if inspect.iscoroutinefunction(func):
+            raise ValueError(
+                f"Function '{self._function_name}' is async; the process executor "
+                f"only runs sync functions."
+            )
+        if detection_result.ctx_facade_param_name:
+            raise ValueError(
+                f"Function '{self._function_name}' takes a ToolContextFacade, which "
+                f"cannot be passed to the process executor."
+            )
+        tool_context_param = inspect.signature(func).parameters.get("tool_context")
+        if tool_context_param is not None and tool_context_param.default is inspect.Parameter.empty:
+            raise ValueError(
+                f"Function '{self._function_name}' requires tool_context, which "
+                f"cannot be passed to the process executor."
+            )
+
+        accepts_tool_config = "tool_config" in inspect.signature(func).parameters
+        return create_executor(
+            "process",
+            module=self._module_path,
+            function_name=self._function_name,
+            base_path=self._base_path,
+            pass_tool_config=self._pass_tool_config and accepts_tool_config,
+            **executor_options,
+        )
+
     def _load_class_based_tools(
         self, component: "SamAgentComponent"
     ) -> List[DynamicTool]:
@@ -41,6 +41,13 @@ class PythonToolConfig(BaseToolConfig):
         description="Name of the lifecycle cleanup function in the same component_module.",
     )
     raw_string_args: List[str] = Field(default_factory=list)
+    executor: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description=(
+            "Executor settings for function tools. Use {type: process, ...} to run "
+            "CPU-bound functions in a pool of worker processes."
+        ),
+    )
 
 
 class McpToolConfig(BaseToolConfig):
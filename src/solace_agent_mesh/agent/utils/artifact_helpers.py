@@ -25,6 +25,7 @@ from ...common.constants import (
     ARTIFACT_TAG_USER_UPLOADED,
 )
 from ...agent.utils.context_helpers import get_original_session_id
+from ..adk.artifacts.artifact_catalog import ArtifactCatalog, ArtifactCatalogEntry
 
 if TYPE_CHECKING:
     from google.adk.tools import ToolContext
@@ -368,6 +369,49 @@ def _infer_schema(
     return schema_info
 
 
+def _get_artifact_catalog(
+    artifact_service: BaseArtifactService, app_name: str
+) -> Optional[Tuple[ArtifactCatalog, str]]:
+    """
+    Returns the metadata catalog configured on the artifact service together
+    with the scoped app_name its rows are keyed by, or None without a catalog.
+    """
+    catalog = getattr(artifact_service, "artifact_catalog", None)
+    if not isinstance(catalog, ArtifactCatalog):
+        return None
+    scoped_app_name = getattr(artifact_service, "scoped_app_name", None)
+    return catalog, scoped_app_name(app_name) if scoped_app_name else app_name
+
+
+async def _write_through_catalog(
+    artifact_service: BaseArtifactService,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    filename: str,
+    version: int,
+    metadata: Dict[str, Any],
+    log_identifier: str,
+) -> None:
+    """Records a saved artifact version in the catalog, if one is configured."""
+    catalog_scope = _get_artifact_catalog(artifact_service, app_name)
+    if catalog_scope is None:
+        return
+    catalog, scoped_app_name = catalog_scope
+    entry = ArtifactCatalogEntry.from_metadata(
+        filename, version, metadata, is_internal=is_internal_artifact(filename)
+    )
+    try:
+        await asyncio.to_thread(
+            catalog.upsert, scoped_app_name, user_id, session_id, entry
+        )
+    except Exception as e:
+        # The store stays the source of truth; reconcile repairs the catalog.
+        log.warning(
+            "%s Failed to update the artifact catalog: %s", log_identifier, e
+        )
+
+
 async def save_artifact_with_metadata(
     artifact_service: BaseArtifactService,
     app_name: str,
@@ -589,6 +633,16 @@ async def save_artifact_with_metadata(
             )
             status = "success"
             status_message = "Artifact and metadata saved successfully."
+            await _write_through_catalog(
+                artifact_service,
+                app_name,
+                user_id,
+                session_id,
+                filename,
+                data_version,
+                final_metadata,
+                log_identifier,
+            )
         except Exception as meta_save_err:
             log.exception(
                 "%s Failed to save metadata artifact '%s': %s",
@@ -617,6 +671,140 @@ async def save_artifact_with_metadata(
     }
 
 
+async def copy_artifact_with_metadata(
+    artifact_service: BaseArtifactService,
+    app_name: str,
+    source_user_id: str,
+    source_session_id: str,
+    user_id: str,
+    session_id: str,
+    filename: str,
+    metadata_updates: Optional[Dict[str, Any]] = None,
+    reference: bool = False,
+) -> Dict[str, Any]:
+    """
+    Copies the latest version of an artifact and its metadata artifact to
+    another session.
+
+    When the artifact service implements `copy_artifact`, the content is copied
+    by the storage backend (or referenced, with `reference=True`) and only the
+    metadata passes through this process. Otherwise the content is loaded and
+    saved again with save_artifact_with_metadata.
+
+    Returns:
+        The save_artifact_with_metadata result dictionary.
+    """
+    log_identifier = f"[ArtifactHelper:copy:{filename}]"
+    loaded_metadata = await load_artifact_content_or_metadata(
+        artifact_service=artifact_service,
+        app_name=app_name,
+        user_id=source_user_id,
+        session_id=source_session_id,
+        filename=filename,
+        load_metadata_only=True,
+        version="latest",
+    )
+    metadata = (
+        loaded_metadata.get("metadata", {})
+        if loaded_metadata.get("status") == "success"
+        else None
+    )
+    metadata_filename = f"{filename}{METADATA_SUFFIX}"
+
+    copy_method = getattr(artifact_service, "copy_artifact", None)
+    if copy_method is not None and metadata is not None:
+        try:
+            data_version = await copy_method(
+                app_name=app_name,
+                source_user_id=source_user_id,
+                source_session_id=source_session_id,
+                source_filename=filename,
+                user_id=user_id,
+                session_id=session_id,
+                reference=reference,
+            )
+        except NotImplementedError:
+            log.debug(
+                "%s Artifact service cannot copy; loading and saving instead.",
+                log_identifier,
+            )
+        else:
+            if data_version is None:
+                return {
+                    "status": "error",
+                    "data_filename": filename,
+                    "data_version": None,
+                    "metadata_filename": metadata_filename,
+                    "metadata_version": None,
+                    "message": f"Artifact '{filename}' not found in source session.",
+                }
+            copied_metadata = {**metadata, **(metadata_updates or {})}
+            metadata_bytes = json.dumps(copied_metadata, indent=2).encode("utf-8")
+            metadata_version = await artifact_service.save_artifact(
+                app_name=app_name,
+                user_id=user_id,
+                session_id=session_id,
+                filename=metadata_filename,
+                artifact=adk_types.Part.from_bytes(
+                    data=metadata_bytes, mime_type="application/json"
+                ),
+            )
+            log.info(
+                "%s Copied artifact to version %s in storage (reference=%s).",
+                log_identifier,
+                data_version,
+                reference,
+            )
+            await _write_through_catalog(
+                artifact_service,
+                app_name,
+                user_id,
+                session_id,
+                filename,
+                data_version,
+                copied_metadata,
+                log_identifier,
+            )
+            return {
+                "status": "success",
+                "data_filename": filename,
+                "data_version": data_version,
+                "metadata_filename": metadata_filename,
+                "metadata_version": metadata_version,
+                "message": "Artifact and metadata copied successfully.",
+            }
+
+    loaded_artifact = await load_artifact_content_or_metadata(
+        artifact_service=artifact_service,
+        app_name=app_name,
+        user_id=source_user_id,
+        session_id=source_session_id,
+        filename=filename,
+        return_raw_bytes=True,
+        version="latest",
+    )
+    if loaded_artifact.get("status") != "success":
+        return {
+            "status": "error",
+            "data_filename": filename,
+            "data_version": None,
+            "metadata_filename": metadata_filename,
+            "metadata_version": None,
+            "message": loaded_artifact.get("message", "unknown error"),
+        }
+    return await save_artifact_with_metadata(
+        artifact_service=artifact_service,
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        content_bytes=loaded_artifact.get("raw_bytes"),
+        mime_type=loaded_artifact.get("mime_type"),
+        metadata_dict={**(metadata or {}), **(metadata_updates or {})},
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
 async def process_artifact_upload(
     artifact_service: BaseArtifactService,
     component: Any,
@@ -1052,6 +1240,20 @@ async def get_artifact_counts_batch(
     if not session_ids:
         return {}
 
+    catalog_scope = _get_artifact_catalog(artifact_service, app_name)
+    if catalog_scope is not None and catalog_scope[0].serve_listings:
+        catalog, scoped_app_name = catalog_scope
+        try:
+            return await asyncio.to_thread(
+                catalog.count_sessions, scoped_app_name, user_id, session_ids
+            )
+        except Exception as e:
+            log.warning(
+                "%s Artifact catalog count failed, counting from storage: %s",
+                log_prefix,
+                e,
+            )
+
     try:
         list_keys_method = getattr(artifact_service, "list_artifact_keys")
     except AttributeError:
@@ -1104,6 +1306,12 @@ async def get_artifact_info_list(
     log_prefix = f"[ArtifactHelper:get_info_list] App={app_name}, User={user_id}, Session={session_id} -"
     artifact_info_list: List[ArtifactInfo] = []
 
+    catalog_info_list = await _get_artifact_info_list_from_catalog(
+        artifact_service, app_name, user_id, session_id, log_prefix
+    )
+    if catalog_info_list is not None:
+        return catalog_info_list
+
     try:
         list_keys_method = getattr(artifact_service, "list_artifact_keys")
         keys = await list_keys_method(
@@ -1276,6 +1484,54 @@ def _metadata_to_artifact_info(
     )
 
 
+async def _get_artifact_info_list_from_catalog(
+    artifact_service: BaseArtifactService,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    log_prefix: str,
+) -> Optional[List[ArtifactInfo]]:
+    """
+    Serves a session listing from the artifact catalog with a single query.
+
+    Returns None when the catalog is not configured to serve listings or the
+    query fails, so the caller falls back to listing storage.
+    """
+    catalog_scope = _get_artifact_catalog(artifact_service, app_name)
+    if catalog_scope is None or not catalog_scope[0].serve_listings:
+        return None
+    catalog, scoped_app_name = catalog_scope
+    try:
+        entries = await asyncio.to_thread(
+            catalog.list_session, scoped_app_name, user_id, session_id
+        )
+    except Exception as e:
+        log.warning(
+            "%s Artifact catalog listing failed, listing storage: %s", log_prefix, e
+        )
+        return None
+
+    artifact_info_list: List[ArtifactInfo] = []
+    for entry in entries:
+        info = _metadata_to_artifact_info(
+            entry.filename,
+            entry.to_metadata(),
+            version=entry.latest_version,
+            version_count=entry.version_count,
+        )
+        info.uri = _format_artifact_path_uri(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=entry.filename,
+        )
+        artifact_info_list.append(info)
+    log.debug(
+        "%s Returning %d artifacts from the catalog.", log_prefix, len(artifact_info_list)
+    )
+    return artifact_info_list
+
+
 async def get_artifact_info_list_fast(
     artifact_service: BaseArtifactService,
     app_name: str,
@@ -1295,6 +1551,12 @@ async def get_artifact_info_list_fast(
     """
     log_prefix = f"[ArtifactHelper:get_info_list_fast] App={app_name}, User={user_id}, Session={session_id} -"
 
+    catalog_info_list = await _get_artifact_info_list_from_catalog(
+        artifact_service, app_name, user_id, session_id, log_prefix
+    )
+    if catalog_info_list is not None:
+        return catalog_info_list
+
     try:
         # If the service can give us filenames + latest versions in a single
         # listing pass, use that — load_artifact_content_or_metadata then skips
@@ -1414,6 +1676,80 @@ async def get_artifact_info_list_fast(
         return []
 
 
+async def reconcile_artifact_catalog(
+    artifact_service: BaseArtifactService,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+) -> Dict[str, int]:
+    """
+    Rebuilds the catalog rows of one session from the artifact store.
+
+    Artifacts saved before the catalog existed, or by code paths that bypass
+    save_artifact_with_metadata, are added; rows of artifacts that are no
+    longer stored are removed.
+
+    Returns:
+        A dictionary with the number of "upserted" and "removed" rows.
+
+    Raises:
+        ValueError: If the artifact service has no catalog configured.
+    """
+    catalog_scope = _get_artifact_catalog(artifact_service, app_name)
+    if catalog_scope is None:
+        raise ValueError("The artifact service has no artifact catalog configured.")
+    catalog, scoped_app_name = catalog_scope
+    log_prefix = f"[ArtifactHelper:reconcile] App={scoped_app_name}, User={user_id}, Session={session_id} -"
+
+    keys = await artifact_service.list_artifact_keys(
+        app_name=app_name, user_id=user_id, session_id=session_id
+    )
+    entries: List[ArtifactCatalogEntry] = []
+    for filename in keys:
+        # User-scoped keys belong to no session
+        if filename.endswith(METADATA_SUFFIX) or filename.startswith("user:"):
+            continue
+        versions = await artifact_service.list_versions(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+        )
+        if not versions:
+            continue
+        data = await load_artifact_content_or_metadata(
+            artifact_service=artifact_service,
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+            version="latest",
+            load_metadata_only=True,
+            log_identifier_prefix=log_prefix,
+        )
+        metadata = data.get("metadata", {}) if data.get("status") == "success" else {}
+        entries.append(
+            ArtifactCatalogEntry.from_metadata(
+                filename,
+                max(versions),
+                metadata,
+                version_count=len(versions),
+                is_internal=is_internal_artifact(filename),
+            )
+        )
+
+    removed = await asyncio.to_thread(
+        catalog.replace_session, scoped_app_name, user_id, session_id, entries
+    )
+    log.info(
+        "%s Reconciled %d artifacts, removed %d stale rows.",
+        log_prefix,
+        len(entries),
+        removed,
+    )
+    return {"upserted": len(entries), "removed": removed}
+
+
 async def load_artifact_content_or_metadata(
     artifact_service: BaseArtifactService,
     app_name: str,
@@ -88,6 +88,8 @@ from .protocol import (
     get_gateway_response_subscription_topic,
     get_gateway_response_topic,
     get_gateway_status_subscription_topic,
+    get_gateway_sse_fanout_topic,
+    get_gateway_sse_fanout_subscription_topic,
     get_gateway_status_topic,
     get_message_from_send_request,
     get_peer_agent_status_topic,
@@ -215,6 +217,8 @@ __all__ = [
     "get_gateway_response_subscription_topic",
     "get_gateway_response_topic",
     "get_gateway_status_subscription_topic",
+    "get_gateway_sse_fanout_topic",
+    "get_gateway_sse_fanout_subscription_topic",
     "get_gateway_status_topic",
     "get_message_from_send_request",
     "get_peer_agent_status_topic",
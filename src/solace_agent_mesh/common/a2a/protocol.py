@@ -113,6 +113,26 @@ def get_gateway_response_subscription_topic(
     return f"{get_a2a_base_topic(namespace)}/gateway/response/{self_gateway_id}/>"
 
 
+def get_gateway_sse_fanout_topic(namespace: str, group: str, task_id: str) -> str:
+    """
+    Returns the topic on which gateway replicas of a group re-publish the SSE
+    events of a task so that any replica can serve the task's stream.
+    """
+    if not group:
+        raise ValueError("Gateway group is required for SSE fan-out topic")
+    return f"{get_a2a_base_topic(namespace)}/gateway/sse/{group}/{task_id}"
+
+
+def get_gateway_sse_fanout_subscription_topic(namespace: str, group: str) -> str:
+    """
+    Returns the wildcard topic for a gateway replica to subscribe to receive the
+    SSE events re-published by the other replicas of its group.
+    """
+    if not group:
+        raise ValueError("Gateway group is required for SSE fan-out subscription")
+    return f"{get_a2a_base_topic(namespace)}/gateway/sse/{group}/>"
+
+
 def get_peer_agent_status_topic(
     namespace: str, delegating_agent_name: str, sub_task_id: str
 ) -> str:
@@ -3,15 +3,41 @@ Base registry for tracking A2A cards with health monitoring.
 Provides common functionality for AgentRegistry and GatewayRegistry.
 """
 
+import heapq
 import threading
 import time
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Callable
 import logging
 
 from a2a.types import AgentCard
 
+from .constants import EXTENSION_URI_TOOLS
+
 log = logging.getLogger(__name__)
 
+# Kinds of capability keys in the secondary index
+CAPABILITY_SKILL = "skill"
+CAPABILITY_TAG = "tag"
+CAPABILITY_TOOL = "tool"
+CAPABILITY_EXTENSION = "extension"
+
+
+def _iter_capabilities(card: AgentCard) -> Iterator[Tuple[str, str]]:
+    """Yields the (kind, value) capability keys a card is indexed under."""
+    for skill in card.skills or []:
+        yield CAPABILITY_SKILL, skill.id
+        if skill.name:
+            yield CAPABILITY_SKILL, skill.name
+        for tag in skill.tags or []:
+            yield CAPABILITY_TAG, tag
+    extensions = card.capabilities.extensions if card.capabilities else None
+    for extension in extensions or []:
+        yield CAPABILITY_EXTENSION, extension.uri
+        if extension.uri == EXTENSION_URI_TOOLS and extension.params:
+            for tool in extension.params.get("tools") or []:
+                if isinstance(tool, dict) and tool.get("name"):
+                    yield CAPABILITY_TOOL, tool["name"]
+
 
 class BaseRegistry:
     """
@@ -19,8 +45,17 @@ class BaseRegistry:
 
     Provides thread-safe storage, TTL-based health monitoring, and lifecycle callbacks.
     Subclasses should provide entity-specific method aliases for backward compatibility.
+
+    Heartbeats are also pushed on a min-heap ordered by time, so a health sweep
+    (get_expired) only touches entries older than the TTL instead of every
+    registered entity. Cards are indexed by skill, skill tag, tool name and
+    extension URI for lookups by capability.
     """
 
+    # Rebuild the expiry heap once superseded heartbeats outnumber live entries
+    # by this factor
+    _HEAP_COMPACTION_FACTOR = 4
+
     def __init__(
         self,
         entity_name: str,
@@ -39,9 +74,26 @@ class BaseRegistry:
         self._items: Dict[str, AgentCard] = {}
         self._last_seen: Dict[str, float] = {}
         self._lock = threading.Lock()
+        self._generation = 0
+        # (last_seen, item_id); entries superseded by a newer heartbeat or a
+        # removal are skipped lazily.
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._capability_index: Dict[Tuple[str, str], Set[str]] = {}
+        self._item_capabilities: Dict[str, Set[Tuple[str, str]]] = {}
         self._on_added = on_added
         self._on_removed = on_removed
 
+    @property
+    def generation(self) -> int:
+        """
+        Counter incremented whenever a card is added, changed or removed.
+
+        Heartbeats that re-register an unchanged card leave it untouched, so
+        caches derived from the registry can be keyed on it.
+        """
+        with self._lock:
+            return self._generation
+
     def set_on_added_callback(self, callback: Callable[[AgentCard], None]):
         """Sets the callback function to be called when a new entity is added."""
         self._on_added = callback
@@ -68,11 +120,16 @@ class BaseRegistry:
             return False
 
         with self._lock:
-            is_new = card.name not in self._items
+            existing = self._items.get(card.name)
+            is_new = existing is None
             current_time = time.time()
 
+            if is_new or existing != card:
+                self._generation += 1
+                self._reindex(card.name, card)
             self._items[card.name] = card
             self._last_seen[card.name] = current_time
+            self._push_heartbeat(card.name, current_time)
 
         if is_new and self._on_added:
             try:
@@ -167,6 +224,81 @@ class BaseRegistry:
 
             return is_expired, time_since_last_seen
 
+    def get_expired(self, ttl_seconds: int) -> List[Tuple[str, int]]:
+        """
+        Returns the entities whose last heartbeat is older than the TTL.
+
+        Only heap entries older than the TTL are visited, so a sweep costs
+        O(expired log n) rather than O(n). Expired entities stay registered
+        (and are reported again) until the caller removes them.
+
+        Args:
+            ttl_seconds: The TTL in seconds
+
+        Returns:
+            List of (item_id, seconds_since_last_seen), oldest first
+        """
+        current_time = time.time()
+        cutoff = current_time - ttl_seconds
+        expired: List[Tuple[float, str]] = []
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] < cutoff:
+                last_seen, item_id = heapq.heappop(heap)
+                if self._last_seen.get(item_id) == last_seen:
+                    expired.append((last_seen, item_id))
+            for entry in expired:
+                heapq.heappush(heap, entry)
+
+        return [
+            (item_id, int(current_time - last_seen)) for last_seen, item_id in expired
+        ]
+
+    def find_by_skill(self, skill: str) -> List[str]:
+        """Returns the sorted IDs of entities with a skill of this ID or name."""
+        return self._find(CAPABILITY_SKILL, skill)
+
+    def find_by_tag(self, tag: str) -> List[str]:
+        """Returns the sorted IDs of entities with a skill carrying this tag."""
+        return self._find(CAPABILITY_TAG, tag)
+
+    def find_by_tool(self, tool_name: str) -> List[str]:
+        """Returns the sorted IDs of entities advertising this tool."""
+        return self._find(CAPABILITY_TOOL, tool_name)
+
+    def find_by_extension(self, uri: str) -> List[str]:
+        """Returns the sorted IDs of entities declaring this extension URI."""
+        return self._find(CAPABILITY_EXTENSION, uri)
+
+    def _find(self, kind: str, value: str) -> List[str]:
+        with self._lock:
+            return sorted(self._capability_index.get((kind, value), ()))
+
+    def _reindex(self, item_id: str, card: Optional[AgentCard]) -> None:
+        # Caller holds the lock
+        for key in self._item_capabilities.pop(item_id, ()):
+            holders = self._capability_index.get(key)
+            if holders is not None:
+                holders.discard(item_id)
+                if not holders:
+                    del self._capability_index[key]
+        if card is None:
+            return
+        keys = set(_iter_capabilities(card))
+        for key in keys:
+            self._capability_index.setdefault(key, set()).add(item_id)
+        self._item_capabilities[item_id] = keys
+
+    def _push_heartbeat(self, item_id: str, last_seen: float) -> None:
+        # Caller holds the lock
+        heap = self._expiry_heap
+        heapq.heappush(heap, (last_seen, item_id))
+        if len(heap) > self._HEAP_COMPACTION_FACTOR * len(self._last_seen) + 64:
+            self._expiry_heap = [
+                (seen, key) for key, seen in self._last_seen.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
     def remove(self, item_id: str) -> bool:
         """
         Removes an entity from the registry.
@@ -202,6 +334,8 @@ class BaseRegistry:
             del self._items[item_id]
             if item_id in self._last_seen:
                 del self._last_seen[item_id]
+            self._reindex(item_id, None)
+            self._generation += 1
 
         if self._on_removed:
             try:
@@ -223,6 +357,11 @@ class BaseRegistry:
             count = len(self._items)
             self._items.clear()
             self._last_seen.clear()
+            self._expiry_heap.clear()
+            self._capability_index.clear()
+            self._item_capabilities.clear()
+            if count > 0:
+                self._generation += 1
         if count > 0:
             log.info("Cleared %d %s(s) from registry", count, self._entity_name)
 
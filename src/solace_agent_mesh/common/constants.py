@@ -14,6 +14,7 @@ TEXT_ARTIFACT_CONTEXT_DEFAULT_LENGTH = (
 # Extension URIs
 EXTENSION_URI_SCHEMAS = "https://solace.com/a2a/extensions/sam/schemas"
 EXTENSION_URI_AGENT_TYPE = "https://solace.com/a2a/extensions/agent-type"
+EXTENSION_URI_TOOLS = "https://solace.com/a2a/extensions/sam/tools"
 
 # System artifact tags (prefixed with __ to distinguish from user tags)
 ARTIFACT_TAG_USER_UPLOADED = "__user_uploaded"
@@ -6,8 +6,10 @@ and determining feature availability. The default implementation provides passth
 behavior that allows all operations.
 """
 
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 log = logging.getLogger(__name__)
 
@@ -137,3 +139,27 @@ class ConfigResolver:
             len(available_options),
         )
         return available_options
+
+    @staticmethod
+    def get_user_config_fingerprint(user_config: Dict[str, Any]) -> Optional[str]:
+        """
+        Return a stable fingerprint of everything in the user configuration
+        that can change the outcome of validate_operation_config.
+
+        Users with equal fingerprints may share cached, permission-filtered
+        responses. The default implementation hashes the whole configuration;
+        resolvers that validate on a subset (such as the user's scopes) can
+        return a fingerprint of that subset so more users share entries.
+
+        Args:
+            user_config: User-specific configuration from resolve_user_config
+
+        Returns:
+            A fingerprint string, or None if the configuration cannot be
+            fingerprinted and responses must not be shared.
+        """
+        try:
+            serialized = json.dumps(user_config, sort_keys=True, default=repr)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
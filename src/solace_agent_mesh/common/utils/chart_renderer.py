@@ -0,0 +1,334 @@
+"""
+Warm, reusable Plotly/Kaleido chart renderer.
+
+Rendering a chart with Kaleido starts a Chromium subprocess, which dominates
+the cost of a single render. ChartRenderer keeps a small pool of worker
+processes (see process_pool.WarmProcessPool), each holding its own warm Kaleido
+scope, so renders run off the event loop and only the first render in a
+worker pays for browser start-up. Callers wait in the pool's queue when every
+worker is busy.
+
+Workers check their Chromium process before each render and restart it if it
+died, reset it after a failed render, and are recycled by the pool after a
+number of calls, on memory growth, or when a render times out. Worker
+processes reap their own Chromium children, and shut Chromium down when they
+are stopped.
+
+This module must stay light to import: it is the worker processes' entry point.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import signal
+import sys
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .process_pool import WarmProcessPool, WorkerCallError, WorkerCrashedError
+
+log = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT_SECONDS = 60
+DEFAULT_MAX_CALLS_PER_WORKER = 200
+DEFAULT_MAX_MEMORY_GROWTH_MB = 1024
+
+_WARMUP_FIGURE = {"data": [{"type": "bar", "x": [0], "y": [0]}]}
+
+
+class ChartRenderError(Exception):
+    """A figure could not be rendered."""
+
+
+def reap_zombie_processes() -> int:
+    """Reap any zombie child processes to prevent accumulation.
+
+    In containerized environments where PID 1 is the Python process (not init),
+    zombie child processes from Kaleido/Chromium are not automatically reaped.
+    This function calls os.waitpid() in a non-blocking loop to clean them up.
+    """
+    reaped = 0
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            reaped += 1
+        except ChildProcessError:
+            # No child processes exist
+            break
+    if reaped > 0:
+        log.debug("Reaped %d zombie child process(es).", reaped)
+    return reaped
+
+
+def _get_kaleido_scope() -> Any:
+    import plotly.io as pio
+
+    if hasattr(pio, "_kaleido") and pio._kaleido is not None:
+        return getattr(pio._kaleido, "scope", pio._kaleido)
+    if hasattr(pio, "kaleido") and hasattr(pio.kaleido, "scope"):
+        return pio.kaleido.scope
+    return None
+
+
+def cleanup_kaleido_scope() -> None:
+    """Shut down the Kaleido Chromium subprocess scope to free resources.
+
+    Kaleido 0.2.x maintains a persistent Chromium subprocess (PlotlyScope)
+    that spawns child renderer processes.
+    """
+    try:
+        scope = _get_kaleido_scope()
+        if scope is None:
+            return
+        if hasattr(scope, "_shutdown_kaleido"):
+            scope._shutdown_kaleido()
+            log.debug("Kaleido scope shut down successfully.")
+        elif hasattr(scope, "_shutdown"):
+            scope._shutdown()
+            log.debug("Kaleido scope shut down successfully.")
+        elif getattr(scope, "_proc", None) is not None:
+            scope._proc.kill()
+            scope._proc.wait()
+            scope._proc = None
+            log.debug("Kaleido subprocess terminated successfully.")
+    except Exception as e:
+        log.debug("Non-critical: Failed to clean up Kaleido scope: %s", e)
+
+
+def _kaleido_is_healthy() -> bool:
+    """False if the scope's Chromium process was started and has since exited."""
+    scope = _get_kaleido_scope()
+    proc = getattr(scope, "_proc", None) if scope is not None else None
+    return proc is None or proc.poll() is None
+
+
+def render_figure(figure: Dict[str, Any], output_format: str, **image_options: Any) -> bytes:
+    """Renders one figure dict in the current process."""
+    import plotly.io as pio
+
+    return pio.to_image(
+        figure, format=output_format, engine="kaleido", validate=False, **image_options
+    )
+
+
+# --- Worker process side -------------------------------------------------
+
+_worker_initialized = False
+
+
+def _init_worker() -> None:
+    global _worker_initialized
+    if _worker_initialized:
+        return
+    _worker_initialized = True
+
+    def _on_terminate(signum, frame):
+        cleanup_kaleido_scope()
+        reap_zombie_processes()
+        sys.exit(0)
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, _on_terminate)
+
+
+def render_figures_in_worker(
+    figures: List[Dict[str, Any]],
+    output_format: str,
+    image_options: Optional[Dict[str, Any]] = None,
+) -> List[Tuple[Optional[bytes], Optional[str]]]:
+    """
+    Worker entry point: renders figures with this worker's warm Kaleido scope.
+
+    Returns:
+        One (image bytes, None) or (None, error message) pair per figure.
+    """
+    _init_worker()
+    if not _kaleido_is_healthy():
+        log.warning("Kaleido Chromium process exited; restarting it.")
+        cleanup_kaleido_scope()
+        reap_zombie_processes()
+
+    results: List[Tuple[Optional[bytes], Optional[str]]] = []
+    for figure in figures:
+        try:
+            results.append((render_figure(figure, output_format, **(image_options or {})), None))
+        except Exception as e:
+            results.append((None, str(e) or type(e).__name__))
+            # A failed render can leave Chromium in a bad state; start fresh
+            cleanup_kaleido_scope()
+        finally:
+            reap_zombie_processes()
+    return results
+
+
+# --- Caller side ---------------------------------------------------------
+
+
+class ChartRenderer:
+    """
+    Renders Plotly figures in a pool of warm Kaleido worker processes.
+
+    Args:
+        workers: Number of worker processes (each runs its own Chromium)
+        timeout_seconds: Time allowed per figure before the worker is killed
+        max_calls_per_worker: Recycle a worker after this many calls (0 = never)
+        max_memory_growth_mb: Recycle a worker once its peak RSS has grown
+            this much (0 = never)
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        max_calls_per_worker: int = DEFAULT_MAX_CALLS_PER_WORKER,
+        max_memory_growth_mb: int = DEFAULT_MAX_MEMORY_GROWTH_MB,
+    ):
+        self.workers = workers
+        self.timeout_seconds = timeout_seconds
+        self._pool = WarmProcessPool(
+            target=f"{__name__}:render_figures_in_worker",
+            max_workers=workers,
+            preload_modules=["plotly.io", "plotly.graph_objects", "kaleido"],
+            max_calls_per_worker=max_calls_per_worker,
+            max_memory_growth_mb=max_memory_growth_mb,
+        )
+        self._started = False
+        self._start_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return dict(self._pool.stats)
+
+    async def start(self) -> None:
+        """Starts the workers and their Chromium processes."""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._started:
+                return
+            await self._pool.start()
+            # One warm-up render per worker; each call holds a worker until done
+            results = await asyncio.gather(
+                *(
+                    self._pool.call(
+                        {"figures": [_WARMUP_FIGURE], "output_format": "png"},
+                        timeout=self.timeout_seconds,
+                    )
+                    for _ in range(self.workers)
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    log.warning("[ChartRenderer] Worker warm-up failed: %s", result)
+            self._started = True
+
+    async def render(
+        self, figure: Dict[str, Any], output_format: str = "png", **image_options: Any
+    ) -> bytes:
+        """
+        Renders one figure.
+
+        Raises:
+            ChartRenderError: If rendering fails or times out
+        """
+        result = (await self.render_batch([figure], output_format, **image_options))[0]
+        if isinstance(result, ChartRenderError):
+            raise result
+        return result
+
+    async def render_batch(
+        self,
+        figures: Sequence[Dict[str, Any]],
+        output_format: str = "png",
+        **image_options: Any,
+    ) -> List[Union[bytes, ChartRenderError]]:
+        """
+        Renders several figures, spread across the workers.
+
+        Returns:
+            Image bytes or a ChartRenderError for each figure, in input order.
+        """
+        if not figures:
+            return []
+        await self.start()
+
+        group_size = math.ceil(len(figures) / self.workers)
+        groups = [list(figures[i : i + group_size]) for i in range(0, len(figures), group_size)]
+        group_results = await asyncio.gather(
+            *(self._render_group(group, output_format, image_options) for group in groups)
+        )
+        return [result for group in group_results for result in group]
+
+    async def _render_group(
+        self,
+        figures: List[Dict[str, Any]],
+        output_format: str,
+        image_options: Dict[str, Any],
+    ) -> List[Union[bytes, ChartRenderError]]:
+        timeout = self.timeout_seconds * len(figures) if self.timeout_seconds else None
+        try:
+            pairs = await self._pool.call(
+                {
+                    "figures": figures,
+                    "output_format": output_format,
+                    "image_options": image_options,
+                },
+                timeout=timeout,
+            )
+        except TimeoutError:
+            error = ChartRenderError(f"Chart rendering timed out after {timeout} seconds")
+            return [error] * len(figures)
+        except (WorkerCallError, WorkerCrashedError) as e:
+            error = ChartRenderError(f"Chart renderer failed: {e}")
+            return [error] * len(figures)
+
+        return [
+            image if error is None else ChartRenderError(error)
+            for image, error in pairs
+        ]
+
+    async def shutdown(self) -> None:
+        """Stops the workers; their Chromium processes exit with them."""
+        await self._pool.shutdown()
+        self._started = False
+
+
+# The pool's queue and locks belong to the loop that created them, and each
+# SAM component runs its own event loop, so renderers are shared per loop
+_shared_renderers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Any, ...], ChartRenderer]]" = (
+    weakref.WeakKeyDictionary()
+)
+_shared_renderers_lock = threading.Lock()
+
+
+def get_chart_renderer(renderer_config: Optional[Dict[str, Any]] = None) -> Optional[ChartRenderer]:
+    """
+    Returns the running event loop's renderer for a renderer configuration.
+
+    Must be called from a coroutine. Returns None when the renderer pool is
+    disabled, in which case callers render in-process.
+    """
+    renderer_config = renderer_config or {}
+    if not renderer_config.get("enabled", True):
+        return None
+
+    settings = (
+        int(renderer_config.get("workers", DEFAULT_WORKERS)),
+        float(renderer_config.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS)),
+        int(renderer_config.get("max_calls_per_worker", DEFAULT_MAX_CALLS_PER_WORKER)),
+        int(renderer_config.get("max_memory_growth_mb", DEFAULT_MAX_MEMORY_GROWTH_MB)),
+    )
+    loop = asyncio.get_running_loop()
+    with _shared_renderers_lock:
+        loop_renderers = _shared_renderers.setdefault(loop, {})
+        renderer = loop_renderers.get(settings)
+        if renderer is None:
+            renderer = ChartRenderer(*settings)
+            loop_renderers[settings] = renderer
+        return renderer
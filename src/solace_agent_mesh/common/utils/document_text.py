@@ -0,0 +1,358 @@
+"""
+Text extraction with citation tracking for PDF, DOCX and PPTX documents.
+
+These functions are pure (bytes in, text and metadata out) and this module
+imports nothing heavy, so it can run in conversion worker processes.
+
+License Compliance:
+- Uses pypdf (BSD-3-Clause) instead of PyMuPDF (AGPL v3)
+- python-docx (MIT License)
+- python-pptx (MIT License)
+"""
+
+import logging
+from datetime import datetime, timezone
+from io import BytesIO
+from typing import Any, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+# Conversion task kinds handled by run_conversion_task
+TASK_PDF_PAGES = "pdf_pages"
+TASK_PDF = "pdf"
+TASK_DOCX = "docx"
+TASK_PPTX = "pptx"
+
+
+def convert_pdf_to_text(pdf_bytes: bytes) -> Tuple[str, dict]:
+    """
+    Extract text from PDF using pypdf with page-level citation tracking.
+
+    IMPORTANT: Page numbers are PHYSICAL/SEQUENTIAL (1, 2, 3, ...),
+    NOT the document's internal page numbers (which may use i, ii, iii, 1, 2, etc.).
+
+    Example:
+      Physical page 1 → "page_1" (may be titled "Preface" or "i" in document)
+      Physical page 2 → "page_2" (may be "ii" in document)
+      Physical page 10 → "page_10" (may be "Page 1" in document)
+
+    This ensures consistent, unambiguous page references.
+
+    Args:
+        pdf_bytes: PDF file content as bytes
+
+    Returns:
+        Tuple of (extracted_text, conversion_metadata)
+
+        conversion_metadata includes:
+        - converter: "pypdf"
+        - page_count: number of pages
+        - char_count: total characters extracted
+        - citation_map: list of {"location": "page_N", "char_start": X, "char_end": Y}
+          where N is the physical/sequential page number (1, 2, 3, ...)
+    """
+    try:
+        pages = extract_pdf_page_texts(pdf_bytes)
+        page_count = len(pages)
+    except Exception as e:
+        log.error(f"PDF conversion failed: {e}")
+        raise ValueError(f"Failed to convert PDF: {e}") from e
+
+    return assemble_pdf_text(pages, page_count)
+
+
+def extract_pdf_page_texts(
+    pdf_bytes: bytes, start_page: int = 1, end_page: Optional[int] = None
+) -> List[Tuple[int, str]]:
+    """
+    Extract the text of a range of PDF pages.
+
+    Args:
+        pdf_bytes: PDF file content as bytes
+        start_page: First physical page to extract (1-indexed, inclusive)
+        end_page: Last physical page to extract (inclusive); defaults to the last page
+
+    Returns:
+        List of (physical page number, page text) in page order
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(BytesIO(pdf_bytes))
+    pages = reader.pages
+    last_page = len(pages) if end_page is None else min(end_page, len(pages))
+
+    return [
+        (page_num, pages[page_num - 1].extract_text())
+        for page_num in range(start_page, last_page + 1)
+    ]
+
+
+def count_pdf_pages(pdf_bytes: bytes) -> int:
+    """Return the number of pages in a PDF."""
+    from pypdf import PdfReader
+
+    return len(PdfReader(BytesIO(pdf_bytes)).pages)
+
+
+def assemble_pdf_text(pages: List[Tuple[int, str]], page_count: int) -> Tuple[str, dict]:
+    """
+    Join extracted page texts and build the page-level citation map.
+
+    Pages may come from several page-range extractions; they must be in
+    physical page order. Produces the same result as converting the whole
+    PDF in one pass.
+
+    Args:
+        pages: List of (physical page number, page text)
+        page_count: Total number of pages in the PDF
+
+    Returns:
+        Tuple of (extracted_text, conversion_metadata), see convert_pdf_to_text
+    """
+    full_text = []
+    citation_map = []
+    char_position = 0
+
+    for page_num, page_text in pages:
+        if page_text:
+            # Record citation info
+            char_start = char_position
+            char_end = char_position + len(page_text)
+
+            # Use "physical_page_N" to clarify this is sequential page number,
+            # not the document's internal page number (which may be i, ii, iii, etc.)
+            citation_map.append({
+                "location": f"physical_page_{page_num}",
+                "char_start": char_start,
+                "char_end": char_end
+            })
+
+            full_text.append(page_text)
+
+            # CRITICAL: Account for newline that will be added by "\n".join()
+            # Move position past the page text AND the newline character
+            char_position = char_end + 1  # +1 for the newline between pages
+
+    # Join with newlines (this is why we added +1 above)
+    extracted_text = "\n".join(full_text)
+
+    # IMPORTANT: Fix the last citation's char_end (no newline after last page)
+    if citation_map:
+        # The last page doesn't have a trailing newline, so subtract 1
+        citation_map[-1]["char_end"] = len(extracted_text)
+
+    metadata = {
+        "converter": "pypdf",
+        "page_count": page_count,
+        "char_count": len(extracted_text),
+        "citation_type": "page",
+        "citation_map": citation_map,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+    log.info(
+        f"PDF conversion: {page_count} pages, {len(extracted_text)} chars, "
+        f"{len(citation_map)} citations"
+    )
+
+    return extracted_text, metadata
+
+
+def convert_docx_to_text(docx_bytes: bytes) -> Tuple[str, dict]:
+    """
+    Extract text from DOCX using python-docx with paragraph-level citation tracking.
+
+    IMPORTANT: Paragraph numbers are PHYSICAL/SEQUENTIAL (1, 2, 3, ...),
+    representing the order of paragraphs in the document.
+
+    This ensures consistent, unambiguous paragraph references.
+
+    Args:
+        docx_bytes: DOCX file content as bytes
+
+    Returns:
+        Tuple of (extracted_text, conversion_metadata)
+
+        conversion_metadata includes:
+        - converter: "python-docx"
+        - paragraph_count: number of paragraphs
+        - char_count: total characters extracted
+        - citation_map: list of {"location": "physical_paragraph_N", "char_start": X, "char_end": Y}
+          where N is the physical/sequential paragraph number (1, 2, 3, ...)
+    """
+    try:
+        from docx import Document
+
+        doc = Document(BytesIO(docx_bytes))
+
+        full_text = []
+        citation_map = []
+        char_position = 0
+
+        for para_num, paragraph in enumerate(doc.paragraphs, start=1):
+            para_text = paragraph.text
+
+            if para_text.strip():  # Only include non-empty paragraphs
+                # Record citation info
+                char_start = char_position
+                char_end = char_position + len(para_text)
+
+                # Use "physical_paragraph_N" for consistency with physical_page_N
+                citation_map.append({
+                    "location": f"physical_paragraph_{para_num}",
+                    "char_start": char_start,
+                    "char_end": char_end
+                })
+
+                full_text.append(para_text)
+
+                # CRITICAL: Account for newline that will be added by "\n".join()
+                char_position = char_end + 1  # +1 for the newline between paragraphs
+
+        # Join with newlines (this is why we added +1 above)
+        extracted_text = "\n".join(full_text)
+
+        # IMPORTANT: Fix the last citation's char_end (no newline after last paragraph)
+        if citation_map:
+            citation_map[-1]["char_end"] = len(extracted_text)
+
+        metadata = {
+            "converter": "python-docx",
+            "paragraph_count": len([p for p in doc.paragraphs if p.text.strip()]),
+            "char_count": len(extracted_text),
+            "citation_type": "paragraph",
+            "citation_map": citation_map,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+
+        log.info(
+            f"DOCX conversion: {len(doc.paragraphs)} paragraphs, {len(extracted_text)} chars, "
+            f"{len(citation_map)} citations"
+        )
+
+        return extracted_text, metadata
+
+    except Exception as e:
+        log.error(f"DOCX conversion failed: {e}")
+        raise ValueError(f"Failed to convert DOCX: {e}") from e
+
+
+def convert_pptx_to_text(pptx_bytes: bytes) -> Tuple[str, dict]:
+    """
+    Extract text from PPTX using python-pptx with slide-level citation tracking.
+
+    IMPORTANT: Slide numbers are PHYSICAL/SEQUENTIAL (1, 2, 3, ...),
+    representing the physical order of slides in the presentation,
+    NOT any custom slide numbers displayed in the presentation.
+
+    Example:
+      Physical slide 1 → "physical_slide_1" (may show "Title" or no number)
+      Physical slide 2 → "physical_slide_2" (may show "Slide 1" internally)
+      Physical slide 10 → "physical_slide_10" (regardless of custom numbering)
+
+    This ensures consistent, unambiguous slide references, especially when
+    slides are hidden or custom numbering is used.
+
+    Args:
+        pptx_bytes: PPTX file content as bytes
+
+    Returns:
+        Tuple of (extracted_text, conversion_metadata)
+
+        conversion_metadata includes:
+        - converter: "python-pptx"
+        - slide_count: number of slides
+        - char_count: total characters extracted
+        - citation_map: list of {"location": "physical_slide_N", "char_start": X, "char_end": Y}
+          where N is the physical/sequential slide number (1, 2, 3, ...)
+    """
+    try:
+        from pptx import Presentation
+
+        prs = Presentation(BytesIO(pptx_bytes))
+
+        full_text = []
+        citation_map = []
+        char_position = 0
+
+        for slide_num, slide in enumerate(prs.slides, start=1):
+            slide_text_parts = []
+
+            # Extract text from all shapes in the slide
+            for shape in slide.shapes:
+                if hasattr(shape, "text") and shape.text:
+                    slide_text_parts.append(shape.text)
+
+            if slide_text_parts:
+                slide_text = "\n".join(slide_text_parts)
+
+                # Record citation info
+                char_start = char_position
+                char_end = char_position + len(slide_text)
+
+                # Use "physical_slide_N" to clarify this is sequential slide number,
+                # not any custom slide numbering that may be displayed
+                citation_map.append({
+                    "location": f"physical_slide_{slide_num}",
+                    "char_start": char_start,
+                    "char_end": char_end
+                })
+
+                full_text.append(slide_text)
+
+                # CRITICAL: Account for double newline that will be added by "\n\n".join()
+                # Move position past the slide text AND the two newline characters
+                char_position = char_end + 2  # +2 for the double newline between slides
+
+        # Join with double newlines (this is why we added +2 above)
+        extracted_text = "\n\n".join(full_text)
+
+        # IMPORTANT: Fix the last citation's char_end (no double newline after last slide)
+        if citation_map:
+            citation_map[-1]["char_end"] = len(extracted_text)
+
+        metadata = {
+            "converter": "python-pptx",
+            "slide_count": len(prs.slides),
+            "char_count": len(extracted_text),
+            "citation_type": "slide",
+            "citation_map": citation_map,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+
+        log.info(
+            f"PPTX conversion: {len(prs.slides)} slides, {len(extracted_text)} chars, "
+            f"{len(citation_map)} citations"
+        )
+
+        return extracted_text, metadata
+
+    except Exception as e:
+        log.error(f"PPTX conversion failed: {e}")
+        raise ValueError(f"Failed to convert PPTX: {e}") from e
+
+
+def run_conversion_task(
+    kind: str,
+    content: bytes,
+    start_page: int = 1,
+    end_page: Optional[int] = None,
+) -> Any:
+    """
+    Conversion worker entry point.
+
+    Returns a list of (page number, text) for TASK_PDF_PAGES, otherwise the
+    (extracted_text, conversion_metadata) tuple of the matching converter.
+    """
+    if kind == TASK_PDF_PAGES:
+        try:
+            return extract_pdf_page_texts(content, start_page, end_page)
+        except Exception as e:
+            raise ValueError(f"Failed to convert PDF: {e}") from e
+    if kind == TASK_PDF:
+        return convert_pdf_to_text(content)
+    if kind == TASK_DOCX:
+        return convert_docx_to_text(content)
+    if kind == TASK_PPTX:
+        return convert_pptx_to_text(content)
+    raise ValueError(f"Unknown conversion task: {kind}")
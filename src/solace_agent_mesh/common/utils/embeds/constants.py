@@ -29,6 +29,22 @@ EMBED_REGEX = re.compile(
     + re.escape(EMBED_DELIMITER_CLOSE)
 )
 
+# Maximum number of embeds resolved concurrently within one resolution pass
+# (override with the "embed_resolution_concurrency" config key)
+DEFAULT_EMBED_RESOLUTION_CONCURRENCY = 8
+
+# Bytes read per ranged artifact read when modifiers are streamed
+# (override with the "embed_stream_chunk_bytes" config key)
+DEFAULT_EMBED_STREAM_CHUNK_BYTES = 1024 * 1024
+
+# CSV content at least this large is parsed into a columnar table when the
+# chain starts with a tabular modifier (override with the
+# "embed_columnar_min_bytes" config key; -1 disables the columnar backend)
+DEFAULT_EMBED_COLUMNAR_MIN_BYTES = 1024 * 1024
+
+# Context key holding the per-resolution ArtifactLoadMemo
+EMBED_MEMO_CONTEXT_KEY = "_embed_artifact_memo"
+
 EARLY_EMBED_TYPES: Set[str] = {
     "math",
     "datetime",
@@ -10,6 +10,7 @@ import base64
 from typing import Any, Tuple, Optional, List, Dict
 
 from .types import DataFormat
+from .tabular import table_to_csv_string, table_to_rows
 from ..mime_helpers import is_text_based_mime_type
 
 log = logging.getLogger(__name__)
@@ -298,6 +299,17 @@ def convert_data(
             elif target_format == DataFormat.JSON_OBJECT:
                 return current_data, DataFormat.JSON_OBJECT, None
 
+        elif current_format == DataFormat.TABLE:
+            if target_format == DataFormat.STRING:
+                return table_to_csv_string(current_data), DataFormat.STRING, None
+            return convert_data(
+                table_to_rows(current_data),
+                DataFormat.LIST_OF_DICTS,
+                target_format,
+                log_id,
+                original_mime_type,
+            )
+
         error_msg = f"Unsupported conversion requested: {current_format_name} -> {target_format.name}"
         log.warning("%s %s", log_id, error_msg)
         return current_data, current_format, error_msg
@@ -395,6 +407,13 @@ def serialize_data(
                 return f"[Serialization Error: {err_msg}]", err_msg
 
         elif target_fmt_lower == "csv":
+            if data_format == DataFormat.TABLE:
+                csv_string, _, error = convert_data(
+                    data, data_format, DataFormat.STRING, log_id, "text/csv"
+                )
+                if error:
+                    return f"[Serialization Error: {error}]", error
+                return csv_string, None
             list_of_dicts, _, error1 = convert_data(
                 data, data_format, DataFormat.LIST_OF_DICTS, log_id, original_mime_type
             )
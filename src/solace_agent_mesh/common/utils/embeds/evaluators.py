@@ -3,6 +3,7 @@ Contains individual evaluator functions for different embed types
 and the mapping dictionary.
 """
 
+import asyncio
 import logging
 import json
 from datetime import datetime
@@ -12,10 +13,100 @@ from asteval import Interpreter
 import math, random
 
 from ....agent.utils.artifact_helpers import format_metadata_for_llm
-from .constants import EMBED_CHAIN_DELIMITER
+from .constants import EMBED_CHAIN_DELIMITER, EMBED_MEMO_CONTEXT_KEY
 
 log = logging.getLogger(__name__)
 
+
+class ArtifactLoadMemo:
+    """
+    Memo of artifact storage reads for one embed resolution pass.
+
+    Latest-version lookups and (filename, version) loads are issued once per
+    pass; embeds resolved concurrently share the in-flight read, including
+    its failure.
+    """
+
+    def __init__(self):
+        self._reads: Dict[Tuple[Any, ...], asyncio.Future] = {}
+
+    async def _once(self, key: Tuple[Any, ...], read: Callable[[], Any]) -> Any:
+        future = self._reads.get(key)
+        if future is None:
+            future = asyncio.ensure_future(read())
+            self._reads[key] = future
+        # Shielded so one cancelled embed does not fail the others sharing the read
+        return await asyncio.shield(future)
+
+    async def list_versions(
+        self, artifact_service: Any, app_name: str, user_id: str, session_id: str, filename: str
+    ) -> Any:
+        return await self._once(
+            ("versions", app_name, user_id, session_id, filename),
+            lambda: artifact_service.list_versions(
+                app_name=app_name,
+                user_id=user_id,
+                session_id=session_id,
+                filename=filename,
+            ),
+        )
+
+    async def load_artifact(
+        self,
+        artifact_service: Any,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        version: int,
+    ) -> Any:
+        return await self._once(
+            ("load", app_name, user_id, session_id, filename, version),
+            lambda: artifact_service.load_artifact(
+                app_name=app_name,
+                user_id=user_id,
+                session_id=session_id,
+                filename=filename,
+                version=version,
+            ),
+        )
+
+
+async def _list_versions(
+    context: Dict[str, Any], artifact_service: Any, app_name: str, user_id: str, session_id: str, filename: str
+) -> Any:
+    """Lists artifact versions through the pass memo when one is present."""
+    memo = context.get(EMBED_MEMO_CONTEXT_KEY)
+    if memo is not None:
+        return await memo.list_versions(artifact_service, app_name, user_id, session_id, filename)
+    return await artifact_service.list_versions(
+        app_name=app_name, user_id=user_id, session_id=session_id, filename=filename
+    )
+
+
+async def _load_artifact(
+    context: Dict[str, Any],
+    artifact_service: Any,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    filename: str,
+    version: int,
+) -> Any:
+    """Loads an artifact version through the pass memo when one is present."""
+    memo = context.get(EMBED_MEMO_CONTEXT_KEY)
+    if memo is not None:
+        return await memo.load_artifact(
+            artifact_service, app_name, user_id, session_id, filename, version
+        )
+    return await artifact_service.load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        version=version,
+    )
+
 MATH_SAFE_SYMBOLS = {
     # Basic math operations
     "abs": abs,
@@ -198,11 +289,8 @@ async def _evaluate_artifact_meta_embed(
         if version_str:
             version_to_load = int(version_str)
         else:
-            versions = await artifact_service.list_versions(
-                app_name=app_name,
-                user_id=user_id,
-                session_id=session_id,
-                filename=filename,
+            versions = await _list_versions(
+                context, artifact_service, app_name, user_id, session_id, filename
             )
             if not versions:
                 err_msg = f"Artifact '{filename}' not found (no versions available)"
@@ -213,12 +301,8 @@ async def _evaluate_artifact_meta_embed(
             err_msg = f"Could not determine version for artifact_meta '{filename}'"
             return f"[Error: {err_msg}]", err_msg, 0
 
-        data_artifact_part = await artifact_service.load_artifact(
-            app_name=app_name,
-            user_id=user_id,
-            session_id=session_id,
-            filename=filename,
-            version=version_to_load,
+        data_artifact_part = await _load_artifact(
+            context, artifact_service, app_name, user_id, session_id, filename, version_to_load
         )
 
         if not data_artifact_part or not data_artifact_part.inline_data:
@@ -325,11 +409,8 @@ async def _evaluate_artifact_content_embed(
                 log.warning("%s %s", log_identifier, err_msg)
                 return None, None, err_msg
         else:
-            versions = await artifact_service.list_versions(
-                app_name=app_name,
-                user_id=user_id,
-                session_id=session_id,
-                filename=filename,
+            versions = await _list_versions(
+                context, artifact_service, app_name, user_id, session_id, filename
             )
             if not versions:
                 return (
@@ -342,12 +423,8 @@ async def _evaluate_artifact_content_embed(
         if version_to_load is None:
             return None, None, f"Could not determine version for artifact '{filename}'"
 
-        artifact_part = await artifact_service.load_artifact(
-            app_name=app_name,
-            user_id=user_id,
-            session_id=session_id,
-            filename=filename,
-            version=version_to_load,
+        artifact_part = await _load_artifact(
+            context, artifact_service, app_name, user_id, session_id, filename, version_to_load
         )
 
         if not artifact_part or not artifact_part.inline_data:
@@ -6,16 +6,29 @@ import logging
 import asyncio
 import json
 import uuid
-from typing import Any, Callable, Dict, Optional, Set, Tuple, List, Union
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple, List, Union
 from .constants import (
     EMBED_REGEX,
     EMBED_DELIMITER_OPEN,
     EMBED_DELIMITER_CLOSE,
     EARLY_EMBED_TYPES,
     LATE_EMBED_TYPES,
+    DEFAULT_EMBED_RESOLUTION_CONCURRENCY,
+    EMBED_MEMO_CONTEXT_KEY,
+)
+from .evaluators import (
+    EMBED_EVALUATORS,
+    ArtifactLoadMemo,
+    _evaluate_artifact_content_embed,
 )
-from .evaluators import EMBED_EVALUATORS, _evaluate_artifact_content_embed
 from .modifiers import MODIFIER_DEFINITIONS, _parse_modifier_chain
+from .streaming import ArtifactStreamError, stream_modifier_prefix
+from .tabular import (
+    TABLE_MODIFIERS,
+    apply_table_modifier,
+    columnar_enabled,
+    parse_csv_table,
+)
 from .converter import (
     convert_data,
     serialize_data,
@@ -41,12 +54,17 @@ def _log_data_state(
     data_size = "N/A"
     data_preview = "N/A"
 
-    if isinstance(data, (bytes, str, list)):
+    if data_format == DataFormat.TABLE:
+        data_size = f"{len(data)} rows"
+    elif isinstance(data, (bytes, str, list)):
         data_size = str(len(data))
     elif isinstance(data, dict):
         data_size = f"{len(data)} keys"
 
-    if isinstance(data, bytes):
+    if data_format == DataFormat.TABLE:
+        columns = list(data.columns)
+        data_preview = f"Table[{len(data)} rows x {len(columns)} columns] (Columns: {columns[:5]}{'...' if len(columns) > 5 else ''})"
+    elif isinstance(data, bytes):
         try:
             data_preview = data[:100].decode("utf-8", errors="replace") + (
                 "..." if len(data) > 100 else ""
@@ -76,30 +94,58 @@ def _log_data_state(
     )
 
 
-async def _evaluate_artifact_content_embed_with_chain(
-    artifact_spec_from_directive: str,
-    modifiers_from_directive: List[Tuple[str, str]],
-    output_format_from_directive: Optional[str],
+def _with_artifact_memo(context: Any) -> Any:
+    """Returns the context with a per-pass ArtifactLoadMemo, adding one if missing."""
+    if isinstance(context, dict) and EMBED_MEMO_CONTEXT_KEY not in context:
+        return {**context, EMBED_MEMO_CONTEXT_KEY: ArtifactLoadMemo()}
+    return context
+
+
+async def _run_bounded(
+    calls: List[Callable[[], Awaitable[Any]]], config: Optional[Dict]
+) -> List[Any]:
+    """
+    Runs independent embed resolutions concurrently, at most
+    `embed_resolution_concurrency` at a time, returning results in call order.
+    """
+    if len(calls) <= 1:
+        return [await call() for call in calls]
+
+    limit = (config or {}).get(
+        "embed_resolution_concurrency", DEFAULT_EMBED_RESOLUTION_CONCURRENCY
+    )
+    semaphore = asyncio.Semaphore(max(1, int(limit)))
+
+    async def run(call: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await call()
+
+    tasks = [asyncio.ensure_future(run(call)) for call in calls]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def _load_and_prepare_artifact_data(
+    parsed_artifact_spec: str,
     context: Any,
     log_identifier: str,
-    resolution_mode: "ResolutionMode",
-    config: Optional[Dict] = None,
-    current_depth: int = 0,
-    visited_artifacts: Optional[Set[Tuple[str, int]]] = None,
-) -> Union[Tuple[str, Optional[str], int], Tuple[None, str, Any]]:
+    config: Optional[Dict],
+    current_depth: int,
+    visited_artifacts: Set[Tuple[str, int]],
+    modifiers: Optional[List[Tuple[str, str]]] = None,
+) -> Tuple[Any, Optional[DataFormat], Optional[str], Optional[Tuple[str, str, int]]]:
     """
     Loads artifact content, recursively resolves its internal embeds if text-based,
-    applies a chain of modifiers, and serializes the final result.
+    and pre-parses JSON, YAML or CSV content for the modifier chain.
+    Large CSV content is parsed into a columnar table when the chain starts
+    with a tabular modifier (see tabular.py).
+    Returns (data, data_format, mime_type, None) on success,
+    or (None, None, None, error_result) on failure.
     """
-    log.info(
-        "%s [Depth:%d] Starting chain execution for artifact directive: %s",
-        log_identifier,
-        current_depth,
-        artifact_spec_from_directive,
-    )
-    visited_artifacts = visited_artifacts or set()
-    parsed_artifact_spec = artifact_spec_from_directive
-
     loaded_content_bytes, original_mime_type, load_error = (
         await _evaluate_artifact_content_embed(
             parsed_artifact_spec, context, log_identifier, config
@@ -115,12 +161,12 @@ async def _evaluate_artifact_content_embed_with_chain(
             load_error,
         )
         err_str = f"[Error loading artifact '{parsed_artifact_spec}': {load_error}]"
-        return err_str, load_error, len(err_str.encode("utf-8"))
+        return None, None, None, (err_str, load_error, len(err_str.encode("utf-8")))
 
     if loaded_content_bytes is None:
         err_msg = f"Internal error - Artifact load for '{parsed_artifact_spec}' returned None content without error."
         log.error("%s %s", log_identifier, err_msg)
-        return f"[Error: {err_msg}]", err_msg, 0
+        return None, None, None, (f"[Error: {err_msg}]", err_msg, 0)
 
     current_data: Any = loaded_content_bytes
     current_format: DataFormat = DataFormat.BYTES
@@ -189,11 +235,11 @@ async def _evaluate_artifact_content_embed_with_chain(
         except UnicodeDecodeError as ude:
             err_msg = f"Failed to decode text-based artifact '{parsed_artifact_spec}' for recursion: {ude}"
             log.warning("%s %s", log_identifier, err_msg)
-            return f"[Error: {err_msg}]", err_msg, 0
+            return None, None, None, (f"[Error: {err_msg}]", err_msg, 0)
         except Exception as recurse_err:
             err_msg = f"Error during recursive resolution of '{parsed_artifact_spec}': {recurse_err}"
             log.exception("%s %s", log_identifier, err_msg)
-            return f"[Error: {err_msg}]", err_msg, 0
+            return None, None, None, (f"[Error: {err_msg}]", err_msg, 0)
     else:
         log.debug(
             "%s [Depth:%d] Artifact '%s' is not text-based (%s). Passing raw bytes to modifier chain.",
@@ -244,25 +290,41 @@ async def _evaluate_artifact_content_embed_with_chain(
                     original_mime_type,
                 )
         elif "csv" in normalized_mime_type:
-            parsed_data, error_msg = _parse_string_to_list_of_dicts(
-                current_data, original_mime_type, log_identifier
-            )
-            if error_msg is None and parsed_data is not None:
-                current_data = parsed_data
-                current_format = DataFormat.LIST_OF_DICTS
+            table = None
+            if (
+                modifiers
+                and modifiers[0][0] in TABLE_MODIFIERS
+                and columnar_enabled(len(current_data), config)
+            ):
+                table = parse_csv_table(current_data, log_identifier)
+            if table is not None:
+                current_data = table
+                current_format = DataFormat.TABLE
                 log.info(
-                    "%s [Depth:%d] Pre-parsed string as LIST_OF_DICTS from CSV.",
+                    "%s [Depth:%d] Pre-parsed string as columnar TABLE from CSV.",
                     log_identifier,
                     current_depth,
                 )
             else:
-                log.warning(
-                    "%s [Depth:%d] Failed to pre-parse as CSV despite MIME type '%s': %s. Content will be treated as STRING.",
-                    log_identifier,
-                    current_depth,
-                    original_mime_type,
-                    error_msg,
+                parsed_data, error_msg = _parse_string_to_list_of_dicts(
+                    current_data, original_mime_type, log_identifier
                 )
+                if error_msg is None and parsed_data is not None:
+                    current_data = parsed_data
+                    current_format = DataFormat.LIST_OF_DICTS
+                    log.info(
+                        "%s [Depth:%d] Pre-parsed string as LIST_OF_DICTS from CSV.",
+                        log_identifier,
+                        current_depth,
+                    )
+                else:
+                    log.warning(
+                        "%s [Depth:%d] Failed to pre-parse as CSV despite MIME type '%s': %s. Content will be treated as STRING.",
+                        log_identifier,
+                        current_depth,
+                        original_mime_type,
+                        error_msg,
+                    )
 
         _log_data_state(
             log_identifier,
@@ -272,8 +334,84 @@ async def _evaluate_artifact_content_embed_with_chain(
             original_mime_type,
         )
 
-    modifier_index = 0
-    for prefix, value in modifiers_from_directive:
+    return current_data, current_format, original_mime_type, None
+
+
+async def _evaluate_artifact_content_embed_with_chain(
+    artifact_spec_from_directive: str,
+    modifiers_from_directive: List[Tuple[str, str]],
+    output_format_from_directive: Optional[str],
+    context: Any,
+    log_identifier: str,
+    resolution_mode: "ResolutionMode",
+    config: Optional[Dict] = None,
+    current_depth: int = 0,
+    visited_artifacts: Optional[Set[Tuple[str, int]]] = None,
+) -> Union[Tuple[str, Optional[str], int], Tuple[None, str, Any]]:
+    """
+    Loads artifact content, recursively resolves its internal embeds if text-based,
+    applies a chain of modifiers, and serializes the final result.
+    Leading line- and row-oriented modifiers are streamed over the artifact
+    bytes when possible (see streaming.py) instead of loading it whole.
+    """
+    log.info(
+        "%s [Depth:%d] Starting chain execution for artifact directive: %s",
+        log_identifier,
+        current_depth,
+        artifact_spec_from_directive,
+    )
+    visited_artifacts = visited_artifacts or set()
+    parsed_artifact_spec = artifact_spec_from_directive
+
+    try:
+        streamed = await stream_modifier_prefix(
+            parsed_artifact_spec,
+            modifiers_from_directive,
+            context,
+            log_identifier,
+            config,
+        )
+    except ArtifactStreamError as stream_err:
+        load_error = str(stream_err)
+        log.warning(
+            "%s [Depth:%d] Error streaming artifact '%s': %s",
+            log_identifier,
+            current_depth,
+            parsed_artifact_spec,
+            load_error,
+        )
+        err_str = f"[Error loading artifact '{parsed_artifact_spec}': {load_error}]"
+        return err_str, load_error, len(err_str.encode("utf-8"))
+
+    if streamed is not None:
+        current_data = streamed.data
+        current_format = streamed.data_format
+        original_mime_type = streamed.mime_type
+        modifier_index = streamed.modifiers_applied
+        _log_data_state(
+            log_identifier,
+            f"[Depth:{current_depth}] After Streaming {modifier_index} Modifier(s)",
+            current_data,
+            current_format,
+            original_mime_type,
+        )
+    else:
+        current_data, current_format, original_mime_type, error_result = (
+            await _load_and_prepare_artifact_data(
+                parsed_artifact_spec,
+                context,
+                log_identifier,
+                config,
+                current_depth,
+                visited_artifacts,
+                modifiers_from_directive,
+            )
+        )
+        if error_result is not None:
+            return error_result
+        modifier_index = 0
+
+    for prefix, value in modifiers_from_directive[modifier_index:]:
         modifier_index += 1
         modifier_step_id = f"Modifier {modifier_index} ({prefix})"
 
@@ -283,6 +421,26 @@ async def _evaluate_artifact_content_embed_with_chain(
             log.warning("%s %s", log_identifier, err_msg)
             return f"[Error: {err_msg}]", err_msg, 0
 
+        if current_format == DataFormat.TABLE and prefix in TABLE_MODIFIERS:
+            table_result = apply_table_modifier(current_data, prefix, value)
+            if table_result is not None:
+                current_data = table_result
+                log.info(
+                    "%s [Depth:%d][%s] Modifier '%s' executed on columnar table.",
+                    log_identifier,
+                    current_depth,
+                    modifier_step_id,
+                    prefix,
+                )
+                _log_data_state(
+                    log_identifier,
+                    f"[Depth:{current_depth}] {modifier_step_id} - After Execution",
+                    current_data,
+                    current_format,
+                    original_mime_type,
+                )
+                continue
+
         modifier_func = modifier_def["function"]
         accepts_formats: List[DataFormat] = modifier_def["accepts"]
         produces_format: DataFormat = modifier_def["produces"]
@@ -540,32 +698,51 @@ async def resolve_embeds_in_string(
         "%s Checking for embeds in text: '%s'", log_identifier, text[:200] + "..."
     )
 
-    for match in EMBED_REGEX.finditer(text):
+    context = _with_artifact_memo(context)
+    matches = list(EMBED_REGEX.finditer(text))
+    to_resolve = [
+        match for match in matches if match.group(1) in types_to_resolve
+    ]
+    for match in to_resolve:
+        log.info(
+            "%s Found embed type '%s' to resolve: expr='%s', fmt='%s', types_to_resolve=%s",
+            log_identifier,
+            match.group(1),
+            match.group(2),
+            match.group(3),
+            types_to_resolve,
+        )
+
+    # Embeds are independent, so resolve them concurrently; results are
+    # applied below in their original order.
+    resolved_values = await _run_bounded(
+        [
+            lambda match=match: resolver_func(
+                match.group(1),
+                match.group(2),
+                match.group(3),
+                context,
+                log_identifier,
+                resolution_mode,
+                config,
+            )
+            for match in to_resolve
+        ],
+        config,
+    )
+    resolved_by_start = {
+        match.start(): value for match, value in zip(to_resolve, resolved_values, strict=True)
+    }
+
+    for match in matches:
         start, end = match.span()
         embed_type = match.group(1)
         expression = match.group(2)
-        format_spec = match.group(3)
 
         resolved_parts.append(text[last_end:start])
 
         if embed_type in types_to_resolve:
-            log.info(
-                "%s Found embed type '%s' to resolve: expr='%s', fmt='%s', types_to_resolve=%s",
-                log_identifier,
-                embed_type,
-                expression,
-                format_spec,
-                types_to_resolve,
-            )
-            resolved_value = await resolver_func(
-                embed_type,
-                expression,
-                format_spec,
-                context,
-                log_identifier,
-                resolution_mode,
-                config,
-            )
+            resolved_value = resolved_by_start[start]
 
             if (
                 isinstance(resolved_value, tuple)
@@ -728,11 +905,47 @@ async def resolve_embeds_recursively_in_string(
     resolved_parts = []
     last_end = 0
 
-    for match in EMBED_REGEX.finditer(text):
+    context = _with_artifact_memo(context)
+    matches = list(EMBED_REGEX.finditer(text))
+    to_resolve = [
+        match for match in matches if match.group(1) in types_to_resolve
+    ]
+    for match in to_resolve:
+        log.debug(
+            "%s [Depth:%d] Found embed '%s' to resolve: expr='%s', fmt='%s'",
+            log_identifier,
+            current_depth,
+            match.group(1),
+            match.group(2),
+            match.group(3),
+        )
+
+    # Resolve concurrently; size limits are applied below in original order
+    resolved_values = await _run_bounded(
+        [
+            lambda match=match: resolver_func(
+                match.group(1),
+                match.group(2),
+                match.group(3),
+                context,
+                log_identifier,
+                resolution_mode,
+                config,
+                current_depth,
+                visited_artifacts,
+            )
+            for match in to_resolve
+        ],
+        config,
+    )
+    resolved_by_start = {
+        match.start(): value for match, value in zip(to_resolve, resolved_values, strict=True)
+    }
+
+    for match in matches:
         start, end = match.span()
         embed_type = match.group(1)
         expression = match.group(2)
-        format_spec = match.group(3)
 
         resolved_parts.append(text[last_end:start])
 
@@ -741,26 +954,7 @@ async def resolve_embeds_recursively_in_string(
             last_end = end
             continue
 
-        log.debug(
-            "%s [Depth:%d] Found embed '%s' to resolve: expr='%s', fmt='%s'",
-            log_identifier,
-            current_depth,
-            embed_type,
-            expression,
-            format_spec,
-        )
-
-        resolved_value = await resolver_func(
-            embed_type,
-            expression,
-            format_spec,
-            context,
-            log_identifier,
-            resolution_mode,
-            config,
-            current_depth,
-            visited_artifacts,
-        )
+        resolved_value = resolved_by_start[start]
 
         if (
             isinstance(resolved_value, tuple)
@@ -0,0 +1,514 @@
+"""
+Streaming execution of leading line- and row-oriented modifiers.
+
+A chain such as `head:10` or `slice_rows:0:20 >>> select_cols:a,b` only needs a
+small part of an artifact, but the materializing chain executor decodes the
+whole artifact, resolves its embeds and parses it before the first modifier
+runs. This module pushes those leading modifiers down into a reader over the
+artifact bytes: text is decoded incrementally, split into lines (or CSV rows)
+and fed through the modifiers one item at a time, and reading stops as soon as
+no further input can reach the output. `tail` on its own reads backwards from
+the end of the artifact.
+
+Reads are ranged when the artifact service provides `load_artifact_range`;
+otherwise the artifact is loaded once (through the pass memo) and scanned
+without being decoded or parsed in full.
+
+Whenever the streamed result could differ from the materialized one the
+caller falls back to the full chain: the mime type is not plain text or CSV,
+a modifier argument is one the modifier itself would reject, a consumed line
+contains embed or template delimiters (which recursive resolution could
+expand), the content does not decode or parse, or a storage read fails (so the
+error is reported the same way). Row chains over large CSV
+that would have to read every row are left to the columnar backend
+(see tabular.py).
+"""
+
+import codecs
+import csv
+import io
+import logging
+import re
+from collections import deque
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ..mime_helpers import is_text_based_mime_type
+from .constants import (
+    DEFAULT_EMBED_STREAM_CHUNK_BYTES,
+    EMBED_DELIMITER_CLOSE,
+    EMBED_DELIMITER_OPEN,
+)
+from .evaluators import _list_versions, _load_artifact
+from .tabular import columnar_enabled
+from .types import DataFormat
+
+log = logging.getLogger(__name__)
+
+LINE_MODIFIERS = frozenset({"grep", "head", "tail", "slice_lines"})
+ROW_MODIFIERS = frozenset({"slice_rows", "select_cols", "filter_rows_eq"})
+STREAMABLE_MODIFIERS = LINE_MODIFIERS | ROW_MODIFIERS
+
+_SKIP = object()
+
+
+class ArtifactStreamError(Exception):
+    """The artifact cannot be streamed for a reason the full chain would also hit."""
+
+
+class StreamedPrefix(NamedTuple):
+    """Result of streaming the leading modifiers of a chain."""
+
+    data: Any
+    data_format: DataFormat
+    mime_type: str
+    modifiers_applied: int
+
+
+class _Fallback(Exception):
+    """The streamed result could differ from the materialized one."""
+
+
+class _StopStream(Exception):
+    """No further input can reach the output."""
+
+
+class _ArtifactSource:
+    """Byte reads of one artifact version, ranged when the service supports them."""
+
+    def __init__(
+        self,
+        context: Dict[str, Any],
+        artifact_service: Any,
+        session: Tuple[str, str, str],
+        filename: str,
+        version: int,
+    ):
+        self._context = context
+        self._artifact_service = artifact_service
+        self._session = session
+        self._filename = filename
+        self._version = version
+        self._load_range = getattr(artifact_service, "load_artifact_range", None)
+        self._content: Optional[bytes] = None
+        self.total_size = 0
+        self.mime_type: Optional[str] = None
+        self.bytes_read = 0
+
+    async def read(self, offset: int, length: Optional[int] = None) -> bytes:
+        """Reads `length` bytes at offset, or the last `-offset` bytes."""
+        app_name, user_id, session_id = self._session
+        if self._load_range is not None:
+            try:
+                result = await self._load_range(
+                    app_name=app_name,
+                    user_id=user_id,
+                    session_id=session_id,
+                    filename=self._filename,
+                    version=self._version,
+                    offset=offset,
+                    length=length,
+                )
+            except NotImplementedError:
+                self._load_range = None
+            except Exception as exc:
+                # The full chain reports storage errors in its usual form
+                raise _Fallback(f"ranged read failed: {exc}") from exc
+            else:
+                if result is None:
+                    raise _Fallback("artifact not found")
+                data, self.total_size, self.mime_type = result
+                self.bytes_read += len(data)
+                return data
+
+        if self._content is None:
+            try:
+                artifact_part = await _load_artifact(
+                    self._context,
+                    self._artifact_service,
+                    app_name,
+                    user_id,
+                    session_id,
+                    self._filename,
+                    self._version,
+                )
+            except Exception as exc:
+                raise _Fallback(f"load failed: {exc}") from exc
+            if not artifact_part or not artifact_part.inline_data:
+                raise _Fallback("artifact not found")
+            self._content = artifact_part.inline_data.data
+            self.total_size = len(self._content)
+            self.mime_type = artifact_part.inline_data.mime_type
+
+        if offset < 0:
+            data = self._content[offset:]
+        else:
+            data = self._content[offset : None if length is None else offset + length]
+        self.bytes_read += len(data)
+        return data
+
+
+def _parse_count(value: str) -> int:
+    count = int(value.strip())
+    if count < 0:
+        raise ValueError("negative count")
+    return count
+
+
+def _parse_slice(value: str) -> Tuple[int, Optional[int]]:
+    """Parses 'start:end' the way the slice modifiers do; negatives need the full data."""
+    if ":" not in value:
+        raise ValueError("missing ':'")
+    start_str, end_str = (part.strip() for part in value.split(":", 1))
+    start = int(start_str) if start_str else 0
+    end = int(end_str) if end_str else None
+    if start < 0 or (end is not None and end < 0):
+        raise ValueError("negative index")
+    return start, end
+
+
+def _slice_stage(start: int, end: Optional[int]) -> Callable[[Any], Any]:
+    index = -1
+
+    def stage(item):
+        nonlocal index
+        index += 1
+        if end is not None and index >= end:
+            raise _StopStream()
+        return item if index >= start else _SKIP
+
+    return stage
+
+
+def _column_check_stage(columns: List[str], stage: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Checks the first row's keys as select_cols/filter_rows_eq do, then runs stage."""
+    checked = False
+
+    def checked_stage(row):
+        nonlocal checked
+        if not checked:
+            if any(column not in row for column in columns):
+                # The modifier reports the missing column with the full data
+                raise _Fallback("column not found")
+            checked = True
+        return stage(row)
+
+    return checked_stage
+
+
+def _plan(
+    modifiers: List[Tuple[str, str]], allowed: frozenset
+) -> Tuple[List[Callable[[Any], Any]], Optional[int]]:
+    """
+    Builds stages for the leading modifiers that can be streamed.
+
+    Returns:
+        (stages, tail_count): stages for every planned modifier except a final
+        `tail`, whose line count is returned separately (None if not planned).
+        The number of planned modifiers is len(stages) + (tail_count is not None).
+    """
+    stages: List[Callable[[Any], Any]] = []
+    for prefix, value in modifiers:
+        if prefix not in allowed:
+            break
+        try:
+            if prefix == "head":
+                stages.append(_slice_stage(0, _parse_count(value)))
+            elif prefix == "tail":
+                return stages, _parse_count(value)
+            elif prefix in ("slice_lines", "slice_rows"):
+                stages.append(_slice_stage(*_parse_slice(value)))
+            elif prefix == "grep":
+                regex = re.compile(value)
+                stages.append(lambda line, regex=regex: line if regex.search(line) else _SKIP)
+            elif prefix == "select_cols":
+                columns = [column.strip() for column in value.split(",")]
+                stages.append(
+                    _column_check_stage(
+                        columns,
+                        lambda row, columns=columns: {c: row.get(c) for c in columns},
+                    )
+                )
+            elif prefix == "filter_rows_eq":
+                column, expected = (part.strip() for part in value.split(":", 1))
+                stages.append(
+                    _column_check_stage(
+                        [column],
+                        lambda row, column=column, expected=expected: (
+                            row if str(row.get(column)) == expected else _SKIP
+                        ),
+                    )
+                )
+        except (ValueError, re.error):
+            # Let the modifier itself report the invalid argument
+            break
+    return stages, None
+
+
+def _stops_early(modifiers: List[Tuple[str, str]]) -> bool:
+    """True if a planned slice has an end, so streaming can stop before EOF."""
+    for prefix, value in modifiers:
+        if prefix in ("head", "tail"):
+            return True
+        if prefix in ("slice_lines", "slice_rows") and _parse_slice(value)[1] is not None:
+            return True
+    return False
+
+
+def _split_lines(buffer: str, final: bool) -> Tuple[List[str], str]:
+    """Splits complete lines off the buffer with str.splitlines semantics."""
+    lines = buffer.splitlines(keepends=True)
+    if final or not lines:
+        return lines, ""
+    # The last line may be incomplete, or end in a '\r' whose '\n' is still unread
+    return lines[:-1], lines[-1]
+
+
+def _split_csv_records(buffer: str, final: bool) -> Tuple[List[str], str]:
+    """Splits complete CSV records (newlines inside quoted fields kept) off the buffer."""
+    records = []
+    record_start = position = 0
+    in_quotes = False
+    while True:
+        newline = buffer.find("\n", position)
+        if newline == -1:
+            break
+        if buffer.count('"', position, newline) % 2:
+            in_quotes = not in_quotes
+        position = newline + 1
+        if not in_quotes:
+            records.append(buffer[record_start:position])
+            record_start = position
+    rest = buffer[record_start:]
+    if final and rest:
+        records.append(rest)
+        rest = ""
+    return records, rest
+
+
+class _CsvRows:
+    """Parses batches of complete CSV records into row dicts, like csv.DictReader."""
+
+    def __init__(self):
+        self.fieldnames: Optional[List[str]] = None
+
+    def __call__(self, records: List[str]):
+        reader = csv.DictReader(io.StringIO("".join(records)), fieldnames=self.fieldnames)
+        if self.fieldnames is None:
+            self.fieldnames = reader.fieldnames
+        return reader
+
+
+def _check_no_embeds(text: str) -> None:
+    if EMBED_DELIMITER_OPEN in text or EMBED_DELIMITER_CLOSE in text:
+        # Recursive embed or template resolution could change this content
+        raise _Fallback("embed delimiters in streamed content")
+
+
+async def _stream_forward(
+    source: _ArtifactSource,
+    data: bytes,
+    rows: bool,
+    stages: List[Callable[[Any], Any]],
+    tail_count: Optional[int],
+    chunk_bytes: int,
+    check_limit: Callable[[], None],
+) -> List[Any]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    split = _split_csv_records if rows else _split_lines
+    parse_rows = _CsvRows() if rows else None
+    output = deque(maxlen=tail_count) if tail_count is not None else []
+    if tail_count == 0:
+        return []
+
+    buffer = ""
+    offset = 0
+    try:
+        while True:
+            offset += len(data)
+            final = not data or offset >= source.total_size
+            buffer += decoder.decode(data, final=final)
+            units, buffer = split(buffer, final)
+            if rows:
+                _check_no_embeds("".join(units))
+                items = parse_rows(units) if units else ()
+            else:
+                items = units
+            for item in items:
+                if not rows:
+                    _check_no_embeds(item)
+                for stage in stages:
+                    item = stage(item)
+                    if item is _SKIP:
+                        break
+                else:
+                    output.append(item)
+            if final:
+                break
+            data = await source.read(offset, chunk_bytes)
+            check_limit()
+    except _StopStream:
+        pass
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise _Fallback(str(e)) from e
+    return list(output)
+
+
+async def _stream_tail(
+    source: _ArtifactSource,
+    data: bytes,
+    count: int,
+    chunk_bytes: int,
+    check_limit: Callable[[], None],
+) -> List[str]:
+    if count == 0:
+        return []
+    chunks = [data]
+    start = source.total_size - len(data)
+    while True:
+        content = b"".join(chunks)
+        if start > 0:
+            # Drop a multi-byte character cut by the read boundary
+            skip = 0
+            while skip < min(3, len(content)) and 0x80 <= content[skip] <= 0xBF:
+                skip += 1
+            content = content[skip:]
+        try:
+            lines = content.decode("utf-8").splitlines(keepends=True)
+        except UnicodeDecodeError as e:
+            raise _Fallback(str(e)) from e
+        # With more lines than needed, the first (possibly partial) one is not kept
+        if start <= 0 or len(lines) > count:
+            break
+        length = min(chunk_bytes, start)
+        start -= length
+        chunks.insert(0, await source.read(start, length))
+        check_limit()
+
+    tail = lines[-count:]
+    for line in tail:
+        _check_no_embeds(line)
+    return tail
+
+
+async def stream_modifier_prefix(
+    artifact_spec: str,
+    modifiers: List[Tuple[str, str]],
+    context: Any,
+    log_identifier: str,
+    config: Optional[Dict] = None,
+) -> Optional[StreamedPrefix]:
+    """
+    Applies the leading streamable modifiers of a chain directly to the artifact bytes.
+
+    Returns:
+        The data after the streamed modifiers, or None when the caller must run
+        the full chain instead.
+
+    Raises:
+        ArtifactStreamError: If reading exceeds the artifact size limit
+    """
+    if not modifiers or modifiers[0][0] not in STREAMABLE_MODIFIERS:
+        return None
+    if not isinstance(context, dict):
+        return None
+    artifact_service = context.get("artifact_service")
+    session_context = context.get("session_context") or {}
+    session = (
+        session_context.get("app_name"),
+        session_context.get("user_id"),
+        session_context.get("session_id"),
+    )
+    if not artifact_service or not all(session):
+        return None
+
+    filename, _, version_str = artifact_spec.strip().partition(":")
+    if not filename:
+        return None
+    try:
+        if version_str:
+            version = int(version_str)
+        else:
+            versions = await _list_versions(
+                context, artifact_service, *session, filename
+            )
+            if not versions:
+                return None
+            version = max(versions)
+    except Exception:
+        return None
+
+    config = config or {}
+    chunk_bytes = max(
+        1, int(config.get("embed_stream_chunk_bytes", DEFAULT_EMBED_STREAM_CHUNK_BYTES))
+    )
+    limit_bytes = config.get("gateway_max_artifact_resolve_size_bytes", -1)
+    if limit_bytes >= 0:
+        # The size limit applies to the bytes actually read
+        chunk_bytes = max(1, min(chunk_bytes, limit_bytes))
+    source = _ArtifactSource(context, artifact_service, session, filename, version)
+
+    def check_limit():
+        if limit_bytes >= 0 and source.bytes_read > limit_bytes:
+            raise ArtifactStreamError(
+                f"Artifact '{filename}' v{version} exceeds maximum size limit "
+                f"({source.total_size} > {limit_bytes} bytes)"
+            )
+
+    tail_first = modifiers[0][0] == "tail"
+    try:
+        data = await source.read(-chunk_bytes if tail_first else 0, chunk_bytes)
+        check_limit()
+
+        mime_type = source.mime_type or ""
+        normalized_mime_type = mime_type.lower()
+        if not is_text_based_mime_type(mime_type) or any(
+            kind in normalized_mime_type for kind in ("json", "yaml", "yml")
+        ):
+            return None
+        rows = "csv" in normalized_mime_type
+
+        stages, tail_count = _plan(modifiers, ROW_MODIFIERS if rows else LINE_MODIFIERS)
+        applied = len(stages) + (tail_count is not None)
+        if not applied:
+            return None
+        if (
+            rows
+            and not _stops_early(modifiers[:applied])
+            and columnar_enabled(source.total_size, config)
+        ):
+            # Every row is needed; vectorized execution over the table is faster
+            return None
+
+        if tail_first:
+            result = "".join(
+                await _stream_tail(source, data, tail_count, chunk_bytes, check_limit)
+            )
+        else:
+            items = await _stream_forward(
+                source, data, rows, stages, tail_count, chunk_bytes, check_limit
+            )
+            result = items if rows else "".join(items)
+    except _Fallback as reason:
+        log.debug(
+            "%s Streaming modifiers over '%s' not possible (%s); materializing.",
+            log_identifier,
+            artifact_spec,
+            reason,
+        )
+        return None
+
+    log.info(
+        "%s Streamed %d modifier(s) over '%s' v%d: read %d of %d bytes.",
+        log_identifier,
+        applied,
+        filename,
+        version,
+        source.bytes_read,
+        source.total_size,
+    )
+    return StreamedPrefix(
+        data=result,
+        data_format=DataFormat.LIST_OF_DICTS if rows else DataFormat.STRING,
+        mime_type=mime_type,
+        modifiers_applied=applied,
+    )
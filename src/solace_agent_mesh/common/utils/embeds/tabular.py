@@ -0,0 +1,148 @@
+"""
+Columnar execution of tabular modifiers.
+
+Large CSV artifacts are parsed once into a pandas DataFrame (DataFormat.TABLE)
+instead of a dict per row, and runs of select_cols, select_fields,
+filter_rows_eq and slice_rows execute as vectorized column operations. The
+table is turned back into rows only when a row-oriented modifier or the final
+serialize_data call needs them, so only the rows that survive the chain are
+materialized.
+
+pandas is imported lazily; without it CSV content is parsed into rows as
+before. Parsing returns None for CSV the row parser would read differently
+(ragged rows, duplicate or BOM-prefixed headers, whitespace-only lines), and
+each operation returns None for an argument the row modifier would reject, so
+the chain converts the table to rows and the row modifier reports the error.
+"""
+
+import csv
+import io
+import logging
+import re
+import warnings
+from typing import Any, Dict, List, Optional
+
+from .constants import DEFAULT_EMBED_COLUMNAR_MIN_BYTES
+
+log = logging.getLogger(__name__)
+
+TABLE_MODIFIERS = frozenset(
+    {"select_cols", "select_fields", "filter_rows_eq", "slice_rows"}
+)
+
+# csv.DictReader keeps whitespace-only lines as rows; pandas skips them
+_WHITESPACE_ONLY_LINE = re.compile(r"^[ \t\f\v]+\r?$", re.MULTILINE)
+
+
+def _pandas() -> Any:
+    try:
+        import pandas
+
+        return pandas
+    except ImportError:
+        return None
+
+
+def columnar_enabled(size: int, config: Optional[Dict] = None) -> bool:
+    """True if content of this size should be parsed into a columnar table."""
+    min_bytes = (config or {}).get(
+        "embed_columnar_min_bytes", DEFAULT_EMBED_COLUMNAR_MIN_BYTES
+    )
+    return min_bytes >= 0 and size >= min_bytes and _pandas() is not None
+
+
+def parse_csv_table(text: str, log_id: str = "[Tabular]") -> Any:
+    """
+    Parses CSV text into a DataFrame of strings, matching csv.DictReader rows.
+
+    Returns:
+        The DataFrame, or None when pandas is unavailable or would not read
+        the text exactly like csv.DictReader.
+    """
+    pd = _pandas()
+    if pd is None or not text or _WHITESPACE_ONLY_LINE.search(text):
+        return None
+
+    buffer = io.StringIO(text)
+    try:
+        header = next(csv.reader(buffer), None)
+        buffer.seek(0)
+        with warnings.catch_warnings():
+            # Rows with extra fields are only a warning with index_col=False
+            warnings.simplefilter("error", pd.errors.ParserWarning)
+            table = pd.read_csv(
+                buffer, dtype=str, keep_default_na=False, index_col=False
+            )
+    except (csv.Error, ValueError, pd.errors.ParserError, pd.errors.ParserWarning) as e:
+        log.debug("%s CSV not parsed as a table: %s", log_id, e)
+        return None
+
+    # Duplicate or BOM-prefixed names are renamed by pandas, not by DictReader
+    if header != list(table.columns):
+        return None
+    # Short rows read as '' here but as None in DictReader; an empty last
+    # column is the only place they can hide
+    if len(table.columns) and (table[table.columns[-1]] == "").any():
+        return None
+    return table
+
+
+def table_to_rows(table: Any) -> List[Dict[str, Any]]:
+    """Converts a table to the list-of-dicts form used by the row modifiers."""
+    columns = list(table.columns)
+    if not columns:
+        return [{} for _ in range(len(table))]
+    return [
+        dict(zip(columns, values, strict=True))
+        for values in zip(*(table[column].tolist() for column in columns), strict=True)
+    ]
+
+
+def table_to_csv_string(table: Any) -> str:
+    """Formats a table exactly as the list-of-dicts to CSV string conversion does."""
+    if not len(table) or not len(table.columns):
+        return ""
+    return table.to_csv(index=False, lineterminator="\r\n").strip("\r\n")
+
+
+def apply_table_modifier(table: Any, prefix: str, value: str) -> Any:
+    """
+    Applies one tabular modifier to a table.
+
+    Returns:
+        The resulting table, or None when the row modifier must run instead.
+    """
+    if prefix not in TABLE_MODIFIERS:
+        return None
+    if not len(table):
+        # Every tabular modifier returns an empty list for empty input
+        return table
+
+    if prefix == "select_cols":
+        columns = [column.strip() for column in value.split(",")]
+        if any(column not in table.columns for column in columns):
+            return None
+        return table[list(dict.fromkeys(columns))]
+
+    if prefix == "select_fields":
+        fields = [field.strip() for field in value.split(",")]
+        return table[[field for field in dict.fromkeys(fields) if field in table.columns]]
+
+    if prefix == "filter_rows_eq":
+        parts = value.split(":", 1)
+        if len(parts) != 2:
+            return None
+        column, expected = parts[0].strip(), parts[1].strip()
+        if column not in table.columns:
+            return None
+        return table[table[column] == expected]
+
+    if ":" not in value:
+        return None
+    start_str, end_str = (part.strip() for part in value.split(":", 1))
+    try:
+        start = int(start_str) if start_str else 0
+        end = int(end_str) if end_str else None
+    except ValueError:
+        return None
+    return table.iloc[start:end]
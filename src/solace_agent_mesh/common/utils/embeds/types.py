@@ -21,3 +21,4 @@ class DataFormat(Enum):
     STRING = auto()
     JSON_OBJECT = auto()
     LIST_OF_DICTS = auto()
+    TABLE = auto()  # Columnar table (pandas DataFrame), see tabular.py
@@ -0,0 +1,465 @@
+"""
+Warm pool of worker processes for CPU-bound Python callables.
+
+Each worker imports its target callable (and any preload modules) once at
+start-up and then serves calls over a pipe, so CPU-heavy work runs outside the
+caller's process and never holds its GIL. Arguments and results are pickled
+with the highest protocol; bytes values above a size threshold are passed
+through shared memory instead of the pipe. Calls support a timeout, and a
+timed-out or cancelled call kills its worker. Workers are recycled after a
+number of calls or once their peak memory has grown past a limit.
+
+This module deliberately imports nothing heavy so workers start quickly.
+"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import pickle
+import sys
+import traceback
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SHARED_MEMORY_THRESHOLD_BYTES = 1024 * 1024
+DEFAULT_STARTUP_TIMEOUT_SECONDS = 60.0
+
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+class WorkerCallError(Exception):
+    """The callable raised an exception inside a worker."""
+
+    def __init__(self, message: str, remote_traceback: str = ""):
+        super().__init__(message)
+        self.remote_traceback = remote_traceback
+
+
+class WorkerCrashedError(Exception):
+    """A worker exited or could not be started."""
+
+
+@dataclass(frozen=True)
+class _SharedBytes:
+    """Placeholder for a bytes value carried in a shared memory segment."""
+
+    name: str
+    size: int
+    mutable: bool
+
+
+def _encode(value: Any, threshold: int, segments: List[shared_memory.SharedMemory]) -> Any:
+    """Moves large bytes values (in plain containers) into shared memory."""
+    if isinstance(value, (bytes, bytearray)):
+        if threshold and len(value) >= threshold:
+            segment = shared_memory.SharedMemory(create=True, size=len(value))
+            segment.buf[: len(value)] = value
+            segments.append(segment)
+            return _SharedBytes(segment.name, len(value), isinstance(value, bytearray))
+        return value
+    if type(value) is dict:
+        return {k: _encode(v, threshold, segments) for k, v in value.items()}
+    if type(value) is list:
+        return [_encode(v, threshold, segments) for v in value]
+    if type(value) is tuple:
+        return tuple(_encode(v, threshold, segments) for v in value)
+    return value
+
+
+def _decode(value: Any, unlink: bool) -> Any:
+    """Restores values encoded by _encode, optionally freeing the segments."""
+    if isinstance(value, _SharedBytes):
+        segment = shared_memory.SharedMemory(name=value.name)
+        try:
+            data = bytes(segment.buf[: value.size])
+        finally:
+            segment.close()
+            if unlink:
+                segment.unlink()
+        return bytearray(data) if value.mutable else data
+    if type(value) is dict:
+        return {k: _decode(v, unlink) for k, v in value.items()}
+    if type(value) is list:
+        return [_decode(v, unlink) for v in value]
+    if type(value) is tuple:
+        return tuple(_decode(v, unlink) for v in value)
+    return value
+
+
+def _release(segments: List[shared_memory.SharedMemory], unlink: bool) -> None:
+    for segment in segments:
+        try:
+            segment.close()
+            if unlink:
+                segment.unlink()
+        except FileNotFoundError:
+            pass
+    segments.clear()
+
+
+def _peak_rss_kb() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _resolve_target(target: str) -> Any:
+    module_name, _, attr_path = target.partition(":")
+    obj = importlib.import_module(module_name)
+    for attr in attr_path.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _worker_main(
+    conn: Any,
+    target: str,
+    base_path: Optional[str],
+    preload_modules: Sequence[str],
+    shared_memory_threshold: int,
+) -> None:
+    """Worker process loop: load the target once, then serve calls until EOF."""
+    try:
+        if base_path and base_path not in sys.path:
+            sys.path.insert(0, base_path)
+        for module_name in preload_modules:
+            importlib.import_module(module_name)
+        func = _resolve_target(target)
+    except Exception as e:
+        conn.send_bytes(pickle.dumps(("error", (f"{type(e).__name__}: {e}", traceback.format_exc()), 0)))
+        conn.close()
+        return
+
+    conn.send_bytes(pickle.dumps(("ready", None, _peak_rss_kb())))
+
+    while True:
+        try:
+            request = conn.recv_bytes()
+        except (EOFError, OSError):
+            break
+
+        segments: List[shared_memory.SharedMemory] = []
+        try:
+            kwargs = _decode(pickle.loads(request), unlink=False)
+            result = func(**kwargs)
+            if asyncio.iscoroutine(result):
+                result = asyncio.run(result)
+            reply = pickle.dumps(
+                ("ok", _encode(result, shared_memory_threshold, segments), _peak_rss_kb()),
+                protocol=_PICKLE_PROTOCOL,
+            )
+        except Exception as e:
+            _release(segments, unlink=True)
+            reply = pickle.dumps(
+                ("error", (f"{type(e).__name__}: {e}", traceback.format_exc()), _peak_rss_kb()),
+                protocol=_PICKLE_PROTOCOL,
+            )
+
+        try:
+            conn.send_bytes(reply)
+        except (EOFError, OSError):
+            _release(segments, unlink=True)
+            break
+        # The caller unlinks result segments after copying them out
+        _release(segments, unlink=False)
+
+
+def _default_start_method() -> str:
+    # forkserver avoids forking a process that runs threads and an event loop,
+    # while forking workers from a small, already-initialised server process
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return "forkserver"
+    return "spawn"
+
+
+class _Worker:
+    def __init__(self, process: Any, conn: Any, baseline_rss_kb: int):
+        self.process = process
+        self.conn = conn
+        self.baseline_rss_kb = baseline_rss_kb
+        self.peak_rss_kb = baseline_rss_kb
+        self.calls = 0
+        self.healthy = True
+
+    def stop(self) -> None:
+        """Stops the worker process; blocks briefly while it exits."""
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=5)
+
+
+class WarmProcessPool:
+    """
+    Pool of long-lived worker processes that call one target callable.
+
+    Args:
+        target: Callable to run, as "module:function"
+        max_workers: Number of worker processes
+        base_path: Directory added to sys.path in workers before importing
+        preload_modules: Modules imported once when a worker starts
+        max_calls_per_worker: Recycle a worker after this many calls (0 = never)
+        max_memory_growth_mb: Recycle a worker once its peak RSS has grown this
+            much since start-up (0 = never)
+        shared_memory_threshold_bytes: Bytes values at least this large are
+            passed through shared memory (0 = never)
+        start_method: multiprocessing start method (default: forkserver where
+            available, otherwise spawn)
+        startup_timeout_seconds: How long a worker may take to become ready
+    """
+
+    def __init__(
+        self,
+        target: str,
+        max_workers: int = 2,
+        base_path: Optional[str] = None,
+        preload_modules: Optional[Sequence[str]] = None,
+        max_calls_per_worker: int = 0,
+        max_memory_growth_mb: int = 0,
+        shared_memory_threshold_bytes: int = DEFAULT_SHARED_MEMORY_THRESHOLD_BYTES,
+        start_method: Optional[str] = None,
+        startup_timeout_seconds: float = DEFAULT_STARTUP_TIMEOUT_SECONDS,
+    ):
+        if ":" not in target:
+            raise ValueError(f"Pool target must be 'module:function', got '{target}'")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_calls_per_worker < 0 or max_memory_growth_mb < 0:
+            raise ValueError("Worker recycling limits must be non-negative")
+
+        self.target = target
+        self.max_workers = max_workers
+        self.base_path = base_path
+        self.preload_modules = list(preload_modules or [])
+        self.max_calls_per_worker = max_calls_per_worker
+        self.max_memory_growth_kb = max_memory_growth_mb * 1024
+        self.shared_memory_threshold_bytes = shared_memory_threshold_bytes
+        self.startup_timeout_seconds = startup_timeout_seconds
+
+        self._ctx = multiprocessing.get_context(start_method or _default_start_method())
+        if self._ctx.get_start_method() == "forkserver":
+            # Also makes the server inherit sys.path, so workers can import us
+            self._ctx.set_forkserver_preload([__name__])
+
+        # Holds idle workers, or None for a slot whose worker is not running
+        self._idle: Optional[asyncio.Queue] = None
+        self._workers: Set[_Worker] = set()
+        self._background: Set[asyncio.Task] = set()
+        self._closed = False
+
+        self.stats: Dict[str, int] = {
+            "calls": 0,
+            "started": 0,
+            "recycled": 0,
+            "timeouts": 0,
+            "crashed": 0,
+        }
+
+    def _ensure_slots(self) -> asyncio.Queue:
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for _ in range(self.max_workers):
+                self._idle.put_nowait(None)
+        return self._idle
+
+    async def start(self) -> None:
+        """Starts every worker up front so the first calls do not pay for it."""
+        idle = self._ensure_slots()
+        slots = [idle.get_nowait() for _ in range(idle.qsize())]
+        to_start = [slot for slot in slots if slot is None]
+        for slot in slots:
+            if slot is not None:
+                idle.put_nowait(slot)
+
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._spawn) for _ in to_start), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                log.warning("[WarmProcessPool:%s] Worker failed to start: %s", self.target, result)
+                idle.put_nowait(None)
+            else:
+                idle.put_nowait(result)
+
+    async def call(self, kwargs: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+        """
+        Calls the target with keyword arguments in a worker.
+
+        Raises:
+            TimeoutError: The call did not finish within the timeout
+            WorkerCallError: The target raised an exception
+            WorkerCrashedError: The worker died or could not be started
+        """
+        if self._closed:
+            raise RuntimeError("Process pool is shut down")
+
+        idle = self._ensure_slots()
+        worker: Optional[_Worker] = await idle.get()
+        try:
+            if worker is None:
+                worker = await asyncio.to_thread(self._spawn)
+            return await self._call_worker(worker, kwargs, timeout)
+        finally:
+            if worker is not None and worker.healthy and not self._should_recycle(worker):
+                idle.put_nowait(worker)
+            else:
+                self._replace(worker)
+
+    async def shutdown(self) -> None:
+        """Stops all workers; calls in progress fail with WorkerCrashedError."""
+        self._closed = True
+        for task in list(self._background):
+            task.cancel()
+        if self._idle is not None:
+            # Wake callers waiting for a slot; they fail instead of hanging
+            for _ in range(self.max_workers):
+                self._idle.put_nowait(None)
+        workers = list(self._workers)
+        self._workers.clear()
+        await asyncio.gather(
+            *(asyncio.to_thread(worker.stop) for worker in workers),
+            return_exceptions=True,
+        )
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                child_conn,
+                self.target,
+                self.base_path,
+                self.preload_modules,
+                self.shared_memory_threshold_bytes,
+            ),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn, 0)
+
+        try:
+            if not parent_conn.poll(self.startup_timeout_seconds):
+                raise WorkerCrashedError(
+                    f"Worker for '{self.target}' did not start within "
+                    f"{self.startup_timeout_seconds}s"
+                )
+            status, detail, rss_kb = pickle.loads(parent_conn.recv_bytes())
+        except (EOFError, OSError) as e:
+            worker.stop()
+            raise WorkerCrashedError(f"Worker for '{self.target}' exited during start-up") from e
+        except BaseException:
+            worker.stop()
+            raise
+
+        if status != "ready":
+            worker.stop()
+            raise WorkerCrashedError(f"Worker for '{self.target}' failed to start: {detail[0]}")
+
+        worker.baseline_rss_kb = worker.peak_rss_kb = rss_kb
+        self._workers.add(worker)
+        self.stats["started"] += 1
+        if self._closed:
+            self._retire(worker)
+            raise WorkerCrashedError("Process pool is shut down")
+        return worker
+
+    async def _call_worker(
+        self, worker: _Worker, kwargs: Dict[str, Any], timeout: Optional[float]
+    ) -> Any:
+        segments: List[shared_memory.SharedMemory] = []
+        try:
+            request = pickle.dumps(
+                _encode(kwargs, self.shared_memory_threshold_bytes, segments),
+                protocol=_PICKLE_PROTOCOL,
+            )
+            try:
+                worker.conn.send_bytes(request)
+                ready = await asyncio.to_thread(worker.conn.poll, timeout)
+                reply = worker.conn.recv_bytes() if ready else None
+            except (EOFError, OSError) as e:
+                worker.healthy = False
+                self.stats["crashed"] += 1
+                raise WorkerCrashedError(f"Worker for '{self.target}' exited during a call") from e
+            except BaseException:
+                # Cancelled (or failed) mid-call: the worker's state is unknown
+                worker.healthy = False
+                raise
+        finally:
+            _release(segments, unlink=True)
+
+        if reply is None:
+            worker.healthy = False
+            self.stats["timeouts"] += 1
+            raise TimeoutError(f"Call to '{self.target}' timed out after {timeout}s")
+
+        status, detail, rss_kb = pickle.loads(reply)
+        worker.calls += 1
+        worker.peak_rss_kb = rss_kb
+        self.stats["calls"] += 1
+
+        if status != "ok":
+            message, remote_traceback = detail
+            raise WorkerCallError(message, remote_traceback)
+        return _decode(detail, unlink=True)
+
+    def _should_recycle(self, worker: _Worker) -> bool:
+        if self.max_calls_per_worker and worker.calls >= self.max_calls_per_worker:
+            return True
+        if (
+            self.max_memory_growth_kb
+            and worker.peak_rss_kb - worker.baseline_rss_kb > self.max_memory_growth_kb
+        ):
+            return True
+        return False
+
+    def _retire(self, worker: _Worker) -> None:
+        self._workers.discard(worker)
+        if worker.process.is_alive():
+            worker.process.terminate()
+        try:
+            worker.conn.close()
+        except OSError:
+            pass
+
+    def _replace(self, worker: Optional[_Worker]) -> None:
+        """Stops a worker and starts its replacement in the background."""
+        if worker is not None:
+            if worker.healthy:
+                self.stats["recycled"] += 1
+            self._retire(worker)
+
+        idle = self._ensure_slots()
+        if self._closed:
+            return
+
+        async def replace() -> None:
+            if worker is not None:
+                await asyncio.to_thread(worker.stop)
+            try:
+                new_worker = await asyncio.to_thread(self._spawn)
+            except Exception as e:
+                log.warning("[WarmProcessPool:%s] Replacement worker failed to start: %s", self.target, e)
+                new_worker = None
+            idle.put_nowait(new_worker)
+
+        task = asyncio.get_running_loop().create_task(replace())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
@@ -374,6 +374,10 @@ class BaseGatewayApp(SamAppBase):
                 trust_card_topic,
             )
 
+        subscriptions.extend(
+            self._get_gateway_specific_subscriptions(resolved_app_config_block)
+        )
+
         log.info(
             "Generated Solace subscriptions for gateway '%s': %s",
             self.gateway_id,
@@ -415,6 +419,16 @@ class BaseGatewayApp(SamAppBase):
         super().__init__(app_info=modified_app_info, **kwargs)
         log.info("BaseGatewayApp '%s' initialized successfully.", self.name)
 
+    def _get_gateway_specific_subscriptions(
+        self, app_config: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns additional broker subscriptions required by a derived gateway.
+        Messages on these topics are passed to the component's
+        `_handle_gateway_specific_message`.
+        """
+        return []
+
     @abstractmethod
     def _get_gateway_component_class(self) -> Type[BaseGatewayComponent]:
         """
@@ -5,6 +5,7 @@ Base Component class for Gateway implementations in the Solace AI Connector.
 import logging
 import asyncio
 import base64
+import contextvars
 import queue
 import re
 import uuid
@@ -67,6 +68,18 @@ from ...common.middleware.registry import MiddlewareRegistry
 
 log = logging.getLogger(__name__)
 
+# Publish time (the ``timestamp`` user property) of the A2A message being
+# handled. Events forwarded to clients derive their IDs from it, so they line
+# up with the task events the task logger stores for the same message.
+_inbound_message_timestamp: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+    "inbound_message_timestamp", default=None
+)
+
+
+def get_inbound_message_timestamp() -> Optional[int]:
+    """Return the publish time of the A2A message being handled, or None."""
+    return _inbound_message_timestamp.get()
+
 info = {
     "class_name": "BaseGatewayComponent",
     "description": (
@@ -1203,6 +1216,15 @@ class BaseGatewayComponent(SamComponentBase):
                 type(parsed_event).__name__,
             )
 
+    async def _handle_gateway_specific_message(
+        self, topic: str, payload: Any
+    ) -> bool:
+        """
+        Handles messages on topics added by `_get_gateway_specific_subscriptions`
+        of the gateway app. Returns True if the message was handled.
+        """
+        return False
+
     async def _handle_discovery_message(self, payload: Dict) -> bool:
         """Handles incoming agent and gateway discovery messages."""
         try:
@@ -2306,9 +2328,16 @@ class BaseGatewayComponent(SamComponentBase):
                         )
 
                     if task_id_from_topic:
-                        processed_successfully = await self._handle_agent_event(
-                            topic, payload, task_id_from_topic
+                        published_at = (item.get("user_properties") or {}).get("timestamp")
+                        token = _inbound_message_timestamp.set(
+                            published_at if isinstance(published_at, int) else None
                         )
+                        try:
+                            processed_successfully = await self._handle_agent_event(
+                                topic, payload, task_id_from_topic
+                            )
+                        finally:
+                            _inbound_message_timestamp.reset(token)
                     else:
                         log.error(
                             "%s Could not extract task_id from topic %s for _handle_agent_event. Ignoring.",
@@ -2316,6 +2345,8 @@ class BaseGatewayComponent(SamComponentBase):
                             topic,
                         )
                         processed_successfully = False
+                elif await self._handle_gateway_specific_message(topic, payload):
+                    processed_successfully = True
                 else:
                     log.warning(
                         "%s Received message on unhandled topic: %s. Acknowledging.",
@@ -20,6 +20,12 @@ DEFAULT_MAX_BATCH_UPLOAD_SIZE_BYTES = 104857600  # 100MB - batch upload limit (s
 DEFAULT_MAX_ZIP_UPLOAD_SIZE_BYTES = 104857600  # 100MB - ZIP import limit
 DEFAULT_MAX_PROJECT_SIZE_BYTES = 104857600  # 100MB - total project size limit
 
+# ===== PROJECT EXPORT / IMPORT =====
+
+DEFAULT_PROJECT_TRANSFER_CONCURRENCY = 4  # concurrent artifact saves/conversions during project import
+PROJECT_TRANSFER_CHUNK_SIZE_BYTES = 1048576  # 1MB - chunk size for streamed export and spooled import
+PROJECT_IMPORT_SPOOL_MAX_BYTES = 8388608  # 8MB - imported ZIPs larger than this are spooled to disk
+
 # ===== FIELD LENGTH LIMITS =====
 
 DEFAULT_MAX_PROJECT_FILE_DESCRIPTION_LENGTH = 1000  # max characters for file/artifact descriptions
@@ -0,0 +1,105 @@
+"""
+Cache of serialized agent discovery responses for the WebUI.
+
+The WebUI polls `/agentCards` frequently. Building the response filters every
+agent and every scoped tool through the config resolver and serializes the
+cards, so the serialized body is cached per (registry generation, user config
+fingerprint) and served with a strong ETag that clients revalidate with
+`If-None-Match`.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class CachedAgentCardResponse:
+    """A serialized response body and its strong ETag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "CachedAgentCardResponse":
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()}"')
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluates an `If-None-Match` header against an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for `If-None-Match`, so a
+    `W/` prefix added by an intermediary still matches.
+    """
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+class AgentCardResponseCache:
+    """
+    Thread-safe LRU cache of agent card responses for one agent registry.
+
+    Entries of older registry generations are dropped as soon as a newer
+    generation is seen. The cache does not register registry callbacks, so it
+    never displaces listeners other components set on the registry.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[int, str], CachedAgentCardResponse]" = (
+            OrderedDict()
+        )
+        self._generation: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get(
+        self, generation: int, fingerprint: str
+    ) -> Optional[CachedAgentCardResponse]:
+        with self._lock:
+            if generation != self._generation:
+                return None
+            cached = self._entries.get((generation, fingerprint))
+            if cached is not None:
+                self._entries.move_to_end((generation, fingerprint))
+            return cached
+
+    def put(
+        self, generation: int, fingerprint: str, body: bytes
+    ) -> CachedAgentCardResponse:
+        cached = CachedAgentCardResponse.from_body(body)
+        with self._lock:
+            if self._generation is not None and generation < self._generation:
+                # Built from a registry snapshot that has since changed
+                return cached
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+            self._entries[(generation, fingerprint)] = cached
+            self._entries.move_to_end((generation, fingerprint))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return cached
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation = None
+        log.debug("[AgentCardResponseCache] Invalidated.")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
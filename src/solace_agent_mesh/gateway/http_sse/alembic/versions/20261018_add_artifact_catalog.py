@@ -0,0 +1,90 @@
+"""Add artifact metadata catalog
+
+Revision ID: 20261018_artifact_catalog
+Revises: 20261018_task_event_sequence
+Create Date: 2026-10-18 00:00:00.000000
+
+Creates ``artifact_catalog``, one row per artifact with its latest version and
+metadata companion, keyed by (app_name, user_id, session_id, filename). The
+gateway serves artifact listings and per-session counts from it when
+``artifact_service.catalog.serve_listings`` is enabled. The table matches
+``solace_agent_mesh.agent.adk.artifacts.artifact_catalog``; existing artifacts
+are added with ``sam artifacts reconcile``.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = '20261018_artifact_catalog'
+down_revision: Union[str, Sequence[str], None] = '20261018_task_event_sequence'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    # Components that share the database may already have created the table
+    if 'artifact_catalog' in inspector.get_table_names():
+        return
+
+    if bind.dialect.name == 'mysql':
+        _upgrade_mysql()
+    else:
+        _upgrade_standard()
+
+    op.create_index(
+        'ix_artifact_catalog_session_internal',
+        'artifact_catalog',
+        ['app_name', 'user_id', 'session_id', 'is_internal'],
+    )
+
+
+def _columns() -> list:
+    # The primary key columns total 766 characters, within MySQL's 3072-byte
+    # key limit in utf8mb4.
+    return [
+        sa.Column('app_name', sa.String(128), primary_key=True),
+        sa.Column('user_id', sa.String(255), primary_key=True),
+        sa.Column('session_id', sa.String(128), primary_key=True),
+        sa.Column('filename', sa.String(255), primary_key=True),
+        sa.Column('latest_version', sa.Integer(), nullable=False),
+        sa.Column('version_count', sa.Integer(), nullable=False),
+        sa.Column('mime_type', sa.String(255), nullable=True),
+        sa.Column('size_bytes', sa.BigInteger(), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('schema_summary', sa.JSON(), nullable=True),
+        sa.Column('source', sa.String(255), nullable=True),
+        sa.Column('tags', sa.JSON(), nullable=True),
+        sa.Column('source_project_id', sa.String(36), nullable=True),  # UUID
+        sa.Column('last_modified', sa.Float(), nullable=True),
+        sa.Column('is_internal', sa.Boolean(), nullable=False),
+        sa.Column('updated_at', sa.BigInteger(), nullable=False),
+    ]
+
+
+def _upgrade_standard() -> None:
+    """Standard upgrade for PostgreSQL and SQLite."""
+    op.create_table('artifact_catalog', *_columns())
+
+
+def _upgrade_mysql() -> None:
+    """MySQL upgrade on InnoDB with utf8mb4, which the key length budget assumes."""
+    op.create_table(
+        'artifact_catalog',
+        *_columns(),
+        mysql_engine='InnoDB',
+        mysql_charset='utf8mb4',
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if 'artifact_catalog' in inspector.get_table_names():
+        op.drop_index('ix_artifact_catalog_session_internal', table_name='artifact_catalog')
+        op.drop_table('artifact_catalog')
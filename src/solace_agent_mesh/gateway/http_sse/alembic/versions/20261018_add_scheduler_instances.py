@@ -0,0 +1,88 @@
+"""Add scheduler instance leases for multi-instance scheduling
+
+Revision ID: 20261018_scheduler_instances
+Revises: 20261018_session_search
+Create Date: 2026-10-18 00:00:00.000000
+
+Creates ``scheduler_instances``, where every live scheduler instance renews a
+lease, and adds ``instance_id`` to ``scheduled_task_executions`` so executions
+owned by an instance whose lease expired can be recovered by the others.
+Existing executions keep a NULL instance_id.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = '20261018_scheduler_instances'
+down_revision: Union[str, Sequence[str], None] = '20261018_session_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = inspector.get_table_names()
+
+    if 'scheduler_instances' not in existing_tables:
+        op.create_table(
+            'scheduler_instances',
+            sa.Column('instance_id', sa.String(64), primary_key=True),
+            sa.Column('namespace', sa.String(255), nullable=False),
+            sa.Column('started_at', sa.BigInteger(), nullable=False),
+            sa.Column('heartbeat_at', sa.BigInteger(), nullable=False),
+            sa.Column('lease_expires_at', sa.BigInteger(), nullable=False),
+        )
+        op.create_index('ix_scheduler_instances_namespace', 'scheduler_instances', ['namespace'])
+        op.create_index('ix_scheduler_instances_lease_expires_at', 'scheduler_instances', ['lease_expires_at'])
+
+    if 'scheduled_task_executions' not in existing_tables:
+        return
+
+    existing = {col['name'] for col in inspector.get_columns('scheduled_task_executions')}
+    if 'instance_id' in existing:
+        return
+
+    dialect_name = bind.dialect.name
+    if dialect_name == 'sqlite':
+        with op.batch_alter_table('scheduled_task_executions') as batch_op:
+            batch_op.add_column(sa.Column('instance_id', sa.String(64), nullable=True))
+            batch_op.create_index('ix_scheduled_task_executions_instance_id', ['instance_id'])
+    else:
+        op.add_column(
+            'scheduled_task_executions',
+            sa.Column('instance_id', sa.String(64), nullable=True),
+        )
+        op.create_index(
+            'ix_scheduled_task_executions_instance_id',
+            'scheduled_task_executions',
+            ['instance_id'],
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = inspector.get_table_names()
+
+    if 'scheduled_task_executions' in existing_tables:
+        existing = {col['name'] for col in inspector.get_columns('scheduled_task_executions')}
+        if 'instance_id' in existing:
+            dialect_name = bind.dialect.name
+            if dialect_name == 'sqlite':
+                with op.batch_alter_table('scheduled_task_executions') as batch_op:
+                    batch_op.drop_index('ix_scheduled_task_executions_instance_id')
+                    batch_op.drop_column('instance_id')
+            else:
+                op.drop_index(
+                    'ix_scheduled_task_executions_instance_id',
+                    table_name='scheduled_task_executions',
+                )
+                op.drop_column('scheduled_task_executions', 'instance_id')
+
+    if 'scheduler_instances' in existing_tables:
+        op.drop_index('ix_scheduler_instances_lease_expires_at', table_name='scheduler_instances')
+        op.drop_index('ix_scheduler_instances_namespace', table_name='scheduler_instances')
+        op.drop_table('scheduler_instances')
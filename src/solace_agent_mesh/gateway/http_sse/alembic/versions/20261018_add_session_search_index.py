@@ -0,0 +1,188 @@
+"""Add full-text search index over session names and chat messages
+
+Revision ID: 20261018_session_search
+Revises: 20260501_task_snapshot
+Create Date: 2026-10-18 00:00:00.000000
+
+Creates ``session_search_documents`` holding the searchable text of each
+session name and chat task, plus a dialect-specific native index on it:
+
+- SQLite: FTS5 external-content table ``session_search_fts`` kept in sync by
+  triggers. Skipped (search falls back to ILIKE) if SQLite lacks FTS5.
+- PostgreSQL: stored generated ``search_vector`` tsvector column + GIN index.
+- Other dialects: documents only; search falls back to ILIKE on names.
+
+Existing sessions and chat tasks are backfilled in batches.
+"""
+import json
+import logging
+import time
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect, text
+
+
+revision: str = "20261018_session_search"
+down_revision: Union[str, Sequence[str], None] = "20260501_task_snapshot"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 500
+MAX_DOCUMENT_CHARS = 100_000
+
+
+def _chat_task_text(user_message, message_bubbles) -> str:
+    pieces = [user_message] if user_message else []
+    try:
+        bubbles = json.loads(message_bubbles) if isinstance(message_bubbles, str) else message_bubbles
+    except (TypeError, ValueError):
+        bubbles = []
+    if isinstance(bubbles, list):
+        for bubble in bubbles:
+            if isinstance(bubble, dict):
+                bubble_text = bubble.get("text")
+                if bubble_text and bubble_text != user_message:
+                    pieces.append(bubble_text)
+    return "\n".join(pieces)[:MAX_DOCUMENT_CHARS]
+
+
+def _create_sqlite_fts(bind) -> None:
+    try:
+        bind.execute(text(
+            "CREATE VIRTUAL TABLE session_search_fts USING fts5("
+            "content, content='session_search_documents', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        ))
+    except Exception as e:
+        log.warning("SQLite FTS5 is unavailable, session search will use ILIKE: %s", e)
+        return
+
+    bind.execute(text(
+        "CREATE TRIGGER session_search_documents_ai AFTER INSERT ON session_search_documents BEGIN "
+        "INSERT INTO session_search_fts(rowid, content) VALUES (new.id, new.content); "
+        "END"
+    ))
+    bind.execute(text(
+        "CREATE TRIGGER session_search_documents_ad AFTER DELETE ON session_search_documents BEGIN "
+        "INSERT INTO session_search_fts(session_search_fts, rowid, content) "
+        "VALUES ('delete', old.id, old.content); "
+        "END"
+    ))
+    bind.execute(text(
+        "CREATE TRIGGER session_search_documents_au AFTER UPDATE ON session_search_documents BEGIN "
+        "INSERT INTO session_search_fts(session_search_fts, rowid, content) "
+        "VALUES ('delete', old.id, old.content); "
+        "INSERT INTO session_search_fts(rowid, content) VALUES (new.id, new.content); "
+        "END"
+    ))
+
+
+def _create_postgres_tsvector(bind) -> None:
+    bind.execute(text(
+        "ALTER TABLE session_search_documents ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(content, ''))) STORED"
+    ))
+    bind.execute(text(
+        "CREATE INDEX ix_session_search_documents_vector "
+        "ON session_search_documents USING GIN (search_vector)"
+    ))
+
+
+def _backfill(bind, documents) -> None:
+    now = int(time.time() * 1000)
+
+    sessions = bind.execute(text(
+        "SELECT id, user_id, name FROM sessions WHERE name IS NOT NULL AND name <> ''"
+    )).fetchall()
+    rows = [
+        {
+            "doc_key": f"session:{sid}",
+            "kind": "session_name",
+            "session_id": sid,
+            "user_id": user_id,
+            "content": name[:MAX_DOCUMENT_CHARS],
+            "updated_time": now,
+        }
+        for sid, user_id, name in sessions
+    ]
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        op.bulk_insert(documents, rows[start:start + BACKFILL_BATCH_SIZE])
+
+    last_id = ""
+    while True:
+        batch = bind.execute(
+            text(
+                "SELECT id, session_id, user_id, user_message, message_bubbles "
+                "FROM chat_tasks WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+        ).fetchall()
+        if not batch:
+            break
+        rows = []
+        for task_id, session_id, user_id, user_message, message_bubbles in batch:
+            content = _chat_task_text(user_message, message_bubbles)
+            if content:
+                rows.append({
+                    "doc_key": f"chat_task:{task_id}",
+                    "kind": "chat_task",
+                    "session_id": session_id,
+                    "user_id": user_id,
+                    "content": content,
+                    "updated_time": now,
+                })
+        if rows:
+            op.bulk_insert(documents, rows)
+        last_id = batch[-1][0]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = inspector.get_table_names()
+    if "session_search_documents" in existing_tables or "sessions" not in existing_tables:
+        return
+
+    documents = op.create_table(
+        "session_search_documents",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("doc_key", sa.String(255), nullable=False),
+        sa.Column("kind", sa.String(length=20), nullable=False),
+        sa.Column("session_id", sa.String(64), nullable=False),
+        sa.Column("user_id", sa.String(255), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("updated_time", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(["session_id"], ["sessions.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("doc_key", name="uq_session_search_documents_doc_key"),
+    )
+    op.create_index("ix_session_search_documents_session", "session_search_documents", ["session_id"])
+    op.create_index("ix_session_search_documents_user", "session_search_documents", ["user_id"])
+
+    dialect_name = bind.dialect.name
+    if dialect_name == "sqlite":
+        _create_sqlite_fts(bind)
+    elif dialect_name == "postgresql":
+        _create_postgres_tsvector(bind)
+
+    # Backfill after the native index exists so the SQLite triggers populate it
+    _backfill(bind, documents)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if "session_search_documents" not in inspector.get_table_names():
+        return
+
+    if bind.dialect.name == "sqlite":
+        for trigger in ("ai", "ad", "au"):
+            bind.execute(text(f"DROP TRIGGER IF EXISTS session_search_documents_{trigger}"))
+        bind.execute(text("DROP TABLE IF EXISTS session_search_fts"))
+
+    op.drop_index("ix_session_search_documents_user", table_name="session_search_documents")
+    op.drop_index("ix_session_search_documents_session", table_name="session_search_documents")
+    op.drop_table("session_search_documents")
@@ -0,0 +1,132 @@
+"""Add per-task sequence and result kind to task events
+
+Revision ID: 20261018_task_event_sequence
+Revises: 20261018_scheduler_instances
+Create Date: 2026-10-18 00:00:00.000000
+
+Adds ``sequence`` (the SSE event ID) and ``kind`` (result.kind of response
+payloads) to ``task_events`` together with a unique (task_id, sequence) index,
+so SSE replay after a ``Last-Event-ID`` is an indexed range query. Existing
+events are backfilled: sequences from created_time with ties broken by id in a
+single ROW_NUMBER() pass (UPDATE ... JOIN on MySQL, UPDATE ... FROM elsewhere),
+kinds from the stored payloads in batches.
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect, text
+
+
+revision: str = '20261018_task_event_sequence'
+down_revision: Union[str, Sequence[str], None] = '20261018_scheduler_instances'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 500
+SEQUENCE_PER_MS = 1000
+
+
+_RANKED_SEQUENCES = (
+    "SELECT id, created_time * :per_ms + ROW_NUMBER() OVER ("
+    "PARTITION BY task_id, created_time ORDER BY id) - 1 AS sequence "
+    "FROM task_events"
+)
+
+
+def _backfill_sequences(bind) -> None:
+    # One window-function pass: events sharing a millisecond are numbered by id.
+    # Assumes fewer than SEQUENCE_PER_MS events per task per millisecond.
+    if bind.dialect.name == 'mysql':
+        statement = (
+            f"UPDATE task_events JOIN ({_RANKED_SEQUENCES}) AS ranked "
+            "ON ranked.id = task_events.id "
+            "SET task_events.sequence = ranked.sequence"
+        )
+    else:
+        statement = (
+            f"UPDATE task_events SET sequence = ranked.sequence "
+            f"FROM ({_RANKED_SEQUENCES}) AS ranked "
+            "WHERE ranked.id = task_events.id"
+        )
+    bind.execute(text(statement), {"per_ms": SEQUENCE_PER_MS})
+
+
+def _backfill_kinds(bind) -> None:
+    last_id = ""
+    while True:
+        batch = bind.execute(
+            text(
+                "SELECT id, payload FROM task_events "
+                "WHERE direction = 'response' AND id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+        ).fetchall()
+        if not batch:
+            return
+
+        updates = []
+        for event_id, payload in batch:
+            try:
+                payload = json.loads(payload) if isinstance(payload, str) else payload
+            except (TypeError, ValueError):
+                continue
+            result = payload.get("result") if isinstance(payload, dict) else None
+            kind = result.get("kind") if isinstance(result, dict) else None
+            if isinstance(kind, str):
+                updates.append({"id": event_id, "kind": kind[:32]})
+        if updates:
+            bind.execute(text("UPDATE task_events SET kind = :kind WHERE id = :id"), updates)
+        last_id = batch[-1][0]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if 'task_events' not in inspector.get_table_names():
+        return
+
+    existing = {col['name'] for col in inspector.get_columns('task_events')}
+    if 'sequence' in existing:
+        return
+
+    if bind.dialect.name == 'sqlite':
+        with op.batch_alter_table('task_events') as batch_op:
+            batch_op.add_column(sa.Column('sequence', sa.BigInteger(), nullable=True))
+            batch_op.add_column(sa.Column('kind', sa.String(32), nullable=True))
+    else:
+        op.add_column('task_events', sa.Column('sequence', sa.BigInteger(), nullable=True))
+        op.add_column('task_events', sa.Column('kind', sa.String(32), nullable=True))
+
+    _backfill_sequences(bind)
+    _backfill_kinds(bind)
+
+    op.create_index(
+        'ix_task_events_task_id_sequence',
+        'task_events',
+        ['task_id', 'sequence'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if 'task_events' not in inspector.get_table_names():
+        return
+
+    existing = {col['name'] for col in inspector.get_columns('task_events')}
+    if 'sequence' not in existing:
+        return
+
+    op.drop_index('ix_task_events_task_id_sequence', table_name='task_events')
+    if bind.dialect.name == 'sqlite':
+        with op.batch_alter_table('task_events') as batch_op:
+            batch_op.drop_column('kind')
+            batch_op.drop_column('sequence')
+    else:
+        op.drop_column('task_events', 'kind')
+        op.drop_column('task_events', 'sequence')
@@ -6,6 +6,7 @@ Defines configuration schema and programmatically creates the WebUIBackendCompon
 import logging
 from typing import Any, Dict, List
 
+from ...common import a2a
 from ...gateway.http_sse.component import WebUIBackendComponent
 
 from ...gateway.base.app import BaseGatewayApp
@@ -75,6 +76,20 @@ class WebUIBackendApp(BaseGatewayApp):
             "default": 1000,
             "description": "Maximum size of the SSE connection queues. Adjust based on expected load.",
         },
+        {
+            "name": "sse_fanout_enabled",
+            "required": False,
+            "type": "boolean",
+            "default": False,
+            "description": "Cluster mode: re-publish task SSE events on a per-gateway-group broker topic so any replica holding a client's SSE connection can forward them. Enable on every replica behind the same load balancer.",
+        },
+        {
+            "name": "sse_fanout_group",
+            "required": False,
+            "type": "string",
+            "default": "",
+            "description": "Name of the gateway group whose replicas share SSE events. Must be the same on every replica; defaults to the app name, which replicas sharing a configuration have in common. Replicas still need distinct gateway IDs so each consumes its own queue.",
+        },
         {
             "name": "visualization_queue_size",
             "required": False,
@@ -96,6 +111,21 @@ class WebUIBackendApp(BaseGatewayApp):
             "default": True,
             "description": "If true, the gateway will resolve artifact:// URIs found in A2A messages and embed the content as bytes before sending to the UI. If false, URIs are passed through.",
         },
+        {
+            "name": "project_artifact_copy_mode",
+            "required": False,
+            "type": "string",
+            "default": "copy",
+            "enum": ["copy", "reference"],
+            "description": "How project files are added to chat sessions. 'copy' copies each file inside the artifact store. 'reference' stores a pointer to the project file's version instead (a hard link on the filesystem store); new versions written in the session are stored normally, but on S3 and Azure a referenced file becomes unreadable once it is deleted from the project.",
+        },
+        {
+            "name": "project_transfer_concurrency",
+            "required": False,
+            "type": "integer",
+            "default": 4,
+            "description": "Maximum number of artifacts saved or converted concurrently when a project is imported. Bounds the memory an import holds at once to roughly this many artifacts.",
+        },
         {
             "name": "model",
             "required": False,
@@ -343,6 +373,96 @@ class WebUIBackendApp(BaseGatewayApp):
                 },
             },
         },
+        {
+            "name": "file_conversion",
+            "required": False,
+            "type": "dict",
+            "default": {},
+            "description": "Configuration for converting uploaded PDF, DOCX and PPTX files to text for search indexing.",
+            "dict_schema": {
+                "enabled": {
+                    "type": "boolean",
+                    "required": False,
+                    "default": True,
+                    "description": "Use the conversion engine (worker processes and content-hash cache). When disabled, files are converted on a thread pool without caching.",
+                },
+                "process_workers": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 2,
+                    "description": "Number of conversion worker processes. Large PDFs are split into page ranges across workers. 0 converts on the thread pool but keeps the cache.",
+                },
+                "pages_per_shard": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 50,
+                    "description": "Minimum number of PDF pages per worker shard. Smaller PDFs are converted by a single worker.",
+                },
+                "timeout_seconds": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 300,
+                    "description": "Time allowed for one conversion call before its worker is killed.",
+                },
+                "max_calls_per_worker": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 100,
+                    "description": "Restart a worker after this many conversions to bound memory growth. 0 disables recycling.",
+                },
+                "cache_max_mb": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 256,
+                    "description": "Maximum size of cached conversion output, keyed by file content hash. 0 disables the cache.",
+                },
+            },
+        },
+        {
+            "name": "document_conversion",
+            "required": False,
+            "type": "dict",
+            "default": {},
+            "description": "Configuration for LibreOffice document-to-PDF conversion used by binary artifact previews.",
+            "dict_schema": {
+                "libreoffice_path": {
+                    "type": "string",
+                    "required": False,
+                    "default": None,
+                    "description": "Path to the soffice executable. Searched for on PATH and in common locations if not set.",
+                },
+                "timeout_seconds": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 30,
+                    "description": "Maximum time for one conversion.",
+                },
+                "pool_size": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 0,
+                    "description": "Number of persistent headless LibreOffice workers. 0 starts soffice for every conversion.",
+                },
+                "max_jobs_per_worker": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 50,
+                    "description": "Restart a pooled worker after this many conversions. 0 disables recycling.",
+                },
+                "worker_python": {
+                    "type": "string",
+                    "required": False,
+                    "default": None,
+                    "description": "Python interpreter with the LibreOffice UNO bindings (e.g. /usr/bin/python3 with python3-uno) used to run pooled workers. Defaults to the gateway's interpreter.",
+                },
+                "worker_command": {
+                    "type": "list",
+                    "required": False,
+                    "default": None,
+                    "description": "Command that starts one pooled worker, replacing the bundled LibreOffice worker (e.g. a stand-in converter for tests).",
+                },
+            },
+        },
         {
             "name": "scheduler_service",
             "required": False,
@@ -374,6 +494,24 @@ class WebUIBackendApp(BaseGatewayApp):
                     "default": 10,
                     "description": "Maximum number of concurrent task executions.",
                 },
+                "multi_instance_enabled": {
+                    "type": "boolean",
+                    "required": False,
+                    "default": False,
+                    "description": "Share scheduled tasks across gateway replicas using database leases. Each task is fired by exactly one live instance.",
+                },
+                "lease_ttl_seconds": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 15,
+                    "description": "How long an instance's lease stays valid without a heartbeat. Bounds failover time.",
+                },
+                "heartbeat_interval_seconds": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 5,
+                    "description": "How often each instance renews its lease and rebalances tasks. Must be well below lease_ttl_seconds.",
+                },
             },
         },
         {
@@ -436,6 +574,24 @@ class WebUIBackendApp(BaseGatewayApp):
                     "default": 1000,
                     "description": "Number of records to delete per batch to avoid long-running transactions. Range: 1-10000.",
                 },
+                "max_rows_per_second": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 0,
+                    "description": "I/O budget for cleanup: average rows deleted per second, including child rows such as task events. 0 means unlimited.",
+                },
+                "chunk_pause_ms": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 0,
+                    "description": "Minimum pause between delete batches (in milliseconds).",
+                },
+                "max_run_seconds": {
+                    "type": "integer",
+                    "required": False,
+                    "default": 0,
+                    "description": "Maximum duration of one cleanup run (in seconds). An unfinished run resumes from its last batch on the next run. 0 means unlimited.",
+                },
             },
         },
     ]
@@ -449,10 +605,25 @@ class WebUIBackendApp(BaseGatewayApp):
             "%s Initializing WebUIBackendApp...",
             app_info.get("name", "WebUIBackendApp"),
         )
+        # Read by _get_gateway_specific_subscriptions during the base init
+        self._sse_fanout_default_group = app_info.get("name")
         super().__init__(app_info, **kwargs)
 
         log.debug("%s WebUIBackendApp initialization complete.", self.name)
 
+    def _get_gateway_specific_subscriptions(
+        self, app_config: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        if not app_config.get("sse_fanout_enabled", False):
+            return []
+        # The gateway ID differs per replica, so it cannot name the shared group.
+        # The resolved group is written back for the component to publish on.
+        group = app_config.get("sse_fanout_group") or self._sse_fanout_default_group
+        app_config["sse_fanout_group"] = group
+        return [
+            {"topic": a2a.get_gateway_sse_fanout_subscription_topic(self.namespace, group)}
+        ]
+
     def _get_gateway_component_class(self) -> type[BaseGatewayComponent]:
         return WebUIBackendComponent
 
@@ -22,8 +22,13 @@ from solace_ai_connector.flow.app import App as SACApp
 from ...common.agent_registry import AgentRegistry
 from ...common.features import core as feature_flags
 from ...core_a2a.service import CoreA2AService
-from ...gateway.base.component import BaseGatewayComponent
+from ...gateway.base.component import (
+    BaseGatewayComponent,
+    get_inbound_message_timestamp,
+)
+from ...gateway.http_sse.agent_card_cache import AgentCardResponseCache
 from ...gateway.http_sse.session_manager import SessionManager
+from ...gateway.http_sse.sse_fanout import BrokerSSEFanout
 from ...gateway.http_sse.sse_manager import SSEManager
 from . import dependencies
 from .visualization_mapper import infer_visualization_event_details
@@ -196,6 +201,10 @@ class WebUIBackendComponent(BaseGatewayComponent):
         )
         # SSE manager will be initialized after database setup
         self.sse_manager = None
+        # Cross-replica SSE fan-out, set up with the SSE manager when enabled
+        self.sse_fanout: BrokerSSEFanout | None = None
+
+        self.agent_card_response_cache = AgentCardResponseCache()
 
         self._sse_cleanup_timer_id = f"sse_cleanup_{self.gateway_id}"
         cleanup_interval_sec = self.get_config(
@@ -332,6 +341,22 @@ class WebUIBackendComponent(BaseGatewayComponent):
             publish_func=self.publish_a2a,
         )
 
+        # Configure the document conversion engine used for search indexing
+        from .services.file_converter_service import configure_conversion_engine
+
+        self.conversion_engine = configure_conversion_engine(
+            self.get_config("file_conversion", {})
+        )
+
+        # Configure LibreOffice document-to-PDF conversion (optionally pooled)
+        from .services.document_conversion_service import (
+            configure_document_conversion_service,
+        )
+
+        self.document_conversion_service = configure_document_conversion_service(
+            self.get_config("document_conversion", {})
+        )
+
         # Initialize data retention service and timer
         self.data_retention_service = None
         self._data_retention_timer_id = None
@@ -1662,6 +1687,13 @@ class WebUIBackendComponent(BaseGatewayComponent):
                 hybrid_buffer_enabled,
                 hybrid_buffer_threshold,
             )
+            if self.get_config("sse_fanout_enabled", False):
+                self.sse_fanout = BrokerSSEFanout(
+                    publish=self.publish_a2a_message,
+                    namespace=self.namespace,
+                    group=self.get_config("sse_fanout_group"),
+                )
+                self.sse_manager.set_fanout(self.sse_fanout)
             # task_logging_config already obtained above for hybrid_buffer settings
             self.task_logger_service = TaskLoggerService(
                 session_factory=session_factory, config=task_logging_config
@@ -1993,6 +2025,48 @@ class WebUIBackendComponent(BaseGatewayComponent):
                 )
             self.scheduler_service = None
 
+        # Stop document conversion workers
+        if self.conversion_engine:
+            from .services.file_converter_service import shutdown_conversion_engine
+
+            try:
+                if self.fastapi_event_loop and self.fastapi_event_loop.is_running():
+                    future = asyncio.run_coroutine_threadsafe(
+                        shutdown_conversion_engine(), self.fastapi_event_loop
+                    )
+                    future.result(timeout=10)
+                else:
+                    asyncio.run(shutdown_conversion_engine())
+                log.info("%s Document conversion engine stopped.", self.log_identifier)
+            except Exception as e:
+                log.error(
+                    "%s Error stopping document conversion engine: %s",
+                    self.log_identifier,
+                    e,
+                    exc_info=True,
+                )
+            self.conversion_engine = None
+
+        # Stop pooled LibreOffice workers
+        if self.document_conversion_service and self.document_conversion_service.is_pooled:
+            try:
+                if self.fastapi_event_loop and self.fastapi_event_loop.is_running():
+                    future = asyncio.run_coroutine_threadsafe(
+                        self.document_conversion_service.shutdown(), self.fastapi_event_loop
+                    )
+                    future.result(timeout=15)
+                else:
+                    asyncio.run(self.document_conversion_service.shutdown())
+                log.info("%s LibreOffice worker pool stopped.", self.log_identifier)
+            except Exception as e:
+                log.error(
+                    "%s Error stopping LibreOffice worker pool: %s",
+                    self.log_identifier,
+                    e,
+                    exc_info=True,
+                )
+            self.document_conversion_service = None
+
         self.cancel_timer(self.health_check_timer_id)
         log.info("%s Cleaning up visualization resources...", self.log_identifier)
         if self._visualization_message_queue:
@@ -2257,6 +2331,9 @@ class WebUIBackendComponent(BaseGatewayComponent):
     def get_agent_registry(self) -> AgentRegistry:
         return self.agent_registry
 
+    def get_agent_card_response_cache(self) -> AgentCardResponseCache:
+        return self.agent_card_response_cache
+
     def _check_agent_health(self):
         """
         Checks the health of peer agents and de-registers unresponsive ones.
@@ -2302,30 +2379,25 @@ class WebUIBackendComponent(BaseGatewayComponent):
                 f"Invalid health check configuration. agent_health_check_ttl_seconds ({ttl_seconds}) and agent_health_check_interval_seconds ({health_check_interval}) must be positive and TTL must be greater than interval."
             )
 
-        # Get all agent names from the registry
-        agent_names = self.agent_registry.get_agent_names()
-        total_agents = len(agent_names)
+        total_agents = len(self.agent_registry)
         agents_to_deregister = []
 
         log.debug(
             "%s Checking health of %d peer agents", self.log_identifier, total_agents
         )
 
-        for agent_name in agent_names:
-            # Check if the agent's TTL has expired
-            is_expired, time_since_last_seen = self.agent_registry.check_ttl_expired(
-                agent_name, ttl_seconds
+        # Only agents whose TTL has expired are visited
+        for agent_name, time_since_last_seen in self.agent_registry.get_expired(
+            ttl_seconds
+        ):
+            log.warning(
+                "%s Agent '%s' TTL has expired. De-registering. Time since last seen: %d seconds (TTL: %d seconds)",
+                self.log_identifier,
+                agent_name,
+                time_since_last_seen,
+                ttl_seconds,
             )
-
-            if is_expired:
-                log.warning(
-                    "%s Agent '%s' TTL has expired. De-registering. Time since last seen: %d seconds (TTL: %d seconds)",
-                    self.log_identifier,
-                    agent_name,
-                    time_since_last_seen,
-                    ttl_seconds,
-                )
-                agents_to_deregister.append(agent_name)
+            agents_to_deregister.append(agent_name)
 
         # De-register unresponsive agents
         for agent_name in agents_to_deregister:
@@ -2599,6 +2671,16 @@ class WebUIBackendComponent(BaseGatewayComponent):
         )
         return target_agent_name, a2a_parts, external_request_context
 
+    async def _handle_gateway_specific_message(
+        self, topic: str, payload: Any
+    ) -> bool:
+        """Forwards SSE events re-published by other replicas of the gateway group."""
+        if self.sse_fanout is None or not self.sse_fanout.matches_topic(topic):
+            return False
+        if self.sse_manager is not None:
+            await self.sse_manager.handle_fanout_message(payload)
+        return True
+
     async def _send_update_to_external(
         self,
         external_request_context: dict[str, Any],
@@ -2654,7 +2736,10 @@ class WebUIBackendComponent(BaseGatewayComponent):
 
         try:
             await self.sse_manager.send_event(
-                task_id=sse_task_id, event_data=sse_payload, event_type=sse_event_type
+                task_id=sse_task_id,
+                event_data=sse_payload,
+                event_type=sse_event_type,
+                published_time=get_inbound_message_timestamp(),
             )
             log.debug(
                 "%s Successfully sent %s via SSE for A2A Task ID %s.",
@@ -2708,7 +2793,10 @@ class WebUIBackendComponent(BaseGatewayComponent):
 
         try:
             await self.sse_manager.send_event(
-                task_id=sse_task_id, event_data=sse_payload, event_type="final_response"
+                task_id=sse_task_id,
+                event_data=sse_payload,
+                event_type="final_response",
+                published_time=get_inbound_message_timestamp(),
             )
             log.debug(
                 "%s Successfully sent final_response via SSE for A2A Task ID %s.",
@@ -2755,7 +2843,10 @@ class WebUIBackendComponent(BaseGatewayComponent):
 
         try:
             await self.sse_manager.send_event(
-                task_id=sse_task_id, event_data=sse_payload, event_type="final_response"
+                task_id=sse_task_id,
+                event_data=sse_payload,
+                event_type="final_response",
+                published_time=get_inbound_message_timestamp(),
             )
             log.info(
                 "%s Successfully sent A2A error as 'final_response' via SSE for SSE Task ID %s.",
@@ -20,6 +20,7 @@ from ...common.middleware.config_resolver import ConfigResolver
 from ...common.services.identity_service import BaseIdentityService
 from ...core_a2a.service import CoreA2AService
 from ...gateway.base.task_context import TaskContextManager
+from ...gateway.http_sse.agent_card_cache import AgentCardResponseCache
 from ...gateway.http_sse.services.agent_card_service import AgentCardService
 from ...gateway.http_sse.services.audio_service import AudioService
 from ...gateway.http_sse.services.project_service import ProjectService
@@ -255,6 +256,14 @@ def get_agent_registry(
     return component.get_agent_registry()
 
 
+def get_agent_card_response_cache(
+    component: "WebUIBackendComponent" = Depends(get_sac_component),
+) -> AgentCardResponseCache | None:
+    """FastAPI dependency to get the agent card response cache, if any."""
+    log.debug("get_agent_card_response_cache called")
+    return component.get_agent_card_response_cache()
+
+
 def get_sse_manager(
     component: "WebUIBackendComponent" = Depends(get_sac_component),
 ) -> SSEManager:
@@ -934,6 +943,7 @@ def get_indexing_task_service(
     
     return IndexingTaskService(
         sse_manager=sse_manager,
-        project_service=project_service
+        project_service=project_service,
+        max_concurrency=project_service.transfer_concurrency,
     )
 
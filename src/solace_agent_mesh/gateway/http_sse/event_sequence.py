@@ -0,0 +1,36 @@
+"""
+Monotonic event sequence numbers used as SSE event IDs.
+
+Stored task events and live SSE events derive their IDs from the same value,
+the publish time of the A2A message they carry, so a client's
+``Last-Event-ID`` can be resumed against the task event table: a sequence is
+that time in milliseconds scaled by ``SEQUENCE_PER_MS``, bumped by one
+whenever that would not be strictly greater than the previous sequence of the
+same task.
+"""
+
+SEQUENCE_PER_MS = 1000
+
+
+def next_event_sequence(previous: int | None, now_ms: int) -> int:
+    """Returns the sequence for a new event given the task's previous one."""
+    floor = now_ms * SEQUENCE_PER_MS
+    if previous is None or previous < floor:
+        return floor
+    return previous + 1
+
+
+def sequence_after_timestamp(timestamp_ms: int) -> int:
+    """Returns the last sequence an event created at `timestamp_ms` can have."""
+    return (timestamp_ms + 1) * SEQUENCE_PER_MS - 1
+
+
+def parse_last_event_id(value: str | None) -> int | None:
+    """Parses a ``Last-Event-ID`` header, ignoring IDs this gateway did not issue."""
+    if not value:
+        return None
+    try:
+        sequence = int(value.strip())
+    except ValueError:
+        return None
+    return sequence if sequence >= 0 else None
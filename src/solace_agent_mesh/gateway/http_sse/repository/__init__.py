@@ -17,6 +17,7 @@ from .document_conversion_cache_repository import DocumentConversionCacheReposit
 from .feedback_repository import FeedbackRepository
 from .project_repository import ProjectRepository
 from .session_repository import SessionRepository
+from .session_search_repository import SessionSearchRepository
 from .sse_event_buffer_repository import SSEEventBufferRepository
 from .share_repository import ShareRepository
 from .task_repository import TaskRepository
@@ -45,6 +46,7 @@ __all__ = [
     "FeedbackRepository",
     "ProjectRepository",
     "SessionRepository",
+    "SessionSearchRepository",
     "SSEEventBufferRepository",
     "ShareRepository",
     "TaskRepository",
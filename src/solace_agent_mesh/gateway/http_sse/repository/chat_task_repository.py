@@ -12,11 +12,15 @@ from solace_agent_mesh.shared.utils.types import SessionId, UserId
 from .entities import ChatTask
 from .interfaces import IChatTaskRepository
 from .models import ChatTaskModel
+from .session_search_repository import SessionSearchRepository
 
 
 class ChatTaskRepository(IChatTaskRepository):
     """SQLAlchemy implementation of chat task repository."""
 
+    def __init__(self):
+        self._search_index = SessionSearchRepository()
+
     def save(self, session: DBSession, task: ChatTask) -> ChatTask:
         """Save or update a chat task (upsert)."""
         with MonitorLatency(DBMonitor.query("chat_tasks")):
@@ -54,6 +58,16 @@ class ChatTaskRepository(IChatTaskRepository):
                 ChatTaskModel.id == task.id
             ).first()
 
+        # Keep the full-text search index in step with the stored messages
+        self._search_index.index_chat_task(
+            session,
+            model.id,
+            model.session_id,
+            model.user_id,
+            model.user_message,
+            model.message_bubbles,
+        )
+
         return self._model_to_entity(model)
 
     @MonitorLatency(DBMonitor.query("chat_tasks"))
@@ -109,6 +123,7 @@ class ChatTaskRepository(IChatTaskRepository):
         result = session.query(ChatTaskModel).filter(
             ChatTaskModel.session_id == session_id
         ).delete()
+        self._search_index.delete_chat_tasks_for_session(session, session_id)
         session.flush()
 
         return result > 0
@@ -0,0 +1,143 @@
+"""
+Keyset-paginated, child-first bulk deletion used by data retention.
+
+Rows older than a cutoff are walked in (time, id) order using the table's time
+index, so each chunk is a short index range scan rather than a rescan of rows
+that earlier chunks already removed. Child rows are deleted before their
+parents so nothing depends on database-level cascades, and every chunk commits
+on its own to keep lock hold times short.
+"""
+
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.orm import Session as DBSession
+from solace_ai_connector.common.observability import DBMonitor, MonitorLatency
+
+log = logging.getLogger(__name__)
+
+# (time value, primary key) of the last row removed; rows at or before it are gone
+RetentionCursor = tuple[int, Any]
+
+# Invoked after every committed chunk with the number of rows removed and, for
+# parent chunks, the new cursor (None for child chunks). Returning False stops
+# the deletion; it can be resumed later from the last reported cursor.
+ChunkCallback = Callable[[int, RetentionCursor | None], bool]
+
+
+@dataclass(frozen=True)
+class ChildTable:
+    """A table whose rows reference the parent being deleted."""
+
+    model: Any
+    foreign_key: Any
+
+
+def delete_older_than_in_chunks(
+    session: DBSession,
+    model: Any,
+    time_column: Any,
+    cutoff_time_ms: int,
+    batch_size: int,
+    children: Sequence[ChildTable] = (),
+    after: RetentionCursor | None = None,
+    on_chunk: ChunkCallback | None = None,
+) -> int:
+    """
+    Delete rows of `model` whose `time_column` is before the cutoff.
+
+    Args:
+        session: Database session; committed after every chunk
+        model: SQLAlchemy model to delete from
+        time_column: Indexed epoch-millisecond column to page on
+        cutoff_time_ms: Rows strictly older than this are deleted
+        batch_size: Maximum rows fetched or deleted per statement
+        children: Tables referencing `model` whose rows are removed first
+        after: Cursor to resume from (rows at or before it are skipped)
+        on_chunk: Progress callback, see ChunkCallback
+
+    Returns:
+        Number of parent rows deleted (child rows are reported via on_chunk)
+    """
+    table = model.__tablename__
+    pk = model.__mapper__.primary_key[0]
+    total_deleted = 0
+
+    while True:
+        stmt = select(time_column, pk).where(time_column < cutoff_time_ms)
+        if after is not None:
+            after_time, after_id = after
+            stmt = stmt.where(
+                or_(
+                    time_column > after_time,
+                    and_(time_column == after_time, pk > after_id),
+                )
+            )
+        stmt = stmt.order_by(time_column, pk).limit(batch_size)
+
+        with MonitorLatency(DBMonitor.query(table)):
+            rows = session.execute(stmt).all()
+
+        if not rows:
+            break
+
+        ids = [row[1] for row in rows]
+
+        for child in children:
+            if not _delete_children(session, child, ids, batch_size, on_chunk):
+                return total_deleted
+
+        with MonitorLatency(DBMonitor.delete(table)):
+            deleted_count = session.execute(
+                delete(model).where(pk.in_(ids)).execution_options(synchronize_session=False)
+            ).rowcount
+            session.commit()
+
+        total_deleted += deleted_count
+        after = (rows[-1][0], rows[-1][1])
+
+        if on_chunk is not None and on_chunk(deleted_count, after) is False:
+            break
+
+        if len(rows) < batch_size:
+            break
+
+    return total_deleted
+
+
+def _delete_children(
+    session: DBSession,
+    child: ChildTable,
+    parent_ids: list[Any],
+    batch_size: int,
+    on_chunk: ChunkCallback | None,
+) -> bool:
+    """Delete the children of a chunk of parents. Returns False if stopped."""
+    table = child.model.__tablename__
+    child_pk = child.model.__mapper__.primary_key[0]
+
+    while True:
+        with MonitorLatency(DBMonitor.query(table)):
+            child_ids = session.execute(
+                select(child_pk).where(child.foreign_key.in_(parent_ids)).limit(batch_size)
+            ).scalars().all()
+
+        if not child_ids:
+            return True
+
+        with MonitorLatency(DBMonitor.delete(table)):
+            deleted_count = session.execute(
+                delete(child.model)
+                .where(child_pk.in_(child_ids))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            session.commit()
+
+        if on_chunk is not None and on_chunk(deleted_count, None) is False:
+            return False
+
+        if len(child_ids) < batch_size:
+            return True
@@ -13,6 +13,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session as DBSession
 from solace_ai_connector.common.observability import DBMonitor, MonitorLatency
 
+from .chunked_delete import ChunkCallback, RetentionCursor, delete_older_than_in_chunks
 from .models.document_conversion_cache_model import DocumentConversionCacheModel
 from solace_agent_mesh.shared.utils.timestamp_utils import now_epoch_ms
 
@@ -209,6 +210,36 @@ class DocumentConversionCacheRepository:
         
         return deleted
 
+    def delete_entries_older_than(
+        self,
+        db: DBSession,
+        older_than_ms: int,
+        batch_size: int,
+        after: Optional[RetentionCursor] = None,
+        on_chunk: Optional[ChunkCallback] = None,
+    ) -> int:
+        """
+        Delete cache entries not accessed since the specified time in committed,
+        keyset-paginated batches on the last_accessed_at index.
+        Args:
+            db: Database session
+            older_than_ms: Delete entries with last_accessed_at before this epoch time (ms)
+            batch_size: Number of entries to delete per batch
+            after: Cursor from a previous, interrupted run to resume from
+            on_chunk: Called after each committed batch; returning False stops the run
+        Returns:
+            Number of entries deleted
+        """
+        return delete_older_than_in_chunks(
+            db,
+            DocumentConversionCacheModel,
+            DocumentConversionCacheModel.last_accessed_at,
+            older_than_ms,
+            batch_size,
+            after=after,
+            on_chunk=on_chunk,
+        )
+
     @MonitorLatency(DBMonitor.query("document_conversion_cache"))
     def get_stats(self, db: DBSession) -> dict:
         """
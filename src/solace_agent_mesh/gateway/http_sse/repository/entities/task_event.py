@@ -16,6 +16,8 @@ class TaskEvent(BaseModel):
     topic: str
     direction: str
     payload: dict[str, Any]
+    sequence: int | None = None
+    kind: str | None = None
 
     class Config:
         from_attributes = True
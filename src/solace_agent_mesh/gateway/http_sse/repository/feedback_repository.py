@@ -7,6 +7,7 @@ from solace_ai_connector.common.observability import DBMonitor, MonitorLatency
 
 from solace_agent_mesh.shared.api.pagination import PaginationParams
 from solace_agent_mesh.shared.utils.types import UserId
+from .chunked_delete import ChunkCallback, RetentionCursor, delete_older_than_in_chunks
 from .entities import Feedback
 from .interfaces import IFeedbackRepository
 from .models import FeedbackModel
@@ -80,52 +81,36 @@ class FeedbackRepository(IFeedbackRepository):
 
         return [self._model_to_entity(model) for model in models]
 
-    def delete_feedback_older_than(self, session: DBSession, cutoff_time_ms: int, batch_size: int) -> int:
+    def delete_feedback_older_than(
+        self,
+        session: DBSession,
+        cutoff_time_ms: int,
+        batch_size: int,
+        after: RetentionCursor | None = None,
+        on_chunk: ChunkCallback | None = None,
+    ) -> int:
         """
         Delete feedback records older than the cutoff time.
-        Uses batch deletion to avoid long-running transactions.
+        Uses keyset-paginated batch deletion to avoid long-running transactions.
 
         Args:
             cutoff_time_ms: Epoch milliseconds - feedback with created_time before this will be deleted
             batch_size: Number of feedback records to delete per batch
+            after: Cursor from a previous, interrupted run to resume from
+            on_chunk: Called after each committed batch; returning False stops the run
 
         Returns:
             Total number of feedback records deleted
         """
-        total_deleted = 0
-
-        while True:
-            # Find a batch of feedback IDs to delete
-            with MonitorLatency(DBMonitor.query("feedback")):
-                feedback_ids_to_delete = (
-                    session.query(FeedbackModel.id)
-                    .filter(FeedbackModel.created_time < cutoff_time_ms)
-                    .limit(batch_size)
-                    .all()
-                )
-
-            if not feedback_ids_to_delete:
-                break
-
-            # Extract IDs from the result tuples
-            ids = [feedback_id[0] for feedback_id in feedback_ids_to_delete]
-
-            # Delete this batch
-            with MonitorLatency(DBMonitor.delete("feedback")):
-                deleted_count = (
-                    session.query(FeedbackModel)
-                    .filter(FeedbackModel.id.in_(ids))
-                    .delete(synchronize_session=False)
-                )
-                session.commit()
-
-            total_deleted += deleted_count
-
-            # If we deleted fewer than batch_size, we're done
-            if deleted_count < batch_size:
-                break
-
-        return total_deleted
+        return delete_older_than_in_chunks(
+            session,
+            FeedbackModel,
+            FeedbackModel.created_time,
+            cutoff_time_ms,
+            batch_size,
+            after=after,
+            on_chunk=on_chunk,
+        )
 
     def _model_to_entity(self, model: FeedbackModel) -> Feedback:
         """Convert SQLAlchemy model to domain entity."""
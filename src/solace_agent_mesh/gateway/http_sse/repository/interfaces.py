@@ -3,11 +3,13 @@ Repository interfaces defining contracts for data access.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Optional
 from sqlalchemy.orm import Session as DBSession
 
 from solace_agent_mesh.shared.api.pagination import PaginationParams
 from solace_agent_mesh.shared.utils.types import SessionId, UserId
+from .chunked_delete import ChunkCallback, RetentionCursor
 from .entities import Feedback, Session, Task, TaskEvent
 from .entities.project import Project
 from ..routers.dto.requests.project_requests import ProjectFilter
@@ -120,6 +122,41 @@ class ITaskRepository(ABC):
         """Find a task with all its events."""
         pass
 
+    @abstractmethod
+    def find_by_ids(self, session: DBSession, task_ids: list[str]) -> list[Task]:
+        """Find tasks by their IDs without loading events."""
+        pass
+
+    @abstractmethod
+    def find_events_page(
+        self,
+        session: DBSession,
+        task_ids: list[str],
+        after: tuple[int, str] | None = None,
+        limit: int = 100,
+    ) -> list[TaskEvent]:
+        """Find one keyset-paginated page of events for the given tasks."""
+        pass
+
+    @abstractmethod
+    def find_replay_events_page(
+        self,
+        session: DBSession,
+        task_id: str,
+        after_sequence: int = 0,
+        limit: int = 200,
+        skip_superseded_artifact_updates: bool = False,
+    ) -> list[TaskEvent]:
+        """Find one page of a task's events after a sequence for SSE replay."""
+        pass
+
+    @abstractmethod
+    def iter_events(
+        self, session: DBSession, task_ids: list[str], batch_size: int | None = None
+    ) -> Iterator[TaskEvent]:
+        """Stream events for the given tasks in chronological order."""
+        pass
+
     @abstractmethod
     def search(
         self,
@@ -134,8 +171,15 @@ class ITaskRepository(ABC):
         pass
 
     @abstractmethod
-    def delete_tasks_older_than(self, session: DBSession, cutoff_time_ms: int, batch_size: int) -> int:
-        """Delete tasks older than cutoff time using batch deletion."""
+    def delete_tasks_older_than(
+        self,
+        session: DBSession,
+        cutoff_time_ms: int,
+        batch_size: int,
+        after: RetentionCursor | None = None,
+        on_chunk: ChunkCallback | None = None,
+    ) -> int:
+        """Delete tasks and their events older than cutoff time using batch deletion."""
         pass
 
 
@@ -179,7 +223,14 @@ class IFeedbackRepository(ABC):
         pass
 
     @abstractmethod
-    def delete_feedback_older_than(self, session: DBSession, cutoff_time_ms: int, batch_size: int) -> int:
+    def delete_feedback_older_than(
+        self,
+        session: DBSession,
+        cutoff_time_ms: int,
+        batch_size: int,
+        after: RetentionCursor | None = None,
+        on_chunk: ChunkCallback | None = None,
+    ) -> int:
         """Delete feedback older than cutoff time using batch deletion."""
         pass
 
@@ -10,6 +10,7 @@ from .project_model import ProjectModel, CreateProjectModel, UpdateProjectModel
 from .project_user_model import ProjectUserModel, CreateProjectUserModel, UpdateProjectUserModel
 from .project_user_pin_model import ProjectUserPinModel
 from .session_model import SessionModel, CreateSessionModel, UpdateSessionModel
+from .session_search_document_model import SessionSearchDocumentModel
 from .sse_event_buffer_model import SSEEventBufferModel
 from .task_event_model import TaskEventModel
 from .task_model import TaskModel
@@ -17,6 +18,7 @@ from .prompt_model import PromptGroupModel, PromptModel, PromptGroupUserModel
 from .scheduled_task_model import (
     ScheduledTaskModel,
     ScheduledTaskExecutionModel,
+    SchedulerInstanceModel,
     ScheduleType,
     ExecutionStatus,
     TriggerType,
@@ -40,6 +42,7 @@ __all__ = [
     "ProjectUserModel",
     "ProjectUserPinModel",
     "SessionModel",
+    "SessionSearchDocumentModel",
     "SSEEventBufferModel",
     "CreateProjectModel",
     "UpdateProjectModel",
@@ -62,6 +65,7 @@ __all__ = [
     "SharedSessionView",
     "ScheduledTaskModel",
     "ScheduledTaskExecutionModel",
+    "SchedulerInstanceModel",
     "ScheduleType",
     "ExecutionStatus",
 ]
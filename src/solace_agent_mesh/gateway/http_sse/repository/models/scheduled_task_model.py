@@ -165,6 +165,11 @@ class ScheduledTaskExecutionModel(Base):
     # before this column existed.
     task_snapshot = Column(JSON, nullable=True)
 
+    # Scheduler instance that ran the execution, so another instance can
+    # recover it if that instance dies. NULL for rows created before
+    # multi-instance coordination existed.
+    instance_id = Column(String(64), nullable=True, index=True)
+
     # Relationships
     scheduled_task = relationship(
         "ScheduledTaskModel",
@@ -172,3 +177,15 @@ class ScheduledTaskExecutionModel(Base):
     )
 
 
+class SchedulerInstanceModel(Base):
+    """Lease held by a live scheduler instance for multi-instance coordination."""
+
+    __tablename__ = "scheduler_instances"
+
+    instance_id = Column(String(64), primary_key=True)
+    namespace = Column(String(255), nullable=False, index=True)
+
+    # Timing (epoch milliseconds)
+    started_at = Column(BigInteger, nullable=False)
+    heartbeat_at = Column(BigInteger, nullable=False)
+    lease_expires_at = Column(BigInteger, nullable=False, index=True)
@@ -0,0 +1,51 @@
+"""
+Session search document SQLAlchemy model.
+
+Each row holds the searchable text of one source object: the name of a session
+or the message text of one chat task. The rows are the content table of the
+native full-text index, which is created by migration and is dialect specific:
+
+- SQLite: an FTS5 external-content table (`session_search_fts`) kept in sync
+  by triggers on this table.
+- PostgreSQL: a stored generated `search_vector` tsvector column with a GIN index.
+"""
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+
+from .base import Base
+
+
+class SessionSearchDocumentModel(Base):
+    """SQLAlchemy model for session search index documents."""
+
+    __tablename__ = "session_search_documents"
+
+    # Integer key so it can serve as the FTS5 content rowid
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # "session:<session_id>" or "chat_task:<task_id>"
+    doc_key = Column(String(255), nullable=False)
+    kind = Column(String(20), nullable=False)  # "session_name" or "chat_task"
+    session_id = Column(
+        String(64),
+        ForeignKey("sessions.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    user_id = Column(String(255), nullable=False)
+    content = Column(Text, nullable=False)
+    updated_time = Column(BigInteger, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("doc_key", name="uq_session_search_documents_doc_key"),
+        Index("ix_session_search_documents_session", "session_id"),
+        Index("ix_session_search_documents_user", "user_id"),
+    )
@@ -2,7 +2,7 @@
 Task Event SQLAlchemy model.
 """
 
-from sqlalchemy import JSON, BigInteger, Column, ForeignKey, String, Text
+from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Index, String, Text
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -12,6 +12,11 @@ class TaskEventModel(Base):
     """SQLAlchemy model for A2A task events."""
 
     __tablename__ = "task_events"
+    __table_args__ = (
+        # Range scans for SSE replay: (task_id, sequence > last seen). Unique,
+        # so concurrent writers cannot give two events the same SSE event ID.
+        Index("ix_task_events_task_id_sequence", "task_id", "sequence", unique=True),
+    )
 
     id = Column(String, primary_key=True)
     task_id = Column(String, ForeignKey("tasks.id", ondelete="CASCADE"), index=True)
@@ -20,6 +25,10 @@ class TaskEventModel(Base):
     topic = Column(Text, nullable=False)
     direction = Column(String(50), nullable=False)
     payload = Column(JSON, nullable=False)
+    # Monotonic per-task sequence, exposed as the SSE event ID
+    sequence = Column(BigInteger, nullable=True)
+    # result.kind of response payloads (task, status-update, artifact-update)
+    kind = Column(String(32), nullable=True)
 
     # Relationship to task
     task = relationship("TaskModel", back_populates="events")
@@ -13,6 +13,7 @@ from solace_agent_mesh.shared.utils.timestamp_utils import now_epoch_ms
 from .entities import Session
 from .interfaces import ISessionRepository
 from .models import CreateSessionModel, SessionModel, UpdateSessionModel
+from .session_search_repository import SessionSearchRepository
 
 
 class SessionRepository(PaginatedRepository[SessionModel, Session], ISessionRepository):
@@ -20,6 +21,7 @@ class SessionRepository(PaginatedRepository[SessionModel, Session], ISessionRepo
 
     def __init__(self):
         super().__init__(SessionModel, Session)
+        self._search_index = SessionSearchRepository()
 
     @property
     def entity_name(self) -> str:
@@ -133,7 +135,7 @@ class SessionRepository(PaginatedRepository[SessionModel, Session], ISessionRepo
                 project_id=session.project_id,
                 updated_time=session.updated_time,
             )
-            return self.update(
+            saved = self.update(
                 db_session, session.id, update_model.model_dump(exclude_none=True)
             )
         else:
@@ -147,7 +149,12 @@ class SessionRepository(PaginatedRepository[SessionModel, Session], ISessionRepo
                 updated_time=session.updated_time,
             )
             # metric already covered
-            return self.create(db_session, create_model.model_dump())
+            saved = self.create(db_session, create_model.model_dump())
+
+        self._search_index.index_session_name(
+            db_session, saved.id, saved.user_id, saved.name
+        )
+        return saved
 
     def mark_viewed(
         self, db_session: DBSession, session_id: SessionId, user_id: UserId, viewed_at: int
@@ -326,8 +333,17 @@ class SessionRepository(PaginatedRepository[SessionModel, Session], ISessionRepo
         agent_id: str | None = None,
     ) -> list[Session]:
         """
-        Search sessions by name/title only using ILIKE.
+        Search sessions by name and chat message content.
+
+        Uses the ranked full-text index when the database has one; otherwise
+        falls back to an ILIKE match on the session name.
         """
+        if self._search_index.is_available(db_session):
+            ranked = self._search_index.search_session_ids(
+                db_session, user_id, query, pagination, project_id, agent_id
+            )
+            return self._find_by_ids_in_order(db_session, [sid for sid, _ in ranked])
+
         # Base query - only non-deleted sessions for the user
         base_query = db_session.query(SessionModel).filter(
             SessionModel.user_id == user_id,
@@ -368,8 +384,13 @@ class SessionRepository(PaginatedRepository[SessionModel, Session], ISessionRepo
         agent_id: str | None = None,
     ) -> int:
         """
-        Count search results for pagination (title-only search).
+        Count search results for pagination.
         """
+        if self._search_index.is_available(db_session):
+            return self._search_index.count_sessions(
+                db_session, user_id, query, project_id, agent_id
+            )
+
         # Base query - only non-deleted sessions for the user
         base_query = db_session.query(SessionModel).filter(
             SessionModel.user_id == user_id,
@@ -388,3 +409,23 @@ class SessionRepository(PaginatedRepository[SessionModel, Session], ISessionRepo
         search_query = base_query.filter(SessionModel.name.ilike(search_pattern))
 
         return search_query.count()
+
+    def _find_by_ids_in_order(
+        self, db_session: DBSession, session_ids: list[SessionId]
+    ) -> list[Session]:
+        """Load sessions by ID, preserving the order of `session_ids`."""
+        if not session_ids:
+            return []
+
+        with MonitorLatency(DBMonitor.query(self.table_name)):
+            models = (
+                db_session.query(SessionModel)
+                .filter(SessionModel.id.in_(session_ids))
+                .options(joinedload(SessionModel.project))
+                .all()
+            )
+
+        by_id = {model.id: model for model in models}
+        return [
+            Session.model_validate(by_id[sid]) for sid in session_ids if sid in by_id
+        ]
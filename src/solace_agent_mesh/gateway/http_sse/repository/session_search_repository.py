@@ -0,0 +1,350 @@
+"""
+Full-text search index over session names and chat task message text.
+
+The searchable text lives in `session_search_documents`. The native index on
+top of it is created by migration and depends on the database dialect:
+
+- SQLite: FTS5 external-content table `session_search_fts`, ranked with bm25().
+- PostgreSQL: generated `search_vector` tsvector column with a GIN index,
+  ranked with ts_rank().
+
+Documents are written through by the session and chat task repositories, so
+the index is maintained incrementally. When no native index exists (e.g. MySQL,
+or SQLite builds without FTS5) `is_available` returns False and callers fall
+back to their non-indexed search.
+"""
+
+import json
+import logging
+import re
+import weakref
+from typing import Any
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as DBSession
+from solace_ai_connector.common.observability import DBMonitor, MonitorLatency
+
+from solace_agent_mesh.shared.api.pagination import PaginationParams
+from solace_agent_mesh.shared.utils.timestamp_utils import now_epoch_ms
+from solace_agent_mesh.shared.utils.types import SessionId, UserId
+from .models import SessionSearchDocumentModel
+
+log = logging.getLogger(__name__)
+
+BACKEND_FTS5 = "fts5"
+BACKEND_TSVECTOR = "tsvector"
+BACKEND_NONE = "none"
+
+SQLITE_FTS_TABLE = "session_search_fts"
+POSTGRES_VECTOR_COLUMN = "search_vector"
+
+KIND_SESSION_NAME = "session_name"
+KIND_CHAT_TASK = "chat_task"
+
+# Upper bound on indexed text per document; keeps very long transcripts from
+# bloating the index while still covering the start of the conversation.
+MAX_DOCUMENT_CHARS = 100_000
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Detected backend per engine; the schema does not change while the process runs.
+_backend_cache: "weakref.WeakKeyDictionary[Engine, str]" = weakref.WeakKeyDictionary()
+
+
+def extract_chat_task_text(user_message: str | None, message_bubbles: Any) -> str:
+    """
+    Extracts the searchable text of a chat task.
+
+    Args:
+        user_message: The original user input text
+        message_bubbles: JSON string (or already decoded list) of message bubbles
+
+    Returns:
+        The user message followed by the text of every bubble, newline separated.
+    """
+    pieces: list[str] = []
+    if user_message:
+        pieces.append(user_message)
+
+    bubbles = message_bubbles
+    if isinstance(bubbles, str):
+        try:
+            bubbles = json.loads(bubbles)
+        except (TypeError, ValueError):
+            bubbles = []
+
+    if isinstance(bubbles, list):
+        for bubble in bubbles:
+            if not isinstance(bubble, dict):
+                continue
+            bubble_text = bubble.get("text")
+            # The user bubble usually repeats user_message verbatim
+            if bubble_text and bubble_text != user_message:
+                pieces.append(bubble_text)
+
+    return "\n".join(pieces)[:MAX_DOCUMENT_CHARS]
+
+
+def _tokenize(query: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(query)
+
+
+class SessionSearchRepository:
+    """Maintains and queries the session full-text search index."""
+
+    @property
+    def table_name(self) -> str:
+        return SessionSearchDocumentModel.__tablename__
+
+    # ------------------------------------------------------------------
+    # Backend detection
+    # ------------------------------------------------------------------
+
+    def get_backend(self, db: DBSession) -> str:
+        """Returns which native index backs searches on this database."""
+        engine = db.get_bind()
+        if isinstance(engine, Engine):
+            cached = _backend_cache.get(engine)
+            if cached is not None:
+                return cached
+        backend = self._detect_backend(db)
+        if isinstance(engine, Engine):
+            _backend_cache[engine] = backend
+        return backend
+
+    def is_available(self, db: DBSession) -> bool:
+        """True when a native full-text index exists for this database."""
+        return self.get_backend(db) != BACKEND_NONE
+
+    def _detect_backend(self, db: DBSession) -> str:
+        try:
+            inspector = inspect(db.connection())
+            dialect = db.get_bind().dialect.name
+            if dialect == "sqlite":
+                if SQLITE_FTS_TABLE in inspector.get_table_names():
+                    return BACKEND_FTS5
+            elif dialect == "postgresql":
+                if self.table_name in inspector.get_table_names():
+                    columns = {c["name"] for c in inspector.get_columns(self.table_name)}
+                    if POSTGRES_VECTOR_COLUMN in columns:
+                        return BACKEND_TSVECTOR
+        except Exception as e:
+            log.warning("Could not detect session search index backend: %s", e)
+        return BACKEND_NONE
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def index_session_name(
+        self, db: DBSession, session_id: SessionId, user_id: UserId, name: str | None
+    ) -> None:
+        """Creates, updates or removes the document holding a session's name."""
+        self._upsert(
+            db,
+            doc_key=f"session:{session_id}",
+            kind=KIND_SESSION_NAME,
+            session_id=session_id,
+            user_id=user_id,
+            content=(name or "")[:MAX_DOCUMENT_CHARS],
+        )
+
+    def index_chat_task(
+        self,
+        db: DBSession,
+        task_id: str,
+        session_id: SessionId,
+        user_id: UserId,
+        user_message: str | None,
+        message_bubbles: Any,
+    ) -> None:
+        """Creates or updates the document holding a chat task's message text."""
+        self._upsert(
+            db,
+            doc_key=f"chat_task:{task_id}",
+            kind=KIND_CHAT_TASK,
+            session_id=session_id,
+            user_id=user_id,
+            content=extract_chat_task_text(user_message, message_bubbles),
+        )
+
+    @MonitorLatency(DBMonitor.delete("session_search_documents"))
+    def delete_chat_tasks_for_session(self, db: DBSession, session_id: SessionId) -> int:
+        """Removes the chat task documents of a session."""
+        return (
+            db.query(SessionSearchDocumentModel)
+            .filter(
+                SessionSearchDocumentModel.session_id == session_id,
+                SessionSearchDocumentModel.kind == KIND_CHAT_TASK,
+            )
+            .delete(synchronize_session=False)
+        )
+
+    def _upsert(
+        self,
+        db: DBSession,
+        doc_key: str,
+        kind: str,
+        session_id: SessionId,
+        user_id: UserId,
+        content: str,
+    ) -> None:
+        with MonitorLatency(DBMonitor.query(self.table_name)):
+            model = (
+                db.query(SessionSearchDocumentModel)
+                .filter(SessionSearchDocumentModel.doc_key == doc_key)
+                .first()
+            )
+
+        if not content:
+            if model:
+                with MonitorLatency(DBMonitor.delete(self.table_name)):
+                    db.delete(model)
+                    db.flush()
+            return
+
+        if model:
+            if model.content == content and model.session_id == session_id:
+                return
+            with MonitorLatency(DBMonitor.update(self.table_name)):
+                model.content = content
+                model.session_id = session_id
+                model.updated_time = now_epoch_ms()
+                db.flush()
+        else:
+            with MonitorLatency(DBMonitor.insert(self.table_name)):
+                db.add(
+                    SessionSearchDocumentModel(
+                        doc_key=doc_key,
+                        kind=kind,
+                        session_id=session_id,
+                        user_id=user_id,
+                        content=content,
+                        updated_time=now_epoch_ms(),
+                    )
+                )
+                db.flush()
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def search_session_ids(
+        self,
+        db: DBSession,
+        user_id: UserId,
+        query: str,
+        pagination: PaginationParams | None = None,
+        project_id: str | None = None,
+        agent_id: str | None = None,
+    ) -> list[tuple[SessionId, float]]:
+        """
+        Returns (session_id, score) pairs for the user's sessions matching the
+        query, best match first. Every query token must match (as a prefix) in
+        the same document. Higher scores are better on all backends.
+        """
+        match = self._build_match(db, query)
+        if match is None:
+            return []
+
+        matches_cte, score_expr, order = self._ranked_matches_sql(db)
+        filters, params = self._session_filters(user_id, project_id, agent_id)
+        params["match"] = match
+
+        sql = (
+            f"{matches_cte} "
+            f"SELECT d.session_id, {score_expr} AS score "
+            "FROM session_search_documents d "
+            "JOIN matches m ON m.doc_id = d.id "
+            "JOIN sessions s ON s.id = d.session_id "
+            f"WHERE {filters} "
+            "GROUP BY d.session_id "
+            f"ORDER BY score {order}, MAX(s.updated_time) DESC"
+        )
+        if pagination:
+            sql += " LIMIT :limit OFFSET :offset"
+            params["limit"] = pagination.page_size
+            params["offset"] = pagination.offset
+
+        with MonitorLatency(DBMonitor.query(self.table_name)):
+            rows = db.execute(text(sql), params).all()
+
+        if order == "ASC":
+            # bm25() is lower-is-better; flip so callers see higher-is-better
+            return [(row[0], -float(row[1])) for row in rows]
+        return [(row[0], float(row[1])) for row in rows]
+
+    def count_sessions(
+        self,
+        db: DBSession,
+        user_id: UserId,
+        query: str,
+        project_id: str | None = None,
+        agent_id: str | None = None,
+    ) -> int:
+        """Counts the user's sessions matching the query."""
+        match = self._build_match(db, query)
+        if match is None:
+            return 0
+
+        matches_cte, _, _ = self._ranked_matches_sql(db)
+        filters, params = self._session_filters(user_id, project_id, agent_id)
+        params["match"] = match
+
+        sql = (
+            f"{matches_cte} "
+            "SELECT COUNT(DISTINCT d.session_id) "
+            "FROM session_search_documents d "
+            "JOIN matches m ON m.doc_id = d.id "
+            "JOIN sessions s ON s.id = d.session_id "
+            f"WHERE {filters}"
+        )
+        with MonitorLatency(DBMonitor.query(self.table_name)):
+            return int(db.execute(text(sql), params).scalar() or 0)
+
+    def _build_match(self, db: DBSession, query: str) -> str | None:
+        tokens = _tokenize(query)
+        if not tokens:
+            return None
+        if self.get_backend(db) == BACKEND_FTS5:
+            # Quoted prefix terms, implicitly AND-ed
+            return " ".join(f'"{token}"*' for token in tokens)
+        return " & ".join(f"{token}:*" for token in tokens)
+
+    def _ranked_matches_sql(self, db: DBSession) -> tuple[str, str, str]:
+        """Returns (CTE producing doc_id/rank, per-session score, sort order)."""
+        backend = self.get_backend(db)
+        if backend == BACKEND_FTS5:
+            return (
+                "WITH matches AS ("
+                "SELECT rowid AS doc_id, rank "
+                f"FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH :match)",
+                "MIN(m.rank)",
+                "ASC",
+            )
+        if backend == BACKEND_TSVECTOR:
+            return (
+                "WITH matches AS ("
+                f"SELECT id AS doc_id, ts_rank({POSTGRES_VECTOR_COLUMN}, "
+                "to_tsquery('simple', :match)) AS rank "
+                "FROM session_search_documents "
+                f"WHERE {POSTGRES_VECTOR_COLUMN} @@ to_tsquery('simple', :match))",
+                "MAX(m.rank)",
+                "DESC",
+            )
+        raise RuntimeError("No native session search index is available.")
+
+    @staticmethod
+    def _session_filters(
+        user_id: UserId, project_id: str | None, agent_id: str | None
+    ) -> tuple[str, dict[str, Any]]:
+        clauses = ["s.user_id = :user_id", "s.deleted_at IS NULL"]
+        params: dict[str, Any] = {"user_id": user_id}
+        if project_id is not None:
+            clauses.append("s.project_id = :project_id")
+            params["project_id"] = project_id
+        if agent_id is not None:
+            clauses.append("s.agent_id = :agent_id")
+            params["agent_id"] = agent_id
+        return " AND ".join(clauses), params
@@ -13,6 +13,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session as DBSession
 from solace_ai_connector.common.observability import DBMonitor, MonitorLatency
 
+from .chunked_delete import ChunkCallback, RetentionCursor, delete_older_than_in_chunks
 from .models.sse_event_buffer_model import SSEEventBufferModel
 from .models.task_model import TaskModel
 from solace_agent_mesh.shared.utils.timestamp_utils import now_epoch_ms
@@ -466,6 +467,8 @@ class SSEEventBufferRepository:
         db: DBSession,
         older_than_ms: int,
         batch_size: int = 1000,
+        after: Optional[RetentionCursor] = None,
+        on_chunk: Optional[ChunkCallback] = None,
     ) -> int:
         """
         Clean up ALL events (both consumed and unconsumed) older than the specified time.
@@ -478,39 +481,21 @@ class SSEEventBufferRepository:
             db: Database session
             older_than_ms: Delete events created before this epoch time (ms)
             batch_size: Number of events to delete per batch
+            after: Cursor from a previous, interrupted run to resume from
+            on_chunk: Called after each committed batch; returning False stops the run
             
         Returns:
             Total number of events deleted
         """
-        total_deleted = 0
-        
-        while True:
-            # Get IDs of events to delete
-            with MonitorLatency(DBMonitor.query("sse_event_buffer")):
-                events_to_delete = db.query(SSEEventBufferModel.id)\
-                    .filter(SSEEventBufferModel.created_at < older_than_ms)\
-                    .limit(batch_size)\
-                    .all()
-
-            if not events_to_delete:
-                break
-
-            event_ids = [e.id for e in events_to_delete]
-
-            with MonitorLatency(DBMonitor.delete("sse_event_buffer")):
-                deleted = db.query(SSEEventBufferModel)\
-                    .filter(SSEEventBufferModel.id.in_(event_ids))\
-                    .delete(synchronize_session=False)
-                db.commit()
-
-            total_deleted += deleted
-
-            log.debug(
-                "%s Deleted batch of %d old SSE events (total so far: %d)",
-                self.log_identifier,
-                deleted,
-                total_deleted,
-            )
+        total_deleted = delete_older_than_in_chunks(
+            db,
+            SSEEventBufferModel,
+            SSEEventBufferModel.created_at,
+            older_than_ms,
+            batch_size,
+            after=after,
+            on_chunk=on_chunk,
+        )
         
         if total_deleted > 0:
             log.info(
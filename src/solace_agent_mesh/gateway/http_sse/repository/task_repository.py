@@ -3,22 +3,33 @@ Task repository implementation using SQLAlchemy.
 """
 
 import logging
+from collections.abc import Iterator
 
-from sqlalchemy.orm import Session as DBSession
+from sqlalchemy import and_, exists, func, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session as DBSession, aliased
 from solace_ai_connector.common.observability import DBMonitor, MonitorLatency
 
 log = logging.getLogger(__name__)
 
 from solace_agent_mesh.shared.api.pagination import PaginationParams
 from solace_agent_mesh.shared.utils.types import UserId
+from ..event_sequence import next_event_sequence
+from .chunked_delete import ChildTable, ChunkCallback, RetentionCursor, delete_older_than_in_chunks
 from .entities import Task, TaskEvent
 from .interfaces import ITaskRepository
 from .models import TaskEventModel, TaskModel
 
+# Attempts to store an event when concurrent writers race for its sequence
+MAX_SEQUENCE_RETRIES = 3
+
 
 class TaskRepository(ITaskRepository):
     """SQLAlchemy implementation of task repository."""
 
+    # Rows fetched per round trip when streaming events with a server-side cursor
+    EVENT_STREAM_BATCH_SIZE = 500
+
     def save_task(self, session: DBSession, task: Task) -> Task:
         """Create or update a task."""
         with MonitorLatency(DBMonitor.query("tasks")):
@@ -73,21 +84,49 @@ class TaskRepository(ITaskRepository):
 
     @MonitorLatency(DBMonitor.insert("task_events"))
     def save_event(self, session: DBSession, event: TaskEvent) -> TaskEvent:
-        """Save a task event."""
-        model = TaskEventModel(
-            id=event.id,
-            task_id=event.task_id,
-            user_id=event.user_id,
-            created_time=event.created_time,
-            topic=event.topic,
-            direction=event.direction,
-            payload=event.payload,
-        )
-        session.add(model)
-        session.flush()
-        # Note: We don't refresh here since we already have all the data,
-        # and refresh can fail in certain edge cases (e.g., foreign key constraints)
-        return event
+        """
+        Save a task event, assigning its per-task sequence and result kind.
+
+        (task_id, sequence) is unique. If a concurrent writer takes the same
+        sequence first, the insert is rolled back to a savepoint and retried
+        with a sequence read after that writer's event.
+        """
+        kind = event.kind or self._result_kind(event.payload)
+        for attempt in range(MAX_SEQUENCE_RETRIES):
+            previous = (
+                session.query(func.max(TaskEventModel.sequence))
+                .filter(TaskEventModel.task_id == event.task_id)
+                .scalar()
+            )
+            sequence = next_event_sequence(previous, event.created_time)
+            model = TaskEventModel(
+                id=event.id,
+                task_id=event.task_id,
+                user_id=event.user_id,
+                created_time=event.created_time,
+                topic=event.topic,
+                direction=event.direction,
+                payload=event.payload,
+                sequence=sequence,
+                kind=kind,
+            )
+            savepoint = session.begin_nested()
+            try:
+                session.add(model)
+                session.flush()
+            except IntegrityError:
+                savepoint.rollback()
+                if attempt == MAX_SEQUENCE_RETRIES - 1:
+                    raise
+                log.warning(
+                    "Sequence %d of task %s was taken concurrently (attempt %d/%d), retrying",
+                    sequence, event.task_id, attempt + 1, MAX_SEQUENCE_RETRIES,
+                )
+                continue
+            savepoint.commit()
+            # Note: We don't refresh here since we already have all the data,
+            # and refresh can fail in certain edge cases (e.g., foreign key constraints)
+            return event.model_copy(update={"sequence": sequence, "kind": kind})
 
     @MonitorLatency(DBMonitor.query("tasks"))
     def find_by_id(self, session: DBSession, task_id: str) -> Task | None:
@@ -117,6 +156,143 @@ class TaskRepository(ITaskRepository):
         events = [self._event_model_to_entity(model) for model in event_models]
         return task, events
 
+    @MonitorLatency(DBMonitor.query("tasks"))
+    def find_by_ids(self, session: DBSession, task_ids: list[str]) -> list[Task]:
+        """Find tasks by their IDs without loading any events."""
+        if not task_ids:
+            return []
+        models = session.query(TaskModel).filter(TaskModel.id.in_(task_ids)).all()
+        return [self._task_model_to_entity(model) for model in models]
+
+    def find_events_page(
+        self,
+        session: DBSession,
+        task_ids: list[str],
+        after: tuple[int, str] | None = None,
+        limit: int = 100,
+    ) -> list[TaskEvent]:
+        """
+        Returns one page of events for the given tasks using keyset pagination.
+
+        Events are ordered by (created_time, id) so that the position of the
+        last returned event is a stable cursor, independent of concurrent inserts.
+
+        Args:
+            session: Database session
+            task_ids: Task IDs whose events should be included
+            after: (created_time, id) of the last event of the previous page
+            limit: Maximum number of events to return
+
+        Returns:
+            Up to `limit` events strictly after the cursor position
+        """
+        if not task_ids:
+            return []
+
+        query = session.query(TaskEventModel).filter(
+            TaskEventModel.task_id.in_(task_ids)
+        )
+        if after is not None:
+            after_time, after_id = after
+            query = query.filter(
+                or_(
+                    TaskEventModel.created_time > after_time,
+                    and_(
+                        TaskEventModel.created_time == after_time,
+                        TaskEventModel.id > after_id,
+                    ),
+                )
+            )
+
+        with MonitorLatency(DBMonitor.query("task_events")):
+            models = (
+                query.order_by(
+                    TaskEventModel.created_time.asc(), TaskEventModel.id.asc()
+                )
+                .limit(limit)
+                .all()
+            )
+
+        return [self._event_model_to_entity(model) for model in models]
+
+    def find_replay_events_page(
+        self,
+        session: DBSession,
+        task_id: str,
+        after_sequence: int = 0,
+        limit: int = 200,
+        skip_superseded_artifact_updates: bool = False,
+    ) -> list[TaskEvent]:
+        """
+        Returns one page of a task's events for SSE replay.
+
+        Served by the (task_id, sequence) index, so each page costs the same
+        regardless of how many events precede the cursor.
+
+        Args:
+            session: Database session
+            task_id: Task whose events should be replayed
+            after_sequence: Sequence of the last event the client received
+            limit: Maximum number of events to return
+            skip_superseded_artifact_updates: Leave out artifact-update
+                responses when the task already has a final task response
+
+        Returns:
+            Up to `limit` events with a sequence greater than `after_sequence`
+        """
+        query = session.query(TaskEventModel).filter(
+            TaskEventModel.task_id == task_id,
+            TaskEventModel.sequence > after_sequence,
+        )
+        if skip_superseded_artifact_updates:
+            final_event = aliased(TaskEventModel)
+            has_final_response = exists().where(
+                final_event.task_id == task_id,
+                final_event.direction == "response",
+                final_event.kind == "task",
+            )
+            query = query.filter(
+                or_(
+                    TaskEventModel.kind.is_(None),
+                    TaskEventModel.kind != "artifact-update",
+                    TaskEventModel.direction != "response",
+                    ~has_final_response,
+                )
+            )
+
+        with MonitorLatency(DBMonitor.query("task_events")):
+            models = query.order_by(TaskEventModel.sequence.asc()).limit(limit).all()
+
+        return [self._event_model_to_entity(model) for model in models]
+
+    def iter_events(
+        self,
+        session: DBSession,
+        task_ids: list[str],
+        batch_size: int | None = None,
+    ) -> Iterator[TaskEvent]:
+        """
+        Streams events for the given tasks in chronological order.
+
+        Rows are fetched through a server-side cursor (`yield_per`) so memory
+        use stays bounded by `batch_size` regardless of how many events exist.
+        The session must stay open until the iterator is exhausted.
+        """
+        if not task_ids:
+            return
+
+        stmt = (
+            select(TaskEventModel)
+            .where(TaskEventModel.task_id.in_(task_ids))
+            .order_by(TaskEventModel.created_time.asc(), TaskEventModel.id.asc())
+            .execution_options(yield_per=batch_size or self.EVENT_STREAM_BATCH_SIZE)
+        )
+
+        for model in session.execute(stmt).scalars():
+            yield self._event_model_to_entity(model)
+            # Detach so the identity map does not grow with the stream
+            session.expunge(model)
+
     def search(
         self,
         session: DBSession,
@@ -145,14 +321,24 @@ class TaskRepository(ITaskRepository):
 
         return [self._task_model_to_entity(model) for model in models]
 
-    def delete_tasks_older_than(self, session: DBSession, cutoff_time_ms: int, batch_size: int) -> int:
+    def delete_tasks_older_than(
+        self,
+        session: DBSession,
+        cutoff_time_ms: int,
+        batch_size: int,
+        after: RetentionCursor | None = None,
+        on_chunk: ChunkCallback | None = None,
+    ) -> int:
         """
-        Delete tasks (and their events via cascade) older than the cutoff time.
-        Uses batch deletion to avoid long-running transactions.
+        Delete tasks older than the cutoff time together with their events.
+        Walks tasks in (start_time, id) order and deletes each chunk's events
+        before the tasks themselves, so no database cascade is relied upon.
 
         Args:
             cutoff_time_ms: Epoch milliseconds - tasks with start_time before this will be deleted
-            batch_size: Number of tasks to delete per batch
+            batch_size: Number of rows to delete per batch
+            after: Cursor from a previous, interrupted run to resume from
+            on_chunk: Called after each committed batch; returning False stops the run
 
         Returns:
             Total number of tasks deleted
@@ -161,36 +347,16 @@ class TaskRepository(ITaskRepository):
             This method commits each batch internally due to the nature of batch processing.
             Each batch is an atomic operation to prevent long-running transactions.
         """
-        total_deleted = 0
-
-        while True:
-            with MonitorLatency(DBMonitor.query("tasks")):
-                task_ids_to_delete = (
-                    session.query(TaskModel.id)
-                    .filter(TaskModel.start_time < cutoff_time_ms)
-                    .limit(batch_size)
-                    .all()
-                )
-
-            if not task_ids_to_delete:
-                break
-
-            ids = [task_id[0] for task_id in task_ids_to_delete]
-
-            with MonitorLatency(DBMonitor.delete("tasks")):
-                deleted_count = (
-                    session.query(TaskModel)
-                    .filter(TaskModel.id.in_(ids))
-                    .delete(synchronize_session=False)
-                )
-                session.commit()
-
-            total_deleted += deleted_count
-
-            if deleted_count < batch_size:
-                break
-
-        return total_deleted
+        return delete_older_than_in_chunks(
+            session,
+            TaskModel,
+            TaskModel.start_time,
+            cutoff_time_ms,
+            batch_size,
+            children=(ChildTable(TaskEventModel, TaskEventModel.task_id),),
+            after=after,
+            on_chunk=on_chunk,
+        )
 
     def find_all_by_parent_chain(self, session: DBSession, task_id: str) -> list[str]:
         """
@@ -393,3 +559,10 @@ class TaskRepository(ITaskRepository):
     def _event_model_to_entity(self, model: TaskEventModel) -> TaskEvent:
         """Convert SQLAlchemy event model to domain entity."""
         return TaskEvent.model_validate(model)
+
+    @staticmethod
+    def _result_kind(payload: dict) -> str | None:
+        """Returns result.kind of a JSON-RPC response payload, if any."""
+        result = payload.get("result") if isinstance(payload, dict) else None
+        kind = result.get("kind") if isinstance(result, dict) else None
+        return kind if isinstance(kind, str) else None
@@ -3,14 +3,25 @@ API Router for agent discovery and management.
 """
 
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from a2a.types import AgentCard
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from pydantic import TypeAdapter
 
 from ....common.agent_registry import AgentRegistry
+from ....common.middleware.config_resolver import ConfigResolver
 from ....common.middleware.registry import MiddlewareRegistry
-from ..dependencies import get_agent_registry, get_user_config
+from ..agent_card_cache import (
+    AgentCardResponseCache,
+    CachedAgentCardResponse,
+    etag_matches,
+)
+from ..dependencies import (
+    get_agent_card_response_cache,
+    get_agent_registry,
+    get_user_config,
+)
 
 log = logging.getLogger(__name__)
 
@@ -20,6 +31,11 @@ router = APIRouter()
 TOOLS_EXTENSION_URI = "https://solace.com/a2a/extensions/sam/tools"
 DISPLAY_NAME_EXTENSION_URI = "https://solace.com/a2a/extensions/display-name"
 
+# Clients may keep the response but must revalidate it with If-None-Match
+AGENT_CARDS_CACHE_CONTROL = "private, no-cache"
+
+_agent_card_list_adapter = TypeAdapter(list[AgentCard])
+
 
 def _get_agent_display_name(agent: AgentCard) -> str:
     """
@@ -167,10 +183,82 @@ def _filter_agent_tools(
     return agent_copy
 
 
+def _get_user_config_fingerprint(
+    config_resolver: Any, user_config: dict[str, Any]
+) -> Optional[str]:
+    fingerprint = getattr(config_resolver, "get_user_config_fingerprint", None)
+    if fingerprint is None:
+        fingerprint = ConfigResolver.get_user_config_fingerprint
+    return fingerprint(user_config)
+
+
+def _build_agent_cards(
+    agent_registry: AgentRegistry,
+    user_config: dict[str, Any],
+    config_resolver: Any,
+    log_prefix: str,
+) -> list[AgentCard]:
+    """
+    Returns the agent cards visible to the user, with tools the user may not
+    use removed, sorted by display name.
+    """
+    agent_names = agent_registry.get_agent_names()
+    all_agents = [
+        agent_registry.get_agent(name)
+        for name in agent_names
+        if agent_registry.get_agent(name)
+    ]
+
+    # Filter agents by user's access permissions
+    filtered_agents = []
+
+    for agent in all_agents:
+        operation_spec = {
+            "operation_type": "agent_access",
+            "target_agent": agent.name,
+        }
+        validation_result = config_resolver.validate_operation_config(
+            user_config, operation_spec, {"source": "agent_cards_endpoint"}
+        )
+        if validation_result.get("valid", False):
+            filtered_agents.append(agent)
+        else:
+            log.debug(
+                "%sAgent '%s' filtered out for user. Required scopes: %s",
+                log_prefix,
+                agent.name,
+                validation_result.get("required_scopes", []),
+            )
+
+    log.debug(
+        "%sReturning %d/%d agents after agent-level filtering.",
+        log_prefix,
+        len(filtered_agents),
+        len(all_agents),
+    )
+
+    # Filter tools within each agent based on user's scopes
+    agents_with_filtered_tools = [
+        _filter_agent_tools(agent, user_config, config_resolver, log_prefix)
+        for agent in filtered_agents
+    ]
+
+    # Sort agents alphabetically by display name (case-insensitive)
+    agents_with_filtered_tools.sort(
+        key=lambda agent: _get_agent_display_name(agent).lower()
+    )
+
+    return agents_with_filtered_tools
+
+
 @router.get("/agentCards", response_model=list[AgentCard])
 async def get_discovered_agent_cards(
     agent_registry: AgentRegistry = Depends(get_agent_registry),
     user_config: dict[str, Any] = Depends(get_user_config),
+    response_cache: Optional[AgentCardResponseCache] = Depends(
+        get_agent_card_response_cache
+    ),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
 ):
     """
     Retrieves a list of discovered A2A agents filtered by user permissions.
@@ -179,61 +267,47 @@ async def get_discovered_agent_cards(
     users only see agents they have permission to access. Additionally, tools
     within each agent are filtered based on their required_scopes to ensure
     users only see tools they have permission to use.
+
+    Responses carry a strong ETag; a request whose If-None-Match matches the
+    current response receives 304 Not Modified. Serialized responses are
+    cached per registry generation and user config fingerprint.
     """
     log_prefix = "[GET /api/v1/agentCards] "
     log.info("%sRequest received.", log_prefix)
     try:
-        agent_names = agent_registry.get_agent_names()
-        all_agents = [
-            agent_registry.get_agent(name)
-            for name in agent_names
-            if agent_registry.get_agent(name)
-        ]
-
-        # Filter agents by user's access permissions
         config_resolver = MiddlewareRegistry.get_config_resolver()
-        filtered_agents = []
-
-        for agent in all_agents:
-            operation_spec = {
-                "operation_type": "agent_access",
-                "target_agent": agent.name,
-            }
-            validation_result = config_resolver.validate_operation_config(
-                user_config, operation_spec, {"source": "agent_cards_endpoint"}
-            )
-            if validation_result.get("valid", False):
-                filtered_agents.append(agent)
-            else:
-                log.debug(
-                    "%sAgent '%s' filtered out for user. Required scopes: %s",
-                    log_prefix,
-                    agent.name,
-                    validation_result.get("required_scopes", []),
-                )
-
-        log.debug(
-            "%sReturning %d/%d agents after agent-level filtering.",
-            log_prefix,
-            len(filtered_agents),
-            len(all_agents),
-        )
-
-        # Filter tools within each agent based on user's scopes
-        agents_with_filtered_tools = [
-            _filter_agent_tools(agent, user_config, config_resolver, log_prefix)
-            for agent in filtered_agents
-        ]
 
-        # Sort agents alphabetically by display name (case-insensitive)
-        agents_with_filtered_tools.sort(
-            key=lambda agent: _get_agent_display_name(agent).lower()
+        # Read the generation before building so a registry change during the
+        # build can never be cached under the newer generation.
+        generation = getattr(agent_registry, "generation", None)
+        fingerprint = None
+        if response_cache is not None and isinstance(generation, int):
+            fingerprint = _get_user_config_fingerprint(config_resolver, user_config)
+
+        cached = (
+            response_cache.get(generation, fingerprint)
+            if fingerprint is not None
+            else None
         )
-
-        return agents_with_filtered_tools
+        if cached is None:
+            agent_cards = _build_agent_cards(
+                agent_registry, user_config, config_resolver, log_prefix
+            )
+            body = _agent_card_list_adapter.dump_json(agent_cards, by_alias=True)
+            if fingerprint is not None:
+                cached = response_cache.put(generation, fingerprint, body)
+            else:
+                cached = CachedAgentCardResponse.from_body(body)
+        else:
+            log.debug("%sServing cached response.", log_prefix)
     except Exception as e:
         log.exception("%sError retrieving discovered agent cards: %s", log_prefix, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error retrieving agent list.",
         ) from e
+
+    headers = {"ETag": cached.etag, "Cache-Control": AGENT_CARDS_CACHE_CONTROL}
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
@@ -964,29 +964,21 @@ async def export_project(
     log.info(f"User {user_id} exporting project {project_id}")
     
     try:
-        # Create ZIP file
-        zip_buffer = await project_service.export_project_as_zip(
+        # Access checks run now; the ZIP itself is built while it streams
+        project, zip_chunks = await project_service.stream_project_export(
             db=db,
             project_id=project_id,
             user_id=user_id
         )
         
-        # Get project for filename
-        project = project_service.get_project(db, project_id, user_id)
-        if not project:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Project not found"
-            )
-        
         # Create safe filename
         safe_name = project.name.replace(' ', '-').replace('/', '-')
         filename = f"project-{safe_name}-{project_id[:8]}.zip"
         
-        log.info(f"Project {project_id} exported successfully")
+        log.info(f"Streaming export of project {project_id}")
         
         return StreamingResponse(
-            zip_buffer,
+            zip_chunks,
             media_type="application/zip",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"'
@@ -166,7 +166,7 @@ async def search_sessions(
     session_service: SessionService = Depends(get_session_business_service),
 ):
     """
-    Search sessions by name/title only.
+    Search sessions by name and chat message content, best match first.
     """
     user_id = user.get("id")
     log.info(
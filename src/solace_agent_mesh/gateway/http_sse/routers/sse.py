@@ -5,13 +5,16 @@ API Router for Server-Sent Events (SSE) subscriptions.
 import logging
 import asyncio
 import json
+from collections.abc import AsyncIterator
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, Request as FastAPIRequest, HTTPException, status, Query
+from fastapi import APIRouter, Depends, Header, Request as FastAPIRequest, HTTPException, status, Query
 
 from sse_starlette.sse import EventSourceResponse
 
 from ....gateway.http_sse.sse_manager import SSEManager
 from ....gateway.http_sse.dependencies import get_sse_manager, get_user_id, short_lived_session, _is_connection_error
+from ....gateway.http_sse.event_sequence import parse_last_event_id, sequence_after_timestamp
+from ....gateway.http_sse.repository.entities import TaskEvent
 from ....gateway.http_sse.repository.task_repository import TaskRepository
 
 log = logging.getLogger(__name__)
@@ -21,99 +24,110 @@ trace_logger = logging.getLogger("sam_trace")
 router = APIRouter()
 
 
-def _prepare_replay_events(
+# Events fetched per short-lived session while replaying
+REPLAY_PAGE_SIZE = 200
+
+_SSE_EVENT_TYPES = {
+    "task": "final_response",
+    "status-update": "status_update",
+    "artifact-update": "artifact_update",
+}
+
+
+def _to_sse_event(event: TaskEvent) -> dict[str, Any]:
+    """Converts a stored task event into an SSE event carrying its sequence as ID."""
+    event_type = "status_update"  # Default
+    if event.direction == "response":
+        event_type = _SSE_EVENT_TYPES.get(event.kind, event_type)
+
+    sse_event = {"event": event_type, "data": json.dumps(event.payload)}
+    if event.sequence is not None:
+        sse_event["id"] = str(event.sequence)
+    return sse_event
+
+
+def _fetch_replay_page(
     task_id: str,
-    is_background_task: bool,
-    last_event_timestamp: int,
-    log_prefix: str
-) -> list[dict[str, Any]]:
+    after_sequence: int,
+    skip_superseded_artifact_updates: bool,
+    log_prefix: str,
+) -> list[TaskEvent]:
     """
-    Prepare events to replay for SSE reconnection using a short-lived database session.
-    
-    This function uses its own database session that is closed before returning,
-    preventing the long-lived SSE connection from holding a database connection.
-    
-    Returns:
-        List of event dictionaries with 'event' type and 'data' payload ready for SSE.
+    Fetch one page of replay events using a short-lived database session.
+
+    Each page opens and closes its own session, so the long-lived SSE
+    connection never holds a database connection while it is streaming.
     """
     from ....gateway.http_sse.dependencies import SessionLocal
 
-    replay_events = []
-
     if SessionLocal is None:
         log.warning("%sDatabase not configured, cannot replay events", log_prefix)
-        return replay_events
-    
-    replay_from_timestamp = last_event_timestamp if last_event_timestamp > 0 else 0
-    
+        return []
+
+    with short_lived_session() as db:
+        return TaskRepository().find_replay_events_page(
+            db,
+            task_id,
+            after_sequence=after_sequence,
+            limit=REPLAY_PAGE_SIZE,
+            skip_superseded_artifact_updates=skip_superseded_artifact_updates,
+        )
+
+
+async def _stream_replay_events(
+    task_id: str,
+    is_background_task: bool,
+    after_sequence: int,
+    log_prefix: str,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Yield missed events for SSE reconnection, one indexed page at a time.
+
+    For background tasks whose final response is already stored, intermediate
+    artifact updates are filtered out by the query itself.
+    """
+    replayed = 0
+    try:
+        while True:
+            page = await asyncio.to_thread(
+                _fetch_replay_page,
+                task_id,
+                after_sequence,
+                is_background_task,
+                log_prefix,
+            )
+            for event in page:
+                yield _to_sse_event(event)
+            replayed += len(page)
+            if len(page) < REPLAY_PAGE_SIZE:
+                break
+            after_sequence = page[-1].sequence
+    except Exception as e:
+        log.error("%sError replaying events: %s", log_prefix, e, exc_info=True)
+
+    log.info("%sFinished replaying %d missed events", log_prefix, replayed)
+
+
+def _resolve_replay_start(
+    is_background_task: bool,
+    last_event_id: Optional[int],
+    last_event_timestamp: int,
+    log_prefix: str,
+) -> int:
+    """Returns the sequence after which events must be replayed."""
+    if last_event_id is not None:
+        log.info("%sResuming after Last-Event-ID %d", log_prefix, last_event_id)
+        return last_event_id
+
     # For background tasks, always replay from the beginning
     if is_background_task:
-        replay_from_timestamp = 0
         log.info("%sBackground task reconnection - replaying ALL events from beginning", log_prefix)
-    else:
-        log.info("%sReplaying events since timestamp %d", log_prefix, replay_from_timestamp)
-    
-    try:
-        with short_lived_session() as db:
-            repo = TaskRepository()
-            task_with_events = repo.find_by_id_with_events(db, task_id)
-            
-            if task_with_events:
-                _, events = task_with_events
-                # Use >= for timestamp 0 to include all events
-                missed_events = [e for e in events if e.created_time > replay_from_timestamp]
-                log.info("%sReplaying %d missed events", log_prefix, len(missed_events))
-                
-                # For background tasks, filter out intermediate artifact update events
-                if is_background_task:
-                    has_final_response = any(
-                        e.direction == "response" and
-                        "result" in e.payload and
-                        e.payload.get("result", {}).get("kind") == "task"
-                        for e in missed_events
-                    )
-                    
-                    if has_final_response:
-                        filtered_events = []
-                        for e in missed_events:
-                            if e.direction == "response" and "result" in e.payload:
-                                result = e.payload.get("result", {})
-                                if result.get("kind") == "artifact-update":
-                                    log.debug(
-                                        "%sFiltering out intermediate artifact-update event during replay",
-                                        log_prefix
-                                    )
-                                    continue
-                            filtered_events.append(e)
-                        missed_events = filtered_events
-                        log.info(
-                            "%sFiltered to %d events (removed intermediate artifact updates)",
-                            log_prefix,
-                            len(missed_events)
-                        )
-                
-                # Convert events to SSE format
-                for event in missed_events:
-                    event_type = "status_update"  # Default
-                    
-                    if event.direction == "response":
-                        if "result" in event.payload:
-                            result = event.payload.get("result", {})
-                            if result.get("kind") == "task":
-                                event_type = "final_response"
-                            elif result.get("kind") == "status-update":
-                                event_type = "status_update"
-                            elif result.get("kind") == "artifact-update":
-                                event_type = "artifact_update"
-                    
-                    replay_events.append({
-                        "event": event_type,
-                        "data": json.dumps(event.payload)
-                    })
-    except Exception as e:
-        log.error("%sError preparing replay events: %s", log_prefix, e, exc_info=True)
-    
-    return replay_events
+        return 0
+
+    if last_event_timestamp > 0:
+        log.info("%sReplaying events since timestamp %d", log_prefix, last_event_timestamp)
+        return sequence_after_timestamp(last_event_timestamp)
+    return 0
 
 
 def _get_task_info(task_id: str, log_prefix: str) -> Optional[bool]:
@@ -157,6 +171,7 @@ async def subscribe_to_task_events(
     request: FastAPIRequest,
     reconnect: bool = Query(False, description="Whether this is a reconnection attempt"),
     last_event_timestamp: int = Query(0, description="Timestamp of last received event for replay"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
     sse_manager: SSEManager = Depends(get_sse_manager),
 ):
     """
@@ -169,8 +184,12 @@ async def subscribe_to_task_events(
         task_id: The task to monitor
         reconnect: If true, replay missed events before streaming live
         last_event_timestamp: Timestamp of last received event (for replay)
+        last_event_id: Standard SSE resume header; replays events after this
+            ID and implies a reconnection
     """
     log_prefix = "[GET /api/v1/sse/subscribe/%s] " % task_id
+    resume_after = parse_last_event_id(last_event_id)
+    reconnect = reconnect or resume_after is not None
     log.debug("%sClient requesting SSE subscription (reconnect=%s).", log_prefix, reconnect)
 
     connection_queue: asyncio.Queue = None
@@ -190,13 +209,13 @@ async def subscribe_to_task_events(
         connection_queue = await sse_manager.create_sse_connection(task_id)
         log.debug("%sSSE connection queue created.", log_prefix)
         
-        # Prepare replay events using a short-lived database session
-        # This closes its DB connection before the SSE stream starts
+        # Replay is streamed page by page inside the generator, each page
+        # with its own short-lived database session.
         # Note: Connection queue is already registered, so any new events will be queued
-        replay_events: list[dict[str, Any]] = []
+        replay_after: Optional[int] = None
         if reconnect:
-            replay_events = _prepare_replay_events(
-                task_id, is_background_task, last_event_timestamp, log_prefix
+            replay_after = _resolve_replay_start(
+                is_background_task, resume_after, last_event_timestamp, log_prefix
             )
 
         async def event_generator():
@@ -206,11 +225,11 @@ async def subscribe_to_task_events(
                 yield {"comment": "SSE connection established"}
                 log.debug("%sSent initial SSE comment.", log_prefix)
                 
-                # Replay pre-fetched events (database session already closed)
-                if replay_events:
-                    for event in replay_events:
+                if replay_after is not None:
+                    async for event in _stream_replay_events(
+                        task_id, is_background_task, replay_after, log_prefix
+                    ):
                         yield event
-                    log.info("%sFinished replaying %d missed events", log_prefix, len(replay_events))
 
                 loop_count = 0
                 while True:
@@ -4,6 +4,7 @@ Includes background task status endpoints.
 """
 from __future__ import annotations
 
+import base64
 import json
 import logging
 from datetime import datetime, timezone
@@ -20,6 +21,7 @@ from a2a.types import (
 )
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi import Request as FastAPIRequest
+from fastapi.responses import StreamingResponse
 from openfeature import api as openfeature_api
 from pydantic import BaseModel
 from sqlalchemy.orm import Session as DBSession
@@ -42,6 +44,7 @@ from ....gateway.http_sse.dependencies import (
     get_task_service,
     get_user_config,
     get_user_id,
+    short_lived_session,
 )
 from ....gateway.http_sse.repository.chat_task_repository import ChatTaskRepository
 from ....gateway.http_sse.repository.entities import Task
@@ -58,7 +61,7 @@ from ..utils.artifact_copy_utils import (
     copy_project_artifacts_to_session,
     has_pending_project_context,
 )
-from ..utils.stim_utils import create_stim_from_task_hierarchy
+from ..utils.stim_utils import create_stim_from_task_hierarchy, iter_stim_ndjson
 
 if TYPE_CHECKING:
     from ....gateway.http_sse.component import WebUIBackendComponent
@@ -1046,33 +1049,140 @@ async def search_tasks(
         ) from e
 
 
+# Maximum number of events returned per page by GET /tasks/{task_id}/events
+MAX_TASK_EVENTS_PAGE_SIZE = 1000
+
+_SSE_DIRECTION_MAP = {
+    "request": "request",
+    "response": "task",
+    "status": "status-update",
+    "error": "error_response",
+}
+
+
+def _encode_events_cursor(event) -> str:
+    """Encodes the (created_time, id) position of an event as an opaque cursor."""
+    raw = json.dumps([event.created_time, event.id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_events_cursor(cursor: str) -> tuple[int, str]:
+    """Decodes a cursor produced by `_encode_events_cursor`."""
+    try:
+        created_time, event_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return int(created_time), str(event_id)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid events cursor.",
+        ) from e
+
+
+def _format_task_event(event, task_id: str) -> dict:
+    """
+    Transforms a stored task event into the A2AEventSSEPayload format used by the
+    frontend, reconstructing the SSE structure from stored data.
+    """
+    # event.payload contains the raw A2A JSON-RPC message
+    # event.created_time is epoch milliseconds
+    # event.direction is simplified (request, response, status, error, etc)
+
+    # Convert timestamp from epoch milliseconds to ISO 8601
+    timestamp_dt = datetime.fromtimestamp(event.created_time / 1000, tz=timezone.utc)
+    timestamp_iso = timestamp_dt.isoformat()
+
+    # Extract metadata from payload using similar logic to SSE component
+    payload = event.payload
+    message_id = payload.get("id")
+    source_entity = "unknown"
+    target_entity = "unknown"
+    method = "N/A"
+
+    # Parse based on direction
+    if event.direction == "request":
+        # It's a request - extract target from message metadata
+        method = payload.get("method", "N/A")
+        if "params" in payload and "message" in payload.get("params", {}):
+            message = payload["params"]["message"]
+            if isinstance(message, dict) and "metadata" in message:
+                target_entity = message["metadata"].get("agent_name", "unknown")
+    elif event.direction in ["status", "response", "error"]:
+        # It's a response - extract source from result metadata
+        if "result" in payload:
+            result = payload["result"]
+            if isinstance(result, dict):
+                # Check for agent_name in metadata
+                if "metadata" in result:
+                    source_entity = result["metadata"].get("agent_name", "unknown")
+                # For status updates, check the message inside
+                if "message" in result:
+                    message = result["message"]
+                    if isinstance(message, dict) and "metadata" in message and source_entity == "unknown":
+                        source_entity = message["metadata"].get("agent_name", "unknown")
+
+    # Map stored direction to SSE direction format
+    sse_direction = _SSE_DIRECTION_MAP.get(event.direction, event.direction)
+
+    # Build the A2AEventSSEPayload structure
+    return {
+        "event_type": "a2a_message",
+        "timestamp": timestamp_iso,
+        "solace_topic": event.topic,
+        "direction": sse_direction,
+        "source_entity": source_entity,
+        "target_entity": target_entity,
+        "message_id": message_id,
+        "task_id": task_id,
+        "payload_summary": {
+            "method": method,
+            "params_preview": None,
+        },
+        "full_payload": payload,
+    }
+
+
 @router.get("/tasks/{task_id}/events", tags=["Tasks"])
 async def get_task_events(
     task_id: str,
     request: FastAPIRequest,
+    cursor: str | None = Query(
+        None, description="Opaque cursor returned as `next_cursor` by the previous page"
+    ),
+    limit: int | None = Query(
+        None,
+        ge=1,
+        le=MAX_TASK_EVENTS_PAGE_SIZE,
+        description="Page size. When omitted (and no cursor is given) all events are returned.",
+    ),
     db: DBSession = Depends(get_db),
     user_id: UserId = Depends(get_user_id),
     user_config: dict = Depends(get_user_config),
     repo: ITaskRepository = Depends(get_task_repository),
 ):
     """
-    Retrieves the complete event history for a task and all its child tasks as JSON.
+    Retrieves the event history for a task and all its child tasks as JSON.
     Returns events in the same format as the SSE stream for workflow visualization.
     Recursively loads all descendant tasks to enable full workflow rendering.
+
+    When `limit` or `cursor` is given, events of the whole task hierarchy are
+    returned one page at a time in chronological order, grouped by task in the
+    same shape as the unpaginated response. The response then carries a
+    `next_cursor` to request the following page, or null when exhausted.
     """
     log_prefix = f"[GET /api/v1/tasks/{task_id}/events] "
     log.info("%sRequest from user %s", log_prefix, user_id)
 
+    paginated = limit is not None or cursor is not None
+    after = _decode_events_cursor(cursor) if cursor else None
+
     try:
-        result = repo.find_by_id_with_events(db, task_id)
-        if not result:
+        task = repo.find_by_id(db, task_id)
+        if not task:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Task with ID '{task_id}' not found.",
             )
 
-        task, events = result
-
         can_read_all = user_config.get("scopes", {}).get("tasks:read:all", False)
         if task.user_id != user_id and not can_read_all:
             raise HTTPException(
@@ -1080,75 +1190,6 @@ async def get_task_events(
                 detail="You do not have permission to view this task.",
             )
 
-        # Transform task events into A2AEventSSEPayload format for the frontend
-        # Need to reconstruct the SSE structure from stored data
-        formatted_events = []
-
-        for event in events:
-            # event.payload contains the raw A2A JSON-RPC message
-            # event.created_time is epoch milliseconds
-            # event.direction is simplified (request, response, status, error, etc)
-
-            # Convert timestamp from epoch milliseconds to ISO 8601
-            timestamp_dt = datetime.fromtimestamp(event.created_time / 1000, tz=timezone.utc)
-            timestamp_iso = timestamp_dt.isoformat()
-
-            # Extract metadata from payload using similar logic to SSE component
-            payload = event.payload
-            message_id = payload.get("id")
-            source_entity = "unknown"
-            target_entity = "unknown"
-            method = "N/A"
-
-            # Parse based on direction
-            if event.direction == "request":
-                # It's a request - extract target from message metadata
-                method = payload.get("method", "N/A")
-                if "params" in payload and "message" in payload.get("params", {}):
-                    message = payload["params"]["message"]
-                    if isinstance(message, dict) and "metadata" in message:
-                        target_entity = message["metadata"].get("agent_name", "unknown")
-            elif event.direction in ["status", "response", "error"]:
-                # It's a response - extract source from result metadata
-                if "result" in payload:
-                    result = payload["result"]
-                    if isinstance(result, dict):
-                        # Check for agent_name in metadata
-                        if "metadata" in result:
-                            source_entity = result["metadata"].get("agent_name", "unknown")
-                        # For status updates, check the message inside
-                        if "message" in result:
-                            message = result["message"]
-                            if isinstance(message, dict) and "metadata" in message and source_entity == "unknown":
-                                source_entity = message["metadata"].get("agent_name", "unknown")
-
-            # Map stored direction to SSE direction format
-            direction_map = {
-                "request": "request",
-                "response": "task",
-                "status": "status-update",
-                "error": "error_response",
-            }
-            sse_direction = direction_map.get(event.direction, event.direction)
-
-            # Build the A2AEventSSEPayload structure
-            formatted_event = {
-                "event_type": "a2a_message",
-                "timestamp": timestamp_iso,
-                "solace_topic": event.topic,
-                "direction": sse_direction,
-                "source_entity": source_entity,
-                "target_entity": target_entity,
-                "message_id": message_id,
-                "task_id": task_id,
-                "payload_summary": {
-                    "method": method,
-                    "params_preview": None,
-                },
-                "full_payload": payload,
-            }
-            formatted_events.append(formatted_event)
-
         # Use database-level query to get all related tasks efficiently
         related_task_ids = repo.find_all_by_parent_chain(db, task_id)
         log.info(
@@ -1158,103 +1199,50 @@ async def get_task_events(
             task_id,
         )
 
-        # Load and format all related tasks
-        all_tasks = {}
-        all_tasks[task_id] = {
-            "events": formatted_events,
-            "initial_request_text": task.initial_request_text or "",
-        }
-
-        # Load remaining related tasks
-        for tid in related_task_ids:
-            if tid == task_id:
+        # Check permissions for each related task
+        readable_tasks = {task_id: task}
+        for related_task in repo.find_by_ids(db, related_task_ids):
+            if related_task.id == task_id:
                 continue  # Already loaded
-
-            task_result = repo.find_by_id_with_events(db, tid)
-            if not task_result:
-                continue
-
-            related_task, related_events = task_result
-
-            # Check permissions for each related task
             if related_task.user_id != user_id and not can_read_all:
                 log.warning(
                     "%sSkipping related task %s due to permission check",
                     log_prefix,
-                    tid,
+                    related_task.id,
                 )
                 continue
+            readable_tasks[related_task.id] = related_task
 
-            # Format events for this related task
-            related_formatted_events = []
+        all_tasks = {
+            tid: {
+                "events": [],
+                "initial_request_text": readable_task.initial_request_text or "",
+            }
+            for tid, readable_task in readable_tasks.items()
+        }
+        readable_ids = list(readable_tasks)
 
-            for event in related_events:
-                timestamp_dt = datetime.fromtimestamp(
-                    event.created_time / 1000, tz=timezone.utc
+        if not paginated:
+            for event in repo.iter_events(db, readable_ids):
+                all_tasks[event.task_id]["events"].append(
+                    _format_task_event(event, event.task_id)
                 )
-                timestamp_iso = timestamp_dt.isoformat()
-                payload = event.payload
-                message_id = payload.get("id")
-                source_entity = "unknown"
-                target_entity = "unknown"
-                method = "N/A"
-
-                if event.direction == "request":
-                    method = payload.get("method", "N/A")
-                    if "params" in payload and "message" in payload.get("params", {}):
-                        message = payload["params"]["message"]
-                        if isinstance(message, dict) and "metadata" in message:
-                            target_entity = message["metadata"].get(
-                                "agent_name", "unknown"
-                            )
-                elif event.direction in ["status", "response", "error"]:
-                    if "result" in payload:
-                        result = payload["result"]
-                        if isinstance(result, dict):
-                            if "metadata" in result:
-                                source_entity = result["metadata"].get(
-                                    "agent_name", "unknown"
-                                )
-                            if "message" in result:
-                                message = result["message"]
-                                if (
-                                    isinstance(message, dict)
-                                    and "metadata" in message
-                                    and source_entity == "unknown"
-                                ):
-                                    source_entity = message["metadata"].get(
-                                        "agent_name", "unknown"
-                                    )
-
-                direction_map = {
-                    "request": "request",
-                    "response": "task",
-                    "status": "status-update",
-                    "error": "error_response",
-                }
-                sse_direction = direction_map.get(event.direction, event.direction)
-
-                formatted_event = {
-                    "event_type": "a2a_message",
-                    "timestamp": timestamp_iso,
-                    "solace_topic": event.topic,
-                    "direction": sse_direction,
-                    "source_entity": source_entity,
-                    "target_entity": target_entity,
-                    "message_id": message_id,
-                    "task_id": tid,
-                    "payload_summary": {"method": method, "params_preview": None},
-                    "full_payload": payload,
-                }
-                related_formatted_events.append(formatted_event)
+            # Return all tasks (parent + children) for the frontend to process
+            return {"tasks": all_tasks}
 
-            all_tasks[tid] = {
-                "events": related_formatted_events,
-                "initial_request_text": related_task.initial_request_text or "",
-            }
+        page_size = limit or MAX_TASK_EVENTS_PAGE_SIZE
+        # Fetch one extra row to learn whether another page exists
+        events = repo.find_events_page(db, readable_ids, after=after, limit=page_size + 1)
+        has_more = len(events) > page_size
+        events = events[:page_size]
+
+        for event in events:
+            all_tasks[event.task_id]["events"].append(
+                _format_task_event(event, event.task_id)
+            )
 
-        # Return all tasks (parent + children) for the frontend to process
-        return {"tasks": all_tasks}
+        next_cursor = _encode_events_cursor(events[-1]) if has_more else None
+        return {"tasks": all_tasks, "next_cursor": next_cursor}
 
     except HTTPException:
         # Re-raise HTTPExceptions (404, 403, etc.) without modification
@@ -1669,6 +1657,10 @@ async def get_task_title_data(
 async def get_task_as_stim_file(
     task_id: str,
     request: FastAPIRequest,
+    stream: bool = Query(
+        False,
+        description="Stream the export as newline-delimited JSON instead of building a YAML document",
+    ),
     db: DBSession = Depends(get_db),
     user_id: UserId = Depends(get_user_id),
     user_config: dict = Depends(get_user_config),
@@ -1676,6 +1668,11 @@ async def get_task_as_stim_file(
 ):
     """
     Retrieves the complete event history for a task and all its child tasks, returning it as a `.stim` file.
+
+    With `stream=true` the export is sent as chunked NDJSON: a first line holding
+    `invocation_details` followed by one line per invocation flow entry. Events
+    are read through a server-side cursor, so memory use does not depend on the
+    size of the task.
     """
     log_prefix = f"[GET /api/v1/tasks/{task_id}] "
     log.info("%sRequest from user %s", log_prefix, user_id)
@@ -1690,25 +1687,18 @@ async def get_task_as_stim_file(
                 detail=f"Task with ID '{task_id}' not found.",
             )
 
-        # Load all tasks and their events
+        # Load all tasks (events are loaded separately below)
         tasks_dict = {}
-        events_dict = {}
         can_read_all = user_config.get("scopes", {}).get("tasks:read:all", False)
 
-        for tid in related_task_ids:
-            result = repo.find_by_id_with_events(db, tid)
-            if result:
-                task, events = result
-
-                # Check permissions for each task
-                if task.user_id != user_id and not can_read_all:
-                    raise HTTPException(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        detail="You do not have permission to view this task.",
-                    )
-
-                tasks_dict[tid] = task
-                events_dict[tid] = events
+        for task in repo.find_by_ids(db, related_task_ids):
+            # Check permissions for each task
+            if task.user_id != user_id and not can_read_all:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="You do not have permission to view this task.",
+                )
+            tasks_dict[task.id] = task
 
         if task_id not in tasks_dict:
             raise HTTPException(
@@ -1723,6 +1713,29 @@ async def get_task_as_stim_file(
                 root_task_id = tid
                 break
 
+        if stream:
+            task_ids = list(tasks_dict)
+
+            def _ndjson_lines():
+                # The request-scoped session may be closed before the body is
+                # sent, so the stream reads events through its own session.
+                with short_lived_session() as stream_db:
+                    yield from iter_stim_ndjson(
+                        tasks_dict, repo.iter_events(stream_db, task_ids), root_task_id
+                    )
+
+            return StreamingResponse(
+                _ndjson_lines(),
+                media_type="application/x-ndjson",
+                headers={
+                    "Content-Disposition": f'attachment; filename="{root_task_id}.stim.ndjson"'
+                },
+            )
+
+        events_dict = {tid: [] for tid in tasks_dict}
+        for event in repo.iter_events(db, list(tasks_dict)):
+            events_dict[event.task_id].append(event)
+
         # Format into .stim structure with all tasks
         stim_data = create_stim_from_task_hierarchy(tasks_dict, events_dict, root_task_id)
 
@@ -11,6 +11,7 @@ from fastapi import UploadFile, HTTPException
 from solace_ai_connector.common.log import log
 
 from ....agent.tools.audio_tools import ALL_AVAILABLE_VOICES
+from .tts_cache import get_shared_tts_cache, make_tts_cache_key
 
 
 # AWS Polly Neural Voices (popular subset)
@@ -137,6 +138,8 @@ class AudioService:
         """
         self.config = config
         self.speech_config = config.get("speech", {})
+        tts_config = self.speech_config.get("tts", {}) if self.speech_config else {}
+        self.tts_cache = get_shared_tts_cache(tts_config.get("cache") if tts_config else None)
         
     async def transcribe_audio_openai(
         self,
@@ -990,19 +993,25 @@ class AudioService:
             
             # Route to appropriate provider
             if final_provider == "azure":
-                return await self.generate_speech_azure(
-                    text, voice, user_id, session_id, app_name, message_id
-                )
+                synthesize = self.generate_speech_azure
             elif final_provider == "gemini":
-                return await self.generate_speech_gemini(
-                    text, voice, user_id, session_id, app_name, message_id
-                )
+                synthesize = self.generate_speech_gemini
             elif final_provider == "polly":
-                return await self.generate_speech_polly(
-                    text, voice, user_id, session_id, app_name, message_id
-                )
+                synthesize = self.generate_speech_polly
             else:
                 raise HTTPException(500, f"Unknown TTS provider: {final_provider}")
+            
+            if not self.tts_cache:
+                return await synthesize(
+                    text, voice, user_id, session_id, app_name, message_id
+                )
+            
+            # Identical text/voice/provider requests share one synthesis
+            cache_key = self._tts_cache_key(text, voice, final_provider, tts_config)
+            return await self.tts_cache.get_or_create(
+                cache_key,
+                lambda: synthesize(text, voice, user_id, session_id, app_name, message_id),
+            )
                 
         except HTTPException:
             raise
@@ -1010,6 +1019,37 @@ class AudioService:
             log.exception("[AudioService] TTS generation error: %s", e)
             raise HTTPException(500, f"TTS generation failed: {str(e)}")
     
+    def _tts_cache_key(
+        self,
+        text: str,
+        voice: Optional[str],
+        provider: str,
+        tts_config: Dict[str, Any],
+    ) -> str:
+        """Builds the cache key, resolving the voice the provider would default to."""
+        default_voices = {
+            "azure": "en-US-JennyNeural",
+            "gemini": "Kore",
+            "polly": "Joanna",
+        }
+        resolved_voice = voice or tts_config.get(provider, {}).get(
+            "default_voice", default_voices.get(provider, "")
+        )
+        # All providers return MP3
+        return make_tts_cache_key(text, resolved_voice, provider, "mp3")
+    
+    def _get_cached_speech(
+        self, text: str, voice: Optional[str], provider: Optional[str]
+    ) -> Optional[bytes]:
+        """Returns already synthesized audio for preprocessed text, if cached."""
+        tts_config = self.speech_config.get("tts", {}) if self.speech_config else {}
+        if not self.tts_cache or not tts_config:
+            return None
+        final_provider = provider or tts_config.get("provider", "gemini")
+        return self.tts_cache.get(
+            self._tts_cache_key(text, voice, final_provider, tts_config)
+        )
+    
     async def stream_speech(
         self,
         text: str,
@@ -1099,15 +1139,36 @@ class AudioService:
         next_to_yield = 0
         pending_tasks: Dict[int, asyncio.Task] = {}
         
+        # Cached chunks are served directly and do not take a generation slot
+        for i, chunk_text in enumerate(chunks):
+            cached_audio = self._get_cached_speech(chunk_text, voice, provider)
+            if cached_audio is not None:
+                results[i] = cached_audio
+        to_generate = [i for i in range(len(chunks)) if i not in results]
+        if results:
+            log.debug("[AudioService] Stream: %d/%d chunks served from cache",
+                     len(results), len(chunks))
+        
         # Start initial batch of tasks
-        for i in range(min(MAX_CONCURRENT, len(chunks))):
+        for i in to_generate[:MAX_CONCURRENT]:
             task = asyncio.create_task(generate_chunk(i, chunks[i]))
             pending_tasks[i] = task
         
-        next_to_start = min(MAX_CONCURRENT, len(chunks))
+        next_to_start = min(MAX_CONCURRENT, len(to_generate))
         
         # Process tasks as they complete, yielding in order
         while next_to_yield < len(chunks):
+            # Yield any chunks that are ready in order
+            while next_to_yield in results:
+                audio_data = results.pop(next_to_yield)
+                if audio_data:
+                    log.debug("[AudioService] Yielding chunk %d (%d bytes)", next_to_yield + 1, len(audio_data))
+                    yield audio_data
+                next_to_yield += 1
+            
+            if next_to_yield >= len(chunks):
+                break
+            
             if not pending_tasks:
                 # No more pending tasks but we haven't yielded everything
                 # This shouldn't happen, but handle gracefully
@@ -1138,18 +1199,11 @@ class AudioService:
                         results[completed_index] = None
                     
                     # Start next task if there are more chunks
-                    if next_to_start < len(chunks):
-                        new_task = asyncio.create_task(generate_chunk(next_to_start, chunks[next_to_start]))
-                        pending_tasks[next_to_start] = new_task
+                    if next_to_start < len(to_generate):
+                        chunk_index = to_generate[next_to_start]
+                        new_task = asyncio.create_task(generate_chunk(chunk_index, chunks[chunk_index]))
+                        pending_tasks[chunk_index] = new_task
                         next_to_start += 1
-            
-            # Yield any chunks that are ready in order
-            while next_to_yield in results:
-                audio_data = results.pop(next_to_yield)
-                if audio_data:
-                    log.debug("[AudioService] Yielding chunk %d (%d bytes)", next_to_yield + 1, len(audio_data))
-                    yield audio_data
-                next_to_yield += 1
     
     async def get_available_voices(self, provider: Optional[str] = None) -> List[str]:
         """
@@ -4,10 +4,12 @@ Service for managing automatic cleanup of old data based on retention policies.
 
 import logging
 import time
-from typing import Any, Callable, Dict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
 
 from sqlalchemy.orm import Session as DBSession
 
+from ..repository.chunked_delete import ChunkCallback, RetentionCursor
 from ..repository.feedback_repository import FeedbackRepository
 from ..repository.task_repository import TaskRepository
 from ..repository.sse_event_buffer_repository import SSEEventBufferRepository
@@ -16,6 +18,66 @@ from solace_agent_mesh.shared.utils.timestamp_utils import now_epoch_ms
 
 log = logging.getLogger(__name__)
 
+
+@dataclass
+class RetentionStats:
+    """Outcome of one retention pass over a single table."""
+
+    table: str
+    deleted: int = 0
+    rows_deleted: int = 0  # Including child rows, e.g. task events
+    elapsed_seconds: float = 0.0
+    lag_ms: Optional[int] = 0  # Age of the oldest row still past the cutoff; None if unknown
+    completed: bool = True
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return float(self.rows_deleted)
+        return self.rows_deleted / self.elapsed_seconds
+
+
+class _ChunkThrottle:
+    """
+    Paces chunked deletes to an I/O budget and tracks progress.
+
+    After each committed chunk it sleeps for at least `chunk_pause_ms` and long
+    enough to keep the average delete rate at or below `max_rows_per_second`.
+    It stops the pass once the run deadline is reached.
+    """
+
+    def __init__(
+        self,
+        stats: RetentionStats,
+        max_rows_per_second: float,
+        chunk_pause_ms: int,
+        deadline: Optional[float],
+    ):
+        self.stats = stats
+        self.cursor: Optional[RetentionCursor] = None
+        self._max_rows_per_second = max_rows_per_second
+        self._chunk_pause_seconds = chunk_pause_ms / 1000
+        self._deadline = deadline
+        self._start = time.monotonic()
+
+    def on_chunk(self, rows: int, cursor: Optional[RetentionCursor]) -> bool:
+        self.stats.rows_deleted += rows
+        if cursor is not None:
+            self.cursor = cursor
+
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self.stats.completed = False
+            return False
+
+        pause = self._chunk_pause_seconds
+        if self._max_rows_per_second > 0:
+            budget_elapsed = self.stats.rows_deleted / self._max_rows_per_second
+            pause = max(pause, budget_elapsed - (time.monotonic() - self._start))
+        if pause > 0:
+            time.sleep(pause)
+        return True
+
+
 class DataRetentionService:
     """
     Service for automatically cleaning up old tasks, task events, feedback,
@@ -29,6 +91,12 @@ class DataRetentionService:
     MIN_BATCH_SIZE = 1
     MAX_BATCH_SIZE = 10000
 
+    # Table keys for checkpoints and run statistics
+    TASKS = "tasks"
+    FEEDBACK = "feedback"
+    SSE_EVENTS = "sse_event_buffer"
+    CONVERSION_CACHE = "document_conversion_cache"
+
     def __init__(
         self, session_factory: Callable[[], DBSession] | None, config: Dict[str, Any]
     ):
@@ -43,13 +111,20 @@ class DataRetentionService:
         self.config = config
         self.log_identifier = "[DataRetentionService]"
 
+        # Cursor of the last committed chunk per table, used to resume a pass
+        # that was stopped by the run time budget or an error
+        self._checkpoints: Dict[str, RetentionCursor] = {}
+        self._run_deadline: Optional[float] = None
+        self.last_run_stats: Dict[str, RetentionStats] = {}
+
         # Validate and store configuration
         self._validate_config()
 
         log.info(
             "%s Initialized with task_retention=%d days, feedback_retention=%d days, "
             "sse_event_retention=%d days, conversion_cache_retention=%d hours, "
-            "cleanup_interval=%d hours, batch_size=%d",
+            "cleanup_interval=%d hours, batch_size=%d, max_rows_per_second=%s, "
+            "chunk_pause_ms=%d, max_run_seconds=%d",
             self.log_identifier,
             self.config.get("task_retention_days"),
             self.config.get("feedback_retention_days"),
@@ -57,6 +132,9 @@ class DataRetentionService:
             self.config.get("conversion_cache_retention_hours"),
             self.config.get("cleanup_interval_hours"),
             self.config.get("batch_size"),
+            self.config.get("max_rows_per_second") or "unlimited",
+            self.config.get("chunk_pause_ms"),
+            self.config.get("max_run_seconds"),
         )
 
     def _validate_config(self) -> None:
@@ -150,6 +228,19 @@ class DataRetentionService:
         else:
             self.config["conversion_cache_retention_hours"] = cache_retention
 
+        # Validate I/O budget settings (0 disables the corresponding limit)
+        for key in ("max_rows_per_second", "chunk_pause_ms", "max_run_seconds"):
+            value = self.config.get(key, 0)
+            if value < 0:
+                log.warning(
+                    "%s %s (%s) must not be negative. Disabling the limit.",
+                    self.log_identifier,
+                    key,
+                    value,
+                )
+                value = 0
+            self.config[key] = value
+
     def cleanup_old_data(self) -> None:
         """
         Main orchestration method for cleaning up old data.
@@ -171,6 +262,9 @@ class DataRetentionService:
 
         log.info("%s Starting data retention cleanup...", self.log_identifier)
         start_time = time.time()
+        max_run_seconds = self.config.get("max_run_seconds")
+        self._run_deadline = time.monotonic() + max_run_seconds if max_run_seconds else None
+        self.last_run_stats = {}
 
         try:
             tasks_deleted = 0
@@ -208,6 +302,17 @@ class DataRetentionService:
                 cache_deleted,
                 elapsed_time,
             )
+            for stats in self.last_run_stats.values():
+                log.info(
+                    "%s Retention %s: deleted=%d rows=%d rows_per_sec=%.1f lag_ms=%s completed=%s",
+                    self.log_identifier,
+                    stats.table,
+                    stats.deleted,
+                    stats.rows_deleted,
+                    stats.rows_per_second,
+                    stats.lag_ms,
+                    stats.completed,
+                )
 
         except Exception as e:
             log.error(
@@ -219,7 +324,7 @@ class DataRetentionService:
 
     def _cleanup_old_tasks(self, retention_days: int) -> int:
         """
-        Deletes tasks (and their events via cascade) older than the retention period.
+        Deletes tasks and their events older than the retention period.
 
         Args:
             retention_days: Number of days to retain tasks
@@ -240,7 +345,13 @@ class DataRetentionService:
         db = self.session_factory()
         try:
             repo = TaskRepository()
-            total_deleted = repo.delete_tasks_older_than(db, cutoff_time_ms, batch_size)
+            total_deleted = self._run_chunked(
+                self.TASKS,
+                cutoff_time_ms,
+                lambda after, on_chunk: repo.delete_tasks_older_than(
+                    db, cutoff_time_ms, batch_size, after=after, on_chunk=on_chunk
+                ),
+            )
 
             if total_deleted == 0:
                 log.info(
@@ -293,7 +404,13 @@ class DataRetentionService:
         db = self.session_factory()
         try:
             repo = FeedbackRepository()
-            total_deleted = repo.delete_feedback_older_than(db, cutoff_time_ms, batch_size)
+            total_deleted = self._run_chunked(
+                self.FEEDBACK,
+                cutoff_time_ms,
+                lambda after, on_chunk: repo.delete_feedback_older_than(
+                    db, cutoff_time_ms, batch_size, after=after, on_chunk=on_chunk
+                ),
+            )
 
             if total_deleted == 0:
                 log.info(
@@ -351,7 +468,13 @@ class DataRetentionService:
         db = self.session_factory()
         try:
             repo = SSEEventBufferRepository()
-            total_deleted = repo.cleanup_old_events(db, cutoff_time_ms, batch_size)
+            total_deleted = self._run_chunked(
+                self.SSE_EVENTS,
+                cutoff_time_ms,
+                lambda after, on_chunk: repo.cleanup_old_events(
+                    db, cutoff_time_ms, batch_size, after=after, on_chunk=on_chunk
+                ),
+            )
 
             if total_deleted == 0:
                 log.info(
@@ -397,11 +520,19 @@ class DataRetentionService:
             retention_hours,
         )
 
+        batch_size = self.config.get("batch_size")
+
         db = self.session_factory()
         try:
             repo = DocumentConversionCacheRepository()
             cutoff_ms = now_epoch_ms() - (retention_hours * 3600 * 1000)
-            total_deleted = repo.cleanup_old_entries(db, cutoff_ms)
+            total_deleted = self._run_chunked(
+                self.CONVERSION_CACHE,
+                cutoff_ms,
+                lambda after, on_chunk: repo.delete_entries_older_than(
+                    db, cutoff_ms, batch_size, after=after, on_chunk=on_chunk
+                ),
+            )
 
             if total_deleted == 0:
                 log.info(
@@ -430,3 +561,55 @@ class DataRetentionService:
             return 0
         finally:
             db.close()
+
+    def _run_chunked(
+        self,
+        table: str,
+        cutoff_time_ms: int,
+        delete: Callable[[Optional[RetentionCursor], ChunkCallback], int],
+    ) -> int:
+        """
+        Runs one chunked delete pass, resuming from the table's checkpoint.
+
+        The checkpoint is kept when the pass stops early (time budget or error)
+        so the next run continues where this one left off, and cleared once the
+        table has caught up with its cutoff.
+        """
+        stats = RetentionStats(table=table)
+        self.last_run_stats[table] = stats
+        throttle = _ChunkThrottle(
+            stats,
+            max_rows_per_second=self.config.get("max_rows_per_second"),
+            chunk_pause_ms=self.config.get("chunk_pause_ms"),
+            deadline=self._run_deadline,
+        )
+
+        after = self._checkpoints.get(table)
+        if after is not None and after[0] >= cutoff_time_ms:
+            after = None
+        if after is not None:
+            log.info(
+                "%s Resuming %s retention from checkpoint %s",
+                self.log_identifier,
+                table,
+                after,
+            )
+
+        start = time.monotonic()
+        try:
+            stats.deleted = delete(after, throttle.on_chunk)
+        except Exception:
+            stats.completed = False
+            raise
+        finally:
+            stats.elapsed_seconds = time.monotonic() - start
+            if throttle.cursor is not None:
+                self._checkpoints[table] = throttle.cursor
+            if stats.completed:
+                self._checkpoints.pop(table, None)
+                stats.lag_ms = 0
+            else:
+                checkpoint = self._checkpoints.get(table)
+                stats.lag_ms = cutoff_time_ms - checkpoint[0] if checkpoint else None
+
+        return stats.deleted
@@ -1,16 +1,24 @@
 """
 Document conversion service for converting Office documents to PDF.
 Uses LibreOffice (soffice) for high-fidelity conversion.
+
+By default each conversion starts its own soffice process. With pool_size > 0
+the service keeps that many headless LibreOffice instances running (see
+libreoffice_worker.py) and routes conversions to idle ones, so start-up cost
+is paid once per worker instead of once per document.
 """
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
 import shutil
+import signal
+import sys
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 log = logging.getLogger(__name__)
 
@@ -25,6 +33,199 @@ MAX_OUTPUT_RETRIES = 10
 INITIAL_RETRY_DELAY = 0.2  # seconds
 MAX_RETRY_DELAY = 2.0  # seconds
 
+# Worker pool defaults
+DEFAULT_MAX_JOBS_PER_WORKER = 50
+DEFAULT_WORKER_STARTUP_TIMEOUT_SECONDS = 60
+WORKER_STOP_GRACE_SECONDS = 10
+
+
+class LibreOfficeWorkerError(Exception):
+    """A pooled LibreOffice worker could not be started or died during a conversion."""
+
+
+class _LibreOfficeWorker:
+    """One worker process and the LibreOffice instance it drives."""
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+        self.jobs = 0
+
+    async def convert(self, input_path: Path, output_path: Path) -> Optional[str]:
+        """Sends one conversion request; returns an error message or None."""
+        request = {"input": str(input_path), "output": str(output_path)}
+        self.process.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+        await self.process.stdin.drain()
+        reply = await self.process.stdout.readline()
+        if not reply:
+            raise LibreOfficeWorkerError("LibreOffice worker exited during a conversion")
+        self.jobs += 1
+        response = json.loads(reply)
+        return None if response.get("ok") else response.get("error") or "Unknown error"
+
+    def kill(self) -> None:
+        """Kills the worker and its LibreOffice instance (its process group)."""
+        if self.process.returncode is not None:
+            return
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError, AttributeError):
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+
+    async def stop(self) -> None:
+        """Asks the worker to shut LibreOffice down, killing it if it does not."""
+        if self.process.returncode is None and self.process.stdin:
+            self.process.stdin.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=WORKER_STOP_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            self.kill()
+            await self.process.wait()
+
+
+class LibreOfficeWorkerPool:
+    """
+    Pool of persistent LibreOffice workers.
+
+    Workers are started on first use and speak the JSON-lines protocol
+    described in libreoffice_worker.py. A worker is recycled after
+    max_jobs_per_worker conversions, and killed (with its LibreOffice
+    instance) when a conversion times out, is cancelled or the worker dies;
+    the next conversion starts a replacement.
+
+    Args:
+        command: Command that starts one worker
+        size: Number of workers
+        max_jobs_per_worker: Recycle a worker after this many conversions (0 = never)
+        startup_timeout_seconds: Time allowed for a worker to report ready
+    """
+
+    def __init__(
+        self,
+        command: list[str],
+        size: int,
+        max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER,
+        startup_timeout_seconds: float = DEFAULT_WORKER_STARTUP_TIMEOUT_SECONDS,
+    ):
+        if size < 1:
+            raise ValueError("LibreOffice worker pool size must be at least 1")
+        self.command = command
+        self.size = size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.startup_timeout_seconds = startup_timeout_seconds
+        self._idle: Optional[asyncio.Queue] = None
+        self._workers: set[_LibreOfficeWorker] = set()
+        self._background: set[asyncio.Task] = set()
+        self._closed = False
+        self.stats = {"conversions": 0, "started": 0, "recycled": 0, "killed": 0}
+
+    def _ensure_slots(self) -> asyncio.Queue:
+        if self._idle is None:
+            # None marks a slot without a running worker
+            self._idle = asyncio.Queue()
+            for _ in range(self.size):
+                self._idle.put_nowait(None)
+        return self._idle
+
+    async def convert(
+        self, input_path: Path, output_path: Path, timeout: float
+    ) -> Optional[str]:
+        """
+        Converts input_path to a PDF at output_path on an idle worker.
+
+        Returns:
+            None on success, otherwise LibreOffice's error message
+
+        Raises:
+            asyncio.TimeoutError: The conversion did not finish within the timeout
+            LibreOfficeWorkerError: The worker could not be started or died
+        """
+        if self._closed:
+            raise LibreOfficeWorkerError("LibreOffice worker pool is shut down")
+
+        idle = self._ensure_slots()
+        worker: Optional[_LibreOfficeWorker] = await idle.get()
+        healthy = False
+        try:
+            if worker is None:
+                worker = await self._spawn()
+            error = await asyncio.wait_for(
+                worker.convert(input_path, output_path), timeout=timeout
+            )
+            healthy = True
+            self.stats["conversions"] += 1
+            return error
+        finally:
+            self._release(worker, healthy)
+
+    async def shutdown(self) -> None:
+        """Stops all workers and their LibreOffice instances."""
+        self._closed = True
+        workers = list(self._workers)
+        self._workers.clear()
+        # Also wait for recycled and killed workers to exit
+        await asyncio.gather(
+            *(worker.stop() for worker in workers),
+            *list(self._background),
+            return_exceptions=True,
+        )
+
+    async def _spawn(self) -> _LibreOfficeWorker:
+        log.info("Starting LibreOffice worker: %s", " ".join(self.command))
+        process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            # Own process group, so a hung worker is killed with its soffice
+            start_new_session=True,
+        )
+        worker = _LibreOfficeWorker(process)
+        try:
+            line = await asyncio.wait_for(
+                process.stdout.readline(), timeout=self.startup_timeout_seconds
+            )
+            status = json.loads(line) if line else {"error": "worker exited during start-up"}
+        except (asyncio.TimeoutError, ValueError) as e:
+            status = {"error": f"no ready message ({type(e).__name__})"}
+        except BaseException:
+            worker.kill()
+            raise
+
+        if not status.get("ready"):
+            worker.kill()
+            await process.wait()
+            raise LibreOfficeWorkerError(
+                f"LibreOffice worker failed to start: {status.get('error')}"
+            )
+        self._workers.add(worker)
+        self.stats["started"] += 1
+        return worker
+
+    def _release(self, worker: Optional[_LibreOfficeWorker], healthy: bool) -> None:
+        idle = self._ensure_slots()
+        if worker is not None and healthy and not self._closed:
+            if not self.max_jobs_per_worker or worker.jobs < self.max_jobs_per_worker:
+                idle.put_nowait(worker)
+                return
+            self.stats["recycled"] += 1
+            self._run_in_background(worker.stop())
+        elif worker is not None:
+            # Timed out, cancelled or crashed: LibreOffice may be hung
+            self.stats["killed"] += 1
+            worker.kill()
+            self._run_in_background(worker.process.wait())
+        if worker is not None:
+            self._workers.discard(worker)
+        idle.put_nowait(None)
+
+    def _run_in_background(self, coro: Any) -> None:
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
 
 class DocumentConversionService:
     """Service for converting documents to PDF using LibreOffice."""
@@ -47,6 +248,10 @@ class DocumentConversionService:
         libreoffice_path: Optional[str] = None,
         timeout_seconds: int = DEFAULT_CONVERSION_TIMEOUT_SECONDS,
         max_file_size_bytes: int = DEFAULT_MAX_CONVERSION_SIZE_BYTES,
+        pool_size: int = 0,
+        max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER,
+        worker_command: Optional[list[str]] = None,
+        worker_python: Optional[str] = None,
     ):
         """
         Initialize the document conversion service.
@@ -55,11 +260,35 @@ class DocumentConversionService:
             libreoffice_path: Path to LibreOffice executable. If None, will search common locations.
             timeout_seconds: Maximum time to wait for conversion (default: 30 seconds)
             max_file_size_bytes: Maximum file size allowed for conversion (default: 50MB)
+            pool_size: Number of persistent LibreOffice workers. 0 starts soffice per conversion.
+            max_jobs_per_worker: Recycle a pooled worker after this many conversions (0 = never)
+            worker_command: Command that starts one pooled worker. Defaults to running
+                libreoffice_worker.py; any command speaking its protocol can stand in.
+            worker_python: Interpreter with the LibreOffice UNO bindings used to run
+                libreoffice_worker.py (default: the current interpreter)
         """
         self.timeout_seconds = timeout_seconds
         self.max_file_size_bytes = max_file_size_bytes
         self.libreoffice_path = libreoffice_path or self._find_libreoffice()
-        self._available = self.libreoffice_path is not None
+        # A stand-in worker command makes pooled conversion possible without soffice
+        self._available = self.libreoffice_path is not None or (
+            bool(worker_command) and pool_size > 0
+        )
+
+        self._pool: Optional[LibreOfficeWorkerPool] = None
+        if pool_size > 0 and self._available:
+            if not worker_command:
+                worker_command = [
+                    worker_python or sys.executable,
+                    str(Path(__file__).with_name("libreoffice_worker.py")),
+                    "--soffice",
+                    self.libreoffice_path,
+                ]
+            self._pool = LibreOfficeWorkerPool(
+                command=worker_command,
+                size=pool_size,
+                max_jobs_per_worker=max_jobs_per_worker,
+            )
 
         if self._available:
             log.info(
@@ -112,6 +341,16 @@ class DocumentConversionService:
         """Check if document conversion is available."""
         return self._available
 
+    @property
+    def is_pooled(self) -> bool:
+        """Check if conversions run on persistent LibreOffice workers."""
+        return self._pool is not None
+
+    async def shutdown(self) -> None:
+        """Stop pooled LibreOffice workers, if any."""
+        if self._pool is not None:
+            await self._pool.shutdown()
+
     def get_supported_extensions(self) -> list[str]:
         """Get list of supported file extensions."""
         return list(self.SUPPORTED_FORMATS.keys())
@@ -208,6 +447,13 @@ class DocumentConversionService:
                 len(input_data),
             )
 
+            if self._pool is not None:
+                result = await self._convert_pooled(
+                    input_path, temp_dir_path / "input.pdf", input_filename
+                )
+                if result is not None:
+                    return result
+
             try:
                 # Run LibreOffice conversion
                 # --headless: Run without GUI
@@ -285,6 +531,55 @@ class DocumentConversionService:
                 log.exception("Unexpected error during document conversion: %s", e)
                 return None, "Conversion failed due to an internal error"
 
+    async def _convert_pooled(
+        self,
+        input_path: Path,
+        output_path: Path,
+        input_filename: str,
+    ) -> Optional[tuple[bytes | None, str | None]]:
+        """
+        Convert on a pooled LibreOffice worker.
+
+        Returns:
+            Tuple of (pdf_bytes, error_message), or None if no worker has ever
+            started. Pooled mode is then turned off and the caller falls back
+            to a per-conversion soffice process.
+        """
+        pool = self._pool
+        subprocess_timeout = min(self.timeout_seconds, 60)
+        try:
+            error = await pool.convert(input_path, output_path, timeout=subprocess_timeout)
+        except asyncio.TimeoutError:
+            log.error(
+                "LibreOffice worker timed out for %s after %d seconds",
+                input_filename,
+                subprocess_timeout,
+            )
+            return None, f"Conversion subprocess timed out after {subprocess_timeout} seconds"
+        except LibreOfficeWorkerError as e:
+            if pool.stats["started"] == 0 and self.libreoffice_path:
+                log.warning("%s. Falling back to starting soffice per conversion.", e)
+                if self._pool is pool:
+                    self._pool = None
+                    await pool.shutdown()
+                return None
+            log.error("LibreOffice worker failed for %s: %s", input_filename, e)
+            return None, "LibreOffice conversion failed"
+
+        if error is not None:
+            log.error("LibreOffice conversion failed: %s", error[:500])
+            return None, "LibreOffice conversion failed"
+        if not output_path.exists():
+            return None, "Conversion completed but no PDF output was generated"
+
+        pdf_bytes = output_path.read_bytes()
+        log.info(
+            "Successfully converted %s to PDF on a pooled worker (output size: %d bytes)",
+            input_filename,
+            len(pdf_bytes),
+        )
+        return pdf_bytes, None
+
     async def _find_output_pdf(
         self,
         temp_dir_path: Path,
@@ -355,6 +650,7 @@ def get_document_conversion_service(
     libreoffice_path: Optional[str] = None,
     timeout_seconds: int = DEFAULT_CONVERSION_TIMEOUT_SECONDS,
     max_file_size_bytes: int = DEFAULT_MAX_CONVERSION_SIZE_BYTES,
+    **pool_options: Any,
 ) -> DocumentConversionService:
     """
     Get or create the document conversion service singleton.
@@ -363,6 +659,7 @@ def get_document_conversion_service(
         libreoffice_path: Optional path to LibreOffice executable
         timeout_seconds: Conversion timeout in seconds (default: 30)
         max_file_size_bytes: Maximum file size allowed for conversion (default: 50MB)
+        **pool_options: pool_size, max_jobs_per_worker, worker_command, worker_python
 
     Returns:
         DocumentConversionService instance
@@ -373,5 +670,32 @@ def get_document_conversion_service(
             libreoffice_path=libreoffice_path,
             timeout_seconds=timeout_seconds,
             max_file_size_bytes=max_file_size_bytes,
+            **pool_options,
         )
     return _conversion_service
+
+
+def configure_document_conversion_service(
+    conversion_config: Optional[dict],
+) -> DocumentConversionService:
+    """
+    Create the singleton from the gateway's `document_conversion` config.
+
+    Replaces any existing instance, whose pooled workers (if any) are left to
+    the caller to shut down.
+    """
+    global _conversion_service
+    conversion_config = conversion_config or {}
+    _conversion_service = None
+    return get_document_conversion_service(
+        libreoffice_path=conversion_config.get("libreoffice_path") or None,
+        timeout_seconds=int(
+            conversion_config.get("timeout_seconds", DEFAULT_CONVERSION_TIMEOUT_SECONDS)
+        ),
+        pool_size=int(conversion_config.get("pool_size", 0)),
+        max_jobs_per_worker=int(
+            conversion_config.get("max_jobs_per_worker", DEFAULT_MAX_JOBS_PER_WORKER)
+        ),
+        worker_command=conversion_config.get("worker_command") or None,
+        worker_python=conversion_config.get("worker_python") or None,
+    )
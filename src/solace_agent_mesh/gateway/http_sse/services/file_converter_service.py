@@ -4,6 +4,11 @@ File Conversion Service for BM25 Indexing
 Converts binary files (PDF, DOCX, PPTX) to text with citation tracking.
 Uses BaseArtifactService interface for storage-agnostic operations.
 
+When a DocumentConversionEngine is configured, conversions run in a pool of
+worker processes (large PDFs are split into page ranges across workers) and
+results are cached by content hash, so identical uploads are converted once.
+Otherwise conversions run on a small thread pool.
+
 License Compliance:
 - Uses pypdf (BSD-3-Clause) instead of PyMuPDF (AGPL v3)
 - python-docx (MIT License)
@@ -12,12 +17,33 @@ License Compliance:
 
 import asyncio
 import concurrent.futures
+import hashlib
 import logging
+import math
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
-from io import BytesIO
 from typing import Tuple, Dict, Any, Optional
 from google.adk.artifacts import BaseArtifactService
 
+from ....common.utils import document_text
+from ....common.utils.document_text import (
+    TASK_DOCX,
+    TASK_PDF,
+    TASK_PDF_PAGES,
+    TASK_PPTX,
+    assemble_pdf_text,
+    convert_docx_to_text,
+    convert_pdf_to_text,
+    convert_pptx_to_text,
+    count_pdf_pages,
+)
+from ....common.utils.process_pool import (
+    WarmProcessPool,
+    WorkerCallError,
+    WorkerCrashedError,
+)
+
 log = logging.getLogger(__name__)
 
 # Dedicated executor for file conversions - bounded to prevent unbounded thread growth
@@ -29,6 +55,23 @@ _CONVERSION_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
 # Citation configuration for text files
 LINES_PER_CITATION_CHUNK = 50  # Group 50 lines per citation entry (reasonable granularity)
 
+PDF_MIME_TYPE = "application/pdf"
+DOCX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+PPTX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+_TASK_BY_MIME_TYPE = {
+    PDF_MIME_TYPE: TASK_PDF,
+    DOCX_MIME_TYPE: TASK_DOCX,
+    PPTX_MIME_TYPE: TASK_PPTX,
+}
+
+# Conversion engine defaults (see the gateway's `file_conversion` config)
+DEFAULT_PROCESS_WORKERS = 2
+DEFAULT_PAGES_PER_SHARD = 50
+DEFAULT_TIMEOUT_SECONDS = 300
+DEFAULT_MAX_CALLS_PER_WORKER = 100
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
 
 def create_line_range_citations(text: str, lines_per_chunk: int = LINES_PER_CITATION_CHUNK) -> dict:
     """
@@ -107,266 +150,271 @@ def create_line_range_citations(text: str, lines_per_chunk: int = LINES_PER_CITA
     return metadata
 
 
-def convert_pdf_to_text(pdf_bytes: bytes) -> Tuple[str, dict]:
+class DocumentConversionEngine:
     """
-    Extract text from PDF using pypdf with page-level citation tracking.
+    Converts documents in worker processes and caches results by content hash.
 
-    IMPORTANT: Page numbers are PHYSICAL/SEQUENTIAL (1, 2, 3, ...),
-    NOT the document's internal page numbers (which may use i, ii, iii, 1, 2, etc.).
+    PDFs with more than `pages_per_shard` pages are split into contiguous page
+    ranges, one per worker, and the page texts are merged into the same text
+    and citation_map a single-pass conversion produces. DOCX and PPTX files are
+    converted whole in one worker.
 
-    Example:
-      Physical page 1 → "page_1" (may be titled "Preface" or "i" in document)
-      Physical page 2 → "page_2" (may be "ii" in document)
-      Physical page 10 → "page_10" (may be "Page 1" in document)
-
-    This ensures consistent, unambiguous page references.
+    Results are held in a byte-bounded LRU keyed by the SHA-256 of the file
+    content and its MIME type. Concurrent conversions of the same content
+    await a single in-flight conversion; failures are not cached.
 
     Args:
-        pdf_bytes: PDF file content as bytes
-
-    Returns:
-        Tuple of (extracted_text, conversion_metadata)
-
-        conversion_metadata includes:
-        - converter: "pypdf"
-        - page_count: number of pages
-        - char_count: total characters extracted
-        - citation_map: list of {"location": "page_N", "char_start": X, "char_end": Y}
-          where N is the physical/sequential page number (1, 2, 3, ...)
+        process_workers: Number of worker processes; 0 converts on the
+            thread pool instead (results are still cached)
+        pages_per_shard: Minimum number of PDF pages per worker shard
+        timeout_seconds: Time allowed per conversion call before the worker is killed
+        max_calls_per_worker: Recycle a worker after this many calls (0 = never)
+        cache_max_bytes: Maximum size of cached text (0 disables the cache)
     """
-    try:
-        from pypdf import PdfReader
-
-        reader = PdfReader(BytesIO(pdf_bytes))
-
-        full_text = []
-        citation_map = []
-        char_position = 0
-
-        for page_num, page in enumerate(reader.pages, start=1):
-            # Extract text from page
-            page_text = page.extract_text()
-
-            if page_text:
-                # Record citation info
-                char_start = char_position
-                char_end = char_position + len(page_text)
-
-                # Use "physical_page_N" to clarify this is sequential page number,
-                # not the document's internal page number (which may be i, ii, iii, etc.)
-                citation_map.append({
-                    "location": f"physical_page_{page_num}",
-                    "char_start": char_start,
-                    "char_end": char_end
-                })
-
-                full_text.append(page_text)
-
-                # CRITICAL: Account for newline that will be added by "\n".join()
-                # Move position past the page text AND the newline character
-                char_position = char_end + 1  # +1 for the newline between pages
-
-        # Join with newlines (this is why we added +1 above)
-        extracted_text = "\n".join(full_text)
-
-        # IMPORTANT: Fix the last citation's char_end (no newline after last page)
-        if citation_map:
-            # The last page doesn't have a trailing newline, so subtract 1
-            citation_map[-1]["char_end"] = len(extracted_text)
-
-        metadata = {
-            "converter": "pypdf",
-            "page_count": len(reader.pages),
-            "char_count": len(extracted_text),
-            "citation_type": "page",
-            "citation_map": citation_map,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
-
-        log.info(
-            f"PDF conversion: {len(reader.pages)} pages, {len(extracted_text)} chars, "
-            f"{len(citation_map)} citations"
-        )
-
-        return extracted_text, metadata
-
-    except Exception as e:
-        log.error(f"PDF conversion failed: {e}")
-        raise ValueError(f"Failed to convert PDF: {e}") from e
-
 
-def convert_docx_to_text(docx_bytes: bytes) -> Tuple[str, dict]:
-    """
-    Extract text from DOCX using python-docx with paragraph-level citation tracking.
-
-    IMPORTANT: Paragraph numbers are PHYSICAL/SEQUENTIAL (1, 2, 3, ...),
-    representing the order of paragraphs in the document.
-
-    This ensures consistent, unambiguous paragraph references.
-
-    Args:
-        docx_bytes: DOCX file content as bytes
-
-    Returns:
-        Tuple of (extracted_text, conversion_metadata)
-
-        conversion_metadata includes:
-        - converter: "python-docx"
-        - paragraph_count: number of paragraphs
-        - char_count: total characters extracted
-        - citation_map: list of {"location": "physical_paragraph_N", "char_start": X, "char_end": Y}
-          where N is the physical/sequential paragraph number (1, 2, 3, ...)
-    """
-    try:
-        from docx import Document
-
-        doc = Document(BytesIO(docx_bytes))
-
-        full_text = []
-        citation_map = []
-        char_position = 0
-
-        for para_num, paragraph in enumerate(doc.paragraphs, start=1):
-            para_text = paragraph.text
-
-            if para_text.strip():  # Only include non-empty paragraphs
-                # Record citation info
-                char_start = char_position
-                char_end = char_position + len(para_text)
-
-                # Use "physical_paragraph_N" for consistency with physical_page_N
-                citation_map.append({
-                    "location": f"physical_paragraph_{para_num}",
-                    "char_start": char_start,
-                    "char_end": char_end
-                })
-
-                full_text.append(para_text)
-
-                # CRITICAL: Account for newline that will be added by "\n".join()
-                char_position = char_end + 1  # +1 for the newline between paragraphs
-
-        # Join with newlines (this is why we added +1 above)
-        extracted_text = "\n".join(full_text)
+    def __init__(
+        self,
+        process_workers: int = DEFAULT_PROCESS_WORKERS,
+        pages_per_shard: int = DEFAULT_PAGES_PER_SHARD,
+        timeout_seconds: Optional[float] = DEFAULT_TIMEOUT_SECONDS,
+        max_calls_per_worker: int = DEFAULT_MAX_CALLS_PER_WORKER,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        if process_workers < 0 or cache_max_bytes < 0:
+            raise ValueError("process_workers and cache_max_bytes must be non-negative")
+        if pages_per_shard < 1:
+            raise ValueError("pages_per_shard must be at least 1")
+
+        self.process_workers = process_workers
+        self.pages_per_shard = pages_per_shard
+        self.timeout_seconds = timeout_seconds or None
+        self.cache_max_bytes = cache_max_bytes
+
+        self._pool: Optional[WarmProcessPool] = None
+        if process_workers > 0:
+            self._pool = WarmProcessPool(
+                target=f"{document_text.__name__}:run_conversion_task",
+                max_workers=process_workers,
+                preload_modules=["pypdf", "docx", "pptx"],
+                max_calls_per_worker=max_calls_per_worker,
+            )
 
-        # IMPORTANT: Fix the last citation's char_end (no newline after last paragraph)
-        if citation_map:
-            citation_map[-1]["char_end"] = len(extracted_text)
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, Tuple[str, dict, int]]" = OrderedDict()
+        self._cache_bytes = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    @staticmethod
+    def content_key(content: bytes, mime_type: str) -> str:
+        """Returns the content address of a conversion."""
+        hasher = hashlib.sha256(mime_type.encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(content)
+        return hasher.hexdigest()
+
+    async def convert(self, content: bytes, mime_type: str) -> Tuple[str, dict]:
+        """
+        Converts a document to text, reusing cached output for identical content.
+
+        Returns:
+            Tuple of (extracted_text, conversion_metadata)
+
+        Raises:
+            ValueError: If the file cannot be converted or the MIME type is unsupported
+        """
+        if mime_type not in _TASK_BY_MIME_TYPE:
+            raise ValueError(f"Unsupported MIME type for conversion: {mime_type}")
+
+        key = self.content_key(content, mime_type)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.shared += 1
+            text, metadata = await asyncio.shield(pending)
+            return text, self._fresh_metadata(metadata)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        # Retrieve the exception even when nobody else is waiting on it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            text, metadata = await self._convert_uncached(content, mime_type)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+        else:
+            self._put(key, text, metadata)
+            future.set_result((text, metadata))
+            return text, metadata
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns cache counters and worker pool counters."""
+        with self._lock:
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "shared": self.shared,
+                "cache_entries": len(self._cache),
+                "cache_bytes": self._cache_bytes,
+                "inflight": len(self._inflight),
+            }
+        if self._pool is not None:
+            stats["pool"] = dict(self._pool.stats)
+        return stats
+
+    async def shutdown(self) -> None:
+        """Stops the worker processes."""
+        if self._pool is not None:
+            await self._pool.shutdown()
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    async def _convert_uncached(self, content: bytes, mime_type: str) -> Tuple[str, dict]:
+        if self._pool is None:
+            converter = {
+                PDF_MIME_TYPE: convert_pdf_to_text,
+                DOCX_MIME_TYPE: convert_docx_to_text,
+                PPTX_MIME_TYPE: convert_pptx_to_text,
+            }[mime_type]
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_CONVERSION_EXECUTOR, converter, content)
 
-        metadata = {
-            "converter": "python-docx",
-            "paragraph_count": len([p for p in doc.paragraphs if p.text.strip()]),
-            "char_count": len(extracted_text),
-            "citation_type": "paragraph",
-            "citation_map": citation_map,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+        if mime_type == PDF_MIME_TYPE and self.process_workers > 1:
+            return await self._convert_pdf_sharded(content)
+        return await self._call_worker(kind=_TASK_BY_MIME_TYPE[mime_type], content=content)
 
-        log.info(
-            f"DOCX conversion: {len(doc.paragraphs)} paragraphs, {len(extracted_text)} chars, "
-            f"{len(citation_map)} citations"
+    async def _convert_pdf_sharded(self, content: bytes) -> Tuple[str, dict]:
+        try:
+            page_count = await asyncio.to_thread(count_pdf_pages, content)
+        except Exception as e:
+            log.error(f"PDF conversion failed: {e}")
+            raise ValueError(f"Failed to convert PDF: {e}") from e
+
+        shard_count = min(self.process_workers, math.ceil(page_count / self.pages_per_shard))
+        if shard_count <= 1:
+            return await self._call_worker(kind=TASK_PDF, content=content)
+
+        shard_size = math.ceil(page_count / shard_count)
+        shards = await asyncio.gather(
+            *(
+                self._call_worker(
+                    kind=TASK_PDF_PAGES,
+                    content=content,
+                    start_page=start_page,
+                    end_page=min(start_page + shard_size - 1, page_count),
+                )
+                for start_page in range(1, page_count + 1, shard_size)
+            )
         )
+        log.debug(f"PDF conversion: {page_count} pages split into {len(shards)} shards")
+        return assemble_pdf_text([page for shard in shards for page in shard], page_count)
 
-        return extracted_text, metadata
-
-    except Exception as e:
-        log.error(f"DOCX conversion failed: {e}")
-        raise ValueError(f"Failed to convert DOCX: {e}") from e
-
-
-def convert_pptx_to_text(pptx_bytes: bytes) -> Tuple[str, dict]:
+    async def _call_worker(self, **kwargs: Any) -> Any:
+        try:
+            return await self._pool.call(kwargs, timeout=self.timeout_seconds)
+        except TimeoutError as e:
+            raise ValueError(
+                f"Conversion timed out after {self.timeout_seconds} seconds"
+            ) from e
+        except WorkerCallError as e:
+            # Worker errors are reported as "<ExceptionType>: <message>"
+            message = str(e)
+            if message.startswith("ValueError: "):
+                message = message[len("ValueError: "):]
+            raise ValueError(message) from e
+        except WorkerCrashedError as e:
+            raise RuntimeError(f"Conversion worker failed: {e}") from e
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _fresh_metadata(metadata: dict) -> dict:
+        return {**metadata, "timestamp": datetime.now(timezone.utc).isoformat()}
+
+    def _get(self, key: str) -> Optional[Tuple[str, dict]]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+        text, metadata, _ = entry
+        return text, self._fresh_metadata(metadata)
+
+    def _put(self, key: str, text: str, metadata: dict) -> None:
+        # Approximate the entry's size by its text; citation maps are small
+        size = len(text) + 64 * len(metadata.get("citation_map", []))
+        if size > self.cache_max_bytes:
+            return
+        with self._lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._cache_bytes -= previous[2]
+            self._cache[key] = (text, metadata, size)
+            self._cache_bytes += size
+            while self._cache and self._cache_bytes > self.cache_max_bytes:
+                _, (_, _, evicted_size) = self._cache.popitem(last=False)
+                self._cache_bytes -= evicted_size
+
+
+_conversion_engine: Optional[DocumentConversionEngine] = None
+
+
+def configure_conversion_engine(
+    conversion_config: Optional[Dict[str, Any]],
+) -> Optional[DocumentConversionEngine]:
     """
-    Extract text from PPTX using python-pptx with slide-level citation tracking.
-
-    IMPORTANT: Slide numbers are PHYSICAL/SEQUENTIAL (1, 2, 3, ...),
-    representing the physical order of slides in the presentation,
-    NOT any custom slide numbers displayed in the presentation.
+    Creates the process-wide conversion engine from a `file_conversion` config.
 
-    Example:
-      Physical slide 1 → "physical_slide_1" (may show "Title" or no number)
-      Physical slide 2 → "physical_slide_2" (may show "Slide 1" internally)
-      Physical slide 10 → "physical_slide_10" (regardless of custom numbering)
-
-    This ensures consistent, unambiguous slide references, especially when
-    slides are hidden or custom numbering is used.
-
-    Args:
-        pptx_bytes: PPTX file content as bytes
-
-    Returns:
-        Tuple of (extracted_text, conversion_metadata)
-
-        conversion_metadata includes:
-        - converter: "python-pptx"
-        - slide_count: number of slides
-        - char_count: total characters extracted
-        - citation_map: list of {"location": "physical_slide_N", "char_start": X, "char_end": Y}
-          where N is the physical/sequential slide number (1, 2, 3, ...)
+    Returns None (conversions use the thread pool without caching) when the
+    engine is disabled.
     """
-    try:
-        from pptx import Presentation
-
-        prs = Presentation(BytesIO(pptx_bytes))
-
-        full_text = []
-        citation_map = []
-        char_position = 0
-
-        for slide_num, slide in enumerate(prs.slides, start=1):
-            slide_text_parts = []
-
-            # Extract text from all shapes in the slide
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text:
-                    slide_text_parts.append(shape.text)
-
-            if slide_text_parts:
-                slide_text = "\n".join(slide_text_parts)
-
-                # Record citation info
-                char_start = char_position
-                char_end = char_position + len(slide_text)
-
-                # Use "physical_slide_N" to clarify this is sequential slide number,
-                # not any custom slide numbering that may be displayed
-                citation_map.append({
-                    "location": f"physical_slide_{slide_num}",
-                    "char_start": char_start,
-                    "char_end": char_end
-                })
-
-                full_text.append(slide_text)
-
-                # CRITICAL: Account for double newline that will be added by "\n\n".join()
-                # Move position past the slide text AND the two newline characters
-                char_position = char_end + 2  # +2 for the double newline between slides
-
-        # Join with double newlines (this is why we added +2 above)
-        extracted_text = "\n\n".join(full_text)
-
-        # IMPORTANT: Fix the last citation's char_end (no double newline after last slide)
-        if citation_map:
-            citation_map[-1]["char_end"] = len(extracted_text)
+    global _conversion_engine
+    conversion_config = conversion_config or {}
+    if not conversion_config.get("enabled", True):
+        _conversion_engine = None
+        return None
+
+    _conversion_engine = DocumentConversionEngine(
+        process_workers=int(conversion_config.get("process_workers", DEFAULT_PROCESS_WORKERS)),
+        pages_per_shard=int(conversion_config.get("pages_per_shard", DEFAULT_PAGES_PER_SHARD)),
+        timeout_seconds=float(conversion_config.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS)),
+        max_calls_per_worker=int(
+            conversion_config.get("max_calls_per_worker", DEFAULT_MAX_CALLS_PER_WORKER)
+        ),
+        cache_max_bytes=int(conversion_config.get("cache_max_mb", 256)) * 1024 * 1024,
+    )
+    return _conversion_engine
 
-        metadata = {
-            "converter": "python-pptx",
-            "slide_count": len(prs.slides),
-            "char_count": len(extracted_text),
-            "citation_type": "slide",
-            "citation_map": citation_map,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
 
-        log.info(
-            f"PPTX conversion: {len(prs.slides)} slides, {len(extracted_text)} chars, "
-            f"{len(citation_map)} citations"
-        )
+def get_conversion_engine() -> Optional[DocumentConversionEngine]:
+    """Returns the configured conversion engine, if any."""
+    return _conversion_engine
 
-        return extracted_text, metadata
 
-    except Exception as e:
-        log.error(f"PPTX conversion failed: {e}")
-        raise ValueError(f"Failed to convert PPTX: {e}") from e
+async def shutdown_conversion_engine() -> None:
+    """Stops the configured engine's worker processes."""
+    global _conversion_engine
+    engine, _conversion_engine = _conversion_engine, None
+    if engine is not None:
+        await engine.shutdown()
 
 
 def should_convert_file(mime_type: str, filename: str) -> bool:
@@ -469,10 +517,13 @@ async def convert_and_save_artifact(
             return {"status": "error", "error": error_msg}
 
         # 2. Detect type and call appropriate converter (in-memory processing)
-        # Run conversion in thread pool to avoid blocking event loop and allow SSE events to be sent
+        # Run conversion off the event loop (process engine or thread pool) so SSE events can be sent
         try:
+            engine = get_conversion_engine()
             loop = asyncio.get_running_loop()
-            if mime_type == "application/pdf":
+            if engine is not None and mime_type in _TASK_BY_MIME_TYPE:
+                text, conversion_metadata = await engine.convert(source_bytes, mime_type)
+            elif mime_type == "application/pdf":
                 text, conversion_metadata = await loop.run_in_executor(
                     _CONVERSION_EXECUTOR, convert_pdf_to_text, source_bytes
                 )
@@ -13,6 +13,8 @@ import logging
 import uuid
 from typing import List, Tuple, Optional, Dict, Any, TYPE_CHECKING
 
+from ...constants import DEFAULT_PROJECT_TRANSFER_CONCURRENCY
+
 if TYPE_CHECKING:
     from .project_service import ProjectService
     from ..sse_manager import SSEManager
@@ -30,16 +32,23 @@ class IndexingTaskService:
     No state tracking - SSEManager handles all connection/event state.
     """
 
-    def __init__(self, sse_manager: "SSEManager", project_service: "ProjectService"):
+    def __init__(
+        self,
+        sse_manager: "SSEManager",
+        project_service: "ProjectService",
+        max_concurrency: int = DEFAULT_PROJECT_TRANSFER_CONCURRENCY,
+    ):
         """
         Initialize indexing task service.
 
         Args:
             sse_manager: SSEManager for sending events
             project_service: ProjectService for file operations
+            max_concurrency: Maximum number of files converted concurrently
         """
         self.sse_manager = sse_manager
         self.project_service = project_service
+        self.max_concurrency = max(1, max_concurrency)
         self.log_identifier = "[IndexingTaskService]"
         log.info(f"{self.log_identifier} Initialized (stateless)")
 
@@ -98,47 +107,58 @@ class IndexingTaskService:
                     "files": [filename for filename, _, _ in files_to_convert]
                 })
 
-                for idx, (filename, version, mime_type) in enumerate(files_to_convert, 1):
-                    try:
-                        # Send per-file progress
-                        await self._send_event(task_id, {
-                            "type": "conversion_file_progress",
-                            "file": filename,
-                            "version": version,
-                            "current": idx,
-                            "total": total_files
-                        })
-
-                        # Convert file (CPU-intensive - run in thread pool)
-                        log.debug(f"{log_prefix} Converting {filename} in thread pool")
-                        result = await self._convert_file_async(project, filename, version, mime_type)
-
-                        if result and result.get("status") == "success":
-                            converted_results.append(result)
+                # Convert with bounded concurrency; each file reports its own progress
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                started = 0
+
+                async def convert(filename: str, version: int, mime_type: str):
+                    nonlocal started
+                    async with semaphore:
+                        try:
+                            started += 1
+                            # Send per-file progress
                             await self._send_event(task_id, {
-                                "type": "conversion_file_completed",
-                                "converted_file": f"{filename}.converted.txt",
-                                "version": result.get('data_version')
+                                "type": "conversion_file_progress",
+                                "file": filename,
+                                "version": version,
+                                "current": started,
+                                "total": total_files
                             })
-                        else:
-                            # Conversion failed - extract error message from result
-                            error_msg = result.get("error") if result else f"Failed to convert '{filename}': Conversion returned no result"
+
+                            # Convert file (CPU-intensive - run in thread pool)
+                            log.debug(f"{log_prefix} Converting {filename} in thread pool")
+                            result = await self._convert_file_async(project, filename, version, mime_type)
+
+                            if result and result.get("status") == "success":
+                                converted_results.append(result)
+                                await self._send_event(task_id, {
+                                    "type": "conversion_file_completed",
+                                    "converted_file": f"{filename}.converted.txt",
+                                    "version": result.get('data_version')
+                                })
+                            else:
+                                # Conversion failed - extract error message from result
+                                error_msg = result.get("error") if result else f"Failed to convert '{filename}': Conversion returned no result"
+                                failed_conversions.append(filename)
+                                await self._send_event(task_id, {
+                                    "type": "conversion_failed",
+                                    "file": filename,
+                                    "error": error_msg
+                                })
+
+                        except Exception as e:
                             failed_conversions.append(filename)
+                            log.error(f"{log_prefix} Failed to convert {filename}: {e}")
+                            error_msg = f"Failed to convert '{filename}': {str(e)}"
                             await self._send_event(task_id, {
                                 "type": "conversion_failed",
                                 "file": filename,
                                 "error": error_msg
                             })
 
-                    except Exception as e:
-                        failed_conversions.append(filename)
-                        log.error(f"{log_prefix} Failed to convert {filename}: {e}")
-                        error_msg = f"Failed to convert '{filename}': {str(e)}"
-                        await self._send_event(task_id, {
-                            "type": "conversion_failed",
-                            "file": filename,
-                            "error": error_msg
-                        })
+                await asyncio.gather(
+                    *(convert(filename, version, mime_type) for filename, version, mime_type in files_to_convert)
+                )
 
                 # Send overall conversion completion summary
                 await self._send_event(task_id, {
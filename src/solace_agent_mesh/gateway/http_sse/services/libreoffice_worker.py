@@ -0,0 +1,180 @@
+"""
+Persistent LibreOffice conversion worker.
+
+Runs one headless LibreOffice instance with its own user profile, connects to
+it over a UNO pipe and converts documents to PDF on request, so the instance's
+start-up cost is paid once per worker instead of once per document.
+
+This file is executed directly as a script by DocumentConversionService's
+worker pool (it is not imported), and only uses the standard library plus the
+Python UNO bindings shipped with LibreOffice.
+
+Protocol (one JSON object per line):
+    worker -> pool at start-up: {"ready": true} or {"ready": false, "error": "..."}
+    pool -> worker:             {"input": "/path/input.docx", "output": "/path/input.pdf"}
+    worker -> pool:             {"ok": true} or {"ok": false, "error": "..."}
+
+Any executable speaking this protocol can be used as a stand-in worker.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# PDF export filters by LibreOffice application
+_WRITER_FILTER = "writer_pdf_Export"
+_IMPRESS_FILTER = "impress_pdf_Export"
+_CALC_FILTER = "calc_pdf_Export"
+
+PDF_EXPORT_FILTERS = {
+    "doc": _WRITER_FILTER,
+    "docx": _WRITER_FILTER,
+    "odt": _WRITER_FILTER,
+    "ppt": _IMPRESS_FILTER,
+    "pptx": _IMPRESS_FILTER,
+    "odp": _IMPRESS_FILTER,
+    "xls": _CALC_FILTER,
+    "xlsx": _CALC_FILTER,
+    "ods": _CALC_FILTER,
+}
+
+
+def _send(message: dict) -> None:
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def _property(name, value):
+    from com.sun.star.beans import PropertyValue
+
+    prop = PropertyValue()
+    prop.Name = name
+    prop.Value = value
+    return prop
+
+
+def _connect(pipe_name: str, soffice: subprocess.Popen, timeout_seconds: float):
+    import uno
+    from com.sun.star.connection import NoConnectException
+
+    local_context = uno.getComponentContext()
+    resolver = local_context.ServiceManager.createInstanceWithContext(
+        "com.sun.star.bridge.UnoUrlResolver", local_context
+    )
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        try:
+            context = resolver.resolve(
+                f"uno:pipe,name={pipe_name};urp;StarOffice.ComponentContext"
+            )
+            return context.ServiceManager.createInstanceWithContext(
+                "com.sun.star.frame.Desktop", context
+            )
+        except NoConnectException as e:
+            if soffice.poll() is not None:
+                raise RuntimeError(
+                    f"soffice exited with code {soffice.returncode}"
+                ) from None
+            if time.monotonic() > deadline:
+                raise RuntimeError(
+                    f"soffice did not accept connections within {timeout_seconds} seconds"
+                ) from e
+            time.sleep(0.1)
+
+
+def _convert(desktop, input_path: str, output_path: str) -> None:
+    import uno
+
+    ext = Path(input_path).suffix.lower().lstrip(".")
+    document = desktop.loadComponentFromURL(
+        uno.systemPathToFileUrl(os.path.abspath(input_path)),
+        "_blank",
+        0,
+        (_property("Hidden", True), _property("ReadOnly", True)),
+    )
+    if document is None:
+        raise RuntimeError("LibreOffice could not load the document")
+    try:
+        document.storeToURL(
+            uno.systemPathToFileUrl(os.path.abspath(output_path)),
+            (_property("FilterName", PDF_EXPORT_FILTERS.get(ext, _WRITER_FILTER)),),
+        )
+    finally:
+        document.close(True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--soffice", required=True, help="Path to the soffice executable")
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    args = parser.parse_args(argv)
+
+    profile_dir = tempfile.mkdtemp(prefix="sam_lo_profile_")
+    pipe_name = f"sam_lo_{os.getpid()}"
+    soffice = subprocess.Popen(
+        [
+            args.soffice,
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--nofirststartwizard",
+            "--norestore",
+            f"-env:UserInstallation={Path(profile_dir).as_uri()}",
+            f"--accept=pipe,name={pipe_name};urp;StarOffice.ComponentContext",
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    desktop = None
+    try:
+        try:
+            desktop = _connect(pipe_name, soffice, args.startup_timeout)
+        except ImportError:
+            _send({
+                "ready": False,
+                "error": "Python UNO bindings are not available to this interpreter",
+            })
+            return 1
+        except Exception as e:
+            _send({"ready": False, "error": str(e)})
+            return 1
+
+        _send({"ready": True})
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                _convert(desktop, request["input"], request["output"])
+                _send({"ok": True})
+            except Exception as e:
+                _send({"ok": False, "error": str(e) or type(e).__name__})
+            if soffice.poll() is not None:
+                # The pool sees end-of-file and replaces this worker
+                return 1
+        return 0
+    finally:
+        if desktop is not None:
+            try:
+                desktop.terminate()
+            except Exception:
+                soffice.terminate()
+        else:
+            soffice.terminate()
+        try:
+            soffice.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            soffice.kill()
+            soffice.wait()
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
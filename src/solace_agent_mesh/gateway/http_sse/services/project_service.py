@@ -2,12 +2,13 @@
 Business service for project-related operations.
 """
 
-from typing import List, Optional, TYPE_CHECKING, Tuple
+from typing import AsyncIterator, List, Optional, TYPE_CHECKING, Tuple
+import asyncio
 import logging
 import json
+import tempfile
 import zipfile
 import os
-from io import BytesIO
 from fastapi import UploadFile
 from datetime import datetime, timezone
 from sqlalchemy.exc import SQLAlchemyError
@@ -25,6 +26,9 @@ from ...constants import (
     DEFAULT_MAX_ZIP_UPLOAD_SIZE_BYTES,
     DEFAULT_MAX_PROJECT_SIZE_BYTES,
     DEFAULT_MAX_PROJECT_FILE_DESCRIPTION_LENGTH,
+    DEFAULT_PROJECT_TRANSFER_CONCURRENCY,
+    PROJECT_TRANSFER_CHUNK_SIZE_BYTES,
+    PROJECT_IMPORT_SPOOL_MAX_BYTES,
     ARTIFACTS_PREFIX
 )
 
@@ -51,6 +55,35 @@ def bytes_to_mb(size_bytes: int) -> float:
     return size_bytes / (1024 * 1024)
 
 
+class _ZipChunkWriter:
+    """
+    Write-only, non-seekable file object for streaming a ZIP archive.
+
+    zipfile falls back to data descriptors when it cannot seek, so every byte
+    it writes is final and can be handed to the client as soon as it is drained.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        return chunk
+
+
 class ProjectService:
     """Service layer for project business logic."""
 
@@ -97,6 +130,12 @@ class ProjectService:
         )
         self.max_project_size_bytes = int(max_project_size_config) if isinstance(max_project_size_config, (int, float)) else DEFAULT_MAX_PROJECT_SIZE_BYTES
 
+        transfer_concurrency_config = (
+            component.get_config("project_transfer_concurrency", DEFAULT_PROJECT_TRANSFER_CONCURRENCY)
+            if component else DEFAULT_PROJECT_TRANSFER_CONCURRENCY
+        )
+        self.transfer_concurrency = max(1, int(transfer_concurrency_config)) if isinstance(transfer_concurrency_config, (int, float)) else DEFAULT_PROJECT_TRANSFER_CONCURRENCY
+
         self.logger.debug(
             "[ProjectService] Initialized with "
             "max_per_file_upload_size_bytes=%d (%.2f MB), "
@@ -1056,21 +1095,25 @@ class ProjectService:
 
         return True
 
-    async def export_project_as_zip(
+    async def stream_project_export(
         self, db, project_id: str, user_id: str
-    ) -> BytesIO:
+    ) -> Tuple[Project, AsyncIterator[bytes]]:
         """
-        Create ZIP file with project data and artifacts.
-        Returns in-memory ZIP file.
-        
+        Prepare a streamed ZIP export of project data and artifacts.
+
+        Access checks and the artifact listing run before anything is streamed,
+        so errors surface as normal responses. The returned iterator loads one
+        artifact at a time and yields the archive in chunks, keeping memory
+        bounded by the largest artifact rather than the whole project.
+
         Args:
             db: Database session
             project_id: The project ID
             user_id: The requesting user ID
-            
+
         Returns:
-            BytesIO: In-memory ZIP file
-            
+            tuple: (project, async iterator over the ZIP file's bytes)
+
         Raises:
             ValueError: If project not found or access denied
         """
@@ -1124,14 +1167,25 @@ class ProjectService:
                 for artifact in artifacts
             ],
         )
-        
-        # Create ZIP in memory
-        zip_buffer = BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        project_json = export_data.model_dump(by_alias=True, mode='json')
+
+        return project, self._iter_project_export_zip(project, artifacts, project_json)
+
+    async def _iter_project_export_zip(
+        self, project: Project, artifacts: List[ArtifactInfo], project_json: dict
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield a project export ZIP chunk by chunk.
+
+        Compression runs in a worker thread so large artifacts do not stall
+        the event loop.
+        """
+        writer = _ZipChunkWriter()
+        with zipfile.ZipFile(writer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
             # Add project.json
-            project_json = export_data.model_dump(by_alias=True, mode='json')
             zip_file.writestr('project.json', json.dumps(project_json, indent=2))
-            
+            yield writer.drain()
+
             # Add artifacts
             if self.artifact_service and artifacts:
                 storage_session_id = f"project-{project.id}"
@@ -1144,20 +1198,34 @@ class ProjectService:
                             session_id=storage_session_id,
                             filename=artifact.filename,
                         )
-                        
-                        if artifact_part and artifact_part.inline_data:
-                            # Add to ZIP under artifacts/ directory
-                            zip_file.writestr(
-                                f'{ARTIFACTS_PREFIX}{artifact.filename}',
-                                artifact_part.inline_data.data
-                            )
                     except Exception as e:
                         self.logger.warning(
                             f"Failed to add artifact {artifact.filename} to export: {e}"
                         )
-        
-        zip_buffer.seek(0)
-        return zip_buffer
+                        continue
+
+                    if not (artifact_part and artifact_part.inline_data):
+                        continue
+
+                    # Add to ZIP under artifacts/ directory
+                    content = memoryview(artifact_part.inline_data.data)
+                    with zip_file.open(
+                        f'{ARTIFACTS_PREFIX}{artifact.filename}',
+                        'w',
+                        force_zip64=len(content) >= zipfile.ZIP64_LIMIT,
+                    ) as entry:
+                        for offset in range(0, len(content), PROJECT_TRANSFER_CHUNK_SIZE_BYTES):
+                            await asyncio.to_thread(
+                                entry.write,
+                                content[offset:offset + PROJECT_TRANSFER_CHUNK_SIZE_BYTES],
+                            )
+                            chunk = writer.drain()
+                            if chunk:
+                                yield chunk
+                    yield writer.drain()
+
+        # Central directory
+        yield writer.drain()
 
     async def import_project_from_zip(
         self, db, zip_file: UploadFile, user_id: str,
@@ -1167,6 +1235,10 @@ class ProjectService:
         """
         Import project from ZIP file with optional conversion and indexing.
 
+        The upload is spooled to a temporary file and artifacts are extracted
+        one entry at a time, with at most ``transfer_concurrency`` artifacts
+        being read, saved or converted at once.
+
         Args:
             db: Database session
             zip_file: Uploaded ZIP file
@@ -1184,27 +1256,12 @@ class ProjectService:
         log_prefix = f"[ProjectService:import_project] User {user_id}:"
         warnings = []
         
-        # Read ZIP file content with size validation
+        # Spool ZIP file with size validation (separate, larger limit than individual artifacts)
         self.logger.info(f"{log_prefix} Reading ZIP file")
-        zip_content = await zip_file.read()
-        zip_size = len(zip_content)
-        self.logger.info(f"{log_prefix} ZIP file read: {zip_size:,} bytes")
-        
-        # Validate ZIP file size (separate, larger limit than individual artifacts)
-        if zip_size > self.max_zip_upload_size_bytes:
-            max_size_mb = bytes_to_mb(self.max_zip_upload_size_bytes)
-            file_size_mb = bytes_to_mb(zip_size)
-            error_msg = (
-                f"ZIP file '{zip_file.filename}' rejected: size ({file_size_mb:.2f} MB) "
-                f"exceeds maximum allowed ({max_size_mb:.2f} MB)"
-            )
-            self.logger.warning(f"{log_prefix} {error_msg}")
-            raise ValueError(error_msg)
-        
-        zip_buffer = BytesIO(zip_content)
+        spooled_zip = await self._spool_zip_upload(zip_file, log_prefix)
         
         try:
-            with zipfile.ZipFile(zip_buffer, 'r') as zip_ref:
+            with zipfile.ZipFile(spooled_zip, 'r') as zip_ref:
                 # Validate ZIP structure
                 if 'project.json' not in zip_ref.namelist():
                     raise ValueError("Invalid project export: missing project.json")
@@ -1240,27 +1297,16 @@ class ProjectService:
                 imported_agent_id = project_data['project'].get('defaultAgentId')
 
                 # Pre-calculate total artifacts size for limit validation
-                artifact_files = [
-                    name for name in zip_ref.namelist()
-                    if name.startswith(ARTIFACTS_PREFIX) and name != ARTIFACTS_PREFIX
+                artifact_entries = [
+                    info for info in zip_ref.infolist()
+                    if info.filename.startswith(ARTIFACTS_PREFIX) and info.filename != ARTIFACTS_PREFIX
                 ]
 
-                total_artifacts_size = 0
-                oversized_artifacts = []
-
-                for artifact_path in artifact_files:
-                    file_info = zip_ref.getinfo(artifact_path)
-                    uncompressed_size = file_info.file_size
-
-                    # Track oversized files (will be skipped during import)
-                    if uncompressed_size > self.max_per_file_upload_size_bytes:
-                        safe_filename = os.path.basename(artifact_path)
-                        oversized_artifacts.append(
-                            (safe_filename, uncompressed_size)
-                        )
-                        continue
-
-                    total_artifacts_size += uncompressed_size
+                # Oversized files are skipped during import, so they don't count
+                total_artifacts_size = sum(
+                    info.file_size for info in artifact_entries
+                    if info.file_size <= self.max_per_file_upload_size_bytes
+                )
 
                 self._validate_project_size_limit(
                     current_project_size=0,
@@ -1286,66 +1332,12 @@ class ProjectService:
                     )
                 
                 # Import artifacts
-                artifacts_imported = 0
+                imported_artifacts = []
                 if self.artifact_service:
-                    storage_session_id = f"project-{project.id}"
-                    
-                    for artifact_path in artifact_files:
-                        try:
-                            filename = os.path.basename(artifact_path)
-
-                            # Validate filename is safe
-                            if not filename or filename in ('.', '..'):
-                                self.logger.warning(f"{log_prefix} Skipping invalid filename in ZIP: {artifact_path}")
-                                warnings.append(f"Skipped invalid filename: {artifact_path}")
-                                continue
-
-                            content_bytes = zip_ref.read(artifact_path)
-                            
-                            # Skip oversized artifacts with a warning (don't fail the entire import)
-                            if len(content_bytes) > self.max_per_file_upload_size_bytes:
-                                max_size_mb = bytes_to_mb(self.max_per_file_upload_size_bytes)
-                                file_size_mb = bytes_to_mb(len(content_bytes))
-                                skip_msg = (
-                                    f"Skipped '{filename}': size ({file_size_mb:.2f} MB) "
-                                    f"exceeds maximum allowed ({max_size_mb:.2f} MB)"
-                                )
-                                self.logger.warning(f"{log_prefix} {skip_msg}")
-                                warnings.append(skip_msg)
-                                continue  # Skip this artifact, continue with others
-
-                            # Find metadata from project.json
-                            artifact_meta = next(
-                                (a for a in project_data.get('artifacts', [])
-                                 if a['filename'] == filename),
-                                None
-                            )
-
-                            metadata = artifact_meta.get('metadata', {}) if artifact_meta else {}
-                            mime_type = artifact_meta.get('mimeType', 'application/octet-stream') if artifact_meta else 'application/octet-stream'
-
-                            if metadata.get("source") == "project":
-                                metadata["source_project_id"] = project.id
-
-                            # Save artifact
-                            from ....agent.utils.artifact_helpers import save_artifact_with_metadata
-                            await save_artifact_with_metadata(
-                                artifact_service=self.artifact_service,
-                                app_name=self.app_name,
-                                user_id=project.user_id,
-                                session_id=storage_session_id,
-                                filename=filename,
-                                content_bytes=content_bytes,
-                                mime_type=mime_type,
-                                metadata_dict=metadata,
-                                timestamp=datetime.now(timezone.utc),
-                            )
-                            artifacts_imported += 1
-                        except Exception as e:
-                            self.logger.warning(
-                                f"Failed to import artifact {artifact_path}: {e}"
-                            )
-                            warnings.append(f"Failed to import artifact: {filename}")
+                    imported_artifacts = await self._import_zip_artifacts(
+                        zip_ref, artifact_entries, project, project_data, warnings, log_prefix
+                    )
+                artifacts_imported = len(imported_artifacts)
 
                 # Post-processing: conversion and indexing (only if feature enabled)
                 if not indexing_enabled:
@@ -1357,24 +1349,13 @@ class ProjectService:
                     needs_conversion = []  # PDF, DOCX, PPTX
                     is_text_based = []     # .txt, .md, .json, .py, etc.
 
-                    for artifact_path in artifact_files:
-                        try:
-                            filename = artifact_path.replace('artifacts/', '')
-                            artifact_meta = next(
-                                (a for a in project_data.get('artifacts', [])
-                                 if a['filename'] == filename),
-                                None
-                            )
-                            mime_type = artifact_meta.get('mimeType', '') if artifact_meta else ''
-
-                            if self._should_convert_file(mime_type, filename):
-                                needs_conversion.append((filename, 0, mime_type))  # v0 on import
-                                self.logger.debug(f"File {filename} marked for conversion")
-                            elif self._is_text_file(mime_type, filename):
-                                is_text_based.append((filename, 0))
-                                self.logger.debug(f"File {filename} is text-based")
-                        except Exception as e:
-                            self.logger.warning(f"Error classifying {filename}: {e}")
+                    for filename, version, mime_type in imported_artifacts:
+                        if self._should_convert_file(mime_type, filename):
+                            needs_conversion.append((filename, version, mime_type))
+                            self.logger.debug(f"File {filename} marked for conversion")
+                        elif self._is_text_file(mime_type, filename):
+                            is_text_based.append((filename, version))
+                            self.logger.debug(f"File {filename} is text-based")
 
                     # Convert binary files
                     conversion_happened = False
@@ -1388,7 +1369,7 @@ class ProjectService:
                         except Exception as e:
                             self.logger.error(f"Conversion failed (non-critical): {e}")
 
-                    # Build index if text files or conversions happened
+                    # Build index once, after all artifacts are saved and converted
                     if is_text_based or conversion_happened:
                         try:
                             await self._rebuild_project_index(project, indexing_enabled)
@@ -1407,6 +1388,147 @@ class ProjectService:
             raise ValueError("Invalid project.json format")
         except KeyError as e:
             raise ValueError(f"Missing required field in project.json: {e}")
+        finally:
+            spooled_zip.close()
+
+    async def _spool_zip_upload(self, zip_file: UploadFile, log_prefix: str):
+        """
+        Copy an uploaded ZIP into a spooled temporary file.
+
+        The upload is read in chunks and rejected as soon as it exceeds the ZIP
+        size limit. Archives above a few MB are spooled to disk rather than
+        held in memory.
+
+        Returns:
+            SpooledTemporaryFile positioned at the start of the archive
+
+        Raises:
+            ValueError: If the ZIP file exceeds the size limit
+        """
+        max_size_mb = bytes_to_mb(self.max_zip_upload_size_bytes)
+
+        def size_exceeded(size_description: str) -> ValueError:
+            error_msg = (
+                f"ZIP file '{zip_file.filename}' rejected: size ({size_description}) "
+                f"exceeds maximum allowed ({max_size_mb:.2f} MB)"
+            )
+            self.logger.warning(f"{log_prefix} {error_msg}")
+            return ValueError(error_msg)
+
+        declared_size = getattr(zip_file, "size", None)
+        if isinstance(declared_size, int) and declared_size > self.max_zip_upload_size_bytes:
+            raise size_exceeded(f"{bytes_to_mb(declared_size):.2f} MB")
+
+        spooled_zip = tempfile.SpooledTemporaryFile(max_size=PROJECT_IMPORT_SPOOL_MAX_BYTES)
+        zip_size = 0
+        try:
+            while chunk := await zip_file.read(PROJECT_TRANSFER_CHUNK_SIZE_BYTES):
+                zip_size += len(chunk)
+                if zip_size > self.max_zip_upload_size_bytes:
+                    raise size_exceeded(f"over {bytes_to_mb(zip_size - len(chunk)):.2f} MB")
+                await asyncio.to_thread(spooled_zip.write, chunk)
+        except BaseException:
+            spooled_zip.close()
+            raise
+
+        spooled_zip.seek(0)
+        self.logger.info(f"{log_prefix} ZIP file read: {zip_size:,} bytes")
+        return spooled_zip
+
+    async def _import_zip_artifacts(
+        self,
+        zip_ref: zipfile.ZipFile,
+        artifact_entries: List[zipfile.ZipInfo],
+        project: Project,
+        project_data: dict,
+        warnings: List[str],
+        log_prefix: str,
+    ) -> List[Tuple[str, int, str]]:
+        """
+        Save the artifact entries of an import archive into the project.
+
+        Entries are decompressed in worker threads and saved with at most
+        ``transfer_concurrency`` in flight. Entries that share a filename are
+        saved in archive order so their versions stay deterministic.
+
+        Returns:
+            List of (filename, version, mime_type) for each saved artifact
+        """
+        artifact_meta_by_name = {}
+        for artifact_meta in project_data.get('artifacts', []):
+            artifact_meta_by_name.setdefault(artifact_meta['filename'], artifact_meta)
+
+        entries_by_filename = {}
+        for info in artifact_entries:
+            filename = os.path.basename(info.filename)
+
+            # Validate filename is safe
+            if not filename or filename in ('.', '..'):
+                self.logger.warning(f"{log_prefix} Skipping invalid filename in ZIP: {info.filename}")
+                warnings.append(f"Skipped invalid filename: {info.filename}")
+                continue
+
+            # Skip oversized artifacts with a warning (don't fail the entire import)
+            if info.file_size > self.max_per_file_upload_size_bytes:
+                max_size_mb = bytes_to_mb(self.max_per_file_upload_size_bytes)
+                file_size_mb = bytes_to_mb(info.file_size)
+                skip_msg = (
+                    f"Skipped '{filename}': size ({file_size_mb:.2f} MB) "
+                    f"exceeds maximum allowed ({max_size_mb:.2f} MB)"
+                )
+                self.logger.warning(f"{log_prefix} {skip_msg}")
+                warnings.append(skip_msg)
+                continue
+
+            entries_by_filename.setdefault(filename, []).append(info)
+
+        storage_session_id = f"project-{project.id}"
+        semaphore = asyncio.Semaphore(self.transfer_concurrency)
+
+        async def import_entries(filename: str, infos: List[zipfile.ZipInfo]):
+            artifact_meta = artifact_meta_by_name.get(filename)
+            mime_type = artifact_meta.get('mimeType', 'application/octet-stream') if artifact_meta else 'application/octet-stream'
+            saved, failures = [], []
+
+            for info in infos:
+                metadata = dict(artifact_meta.get('metadata', {})) if artifact_meta else {}
+                if metadata.get("source") == "project":
+                    metadata["source_project_id"] = project.id
+
+                try:
+                    async with semaphore:
+                        content_bytes = await asyncio.to_thread(zip_ref.read, info)
+                        result = await save_artifact_with_metadata(
+                            artifact_service=self.artifact_service,
+                            app_name=self.app_name,
+                            user_id=project.user_id,
+                            session_id=storage_session_id,
+                            filename=filename,
+                            content_bytes=content_bytes,
+                            mime_type=mime_type,
+                            metadata_dict=metadata,
+                            timestamp=datetime.now(timezone.utc),
+                        )
+                    if result.get("status") == "error":
+                        raise ValueError(result.get("message"))
+                    saved.append((filename, result.get("data_version", 0), mime_type))
+                except Exception as e:
+                    self.logger.warning(
+                        f"Failed to import artifact {info.filename}: {e}"
+                    )
+                    failures.append(f"Failed to import artifact: {filename}")
+
+            return saved, failures
+
+        outcomes = await asyncio.gather(
+            *(import_entries(filename, infos) for filename, infos in entries_by_filename.items())
+        )
+
+        imported_artifacts = []
+        for saved, failures in outcomes:
+            imported_artifacts.extend(saved)
+            warnings.extend(failures)
+        return imported_artifacts
 
     def _resolve_project_name_conflict(
         self, db, desired_name: str, user_id: str
@@ -1561,31 +1683,37 @@ class ProjectService:
 
         from .file_converter_service import convert_and_save_artifact
 
-        results = []
         storage_session_id = f"project-{project.id}"
+        semaphore = asyncio.Semaphore(self.transfer_concurrency)
 
-        for filename, version, mime_type in files_to_convert:
+        async def convert(filename: str, version: int, mime_type: str) -> Optional[dict]:
             try:
-                result = await convert_and_save_artifact(
-                    artifact_service=self.artifact_service,
-                    app_name=self.app_name,
-                    user_id=project.user_id,
-                    session_id=storage_session_id,
-                    source_filename=filename,
-                    source_version=version,
-                    mime_type=mime_type
-                )
+                async with semaphore:
+                    result = await convert_and_save_artifact(
+                        artifact_service=self.artifact_service,
+                        app_name=self.app_name,
+                        user_id=project.user_id,
+                        session_id=storage_session_id,
+                        source_filename=filename,
+                        source_version=version,
+                        mime_type=mime_type
+                    )
                 if result:
-                    results.append(result)
                     self.logger.info(
                         f"Converted {filename} v{version} → "
                         f"{filename}.converted.txt v{result.get('data_version')}"
                     )
+                return result
             except Exception as e:
                 self.logger.error(f"Failed to convert {filename} v{version}: {e}")
                 # Continue with other conversions
+                return None
 
-        return results
+        # Conversions run concurrently, bounded by transfer_concurrency
+        results = await asyncio.gather(
+            *(convert(filename, version, mime_type) for filename, version, mime_type in files_to_convert)
+        )
+        return [result for result in results if result]
 
     async def _rebuild_project_index(
         self,
@@ -0,0 +1,131 @@
+"""
+Database lease coordination between scheduler instances.
+
+Every instance renews a lease row in ``scheduler_instances``. The instances
+whose leases have not expired form the live set, and each scheduled task is
+owned by exactly one of them via rendezvous (highest random weight) hashing,
+so only the owner fires it. When an instance joins, leaves or its lease
+expires, only the tasks it owned (or now owns) move.
+"""
+
+import hashlib
+import logging
+from typing import Callable, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session as DBSession
+
+from ...repository.models import SchedulerInstanceModel
+from ...shared import now_epoch_ms
+
+log = logging.getLogger(__name__)
+
+DEFAULT_LEASE_TTL_SECONDS = 15
+DEFAULT_HEARTBEAT_INTERVAL_SECONDS = 5
+
+
+def _rendezvous_weight(instance_id: str, key: str) -> int:
+    digest = hashlib.blake2b(f"{instance_id}:{key}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class SchedulerCoordinator:
+    """Maintains this instance's lease and the view of live instances."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], DBSession],
+        namespace: str,
+        instance_id: str,
+        lease_ttl_seconds: int = DEFAULT_LEASE_TTL_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.namespace = namespace
+        self.instance_id = instance_id
+        self.lease_ttl_ms = lease_ttl_seconds * 1000
+        self.started_at = now_epoch_ms()
+        self.lease_expires_at = 0
+        self.live_instances: List[str] = []
+
+    def renew_lease(self) -> List[str]:
+        """Renews this instance's lease and refreshes the live instance set.
+
+        Returns:
+            Sorted ids of instances holding an unexpired lease, including this one.
+        """
+        now = now_epoch_ms()
+        expires_at = now + self.lease_ttl_ms
+
+        with self.session_factory() as session:
+            row = session.get(SchedulerInstanceModel, self.instance_id)
+            if row is None:
+                session.add(
+                    SchedulerInstanceModel(
+                        instance_id=self.instance_id,
+                        namespace=self.namespace,
+                        started_at=self.started_at,
+                        heartbeat_at=now,
+                        lease_expires_at=expires_at,
+                    )
+                )
+            else:
+                row.namespace = self.namespace
+                row.heartbeat_at = now
+                row.lease_expires_at = expires_at
+            session.commit()
+
+            stmt = select(SchedulerInstanceModel.instance_id).where(
+                SchedulerInstanceModel.namespace == self.namespace,
+                SchedulerInstanceModel.lease_expires_at > now,
+            )
+            live = sorted(session.execute(stmt).scalars().all())
+
+        self.lease_expires_at = expires_at
+        self.live_instances = live
+        return live
+
+    def release_lease(self) -> None:
+        """Drops this instance's lease so others take over immediately."""
+        with self.session_factory() as session:
+            session.execute(
+                delete(SchedulerInstanceModel).where(
+                    SchedulerInstanceModel.instance_id == self.instance_id
+                )
+            )
+            session.commit()
+        self.lease_expires_at = 0
+        self.live_instances = []
+
+    def purge_expired_leases(self, older_than_ms: int) -> int:
+        """Deletes lease rows that expired before the given time."""
+        with self.session_factory() as session:
+            result = session.execute(
+                delete(SchedulerInstanceModel).where(
+                    SchedulerInstanceModel.namespace == self.namespace,
+                    SchedulerInstanceModel.lease_expires_at < older_than_ms,
+                )
+            )
+            session.commit()
+            return result.rowcount or 0
+
+    def has_valid_lease(self) -> bool:
+        """True while this instance's last renewed lease has not expired."""
+        return now_epoch_ms() < self.lease_expires_at
+
+    def owner_of(self, key: str) -> Optional[str]:
+        """Returns the live instance that owns the given task id."""
+        if not self.live_instances:
+            return None
+        return max(self.live_instances, key=lambda iid: _rendezvous_weight(iid, key))
+
+    def owns(self, key: str) -> bool:
+        """True if this instance holds a valid lease and owns the task id."""
+        return self.has_valid_lease() and self.owner_of(key) == self.instance_id
+
+    def is_leader(self) -> bool:
+        """True for the live instance with the lowest id while its lease is valid."""
+        return (
+            self.has_valid_lease()
+            and bool(self.live_instances)
+            and self.live_instances[0] == self.instance_id
+        )
@@ -525,7 +525,9 @@ class ResultHandler:
         the top of the "Recent Chats" list (ordered by ``updated_time DESC``).
         """
         try:
-            from ...repository.models import ChatTaskModel, SessionModel
+            from ...repository.chat_task_repository import ChatTaskRepository
+            from ...repository.entities import ChatTask
+            from ...repository.models import SessionModel
 
             session_id = f"scheduled_{execution.id}"
 
@@ -632,17 +634,21 @@ class ResultHandler:
                 )
             task_metadata = json.dumps(task_metadata_dict)
 
-            chat_task = ChatTaskModel(
-                id=execution.a2a_task_id or str(uuid.uuid4()),
-                session_id=session_id,
-                user_id=user_id,
-                user_message=user_message,
-                message_bubbles=json.dumps(bubbles),
-                task_metadata=task_metadata,
-                created_time=now,
-                updated_time=now,
+            # Saved through the repository so the messages reach the session
+            # search index like any other chat task.
+            ChatTaskRepository().save(
+                db_session,
+                ChatTask(
+                    id=execution.a2a_task_id or str(uuid.uuid4()),
+                    session_id=session_id,
+                    user_id=user_id,
+                    user_message=user_message,
+                    message_bubbles=json.dumps(bubbles),
+                    task_metadata=task_metadata,
+                    created_time=now,
+                    updated_time=now,
+                ),
             )
-            db_session.add(chat_task)
 
             # Update the session's updated_time so it appears at the top of
             # the "Recent Chats" list (ordered by updated_time DESC).
@@ -2,7 +2,10 @@
 Core scheduler service for managing and executing scheduled tasks.
 Integrates with APScheduler for cron/interval scheduling.
 
-Single-instance architecture — no leader election or multi-instance coordination.
+Runs single-instance by default. With ``multi_instance_enabled`` several
+gateway replicas share the schedule: each renews a lease in the database and
+fires only the tasks it owns (see SchedulerCoordinator). Each scheduled fire
+is also claimed in the database so a run fires once while replicas disagree.
 Tasks run forever while enabled; failures are tracked for observability only.
 """
 
@@ -18,7 +21,7 @@ from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 import pytz
 from croniter import croniter
-from sqlalchemy import select
+from sqlalchemy import or_, select, update
 from sqlalchemy.orm import Session as DBSession
 
 from solace_agent_mesh.common import a2a
@@ -34,8 +37,14 @@ from ...repository.models import (
 )
 from ...repository.models import SessionModel
 from ...repository.scheduled_task_repository import ScheduledTaskRepository
+from ...repository.session_search_repository import SessionSearchRepository
 from ...shared import is_quartz_weekday_cron, now_epoch_ms, parse_interval_to_seconds
 from ...shared.cron import NTH_WORDS, WEEKDAY_NAMES, parse_quartz_weekday_token
+from .coordinator import (
+    DEFAULT_HEARTBEAT_INTERVAL_SECONDS,
+    DEFAULT_LEASE_TTL_SECONDS,
+    SchedulerCoordinator,
+)
 from .result_handler import ResultHandler
 from .notification_service import NotificationService
 
@@ -69,8 +78,9 @@ class TaskAlreadyRunningError(Exception):
 
 class SchedulerService:
     """
-    Core scheduling service for single-instance deployments.
-    Manages scheduled task definitions and executes them via the agent mesh.
+    Core scheduling service.
+    Manages scheduled task definitions and executes them via the agent mesh,
+    optionally sharing the schedule with other instances through DB leases.
     """
 
     def __init__(
@@ -100,6 +110,17 @@ class SchedulerService:
         self.max_concurrent_executions = config.get("max_concurrent_executions", DEFAULT_MAX_CONCURRENT_EXECUTIONS)
         self.stale_execution_timeout_seconds = config.get("stale_execution_timeout_seconds", DEFAULT_STALE_EXECUTION_TIMEOUT_SECONDS)
         self.stale_cleanup_interval_seconds = config.get("stale_cleanup_interval_seconds", DEFAULT_STALE_CLEANUP_INTERVAL_SECONDS)
+        self.heartbeat_interval_seconds = config.get("heartbeat_interval_seconds", DEFAULT_HEARTBEAT_INTERVAL_SECONDS)
+
+        # Multi-instance coordination: None means this instance owns every task
+        self.coordinator: Optional[SchedulerCoordinator] = None
+        if config.get("multi_instance_enabled", False):
+            self.coordinator = SchedulerCoordinator(
+                session_factory=session_factory,
+                namespace=namespace,
+                instance_id=instance_id,
+                lease_ttl_seconds=config.get("lease_ttl_seconds", DEFAULT_LEASE_TTL_SECONDS),
+            )
 
         self.scheduler = AsyncIOScheduler(
             timezone="UTC",
@@ -134,6 +155,7 @@ class SchedulerService:
         )
 
         self._stale_cleanup_task: Optional[asyncio.Task] = None
+        self._coordination_task: Optional[asyncio.Task] = None
 
         log.info(
             "[SchedulerService:%s] Initialized for namespace '%s'",
@@ -144,6 +166,11 @@ class SchedulerService:
         """Start the scheduler service."""
         log.info("[SchedulerService:%s] Starting scheduler service", self.instance_id)
 
+        if self.coordinator:
+            # Join the live set first so orphan recovery can tell which
+            # executions still belong to another running instance.
+            self.coordinator.renew_lease()
+
         # Mark any executions left in RUNNING/PENDING state from a previous
         # crash as FAILED so they don't appear stuck in the UI forever.
         await self._recover_orphaned_executions()
@@ -151,8 +178,16 @@ class SchedulerService:
         self.scheduler.start()
         log.info("[SchedulerService:%s] APScheduler started", self.instance_id)
 
-        # Single instance — load tasks directly on startup
-        await self._load_scheduled_tasks()
+        if self.coordinator:
+            await self._sync_owned_tasks()
+            self._coordination_task = asyncio.create_task(self._coordination_loop())
+            log.info(
+                "[SchedulerService:%s] Multi-instance coordination started (live instances: %s)",
+                self.instance_id, self.coordinator.live_instances,
+            )
+        else:
+            # Single instance — load tasks directly on startup
+            await self._load_scheduled_tasks()
 
         self._stale_cleanup_task = asyncio.create_task(self._stale_cleanup_loop())
         log.info("[SchedulerService:%s] Stale cleanup task started", self.instance_id)
@@ -163,12 +198,22 @@ class SchedulerService:
 
         self.scheduler.shutdown(wait=False)
 
-        if self._stale_cleanup_task and not self._stale_cleanup_task.done():
-            self._stale_cleanup_task.cancel()
+        for background_task in (self._stale_cleanup_task, self._coordination_task):
+            if background_task and not background_task.done():
+                background_task.cancel()
+                try:
+                    await background_task
+                except asyncio.CancelledError:
+                    pass
+
+        if self.coordinator:
             try:
-                await self._stale_cleanup_task
-            except asyncio.CancelledError:
-                pass
+                self.coordinator.release_lease()
+            except Exception as e:
+                log.warning(
+                    "[SchedulerService:%s] Failed to release scheduler lease: %s",
+                    self.instance_id, e,
+                )
 
         for execution_id, task in list(self.running_executions.items()):
             log.info("[SchedulerService:%s] Cancelling execution %s", self.instance_id, execution_id)
@@ -182,6 +227,8 @@ class SchedulerService:
         while True:
             try:
                 await asyncio.sleep(self.stale_cleanup_interval_seconds)
+                if not await self.is_leader():
+                    continue
                 log.info("[SchedulerService:%s] Running stale execution cleanup", self.instance_id)
                 await self._cleanup_stale_executions()
             except asyncio.CancelledError:
@@ -239,13 +286,17 @@ class SchedulerService:
                 exc_info=True,
             )
 
-    async def _recover_orphaned_executions(self):
-        """Mark executions left in RUNNING/PENDING state as FAILED on startup.
+    async def _recover_orphaned_executions(self, on_startup: bool = True):
+        """Mark executions left in RUNNING/PENDING state as FAILED.
 
         When the backend crashes or restarts, any in-flight executions lose
         their in-memory tracking (result_handler, completion events, etc.)
         and can never complete normally.  This method runs once at startup
         to mark them as failed so they don't appear stuck in the UI.
+
+        With multi-instance coordination, executions of other live instances
+        are left alone, and the coordination loop calls this again whenever an
+        instance drops out so its executions are recovered by the survivors.
         """
         try:
             with self.session_factory() as session:
@@ -255,13 +306,29 @@ class SchedulerService:
                         ExecutionStatus.PENDING,
                     ]),
                 )
+                if self.coordinator:
+                    live_owners = [
+                        iid for iid in self.coordinator.live_instances
+                        if not (on_startup and iid == self.instance_id)
+                    ]
+                    if live_owners:
+                        stmt = stmt.where(
+                            or_(
+                                ScheduledTaskExecutionModel.instance_id.is_(None),
+                                ScheduledTaskExecutionModel.instance_id.notin_(live_owners),
+                            )
+                        )
+                    if not on_startup:
+                        # Legacy rows without an owner are only handled at startup
+                        stmt = stmt.where(ScheduledTaskExecutionModel.instance_id.isnot(None))
                 orphaned = session.execute(stmt).scalars().all()
 
                 if not orphaned:
-                    log.info(
-                        "[SchedulerService:%s] No orphaned executions found on startup",
-                        self.instance_id,
-                    )
+                    if on_startup:
+                        log.info(
+                            "[SchedulerService:%s] No orphaned executions found on startup",
+                            self.instance_id,
+                        )
                     return
 
                 now = now_epoch_ms()
@@ -278,8 +345,8 @@ class SchedulerService:
 
                 session.commit()
                 log.info(
-                    "[SchedulerService:%s] Recovered %d orphaned executions on startup",
-                    self.instance_id, len(orphaned),
+                    "[SchedulerService:%s] Recovered %d orphaned executions%s",
+                    self.instance_id, len(orphaned), " on startup" if on_startup else "",
                 )
 
         except Exception as e:
@@ -324,6 +391,115 @@ class SchedulerService:
                 exc_info=True,
             )
 
+    async def _coordination_loop(self):
+        """Renew the lease and rebalance owned tasks every heartbeat interval."""
+        while True:
+            try:
+                await asyncio.sleep(self.heartbeat_interval_seconds)
+                await self._coordination_tick()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                log.error(
+                    "[SchedulerService:%s] Error in coordination loop: %s",
+                    self.instance_id, e,
+                    exc_info=True,
+                )
+
+    async def _coordination_tick(self):
+        """One heartbeat: renew the lease, then reconcile with the new live set."""
+        previous = set(self.coordinator.live_instances)
+        try:
+            live = self.coordinator.renew_lease()
+        except Exception as e:
+            log.error(
+                "[SchedulerService:%s] Failed to renew scheduler lease: %s",
+                self.instance_id, e,
+            )
+            if not self.coordinator.has_valid_lease() and self.active_tasks:
+                # Another instance takes these over once our lease lapses
+                log.warning(
+                    "[SchedulerService:%s] Lease expired, releasing %d tasks",
+                    self.instance_id, len(self.active_tasks),
+                )
+                await self._unload_all_tasks()
+            return
+
+        if set(live) != previous:
+            log.info(
+                "[SchedulerService:%s] Live scheduler instances changed: %s -> %s",
+                self.instance_id, sorted(previous), live,
+            )
+            if previous - set(live):
+                await self._recover_orphaned_executions(on_startup=False)
+
+        await self._sync_owned_tasks()
+
+        if self.coordinator.is_leader():
+            self.coordinator.purge_expired_leases(
+                now_epoch_ms() - self.coordinator.lease_ttl_ms * 4
+            )
+
+    async def _sync_owned_tasks(self):
+        """Schedule the enabled tasks this instance owns and drop the rest.
+
+        Also picks up tasks created, rescheduled, enabled or disabled through
+        another instance by comparing each task's schedule with the one its
+        APScheduler job was built from. Other fields are read at fire time.
+        """
+        try:
+            with self.session_factory() as session:
+                stmt = select(
+                    ScheduledTaskModel.id,
+                    ScheduledTaskModel.schedule_type,
+                    ScheduledTaskModel.schedule_expression,
+                    ScheduledTaskModel.timezone,
+                ).where(
+                    ScheduledTaskModel.enabled == True,
+                    ScheduledTaskModel.namespace == self.namespace,
+                    ScheduledTaskModel.deleted_at == None,
+                )
+                enabled = {
+                    row.id: (row.schedule_type, row.schedule_expression, row.timezone)
+                    for row in session.execute(stmt)
+                }
+        except Exception as e:
+            log.error(
+                "[SchedulerService:%s] Failed to load scheduled tasks for rebalancing: %s",
+                self.instance_id, e,
+                exc_info=True,
+            )
+            return
+
+        for task_id in list(self.active_tasks.keys()):
+            if task_id not in enabled or not self.coordinator.owns(task_id):
+                await self.unschedule_task(task_id)
+
+        to_schedule = [
+            task_id for task_id, schedule in enabled.items()
+            if self.coordinator.owns(task_id)
+            and (
+                task_id not in self.active_tasks
+                or self.active_tasks[task_id].get("schedule") != schedule
+            )
+        ]
+        if not to_schedule:
+            return
+
+        with self.session_factory() as session:
+            tasks = session.execute(
+                select(ScheduledTaskModel).where(ScheduledTaskModel.id.in_(to_schedule))
+            ).scalars().all()
+            for task in tasks:
+                try:
+                    await self.schedule_task(task)
+                except Exception as e:
+                    log.error(
+                        "[SchedulerService:%s] Failed to schedule task %s: %s",
+                        self.instance_id, task.id, e,
+                        exc_info=True,
+                    )
+
     async def _unload_all_tasks(self):
         """Unload all scheduled tasks from APScheduler."""
         for task_id in list(self.active_tasks.keys()):
@@ -349,6 +525,15 @@ class SchedulerService:
         """
         job_id = f"scheduled_task_{task.id}"
 
+        if self.coordinator and not self.coordinator.owns(task.id):
+            # The owning instance picks the change up on its next heartbeat
+            log.info(
+                "[SchedulerService:%s] Task %s is owned by instance %s, not scheduling locally",
+                self.instance_id, task.id, self.coordinator.owner_of(task.id),
+            )
+            await self.unschedule_task(task.id)
+            return
+
         log.info(
             "[SchedulerService:%s] Scheduling task '%s' "
             "(ID: %s, Type: %s, fire_immediately=%s)",
@@ -371,6 +556,7 @@ class SchedulerService:
                 "job": job,
                 "task_name": task.name,
                 "schedule_type": task.schedule_type,
+                "schedule": (task.schedule_type, task.schedule_expression, task.timezone),
             }
 
             if job.next_run_time:
@@ -511,6 +697,17 @@ class SchedulerService:
         """
         # Acquire a per-task lock so overlapping cron triggers for the same
         # task wait rather than corrupting the persistent session.
+        if (
+            self.coordinator
+            and trigger_type == TriggerType.SCHEDULED
+            and not self.coordinator.owns(task_id)
+        ):
+            log.info(
+                "[SchedulerService:%s] Task %s no longer owned by this instance, skipping fire",
+                self.instance_id, task_id,
+            )
+            return
+
         task_lock = self._task_locks.setdefault(task_id, asyncio.Lock())
 
         if task_lock.locked():
@@ -520,9 +717,53 @@ class SchedulerService:
             )
             return
 
+        if (
+            self.coordinator
+            and trigger_type == TriggerType.SCHEDULED
+            and not self._claim_scheduled_fire(task_id)
+        ):
+            log.info(
+                "[SchedulerService:%s] Task %s run already claimed by another instance, skipping fire",
+                self.instance_id, task_id,
+            )
+            return
+
         async with task_lock:
             await self._execute_scheduled_task_inner(task_id, trigger_type, triggered_by)
 
+    def _claim_scheduled_fire(self, task_id: str) -> bool:
+        """Fence a scheduled fire in the database.
+
+        Ownership is decided from this instance's view of the live set, and
+        two replicas can briefly disagree while membership changes. The fire
+        is therefore claimed with a conditional UPDATE that moves the task's
+        ``next_run_at`` past now, and only while it is still due. The first
+        replica to commit wins; any other replica firing the same run finds
+        ``next_run_at`` already in the future and matches no rows.
+        """
+        now_ms = now_epoch_ms()
+        next_run_ms = None
+        job_info = self.active_tasks.get(task_id)
+        if job_info and job_info.get("job") and job_info["job"].next_run_time:
+            next_run_ms = int(job_info["job"].next_run_time.timestamp() * 1000)
+        if next_run_ms is None or next_run_ms <= now_ms:
+            # One-time tasks have no next run; park the marker just past now
+            # so the claim still excludes concurrent fires.
+            next_run_ms = now_ms + 1
+
+        with self.session_factory() as session:
+            result = session.execute(
+                update(ScheduledTaskModel)
+                .where(
+                    ScheduledTaskModel.id == task_id,
+                    ScheduledTaskModel.next_run_at.is_not(None),
+                    ScheduledTaskModel.next_run_at <= now_ms,
+                )
+                .values(next_run_at=next_run_ms)
+            )
+            session.commit()
+            return result.rowcount == 1
+
     async def trigger_task_now(self, task_id: str, triggered_by: Optional[str] = None) -> str:
         """Manually execute a task "Run Now".
 
@@ -648,6 +889,7 @@ class SchedulerService:
                                     trigger_type=trigger_type,
                                     triggered_by=triggered_by,
                                     task_snapshot=persisted_snapshot,
+                                    instance_id=self.instance_id,
                                 )
                                 session.add(execution)
                                 session.commit()
@@ -675,6 +917,7 @@ class SchedulerService:
                             trigger_type=trigger_type,
                             triggered_by=triggered_by,
                             task_snapshot=persisted_snapshot,
+                            instance_id=self.instance_id,
                         )
                         session.add(execution)
                         task.last_run_at = current_time
@@ -926,6 +1169,11 @@ class SchedulerService:
                         updated_time=now,
                     )
                     sess.add(session_record)
+                    # SessionRepository.save does not carry `source`, so index
+                    # the name directly to make the session searchable
+                    SessionSearchRepository().index_session_name(
+                        sess, session_id, user_id, session_record.name
+                    )
 
                     # Also mark execution as RUNNING in the same transaction
                     execution = sess.get(ScheduledTaskExecutionModel, execution_id)
@@ -1216,8 +1464,14 @@ class SchedulerService:
             )
 
     async def is_leader(self) -> bool:
-        """Always True — single-instance architecture."""
-        return True
+        """True if this instance runs namespace-wide housekeeping.
+
+        Always True without multi-instance coordination; otherwise only the
+        live instance with the lowest id is leader.
+        """
+        if not self.coordinator:
+            return True
+        return self.coordinator.is_leader()
 
     async def handle_a2a_response(self, message_data: Dict[str, Any]):
         """Handle an A2A response message."""
@@ -1234,4 +1488,6 @@ class SchedulerService:
             "running_executions_count": len(self.running_executions),
             "pending_results_count": pending_count,
             "scheduler_running": self.scheduler.running if self.scheduler else False,
+            "multi_instance_enabled": self.coordinator is not None,
+            "live_instances": list(self.coordinator.live_instances) if self.coordinator else [self.instance_id],
         }
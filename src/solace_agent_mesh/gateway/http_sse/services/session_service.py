@@ -457,7 +457,10 @@ class SessionService:
         agent_id: str | None = None,
     ) -> PaginatedResponse[Session]:
         """
-        Search sessions by name/title only.
+        Search sessions by name and chat message content.
+
+        Results are ranked by the full-text index when the database has one,
+        otherwise sessions are matched on their name only.
 
         Args:
             db: Database session
@@ -195,12 +195,16 @@ class TaskLoggerService:
                     db.rollback()
                     db.begin()
 
-            # Create and save the event using the sanitized raw payload
+            # Create and save the event using the sanitized raw payload.
+            # Timestamp it with the message's publish time: the gateway derives
+            # live SSE event IDs from the same value, so they match the stored
+            # sequence that replay resumes from.
+            published_at = (user_properties or {}).get("timestamp")
             task_event = TaskEvent(
                 id=str(uuid.uuid4()),
                 task_id=task_id,
                 user_id=user_id,
-                created_time=now_epoch_ms(),
+                created_time=published_at if isinstance(published_at, int) else now_epoch_ms(),
                 topic=topic,
                 direction=direction,
                 payload=sanitized_payload,
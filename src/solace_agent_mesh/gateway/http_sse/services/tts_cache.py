@@ -0,0 +1,269 @@
+"""
+Content-addressed cache for synthesized speech audio.
+
+Entries are keyed by a hash of the speech text (after markdown preprocessing),
+the resolved voice, the provider and the audio format, so replays of the same
+message, shared chats and repeated sentence chunks in streamed playback reuse
+one synthesis. Audio is held in a byte-bounded in-memory LRU and, when a disk
+directory is configured, written through to a byte-bounded on-disk LRU that
+survives restarts. Concurrent requests for the same key await a single
+in-flight synthesis.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from solace_ai_connector.common.log import log
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_DISK_MAX_BYTES = 512 * 1024 * 1024
+
+_DISK_SUFFIX = ".audio"
+
+
+def make_tts_cache_key(
+    text: str, voice: str, provider: str, audio_format: str = "mp3"
+) -> str:
+    """Returns the content address of a synthesis request."""
+    hasher = hashlib.sha256()
+    for part in (provider, voice, audio_format, text):
+        encoded = (part or "").encode("utf-8")
+        # Length-prefix each part so field boundaries cannot be forged
+        hasher.update(len(encoded).to_bytes(8, "big"))
+        hasher.update(encoded)
+    return hasher.hexdigest()
+
+
+class TTSAudioCache:
+    """Bounded memory cache with optional disk spill and in-flight sharing."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+    ):
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("TTS cache max_entries and max_bytes must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+        if self.disk_dir:
+            self._load_disk_index()
+
+    # ------------------------------------------------------------------
+    # Lookup and storage
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns cached audio, promoting disk entries into memory."""
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return audio
+            on_disk = key in self._disk
+
+        if on_disk:
+            audio = self._read_disk(key)
+            if audio is not None:
+                with self._lock:
+                    self._disk.move_to_end(key)
+                    self._store_memory(key, audio)
+                    self.hits += 1
+                return audio
+        return None
+
+    def put(self, key: str, audio: bytes) -> None:
+        """Stores audio in memory and, if configured, on disk."""
+        if not audio:
+            return
+        with self._lock:
+            self._store_memory(key, audio)
+        if self.disk_dir:
+            self._write_disk(key, audio)
+
+    async def get_or_create(
+        self, key: str, synthesize: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """
+        Returns cached audio for the key or synthesizes it once.
+
+        Callers that arrive while a synthesis for the same key is running await
+        that synthesis instead of starting another. Failures are not cached.
+        """
+        audio = self.get(key)
+        if audio is not None:
+            return audio
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.shared += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        # Retrieve the exception even when nobody else is waiting on it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            audio = await synthesize()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+        else:
+            self.put(key, audio)
+            future.set_result(audio)
+            return audio
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns counters and current sizes."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "shared": self.shared,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes,
+                "inflight": len(self._inflight),
+            }
+
+    def _store_memory(self, key: str, audio: bytes) -> None:
+        # Callers hold self._lock
+        if len(audio) > self.max_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        while self._memory and (
+            len(self._memory) > self.max_entries or self._memory_bytes > self.max_bytes
+        ):
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    # ------------------------------------------------------------------
+    # Disk spill
+    # ------------------------------------------------------------------
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key + _DISK_SUFFIX)
+
+    def _load_disk_index(self) -> None:
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            entries = []
+            for name in os.listdir(self.disk_dir):
+                if not name.endswith(_DISK_SUFFIX):
+                    continue
+                stat = os.stat(os.path.join(self.disk_dir, name))
+                entries.append((stat.st_mtime, name[: -len(_DISK_SUFFIX)], stat.st_size))
+        except OSError as e:
+            log.warning("[TTSAudioCache] Disabling disk cache at %s: %s", self.disk_dir, e)
+            self.disk_dir = None
+            return
+
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+        self._evict_disk()
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path_for(key), "rb") as f:
+                return f.read()
+        except OSError:
+            with self._lock:
+                size = self._disk.pop(key, None)
+                if size is not None:
+                    self._disk_bytes -= size
+            return None
+
+    def _write_disk(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.disk_max_bytes:
+            return
+        with self._lock:
+            if key in self._disk:
+                self._disk.move_to_end(key)
+                return
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+            os.replace(tmp_path, self._path_for(key))
+        except OSError as e:
+            log.warning("[TTSAudioCache] Failed to write cache entry %s: %s", key, e)
+            return
+        with self._lock:
+            self._disk[key] = len(audio)
+            self._disk_bytes += len(audio)
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        # Callers hold self._lock (or run during construction)
+        while self._disk and self._disk_bytes > self.disk_max_bytes:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(self._path_for(key))
+            except OSError:
+                pass
+
+
+# AudioService is created per request, so caches are shared per configuration.
+_shared_caches: Dict[Tuple[Any, ...], TTSAudioCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_tts_cache(cache_config: Optional[Dict[str, Any]]) -> Optional[TTSAudioCache]:
+    """
+    Returns the process-wide cache for a `speech.tts.cache` configuration.
+
+    Returns None when caching is disabled.
+    """
+    cache_config = cache_config or {}
+    if not cache_config.get("enabled", True):
+        return None
+
+    settings = (
+        int(cache_config.get("max_entries", DEFAULT_MAX_ENTRIES)),
+        int(cache_config.get("max_bytes", DEFAULT_MAX_BYTES)),
+        cache_config.get("disk_dir") or None,
+        int(cache_config.get("disk_max_bytes", DEFAULT_DISK_MAX_BYTES)),
+    )
+    with _shared_caches_lock:
+        cache = _shared_caches.get(settings)
+        if cache is None:
+            cache = TTSAudioCache(*settings)
+            _shared_caches[settings] = cache
+        return cache
@@ -0,0 +1,115 @@
+"""
+Cross-replica fan-out of SSE events for WebUI gateway clusters.
+
+The replica that receives an agent's events for a task re-publishes every SSE
+event through a fan-out backend. The other replicas of the same group forward
+it to the SSE connections they hold for that task, so a browser can be served
+by whichever replica the load balancer picks.
+
+Replicas run with distinct gateway IDs, each consuming its own queue, so the
+group is a name they share: ``sse_fanout_group``, or the WebUI app name.
+"""
+
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional
+
+from ...common import a2a
+
+log = logging.getLogger(__name__)
+
+FANOUT_KIND_EVENT = "event"
+FANOUT_KIND_CLOSE = "close"
+
+
+class SSEFanout(ABC):
+    """
+    Pluggable pub/sub backend used by the SSEManager to share task events
+    between gateway replicas.
+
+    Subclasses implement `_publish`; messages published by other replicas must
+    be handed to `SSEManager.handle_fanout_message`.
+    """
+
+    def __init__(self, instance_id: Optional[str] = None):
+        self.instance_id = instance_id or uuid.uuid4().hex
+
+    def publish_event(self, task_id: str, sse_payload: Dict[str, Any]) -> None:
+        """Shares one SSE event of a task with the other replicas."""
+        self._safe_publish(
+            task_id,
+            {
+                "kind": FANOUT_KIND_EVENT,
+                "origin": self.instance_id,
+                "task_id": task_id,
+                "sse": sse_payload,
+            },
+        )
+
+    def publish_close(self, task_id: str) -> None:
+        """Tells the other replicas to close their SSE connections for a task."""
+        self._safe_publish(
+            task_id,
+            {
+                "kind": FANOUT_KIND_CLOSE,
+                "origin": self.instance_id,
+                "task_id": task_id,
+            },
+        )
+
+    def is_own_message(self, message: Dict[str, Any]) -> bool:
+        return message.get("origin") == self.instance_id
+
+    def _safe_publish(self, task_id: str, message: Dict[str, Any]) -> None:
+        # Fan-out is best effort: the local stream and DB replay must never
+        # fail because the broker rejected a re-publish.
+        try:
+            self._publish(task_id, message)
+        except Exception as e:
+            log.warning(
+                "[SSEFanout] Failed to publish %s for task %s: %s",
+                message.get("kind"),
+                task_id,
+                e,
+            )
+
+    @abstractmethod
+    def _publish(self, task_id: str, message: Dict[str, Any]) -> None:
+        """Publishes one fan-out message for a task to the other replicas."""
+
+
+class BrokerSSEFanout(SSEFanout):
+    """
+    Fan-out over the Solace broker on a per-gateway-group topic.
+
+    Args:
+        publish: Callable with the signature of `publish_a2a_message(payload, topic)`.
+        namespace: A2A namespace of the gateway.
+        group: Name shared by all replicas that serve the same users.
+        instance_id: Unique ID of this replica; generated when omitted.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[Dict[str, Any], str], Any],
+        namespace: str,
+        group: str,
+        instance_id: Optional[str] = None,
+    ):
+        super().__init__(instance_id)
+        self._publish_fn = publish
+        self._namespace = namespace
+        self._group = group
+        self.subscription_topic = a2a.get_gateway_sse_fanout_subscription_topic(
+            namespace, group
+        )
+
+    def matches_topic(self, topic: str) -> bool:
+        return a2a.topic_matches_subscription(topic, self.subscription_topic)
+
+    def _publish(self, task_id: str, message: Dict[str, Any]) -> None:
+        self._publish_fn(
+            message,
+            a2a.get_gateway_sse_fanout_topic(self._namespace, self._group, task_id),
+        )
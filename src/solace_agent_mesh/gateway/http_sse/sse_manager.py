@@ -15,7 +15,9 @@ from sqlalchemy import text
 
 from solace_agent_mesh.shared.utils.timestamp_utils import now_epoch_ms
 
+from .event_sequence import next_event_sequence
 from .sse_event_buffer import SSEEventBuffer
+from .sse_fanout import FANOUT_KIND_CLOSE, FANOUT_KIND_EVENT, SSEFanout
 from .persistent_sse_event_buffer import PersistentSSEEventBuffer
 
 log = logging.getLogger(__name__)
@@ -53,6 +55,12 @@ class SSEManager:
         self._session_factory = session_factory
         self._background_task_cache: Dict[str, bool] = {}  # Cache to avoid repeated DB queries
         self._tasks_with_prior_connection: set = set()  # Track tasks that have had at least one SSE connection
+        # task_id → sequence of the last event sent, used as the SSE event ID
+        self._last_event_sequences: Dict[str, int] = {}
+        # Cross-replica fan-out (cluster mode); None when running standalone
+        self._fanout: Optional[SSEFanout] = None
+        # task_id → origin replica → highest sequence forwarded, for de-duplication
+        self._fanout_sequences: Dict[str, Dict[str, int]] = {}
 
         # User-level notification queues for push events (e.g. scheduled task session created).
         # Keyed by user_id → list of asyncio.Queue.
@@ -76,6 +84,15 @@ class SSEManager:
                 hybrid_buffer_threshold,
             )
 
+    def set_fanout(self, fanout: Optional[SSEFanout]) -> None:
+        """Enables (or disables with None) cross-replica fan-out of task events."""
+        self._fanout = fanout
+        log.info(
+            "%s Cross-replica SSE fan-out %s",
+            self.log_identifier,
+            f"enabled (instance {fanout.instance_id})" if fanout else "disabled",
+        )
+
     def _sanitize_json(self, obj):
         if isinstance(obj, dict):
             return {k: self._sanitize_json(v) for k, v in obj.items()}
@@ -350,7 +367,11 @@ class SSEManager:
         return self._persistent_buffer
 
     async def send_event(
-        self, task_id: str, event_data: Dict[str, Any], event_type: str = "message"
+        self,
+        task_id: str,
+        event_data: Dict[str, Any],
+        event_type: str = "message",
+        published_time: Optional[int] = None,
     ):
         """
         Sends an event (as a dictionary) to all active SSE connections for a specific task.
@@ -360,6 +381,10 @@ class SSEManager:
             task_id: The ID of the task the event belongs to.
             event_data: The dictionary representing the A2A event (e.g., TaskStatusUpdateEvent).
             event_type: The type of the SSE event (default: "message").
+            published_time: Publish time of the A2A message the event was
+                derived from. The task logger stores that message with a
+                sequence derived from the same time, so the SSE event ID
+                matches the stored event's sequence.
         """
         # Serialize data outside the lock
         try:
@@ -375,7 +400,21 @@ class SSEManager:
             )
             return
 
-        sse_payload = {"event": event_type, "data": serialized_data}
+        with self._lock:
+            sequence = next_event_sequence(
+                self._last_event_sequences.get(task_id),
+                published_time if published_time is not None else now_epoch_ms(),
+            )
+            self._last_event_sequences[task_id] = sequence
+
+        sse_payload = {
+            "id": str(sequence),
+            "event": event_type,
+            "data": serialized_data,
+        }
+
+        if self._fanout is not None:
+            self._fanout.publish_event(task_id, sse_payload)
 
         # Check if this task is registered for persistent buffering
         is_registered = self._is_task_registered_for_buffering(task_id)
@@ -469,9 +508,15 @@ class SSEManager:
                 task_id,
             )
 
+        await self._put_on_queues(task_id, sse_payload, queues_copy)
+
+    async def _put_on_queues(
+        self, task_id: str, sse_payload: Dict[str, Any], queues: List[asyncio.Queue]
+    ):
+        """Puts an SSE payload on the given connection queues, dropping broken ones."""
         # Send to queues outside the lock (async operations)
         queues_to_remove = []
-        for connection_queue in queues_copy:
+        for connection_queue in queues:
             try:
                 await asyncio.wait_for(
                     connection_queue.put(sse_payload), timeout=0.1
@@ -528,6 +573,82 @@ class SSEManager:
                             task_id,
                         )
 
+    async def handle_fanout_message(self, message: Dict[str, Any]) -> None:
+        """
+        Forwards an SSE event or close signal re-published by another replica
+        to the SSE connections this replica holds for the task.
+
+        Events are not buffered or persisted here; the originating replica has
+        already done that. Events at or below the highest sequence already
+        forwarded from the same origin are dropped as duplicates.
+        """
+        if not isinstance(message, dict):
+            return
+        if self._fanout is not None and self._fanout.is_own_message(message):
+            return
+
+        task_id = message.get("task_id")
+        origin = message.get("origin")
+        kind = message.get("kind")
+        if not task_id or not origin:
+            log.warning(
+                "%s Ignoring malformed fan-out message: %s",
+                self.log_identifier,
+                message,
+            )
+            return
+
+        if kind == FANOUT_KIND_CLOSE:
+            await self._close_local_connections(task_id)
+            return
+        if kind != FANOUT_KIND_EVENT:
+            return
+
+        sse_payload = message.get("sse")
+        if not isinstance(sse_payload, dict):
+            return
+        try:
+            sequence = int(sse_payload.get("id"))
+        except (TypeError, ValueError):
+            sequence = None
+
+        with self._lock:
+            queues = self._connections.get(task_id)
+            if not queues:
+                return
+            if sequence is not None:
+                seen = self._fanout_sequences.setdefault(task_id, {})
+                if sequence <= seen.get(origin, -1):
+                    log.debug(
+                        "%s Dropping duplicate fan-out event %d for Task ID: %s",
+                        self.log_identifier,
+                        sequence,
+                        task_id,
+                    )
+                    return
+                seen[origin] = sequence
+            queues_copy = list(queues)
+
+        await self._put_on_queues(task_id, sse_payload, queues_copy)
+
+    async def _close_local_connections(self, task_id: str) -> None:
+        """Signals this replica's SSE connections for a task to close."""
+        with self._lock:
+            queues_to_close = self._connections.pop(task_id, None)
+            self._fanout_sequences.pop(task_id, None)
+            self._tasks_with_prior_connection.discard(task_id)
+
+        for q in queues_to_close or []:
+            try:
+                await asyncio.wait_for(q.put(None), timeout=0.1)
+            except Exception as e:
+                log.warning(
+                    "%s Could not signal close on SSE queue for Task ID %s: %s",
+                    self.log_identifier,
+                    task_id,
+                    e,
+                )
+
     async def close_connection(self, task_id: str, connection_queue: asyncio.Queue):
         """
         Signals a specific SSE connection queue to close by putting None.
@@ -617,7 +738,12 @@ class SSEManager:
                     task_id,
                 )
 
+        if self._fanout is not None:
+            self._fanout.publish_close(task_id)
+
         with self._lock:
+            self._last_event_sequences.pop(task_id, None)
+            self._fanout_sequences.pop(task_id, None)
             if task_id in self._connections:
                 # This is the "normal" case: a client is or was connected.
                 # It's safe to clean up everything.
@@ -713,6 +839,8 @@ class SSEManager:
                     all_queues_to_close.extend(queues)
             self._connections.clear()
             self._tasks_with_prior_connection.clear()
+            self._last_event_sequences.clear()
+            self._fanout_sequences.clear()
 
         # Close queues outside the lock (async operations)
         closed_count = len(all_queues_to_close)
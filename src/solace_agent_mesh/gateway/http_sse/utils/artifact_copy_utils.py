@@ -3,16 +3,15 @@ Utility functions for copying project artifacts to sessions.
 """
 
 import logging
-from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from sqlalchemy.orm import Session as DbSession
 
 from ....agent.utils.artifact_helpers import (
+    copy_artifact_with_metadata,
     get_artifact_info_list,
     is_internal_artifact,
     load_artifact_content_or_metadata,
-    save_artifact_with_metadata,
 )
 
 if TYPE_CHECKING:
@@ -101,6 +100,11 @@ async def copy_project_artifacts_to_session(
     - When indexing_enabled=True: Copies all artifacts including converted text
       files and BM25 index (complete context for search)
 
+    Artifact content is copied inside the artifact store when the artifact
+    service supports it (see copy_artifact_with_metadata). With the gateway
+    setting project_artifact_copy_mode "reference", session artifacts are
+    references to the project's versions instead of copies.
+
     This function handles:
     - Loading artifacts from the project storage
     - Filtering based on indexing feature flag
@@ -151,6 +155,7 @@ async def copy_project_artifacts_to_session(
 
         source_user_id = project.user_id
         project_artifacts_session_id = f"project-{project.id}"
+        reference = component.get_config("project_artifact_copy_mode", "copy") == "reference"
 
         log.info(
             "%sChecking for artifacts in project %s (storage session: %s)",
@@ -259,64 +264,35 @@ async def copy_project_artifacts_to_session(
             copied_artifact_names.append(artifact_info.filename)
 
             try:
-                # Load artifact content from project storage
-                loaded_artifact = await load_artifact_content_or_metadata(
-                    artifact_service=artifact_service,
-                    app_name=project_service.app_name,
-                    user_id=source_user_id,
-                    session_id=project_artifacts_session_id,
-                    filename=artifact_info.filename,
-                    return_raw_bytes=True,
-                    version="latest",
-                )
-
-                # Load the full metadata separately
-                loaded_metadata = await load_artifact_content_or_metadata(
+                # The artifact service copies the content in storage where it
+                # can; this flag will be checked on the next user message to
+                # inject full context
+                copy_result = await copy_artifact_with_metadata(
                     artifact_service=artifact_service,
                     app_name=project_service.app_name,
-                    user_id=source_user_id,
-                    session_id=project_artifacts_session_id,
+                    source_user_id=source_user_id,
+                    source_session_id=project_artifacts_session_id,
+                    user_id=user_id,
+                    session_id=session_id,
                     filename=artifact_info.filename,
-                    load_metadata_only=True,
-                    version="latest",
+                    metadata_updates={"project_context_pending": True},
+                    reference=reference,
                 )
-
-                # Save a copy to the current chat session
-                if loaded_artifact.get("status") == "success":
-                    full_metadata = (
-                        loaded_metadata.get("metadata", {})
-                        if loaded_metadata.get("status") == "success"
-                        else {}
-                    )
-
-                    # This flag will be checked on the next user message to inject full context
-                    full_metadata["project_context_pending"] = True
-
-                    await save_artifact_with_metadata(
-                        artifact_service=artifact_service,
-                        app_name=project_service.app_name,
-                        user_id=user_id,
-                        session_id=session_id,
-                        filename=artifact_info.filename,
-                        content_bytes=loaded_artifact.get("raw_bytes"),
-                        mime_type=loaded_artifact.get("mime_type"),
-                        metadata_dict=full_metadata,
-                        timestamp=datetime.now(timezone.utc),
-                    )
+                if copy_result.get("status") == "success":
                     artifacts_copied += 1
                     log.info(
                         "%sSuccessfully copied %s artifact %s (v%s) to session",
                         log_prefix,
                         artifact_type,
                         artifact_info.filename,
-                        loaded_artifact.get("version", "unknown"),
+                        copy_result.get("data_version", "unknown"),
                     )
                 else:
                     log.warning(
-                        "%sFailed to load artifact %s: %s",
+                        "%sFailed to copy artifact %s: %s",
                         log_prefix,
                         artifact_info.filename,
-                        loaded_artifact.get("status"),
+                        copy_result.get("message"),
                     )
             except Exception as e:
                 log.error(
@@ -412,53 +388,23 @@ async def copy_session_artifacts(
         artifacts_copied = 0
         for artifact_info in source_artifacts:
             try:
-                # Load artifact content
-                loaded = await load_artifact_content_or_metadata(
+                copy_result = await copy_artifact_with_metadata(
                     artifact_service=artifact_service,
                     app_name=app_name,
-                    user_id=source_user_id,
-                    session_id=source_session_id,
+                    source_user_id=source_user_id,
+                    source_session_id=source_session_id,
+                    user_id=target_user_id,
+                    session_id=target_session_id,
                     filename=artifact_info.filename,
-                    return_raw_bytes=True,
-                    version="latest",
                 )
-
-                # Load metadata
-                loaded_meta = await load_artifact_content_or_metadata(
-                    artifact_service=artifact_service,
-                    app_name=app_name,
-                    user_id=source_user_id,
-                    session_id=source_session_id,
-                    filename=artifact_info.filename,
-                    load_metadata_only=True,
-                    version="latest",
-                )
-
-                if loaded.get("status") == "success":
-                    metadata = (
-                        loaded_meta.get("metadata", {})
-                        if loaded_meta.get("status") == "success"
-                        else {}
-                    )
-
-                    await save_artifact_with_metadata(
-                        artifact_service=artifact_service,
-                        app_name=app_name,
-                        user_id=target_user_id,
-                        session_id=target_session_id,
-                        filename=artifact_info.filename,
-                        content_bytes=loaded.get("raw_bytes"),
-                        mime_type=loaded.get("mime_type"),
-                        metadata_dict=metadata,
-                        timestamp=datetime.now(timezone.utc),
-                    )
+                if copy_result.get("status") == "success":
                     artifacts_copied += 1
                 else:
                     log.warning(
-                        "%sFailed to load artifact %s: %s",
+                        "%sFailed to copy artifact %s: %s",
                         log_prefix,
                         artifact_info.filename,
-                        loaded.get("message", "unknown error"),
+                        copy_result.get("message", "unknown error"),
                     )
             except Exception as e:
                 log.error(
@@ -2,7 +2,8 @@
 Utility functions for creating .stim file structures.
 """
 
-from typing import Dict, List
+import json
+from typing import Dict, Iterable, Iterator, List
 
 from ..repository.entities import Task, TaskEvent
 
@@ -46,8 +47,6 @@ def create_stim_from_task_hierarchy(
     Returns:
         A dictionary representing the .stim file content with all task events.
     """
-    root_task = tasks[root_task_id]
-
     # Collect all events from all tasks and sort by created_time
     combined_events = []
     for task_id, events in all_events.items():
@@ -57,16 +56,56 @@ def create_stim_from_task_hierarchy(
     combined_events.sort(key=lambda e: e.created_time)
 
     return {
-        "invocation_details": {
-            "log_file_version": "2.0",  # New version for gateway-generated logs
-            "task_id": root_task.id,
-            "user_id": root_task.user_id,
-            "start_time": root_task.start_time,
-            "end_time": root_task.end_time,
-            "status": root_task.status,
-            "initial_request_text": root_task.initial_request_text,
-            "includes_child_tasks": len(tasks) > 1,
-            "total_tasks": len(tasks),
-        },
+        "invocation_details": create_stim_invocation_details(tasks, root_task_id),
         "invocation_flow": [event.model_dump() for event in combined_events],
     }
+
+
+def create_stim_invocation_details(tasks: Dict[str, Task], root_task_id: str) -> dict:
+    """
+    Builds the `invocation_details` header of a .stim file for a task hierarchy.
+
+    Args:
+        tasks: Dictionary of task_id -> Task entity for all tasks in hierarchy.
+        root_task_id: The root task ID.
+
+    Returns:
+        The invocation details dictionary.
+    """
+    root_task = tasks[root_task_id]
+    return {
+        "log_file_version": "2.0",  # New version for gateway-generated logs
+        "task_id": root_task.id,
+        "user_id": root_task.user_id,
+        "start_time": root_task.start_time,
+        "end_time": root_task.end_time,
+        "status": root_task.status,
+        "initial_request_text": root_task.initial_request_text,
+        "includes_child_tasks": len(tasks) > 1,
+        "total_tasks": len(tasks),
+    }
+
+
+def iter_stim_ndjson(
+    tasks: Dict[str, Task], events: Iterable[TaskEvent], root_task_id: str
+) -> Iterator[str]:
+    """
+    Serializes a task hierarchy as newline-delimited JSON, one record at a time.
+
+    The first line is `{"invocation_details": {...}}`; every following line is
+    one entry of the invocation flow. `events` is consumed lazily and must
+    already be in chronological order, so the whole export never has to be
+    held in memory.
+
+    Args:
+        tasks: Dictionary of task_id -> Task entity for all tasks in hierarchy.
+        events: Chronologically ordered events for all tasks.
+        root_task_id: The root task ID.
+
+    Yields:
+        NDJSON lines, each terminated by a newline.
+    """
+    header = {"invocation_details": create_stim_invocation_details(tasks, root_task_id)}
+    yield json.dumps(header, ensure_ascii=False) + "\n"
+    for event in events:
+        yield json.dumps(event.model_dump(), ensure_ascii=False) + "\n"
@@ -909,31 +909,27 @@ class PlatformServiceComponent(SamComponentBase):
         """
         Check agent health and remove expired agents from registry.
 
-        Called periodically by the health check timer. Iterates through all
-        registered agents and removes any whose TTL has expired (i.e., they
-        haven't sent a heartbeat recently).
+        Called periodically by the health check timer. Removes the registered
+        agents whose TTL has expired (i.e., they haven't sent a heartbeat
+        recently); only those agents are visited.
         """
         log.debug("%s Performing agent health check...", self.log_identifier)
 
-        agent_names = self.agent_registry.get_agent_names()
-        total_agents = len(agent_names)
+        total_agents = len(self.agent_registry)
         agents_removed = 0
 
-        for agent_name in agent_names:
-            is_expired, time_since_last_seen = self.agent_registry.check_ttl_expired(
-                agent_name, self.health_check_ttl_seconds
+        for agent_name, time_since_last_seen in self.agent_registry.get_expired(
+            self.health_check_ttl_seconds
+        ):
+            log.warning(
+                "%s Agent '%s' TTL expired (last seen: %d seconds ago, TTL: %d seconds). Removing from registry.",
+                self.log_identifier,
+                agent_name,
+                time_since_last_seen,
+                self.health_check_ttl_seconds,
             )
-
-            if is_expired:
-                log.warning(
-                    "%s Agent '%s' TTL expired (last seen: %d seconds ago, TTL: %d seconds). Removing from registry.",
-                    self.log_identifier,
-                    agent_name,
-                    time_since_last_seen,
-                    self.health_check_ttl_seconds,
-                )
-                self.agent_registry.remove_agent(agent_name)
-                agents_removed += 1
+            self.agent_registry.remove_agent(agent_name)
+            agents_removed += 1
 
         if agents_removed > 0:
             log.info(
@@ -982,31 +978,27 @@ class PlatformServiceComponent(SamComponentBase):
         """
         Check gateway health and remove expired gateways from registry.
 
-        Called periodically by the health check timer. Iterates through all
-        registered gateways and removes any whose TTL has expired (i.e., they
-        haven't sent a heartbeat recently).
+        Called periodically by the health check timer. Removes the registered
+        gateways whose TTL has expired (i.e., they haven't sent a heartbeat
+        recently); only those gateways are visited.
         """
         log.debug("%s Performing gateway health check...", self.log_identifier)
 
-        gateway_ids = self.gateway_registry.get_gateway_ids()
-        total_gateways = len(gateway_ids)
+        total_gateways = len(self.gateway_registry)
         gateways_removed = 0
 
-        for gateway_id in gateway_ids:
-            is_expired, time_since_last_seen = self.gateway_registry.check_ttl_expired(
-                gateway_id, self.health_check_ttl_seconds
+        for gateway_id, time_since_last_seen in self.gateway_registry.get_expired(
+            self.health_check_ttl_seconds
+        ):
+            log.warning(
+                "%s Gateway '%s' TTL expired (last seen: %d seconds ago, TTL: %d seconds). Removing from registry.",
+                self.log_identifier,
+                gateway_id,
+                time_since_last_seen,
+                self.health_check_ttl_seconds,
             )
-
-            if is_expired:
-                log.warning(
-                    "%s Gateway '%s' TTL expired (last seen: %d seconds ago, TTL: %d seconds). Removing from registry.",
-                    self.log_identifier,
-                    gateway_id,
-                    time_since_last_seen,
-                    self.health_check_ttl_seconds,
-                )
-                self.gateway_registry.remove_gateway(gateway_id)
-                gateways_removed += 1
+            self.gateway_registry.remove_gateway(gateway_id)
+            gateways_removed += 1
 
         if gateways_removed > 0:
             log.info(
@@ -1,15 +1,17 @@
-from .constants import OutboxStatus
+from .constants import OutboxProcessingMode, OutboxStatus
 from .entity import OutboxEventEntity
 from .models import CreateOutboxEventModel, OutboxEventModel, UpdateOutboxEventModel
-from .poller import OutboxEventPoller
+from .poller import OutboxEventPoller, PollCycleMetrics
 from .repository import OutboxEventRepository
 
 __all__ = [
+    "OutboxProcessingMode",
     "OutboxStatus",
     "OutboxEventEntity",
     "OutboxEventModel",
     "CreateOutboxEventModel",
     "UpdateOutboxEventModel",
     "OutboxEventPoller",
+    "PollCycleMetrics",
     "OutboxEventRepository",
 ]
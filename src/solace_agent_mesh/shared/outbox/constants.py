@@ -3,3 +3,8 @@ class OutboxStatus:
     COMPLETED = "completed"
     SKIPPED = "skipped"
     ERROR = "error"
+
+
+class OutboxProcessingMode:
+    SEQUENTIAL = "sequential"
+    CONCURRENT = "concurrent"
@@ -2,10 +2,31 @@ import asyncio
 import contextlib
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from .constants import OutboxProcessingMode
+from .models import UpdateOutboxEventModel
 
 log = logging.getLogger(__name__)
 
 
+@dataclass
+class PollCycleMetrics:
+    fetched: int = 0
+    deduplicated: int = 0
+    processed: int = 0
+    failed: int = 0
+    commits: int = 0
+    duration_ms: int = 0
+
+    @property
+    def events_per_second(self) -> float:
+        if self.duration_ms <= 0:
+            return float(self.processed)
+        return self.processed * 1000 / self.duration_ms
+
+
 class OutboxEventPoller:
 
     def __init__(
@@ -18,7 +39,13 @@ class OutboxEventPoller:
         interval_seconds: int = 10,
         cleanup_interval_seconds: int = 3600,
         cleanup_retention_ms: int = 86_400_000,
+        processing_mode: str = OutboxProcessingMode.SEQUENTIAL,
+        max_concurrency: int = 4,
+        commit_batch_size: int = 10,
+        claim_lease_ms: int = 300_000,
     ):
+        if processing_mode not in (OutboxProcessingMode.SEQUENTIAL, OutboxProcessingMode.CONCURRENT):
+            raise ValueError(f"Unknown outbox processing mode: {processing_mode}")
         self._processor = processor
         self._db_session_factory = db_session_factory
         self._outbox_repository = outbox_repository
@@ -30,6 +57,12 @@ class OutboxEventPoller:
         self._task: asyncio.Task | None = None
         self._running = False
         self._last_cleanup: float = 0
+        self._processing_mode = processing_mode
+        self._max_concurrency = max(1, max_concurrency)
+        self._commit_batch_size = max(1, commit_batch_size)
+        self._claim_lease_ms = claim_lease_ms
+        self._executor: ThreadPoolExecutor | None = None
+        self.last_cycle_metrics: PollCycleMetrics | None = None
 
     async def start(self):
         if self._running:
@@ -37,6 +70,10 @@ class OutboxEventPoller:
             return
 
         self._running = True
+        if self._processing_mode == OutboxProcessingMode.CONCURRENT:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency, thread_name_prefix="outbox-worker"
+            )
         self._task = asyncio.create_task(self._run())
         log.info(f"OutboxEventPoller started with {self._interval_seconds}s interval")
 
@@ -49,20 +86,32 @@ class OutboxEventPoller:
             self._task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._task
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         log.info("OutboxEventPoller stopped")
 
     async def _run(self):
         while self._running:
             try:
                 await asyncio.sleep(self._interval_seconds)
-                self._poll_cycle()
-                self._maybe_cleanup()
+                if self._processing_mode == OutboxProcessingMode.CONCURRENT:
+                    # Keep database round-trips and event processing off the event loop
+                    await asyncio.to_thread(self._poll_cycle)
+                    await asyncio.to_thread(self._maybe_cleanup)
+                else:
+                    self._poll_cycle()
+                    self._maybe_cleanup()
             except asyncio.CancelledError:
                 break
             except Exception:
                 log.exception("Error in outbox poller cycle")
 
     def _poll_cycle(self):
+        if self._processing_mode == OutboxProcessingMode.CONCURRENT:
+            self._poll_cycle_concurrent()
+            return
+
         cycle_start = time.time()
 
         if not self._heartbeat_tracker.is_heartbeat_active():
@@ -106,11 +155,108 @@ class OutboxEventPoller:
                 db.close()
 
         cycle_ms = int((time.time() - cycle_start) * 1000)
+        self.last_cycle_metrics = PollCycleMetrics(
+            fetched=fetched,
+            deduplicated=len(deduplicated_ids),
+            processed=processed,
+            failed=failed,
+            commits=processed,
+            duration_ms=cycle_ms,
+        )
         log.info(
             "Outbox poll cycle: fetched=%d deduplicated=%d processed=%d failed=%d duration_ms=%d",
             fetched, len(deduplicated_ids), processed, failed, cycle_ms,
         )
 
+    def _poll_cycle_concurrent(self):
+        """Claims a batch, then processes it in chunks on the worker pool.
+
+        Each chunk shares one session and commits once; every event runs in its
+        own savepoint so a failing event is rolled back without affecting the
+        rest of its chunk.
+        """
+        cycle_start = time.time()
+
+        if not self._heartbeat_tracker.is_heartbeat_active():
+            log.debug("Deployer offline, skipping outbox poll cycle")
+            return
+
+        now_ms = int(time.time() * 1000)
+        fetch_db = self._db_session_factory()
+        try:
+            events = self._outbox_repository.claim_pending_events(
+                fetch_db, now_ms, limit=self._batch_size, lease_ms=self._claim_lease_ms
+            )
+            if not events:
+                fetch_db.commit()
+                return
+
+            deduplicated_ids = self._outbox_repository.bulk_deduplicate_events(
+                fetch_db, [e.id for e in events]
+            )
+            fetch_db.commit()
+        except Exception:
+            log.exception("Error claiming outbox events")
+            fetch_db.rollback()
+            return
+        finally:
+            fetch_db.close()
+
+        to_process = [e for e in events if e.id not in deduplicated_ids]
+        chunks = [
+            to_process[i:i + self._commit_batch_size]
+            for i in range(0, len(to_process), self._commit_batch_size)
+        ]
+
+        metrics = PollCycleMetrics(fetched=len(events), deduplicated=len(deduplicated_ids))
+        if chunks:
+            if self._executor is not None and len(chunks) > 1:
+                results = list(self._executor.map(lambda c: self._process_chunk(c, now_ms), chunks))
+            else:
+                results = [self._process_chunk(chunk, now_ms) for chunk in chunks]
+            for processed, failed, committed in results:
+                metrics.processed += processed
+                metrics.failed += failed
+                metrics.commits += int(committed)
+
+        metrics.duration_ms = int((time.time() - cycle_start) * 1000)
+        self.last_cycle_metrics = metrics
+        log.info(
+            "Outbox poll cycle: fetched=%d deduplicated=%d processed=%d failed=%d "
+            "commits=%d duration_ms=%d events_per_sec=%.1f",
+            metrics.fetched, metrics.deduplicated, metrics.processed, metrics.failed,
+            metrics.commits, metrics.duration_ms, metrics.events_per_second,
+        )
+
+    def _process_chunk(self, events, now_ms: int) -> tuple[int, int, bool]:
+        processed = 0
+        failed = 0
+        db = self._db_session_factory()
+        try:
+            for event in events:
+                savepoint = db.begin_nested()
+                try:
+                    self._processor.process_single_event(db, event)
+                    savepoint.commit()
+                    processed += 1
+                except Exception:
+                    log.exception("Error processing outbox event %s", event.id)
+                    savepoint.rollback()
+                    failed += 1
+                    # Release the claim so the event is retried on the next cycle
+                    self._outbox_repository.update_event(
+                        db, event.id, UpdateOutboxEventModel(next_retry_at=now_ms)
+                    )
+            db.commit()
+            return processed, failed, True
+        except Exception:
+            log.exception("Error committing outbox event chunk")
+            db.rollback()
+            # Unreleased claims become due again once the lease expires
+            return 0, len(events), False
+        finally:
+            db.close()
+
     def _maybe_cleanup(self):
         now = time.time()
         if now - self._last_cleanup < self._cleanup_interval_seconds:
@@ -67,6 +67,38 @@ class OutboxEventRepository:
 
         return [OutboxEventEntity.model_validate(r) for r in rows]
 
+    def claim_pending_events(
+        self, session: Session, now_ms: int, limit: int, lease_ms: int
+    ) -> list[OutboxEventEntity]:
+        """Claims due pending events for this poller by pushing their next_retry_at
+        past a lease deadline. Rows locked by another poller are skipped
+        (FOR UPDATE SKIP LOCKED on dialects that support it), so several poller
+        instances can share the queue. Unprocessed claims become due again once
+        the lease expires. The caller must commit to publish the claim."""
+        with MonitorLatency(DBMonitor.query("outbox_events")):
+            rows = (
+                session.query(OutboxEventModel)
+                .filter(
+                    OutboxEventModel.status == "pending",
+                    OutboxEventModel.next_retry_at <= now_ms,
+                )
+                .order_by(OutboxEventModel.created_time.asc())
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+
+        if not rows:
+            return []
+
+        lease_until = now_ms + lease_ms
+        for row in rows:
+            row.next_retry_at = lease_until
+        with MonitorLatency(DBMonitor.update("outbox_events")):
+            session.flush()
+
+        return [OutboxEventEntity.model_validate(r) for r in rows]
+
     @MonitorLatency(DBMonitor.query("outbox_events"))
     def has_pending_event(
         self, session: Session, entity_type: str, entity_id: str, event_type: str
@@ -20,6 +20,7 @@ from ..agent.utils.artifact_helpers import (
     format_artifact_uri,
 )
 from .app import WorkflowNode, WorkflowInvokeNode
+from .flow_control.conditional import split_embedded_templates
 from .utils import parse_duration
 from .workflow_execution_context import WorkflowExecutionContext, WorkflowExecutionState
 
@@ -54,12 +55,8 @@ class AgentCaller:
         if not template_string:
             return None
 
-        # Pattern to match {{...}} template expressions
-        template_pattern = re.compile(r"\{\{\s*(.+?)\s*\}\}")
-
-        def replace_template(match: re.Match) -> str:
-            """Replace a single template match with its resolved value."""
-            full_match = match.group(0)  # The full {{...}} string
+        def resolve_template(full_match: str) -> str:
+            """Resolve a single {{...}} template to its string value."""
             try:
                 # Use dag_executor to resolve the full template
                 resolved = self.host.dag_executor.resolve_value(
@@ -76,8 +73,13 @@ class AgentCaller:
                 )
                 return full_match
 
-        # Replace all template expressions in the string
-        resolved = template_pattern.sub(replace_template, template_string)
+        # Replace all template expressions in the string; the split into
+        # literal text and templates is computed once per string
+        segments = split_embedded_templates(template_string)
+        resolved = "".join(
+            resolve_template(segment) if index % 2 else segment
+            for index, segment in enumerate(segments)
+        )
         return resolved
 
     async def call_agent(
@@ -572,6 +572,30 @@ class WorkflowAppConfig(SamAgentAppConfig):
     default_max_map_items: int = Field(
         default=100, description="Default max items for map nodes"
     )
+    node_output_cache_max_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        ge=0,
+        description="Size bound on node output artifacts kept parsed in memory per execution",
+    )
+    resume_workflows_on_startup: bool = Field(
+        default=True,
+        description="Resume executions that were still running when the workflow last stopped",
+    )
+    resume_workflows_delay_seconds: int = Field(
+        default=15,
+        ge=0,
+        description="Time to wait for agent discovery before re-dispatching resumed executions",
+    )
+    state_snapshot_interval: int = Field(
+        default=20,
+        ge=1,
+        description="Number of state log events between persisted workflow state snapshots",
+    )
+    execution_lease_seconds: int = Field(
+        default=60,
+        ge=3,
+        description="How long an instance's claim on a running execution lasts without renewal",
+    )
 
     # Override optional fields from SamAgentAppConfig that might not be needed or have different defaults
     model: Optional[Union[str, Dict[str, Any]]] = None
@@ -5,14 +5,17 @@ Orchestrates workflow execution by coordinating agents.
 
 import logging
 import threading
+import time
 import uuid
 import asyncio
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from solace_ai_connector.common.message import Message as SolaceMessage
 from solace_ai_connector.common.event import Event, EventType
+from google.adk.events import Event as ADKEvent, EventActions
+from google.adk.sessions.base_session_service import GetSessionConfig
 
 from ..common import a2a
 from ..common.sac.sam_component_base import SamComponentBase
@@ -33,13 +36,31 @@ from ..common.data_parts import (
     ArtifactRef,
 )
 from ..agent.adk.services import (
+    STALE_SESSION_ERROR_SUBSTRING,
+    STALE_SESSION_MAX_RETRIES,
+    append_event_with_retry,
     initialize_session_service,
     initialize_artifact_service,
 )
 from ..agent.utils.artifact_helpers import save_artifact_with_metadata
 from .app import WorkflowDefinition
-from .workflow_execution_context import WorkflowExecutionContext, WorkflowExecutionState
+from .workflow_execution_context import (
+    DEFAULT_NODE_OUTPUT_CACHE_MAX_BYTES,
+    NodeOutputCache,
+    WorkflowExecutionContext,
+    WorkflowExecutionState,
+)
 from .dag_executor import DAGExecutor, WorkflowNodeFailureError
+from .state_log import (
+    DEFAULT_EXECUTION_LEASE_SECONDS,
+    DEFAULT_STATE_SNAPSHOT_INTERVAL,
+    LEASE_METADATA_KEY,
+    WorkflowStateLog,
+    active_lease_owner,
+    persisted_execution_ids,
+    replay_workflow_state,
+    restore_workflow_state,
+)
 from .agent_caller import AgentCaller
 from .protocol.event_handlers import (
     handle_task_request,
@@ -107,6 +128,8 @@ class WorkflowExecutorComponent(SamComponentBase):
         # Initialize execution tracking
         self.active_workflows: Dict[str, WorkflowExecutionContext] = {}
         self.active_workflows_lock = threading.Lock()
+        # Owner recorded in the lease of every execution this instance runs
+        self.instance_id = uuid.uuid4().hex
 
         # Initialize executor components
         self.dag_executor = DAGExecutor(self.workflow_definition, self)
@@ -173,9 +196,33 @@ class WorkflowExecutorComponent(SamComponentBase):
         # Set up periodic agent card publishing
         self._setup_periodic_agent_card_publishing()
 
+        # Keep the leases of running executions from lapsing
+        self._setup_periodic_lease_renewal()
+
+        # Pick up executions interrupted by a restart before new requests arrive
+        resumed_contexts = []
+        leased_execution_ids = []
+        if self.get_config("resume_workflows_on_startup", True):
+            resumed_contexts = await self._restore_interrupted_workflows(
+                leased_execution_ids
+            )
+
         # Component is now ready to receive requests
         log.info(f"{self.log_identifier} Workflow ready: {self.workflow_name}")
 
+        if resumed_contexts:
+            # Give peer agents time to publish their cards before re-dispatching
+            await asyncio.sleep(self.get_config("resume_workflows_delay_seconds", 15))
+            for workflow_context in resumed_contexts:
+                await self._resume_workflow(workflow_context)
+
+        if leased_execution_ids:
+            # Leases left by this instance's previous run lapse within one lease
+            # period; those of executions live elsewhere are renewed meanwhile
+            await asyncio.sleep(self._get_lease_seconds())
+            for workflow_context in await self._restore_interrupted_workflows():
+                await self._resume_workflow(workflow_context)
+
     def _pre_async_cleanup(self) -> None:
         """Pre-cleanup before async loop stops."""
         pass
@@ -215,6 +262,39 @@ class WorkflowExecutorComponent(SamComponentBase):
                 f"{self.log_identifier} Error during agent card publishing setup: {e}"
             )
 
+    def _setup_periodic_lease_renewal(self) -> None:
+        """Renews the leases of active executions every third of the lease duration."""
+        interval_ms = int(self._get_lease_seconds() * 1000 / 3)
+        self.add_timer(
+            delay_ms=interval_ms,
+            timer_id="workflow_lease_renewal",
+            interval_ms=interval_ms,
+            callback=lambda timer_data: self._schedule_lease_renewal(),
+        )
+
+    def _schedule_lease_renewal(self) -> None:
+        """Timer callback; the renewal itself runs on the component's event loop."""
+        loop = self.get_async_loop()
+        if loop and loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._renew_workflow_leases(), loop)
+
+    async def _renew_workflow_leases(self) -> None:
+        """Persist active executions whose lease is due for renewal."""
+        with self.active_workflows_lock:
+            workflow_contexts = list(self.active_workflows.values())
+
+        for workflow_context in workflow_contexts:
+            workflow_state = workflow_context.workflow_state
+            if not workflow_state or workflow_state.metadata.get("status") != "running":
+                continue
+            try:
+                await self._update_workflow_state(workflow_context, workflow_state)
+            except Exception as e:
+                log.error(
+                    f"{self.log_identifier} Failed to renew lease of workflow "
+                    f"{workflow_context.workflow_task_id}: {e}"
+                )
+
     def _publish_workflow_agent_card_sync(self) -> None:
         """
         Synchronous wrapper for publishing workflow agent card.
@@ -905,25 +985,252 @@ class WorkflowExecutorComponent(SamComponentBase):
         self,
         workflow_context: WorkflowExecutionContext,
         workflow_state: WorkflowExecutionState,
+        force_snapshot: bool = False,
+    ):
+        """
+        Persist workflow state to the session service.
+
+        Only the changes since the previous call are appended to the state log;
+        see state_log.py for the persisted format. A running execution's lease
+        is renewed along the way once half of it has elapsed.
+        """
+        state_log = self._get_state_log(workflow_context)
+
+        # Serialize writes so log tails cannot land out of order
+        async with state_log.lock:
+            if workflow_state.metadata.get("status") == "running":
+                self._refresh_lease(workflow_state)
+            state_delta = state_log.record(workflow_state, force_snapshot)
+            await self._append_state_delta(workflow_context, state_delta)
+
+    def _get_state_log(self, workflow_context: WorkflowExecutionContext) -> WorkflowStateLog:
+        if workflow_context.state_log is None:
+            workflow_context.state_log = WorkflowStateLog(
+                self.get_config(
+                    "state_snapshot_interval", DEFAULT_STATE_SNAPSHOT_INTERVAL
+                )
+            )
+        return workflow_context.state_log
+
+    def _state_event(
+        self, workflow_context: WorkflowExecutionContext, state_delta: Dict[str, Any]
+    ) -> ADKEvent:
+        return ADKEvent(
+            invocation_id=workflow_context.workflow_task_id,
+            author=self.workflow_name,
+            actions=EventActions(state_delta=state_delta),
+        )
+
+    async def _append_state_delta(
+        self, workflow_context: WorkflowExecutionContext, state_delta: Dict[str, Any]
     ):
-        """Persist workflow state to session service."""
+        """Append a state delta to the workflow session, creating it if needed."""
+        if not state_delta:
+            return
+
         session = await self._get_workflow_session(workflow_context)
-        session.state["workflow_execution"] = workflow_state.model_dump()
-        # Note: Session state is persisted automatically by the SessionService
-        # when managed through ADK operations (get_session, append_event, etc.)
+        if not session:
+            session = await self.session_service.create_session(
+                app_name=self.workflow_name,
+                user_id=workflow_context.a2a_context["user_id"],
+                session_id=workflow_context.a2a_context["session_id"],
+            )
+        await append_event_with_retry(
+            session_service=self.session_service,
+            session=session,
+            event=self._state_event(workflow_context, state_delta),
+            app_name=self.workflow_name,
+            user_id=session.user_id,
+            session_id=session.id,
+            log_identifier=f"{self.log_identifier}[Workflow:{workflow_context.workflow_task_id}]",
+        )
+
+    def _get_lease_seconds(self) -> int:
+        return self.get_config("execution_lease_seconds", DEFAULT_EXECUTION_LEASE_SECONDS)
+
+    def _refresh_lease(self, workflow_state: WorkflowExecutionState, force: bool = False):
+        """Record this instance as the execution's owner for another lease period."""
+        lease_seconds = self._get_lease_seconds()
+        now = time.time()
+        lease = workflow_state.metadata.get(LEASE_METADATA_KEY)
+        # Renewing on every write would add a lease change to each log event
+        if (
+            not force
+            and lease
+            and lease["owner"] == self.instance_id
+            and lease["expires_at"] - now > lease_seconds / 2
+        ):
+            return
+        workflow_state.metadata[LEASE_METADATA_KEY] = {
+            "owner": self.instance_id,
+            "expires_at": now + lease_seconds,
+        }
+
+    async def _restore_workflow_state(
+        self, workflow_context: WorkflowExecutionContext, session
+    ) -> Optional[WorkflowExecutionState]:
+        """Rebuild an execution's persisted state by replaying its state log."""
+
+        async def load_output(node_id: str, ref: Dict[str, Any]) -> Any:
+            return await self._load_artifact_json(
+                workflow_context, ref["artifact_name"], ref["artifact_version"]
+            )
+
+        return await restore_workflow_state(
+            session.state, workflow_context.workflow_task_id, load_output
+        )
+
+    async def _restore_interrupted_workflows(
+        self, leased_execution_ids: Optional[List[str]] = None
+    ) -> List[WorkflowExecutionContext]:
+        """
+        Rebuild the executions that were still running when their owner stopped.
+
+        Only executions whose lease has lapsed are taken over, so executions
+        still live on another instance of the workflow are left alone; their
+        IDs are added to `leased_execution_ids` when it is given. Each restored
+        execution is claimed, registered in active_workflows, and has the nodes
+        that were in flight reset so they are dispatched again by
+        _resume_workflow.
+        """
+        try:
+            response = await self.session_service.list_sessions(
+                app_name=self.workflow_name
+            )
+        except Exception as e:
+            log.error(f"{self.log_identifier} Failed to list workflow sessions: {e}")
+            return []
+
+        restored = []
+        for session in response.sessions:
+            for execution_id in persisted_execution_ids(session.state):
+                encoded = replay_workflow_state(session.state, execution_id)
+                if not self._is_resumable(encoded):
+                    if leased_execution_ids is not None and self._is_running(encoded):
+                        leased_execution_ids.append(execution_id)
+                    continue
+                with self.active_workflows_lock:
+                    if execution_id in self.active_workflows:
+                        continue
+
+                workflow_context = WorkflowExecutionContext(
+                    execution_id, encoded["metadata"]["a2a_context"]
+                )
+                try:
+                    workflow_state = await self._claim_workflow(workflow_context)
+                except Exception as e:
+                    log.error(
+                        f"{self.log_identifier} Failed to restore workflow {execution_id}: {e}"
+                    )
+                    continue
+                if workflow_state is None:
+                    continue
+
+                with self.active_workflows_lock:
+                    self.active_workflows[execution_id] = workflow_context
+                restored.append(workflow_context)
+
+        return restored
+
+    @staticmethod
+    def _is_running(encoded: Optional[Dict[str, Any]]) -> bool:
+        """Whether a replayed execution was running and can be resumed by some instance."""
+        return bool(
+            encoded
+            and encoded["metadata"].get("status") == "running"
+            and encoded["metadata"].get("a2a_context")
+        )
+
+    def _is_resumable(self, encoded: Optional[Dict[str, Any]]) -> bool:
+        """Whether a replayed execution was running and is not owned by a live instance."""
+        if not self._is_running(encoded):
+            return False
+        owner = active_lease_owner(encoded["metadata"], time.time())
+        return owner is None or owner == self.instance_id
+
+    async def _claim_workflow(
+        self, workflow_context: WorkflowExecutionContext
+    ) -> Optional[WorkflowExecutionState]:
+        """
+        Take over an interrupted execution by writing this instance's lease.
+
+        The claim is appended against the session as it was read, without the
+        stale-session retry, so if another instance claims the execution (or
+        its owner renews the lease) in the meantime the append is rejected and
+        the lease is checked again. Returns None if the execution is no longer
+        resumable by this instance.
+        """
+        execution_id = workflow_context.workflow_task_id
+        for _ in range(STALE_SESSION_MAX_RETRIES + 1):
+            session = await self._get_workflow_session(workflow_context)
+            if not session or not self._is_resumable(
+                replay_workflow_state(session.state, execution_id)
+            ):
+                log.info(
+                    f"{self.log_identifier} Workflow {execution_id} is owned by another "
+                    "instance or no longer running; not resuming it."
+                )
+                return None
+
+            workflow_state = await self._restore_workflow_state(workflow_context, session)
+            resumed_nodes = self.dag_executor.reset_in_flight_nodes(workflow_state)
+            self._refresh_lease(workflow_state, force=True)
+            state_log = self._get_state_log(workflow_context)
+            try:
+                async with state_log.lock:
+                    await self.session_service.append_event(
+                        session=session,
+                        event=self._state_event(
+                            workflow_context,
+                            state_log.record(workflow_state, force_snapshot=True),
+                        ),
+                    )
+            except ValueError as e:
+                if STALE_SESSION_ERROR_SUBSTRING not in str(e):
+                    raise
+                continue
+
+            workflow_context.workflow_state = workflow_state
+            log.info(
+                f"{self.log_identifier} Restored workflow {execution_id} with "
+                f"{len(workflow_state.completed_nodes)} completed nodes; "
+                f"re-dispatching {resumed_nodes}"
+            )
+            return workflow_state
+
+        log.warning(
+            f"{self.log_identifier} Could not claim workflow {execution_id}: "
+            "its session kept changing."
+        )
+        return None
+
+    async def _resume_workflow(self, workflow_context: WorkflowExecutionContext):
+        """Continue a restored execution from its persisted state."""
+        try:
+            await self.dag_executor.execute_workflow(
+                workflow_context.workflow_state, workflow_context
+            )
+        except Exception as e:
+            log.exception(
+                f"{self.log_identifier} Failed to resume workflow "
+                f"{workflow_context.workflow_task_id}: {e}"
+            )
+            await self.finalize_workflow_failure(workflow_context, e)
 
     async def _cleanup_workflow_state(self, workflow_context: WorkflowExecutionContext):
         """Clean up workflow state on completion."""
-        # Set TTL on session state for auto-cleanup
-        session = await self._get_workflow_session(workflow_context)
-
         # Mark workflow complete
         state = workflow_context.workflow_state
         state.metadata["completion_time"] = datetime.now(timezone.utc).isoformat()
         state.metadata["status"] = "completed"
 
-        session.state["workflow_execution"] = state.model_dump()
-        # Note: Session state is persisted automatically by the SessionService
+        # Drop the finished execution's persisted state so that sessions
+        # running many executions do not accumulate it
+        state_log = self._get_state_log(workflow_context)
+        async with state_log.lock:
+            await self._append_state_delta(
+                workflow_context, state_log.clear(state.execution_id)
+            )
 
         # Clean up any remaining cache entries for timeout tracking
         # These should normally be removed when nodes complete, but this is a safety net
@@ -936,10 +1243,12 @@ class WorkflowExecutorComponent(SamComponentBase):
 
     async def _get_workflow_session(self, workflow_context: WorkflowExecutionContext):
         """Retrieve the ADK session for the workflow."""
+        # Workflow state lives in session state, so skip loading the event history
         return await self.session_service.get_session(
             app_name=self.workflow_name,
             user_id=workflow_context.a2a_context["user_id"],
             session_id=workflow_context.a2a_context["session_id"],
+            config=GetSessionConfig(num_recent_events=1),
         )
 
     async def _load_node_output(
@@ -950,7 +1259,27 @@ class WorkflowExecutorComponent(SamComponentBase):
         workflow_context: WorkflowExecutionContext,
         sub_task_id: Optional[str] = None,
     ) -> Any:
-        """Load a node's output artifact.
+        """Load a node's output artifact."""
+        # If sub_task_id is not provided, look it up from the node_id
+        if not sub_task_id:
+            sub_task_id = workflow_context.get_sub_task_for_node(node_id)
+            if not sub_task_id:
+                raise ValueError(f"No sub-task ID found for node {node_id}")
+
+        return await self._load_artifact_json(
+            workflow_context, artifact_name, artifact_version
+        )
+
+    async def _load_artifact_json(
+        self,
+        workflow_context: WorkflowExecutionContext,
+        artifact_name: str,
+        artifact_version: Optional[int],
+    ) -> Any:
+        """Load and parse a JSON artifact from the workflow's session.
+
+        Parsed artifacts are memoized per execution by (name, version), so an
+        output that is referenced more than once is fetched and parsed once.
 
         Artifacts are namespace-scoped by the ScopedArtifactServiceWrapper,
         so the app_name parameter is automatically transformed to the namespace
@@ -960,16 +1289,20 @@ class WorkflowExecutorComponent(SamComponentBase):
         We use the parent workflow session ID to load artifacts, as agents are expected
         to save their outputs to the shared parent session scope.
         """
+        if workflow_context.output_cache is None:
+            workflow_context.output_cache = NodeOutputCache(
+                self.get_config(
+                    "node_output_cache_max_bytes", DEFAULT_NODE_OUTPUT_CACHE_MAX_BYTES
+                )
+            )
+        output_cache = workflow_context.output_cache
+        if artifact_version is not None and (artifact_name, artifact_version) in output_cache:
+            return output_cache.get(artifact_name, artifact_version)
+
         user_id = workflow_context.a2a_context["user_id"]
         # Use the parent session ID (caller's session) to ensure artifacts are shared/persisted
         workflow_session_id = workflow_context.a2a_context["session_id"]
 
-        # If sub_task_id is not provided, look it up from the node_id
-        if not sub_task_id:
-            sub_task_id = workflow_context.get_sub_task_for_node(node_id)
-            if not sub_task_id:
-                raise ValueError(f"No sub-task ID found for node {node_id}")
-
         # The app_name doesn't matter in namespace mode - the ScopedArtifactServiceWrapper
         # will replace it with self.namespace. But we pass workflow_name for consistency.
         artifact = await self.artifact_service.load_artifact(
@@ -985,7 +1318,11 @@ class WorkflowExecutorComponent(SamComponentBase):
                 f"Artifact {artifact_name} v{artifact_version} not found in session {workflow_session_id}"
             )
 
-        return json.loads(artifact.inline_data.data.decode("utf-8"))
+        data = artifact.inline_data.data
+        output = json.loads(data.decode("utf-8"))
+        if artifact_version is not None:
+            output_cache.put(artifact_name, artifact_version, output, len(data))
+        return output
 
     def cleanup(self):
         """Clean up resources on component shutdown."""
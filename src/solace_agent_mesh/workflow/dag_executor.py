@@ -4,10 +4,10 @@ Manages the execution order of workflow nodes based on their dependencies.
 """
 
 import logging
-import re
 import asyncio
 import json
 import uuid
+from collections import ChainMap
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
 
@@ -22,7 +22,11 @@ from .app import (
     MapNode,
     WorkflowInvokeNode,
 )
-from .workflow_execution_context import WorkflowExecutionContext, WorkflowExecutionState
+from .workflow_execution_context import (
+    MapNodeRuntime,
+    WorkflowExecutionContext,
+    WorkflowExecutionState,
+)
 from ..common.data_parts import (
     StructuredInvocationResult,
     WorkflowNodeExecutionStartData,
@@ -262,6 +266,7 @@ class DAGExecutor:
                 log.debug(
                     f"{log_id} Waiting for {len(workflow_state.pending_nodes)} pending nodes"
                 )
+                await self.host._update_workflow_state(workflow_context, workflow_state)
                 return  # Execution will resume on node completion
 
             # Execute next nodes with implicit parallelism detection and branch inheritance
@@ -307,6 +312,32 @@ class DAGExecutor:
             # Persist state
             await self.host._update_workflow_state(workflow_context, workflow_state)
 
+    def reset_in_flight_nodes(self, workflow_state: WorkflowExecutionState) -> List[str]:
+        """
+        Clear dispatch bookkeeping for nodes that were running when the state
+        was persisted, so that execute_workflow dispatches them again.
+
+        Completed nodes are left alone. An in-flight loop iteration is run
+        again, and map nodes restart their iterations since per-iteration
+        results are only held in memory.
+
+        Returns the IDs of the nodes that will be re-dispatched.
+        """
+        resumed = list(workflow_state.pending_nodes)
+        for node_id in resumed:
+            node = self.nodes.get(node_id)
+            if node is None:
+                continue
+            if node.type == "map":
+                workflow_state.metadata.pop(f"map_state_{node_id}", None)
+            elif node.type == "loop" and node_id in workflow_state.active_branches:
+                workflow_state.loop_iterations[node_id] -= 1
+            workflow_state.active_branches.pop(node_id, None)
+
+        workflow_state.pending_nodes = []
+        workflow_state.in_flight_sub_tasks = {}
+        return resumed
+
     def _get_inherited_branch(
         self,
         node_id: str,
@@ -834,21 +865,22 @@ class DAGExecutor:
         log.info(f"{log_id} Starting map with {len(items)} items")
 
         # Initialize tracking state
-        # We store the full list of items and their status
+        # Items and results are kept in memory on the execution context; the
+        # persisted state only tracks a cursor over the items and counters.
+        # Items before next_index have been launched, so pending work is the
+        # range [next_index, total_items).
         map_state = {
-            "items": items,
-            "results": [None] * len(items),  # Placeholders for results
-            "pending_indices": list(range(len(items))),  # Indices waiting to run
-            "active_indices": set(),  # Indices currently running
+            "total_items": len(items),
+            "next_index": 0,
             "completed_count": 0,
             "concurrency_limit": node.concurrency_limit,
             "target_node_id": node.node,
             "parallel_group_id": parallel_group_id,
         }
 
-        # Store in active_branches (using a dict instead of list for map state)
         # Store map state in metadata field (designed for node-specific extensible state).
         # active_branches tracks the currently executing sub-tasks for this map node.
+        workflow_context.map_runtimes[node.id] = MapNodeRuntime(items=items)
         workflow_state.metadata[f"map_state_{node.id}"] = map_state
         workflow_state.active_branches[node.id] = []
 
@@ -868,32 +900,28 @@ class DAGExecutor:
             return
 
         map_state = workflow_state.metadata.get(f"map_state_{map_node_id}")
-        if not map_state:
+        runtime = workflow_context.map_runtimes.get(map_node_id)
+        if not map_state or not runtime:
             return
 
         concurrency_limit = map_state["concurrency_limit"]
-        active_indices = map_state["active_indices"]
-        pending_indices = map_state["pending_indices"]
-        items = map_state["items"]
+        active_branches = workflow_state.active_branches[map_node_id]
         target_node_id = map_state["target_node_id"]
         parallel_group_id = map_state.get("parallel_group_id")
 
         # Determine how many to launch
-        while pending_indices:
-            if concurrency_limit and len(active_indices) >= concurrency_limit:
+        while map_state["next_index"] < map_state["total_items"]:
+            if concurrency_limit and len(active_branches) >= concurrency_limit:
                 break
 
-            index = pending_indices.pop(0)
-            item = items[index]
-            active_indices.add(index)
+            index = map_state["next_index"]
+            map_state["next_index"] += 1
+            item = runtime.items[index]
 
             # Create iteration state
-            iteration_state = workflow_state.model_copy(deep=False)
-            iteration_state.node_outputs = {
-                **workflow_state.node_outputs,
-                "_map_item": {"output": item},
-                "_map_index": {"output": index},
-            }
+            iteration_state = self._create_map_iteration_state(
+                workflow_state, item, index
+            )
 
             target_node = self.nodes[target_node_id]
             iter_node = target_node.model_copy()
@@ -928,13 +956,35 @@ class DAGExecutor:
                 )
 
             # Track active sub-task
-            workflow_state.active_branches[map_node_id].append(
+            active_branches.append(
                 {
                     "index": index,
                     "sub_task_id": sub_task_id,
                 }
             )
 
+    def _create_map_iteration_state(
+        self,
+        workflow_state: WorkflowExecutionState,
+        item: Any,
+        index: int,
+    ) -> WorkflowExecutionState:
+        """
+        Create the state a map iteration resolves its inputs against.
+
+        The iteration variables are layered over the workflow's node outputs
+        instead of copying them, so launching an iteration does not scale with
+        the size of the workflow state.
+        """
+        iteration_outputs = ChainMap(
+            {
+                "_map_item": {"output": item},
+                "_map_index": {"output": index},
+            },
+            workflow_state.node_outputs,
+        )
+        return workflow_state.model_copy(update={"node_outputs": iteration_outputs})
+
     def resolve_value(
         self, value_def: Any, workflow_state: WorkflowExecutionState
     ) -> Any:
@@ -1001,20 +1051,16 @@ class DAGExecutor:
         - {{item}} -> {{_map_item}}
         - {{workflow.parameters.x}} -> {{workflow.input.x}}
         """
-        # Apply Argo-compatible aliases
-        from .flow_control.conditional import _apply_template_aliases
-
-        template = _apply_template_aliases(template)
+        # Apply Argo-compatible aliases and extract the variable path.
+        # Templates are compiled once and reused across resolutions.
+        from .flow_control.conditional import compile_template
 
-        # Extract variable path
-        # Use fullmatch to ensure the template takes up the entire string
-        # and handle optional whitespace inside braces: {{  value  }}
-        match = re.fullmatch(r"\{\{\s*(.+?)\s*\}\}", template)
-        if not match:
-            return template
+        compiled = compile_template(template)
+        if compiled.parts is None:
+            return compiled.text
 
-        path = match.group(1)
-        parts = path.split(".")
+        path = compiled.path
+        parts = compiled.parts
 
         # Navigate path in workflow state
         if parts[0] == "workflow" and parts[1] == "input":
@@ -1083,6 +1129,16 @@ class DAGExecutor:
 
         workflow_state = workflow_context.workflow_state
 
+        # The first response for a dispatch consumes its sub-task ID, so
+        # repeated responses and those for dispatches abandoned by a resume
+        # are dropped here
+        if workflow_state.in_flight_sub_tasks.pop(sub_task_id, None) is None:
+            log.warning(
+                f"{log_id} Sub-task {sub_task_id} for node '{node_id}' is not in flight. "
+                "Ignoring duplicate response."
+            )
+            return
+
         # Check result status
         if result.status == "error":
             log.error(f"{log_id} Node '{node_id}' failed: {result.error_message}")
@@ -1138,6 +1194,13 @@ class DAGExecutor:
                 workflow_state,
                 workflow_context,
             )
+        elif node_id not in self.nodes:
+            # Map iterations leave active_branches once they complete, so a
+            # repeated response for one lands here rather than on a real node
+            log.warning(
+                f"{log_id} Sub-task {sub_task_id} for iteration '{node_id}' already completed. "
+                "Ignoring duplicate response."
+            )
         else:
             # Standard node completion
             artifact_name = result.output_artifact_ref.name if result.output_artifact_ref else None
@@ -1154,6 +1217,10 @@ class DAGExecutor:
                     workflow_context,
                 )
                 workflow_state.node_outputs[node_id] = {"output": artifact_data}
+                workflow_state.output_refs[node_id] = {
+                    "artifact_name": result.output_artifact_ref.name,
+                    "artifact_version": result.output_artifact_ref.version,
+                }
 
             # Continue workflow execution
             await self.execute_workflow(workflow_state, workflow_context)
@@ -1222,6 +1289,10 @@ class DAGExecutor:
                 workflow_state.node_outputs[inner_node_id] = {
                     "output": artifact_data
                 }
+                workflow_state.output_refs[inner_node_id] = {
+                    "artifact_name": result.output_artifact_ref.name,
+                    "artifact_version": result.output_artifact_ref.version,
+                }
                 log.debug(f"{log_id} Stored loop iteration result under '{inner_node_id}'")
 
             # Clear active branches for this loop
@@ -1234,23 +1305,23 @@ class DAGExecutor:
         elif control_node.type == "map":
             # Handle Map logic (concurrency, state update)
             map_state = workflow_state.metadata.get(f"map_state_{control_node_id}")
-            if map_state:
+            runtime = workflow_context.map_runtimes.get(control_node_id)
+            if map_state and runtime:
                 index = completed_branch["index"]
-                # Safely remove index (idempotency check above should prevent this, but being safe)
-                if index in map_state["active_indices"]:
-                    map_state["active_indices"].remove(index)
-                else:
-                    log.warning(f"{log_id} Index {index} not found in active_indices during completion.")
+                # Only running iterations stay in active_branches
+                branches.remove(completed_branch)
 
+                # Aggregate the result as it arrives rather than all at the end
+                runtime.results[index] = await self._load_map_iteration_output(
+                    control_node_id, completed_branch, workflow_context
+                )
                 map_state["completed_count"] += 1
-                # Store result in map_state for final aggregation
-                map_state["results"][index] = completed_branch
 
                 # Publish map progress
                 progress_data = WorkflowMapProgressData(
                     type="workflow_map_progress",
                     node_id=control_node_id,
-                    total_items=len(map_state["items"]),
+                    total_items=map_state["total_items"],
                     completed_items=map_state["completed_count"],
                     status="in-progress",
                 )
@@ -1262,48 +1333,50 @@ class DAGExecutor:
                 )
 
                 # Check if ALL items are complete
-                if map_state["completed_count"] == len(map_state["items"]):
+                if map_state["completed_count"] == map_state["total_items"]:
                     log.info(f"{log_id} All map items completed")
                     await self._finalize_map_node(
-                        control_node_id, map_state, workflow_state, workflow_context
+                        control_node_id, runtime, workflow_state, workflow_context
                     )
 
+    async def _load_map_iteration_output(
+        self,
+        map_node_id: str,
+        iter_info: Dict,
+        workflow_context: WorkflowExecutionContext,
+    ) -> Any:
+        """Load the output artifact of a completed map iteration."""
+        artifact_name = iter_info["result"]["artifact_name"]
+        if not artifact_name:
+            log.error(
+                f"{self.host.log_identifier}[Map:{map_node_id}] Missing result for item {iter_info['index']}"
+            )
+            return None
+
+        return await self.host._load_node_output(
+            node_id=map_node_id,
+            artifact_name=artifact_name,
+            artifact_version=iter_info["result"]["artifact_version"],
+            workflow_context=workflow_context,
+            sub_task_id=iter_info["sub_task_id"],
+        )
+
     async def _finalize_map_node(
         self,
         map_node_id: str,
-        map_state: Dict,
+        runtime: MapNodeRuntime,
         workflow_state: WorkflowExecutionState,
         workflow_context: WorkflowExecutionContext,
     ):
-        """Aggregate map results."""
-        log_id = f"{self.host.log_identifier}[Map:{map_node_id}]"
-
-        results_list = []
-        # map_state["results"] is already ordered by index
-        for iter_info in map_state["results"]:
-            if not iter_info or "result" not in iter_info:
-                # Should not happen if completed_count check is correct
-                log.error(f"{log_id} Missing result for item")
-                results_list.append(None)
-                continue
-
-            artifact_name = iter_info["result"]["artifact_name"]
-            artifact_version = iter_info["result"]["artifact_version"]
-
-            artifact_data = await self.host._load_node_output(
-                node_id=map_node_id,
-                artifact_name=artifact_name,
-                artifact_version=artifact_version,
-                workflow_context=workflow_context,
-                sub_task_id=iter_info["sub_task_id"],
-            )
-            results_list.append(artifact_data)
+        """Publish the aggregated map results."""
+        # runtime.results is already ordered by index
+        results_list = runtime.results
 
         # Create aggregated artifact
         merged_artifact_name = f"map_{map_node_id}_results.json"
         merged_bytes = json.dumps({"results": results_list}).encode("utf-8")
 
-        await save_artifact_with_metadata(
+        save_result = await save_artifact_with_metadata(
             artifact_service=self.host.artifact_service,
             app_name=self.host.workflow_name,
             user_id=workflow_context.a2a_context["user_id"],
@@ -1333,9 +1406,14 @@ class DAGExecutor:
         if map_node_id in workflow_state.pending_nodes:
             workflow_state.pending_nodes.remove(map_node_id)
         workflow_state.node_outputs[map_node_id] = {"output": {"results": results_list}}
+        workflow_state.output_refs[map_node_id] = {
+            "artifact_name": merged_artifact_name,
+            "artifact_version": save_result.get("data_version"),
+        }
 
         # Cleanup state
         del workflow_state.active_branches[map_node_id]
         del workflow_state.metadata[f"map_state_{map_node_id}"]
+        del workflow_context.map_runtimes[map_node_id]
 
         await self.execute_workflow(workflow_state, workflow_context)
@@ -10,12 +10,20 @@ import ast
 import logging
 import operator
 import re
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional, Tuple
 
 from ..workflow_execution_context import WorkflowExecutionState
 
 log = logging.getLogger(__name__)
 
+# Bound on distinct templates and conditions kept compiled
+COMPILE_CACHE_SIZE = 4096
+
+_TEMPLATE_PATTERN = re.compile(r"\{\{(.+?)\}\}")
+_FULL_TEMPLATE_PATTERN = re.compile(r"\{\{\s*(.+?)\s*\}\}")
+_EMBEDDED_TEMPLATE_PATTERN = re.compile(r"(\{\{\s*.+?\s*\}\})")
+
 
 # Comparison operators supported in conditions
 _COMPARE_OPS = {
@@ -49,12 +57,21 @@ def _safe_eval_expression(expr: str) -> Any:
     Raises:
         ValueError: If the expression contains unsupported syntax
     """
+    return _eval_node(_parse_expression(expr))
+
+
+def _parse_expression(expr: str) -> ast.AST:
+    """
+    Parse an expression whose references have already been substituted.
+
+    Not memoized: the expression embeds runtime node outputs, so a cache would
+    be keyed on (and keep alive) user data. Only `compile_condition` is cached.
+    """
     try:
         tree = ast.parse(expr, mode="eval")
     except SyntaxError as e:
         raise ValueError(f"Invalid expression syntax: {e}") from e
-
-    return _eval_node(tree.body)
+    return tree.body
 
 
 def _eval_node(node: ast.AST) -> Any:
@@ -156,6 +173,62 @@ def _apply_template_aliases(expression: str) -> str:
     return result
 
 
+class CompiledTemplate(NamedTuple):
+    """A value template with aliases applied and its reference path split."""
+
+    text: str
+    path: Optional[str]
+    parts: Optional[Tuple[str, ...]]
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Compile a template that makes up a whole value, e.g. "{{node.output.field}}".
+
+    `path` and `parts` are None when the string is not a single template.
+    """
+    text = _apply_template_aliases(template)
+    match = _FULL_TEMPLATE_PATTERN.fullmatch(text)
+    if not match:
+        return CompiledTemplate(text, None, None)
+    path = match.group(1)
+    return CompiledTemplate(text, path, tuple(path.split(".")))
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def split_embedded_templates(template_string: str) -> Tuple[str, ...]:
+    """
+    Split a string containing templates, e.g. "Hello {{name}}!".
+
+    Items alternate between literal text and full "{{...}}" templates, starting
+    and ending with literal text.
+    """
+    return tuple(_EMBEDDED_TEMPLATE_PATTERN.split(template_string))
+
+
+class CompiledCondition(NamedTuple):
+    """A condition split into literal text and the paths it references."""
+
+    expression: str
+    # Alternates literal text and (path, parts) references
+    segments: Tuple[Any, ...]
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_condition(condition_expr: str) -> CompiledCondition:
+    """Apply aliases to a condition and locate its {{...}} references once."""
+    expression = _apply_template_aliases(condition_expr)
+    segments = []
+    for index, piece in enumerate(_TEMPLATE_PATTERN.split(expression)):
+        if index % 2:
+            path = piece.strip()
+            segments.append((path, tuple(path.split("."))))
+        else:
+            segments.append(piece)
+    return CompiledCondition(expression, tuple(segments))
+
+
 def evaluate_condition(
     condition_expr: str, workflow_state: WorkflowExecutionState
 ) -> bool:
@@ -168,14 +241,12 @@ def evaluate_condition(
     - {{workflow.parameters.x}} for workflow input
     """
     # Apply template aliases for Argo compatibility
-    condition_expr = _apply_template_aliases(condition_expr)
+    compiled = compile_condition(condition_expr)
+    condition_expr = compiled.expression
 
     try:
-        # Helper to resolve a single match
-        def replace_match(match):
-            path = match.group(1).strip()
-            parts = path.split(".")
-
+        # Helper to resolve a single reference
+        def resolve_reference(path, parts):
             # Navigate path in workflow state (similar to DAGExecutor._resolve_template)
             if parts[0] == "workflow" and parts[1] == "input":
                 if "workflow_input" not in workflow_state.node_outputs:
@@ -208,7 +279,10 @@ def evaluate_condition(
             return str(data)
 
         # Replace all {{...}} patterns with their resolved string values
-        clean_expr = re.sub(r"\{\{(.+?)\}\}", replace_match, condition_expr)
+        clean_expr = "".join(
+            segment if isinstance(segment, str) else resolve_reference(*segment)
+            for segment in compiled.segments
+        )
 
         log.debug(f"Evaluated condition: '{condition_expr}' -> '{clean_expr}'")
 
@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Dict, Any
 
 from solace_ai_connector.common.message import Message as SolaceMessage
+from google.adk.sessions.base_session_service import GetSessionConfig
 from a2a.types import (
     A2ARequest,
     AgentCard,
@@ -156,6 +157,18 @@ async def handle_task_request(
         # serialization issues when a2a_context is stored in ADK session state.
         # It is stored in WorkflowExecutionContext instead.
 
+        # A request redelivered after a restart belongs to a workflow that the
+        # startup recovery pass has already resumed
+        with component.active_workflows_lock:
+            resumed_context = component.active_workflows.get(workflow_task_id)
+        if resumed_context:
+            log.info(
+                f"{component.log_identifier} Request for resumed workflow {workflow_task_id} "
+                "redelivered; attaching it to the running execution."
+            )
+            resumed_context.set_original_solace_message(message)
+            return
+
         # Initialize workflow state
         workflow_state = await _initialize_workflow_state(component, a2a_context)
 
@@ -241,26 +254,26 @@ async def _initialize_workflow_state(
         execution_id=execution_id,
         start_time=datetime.now(timezone.utc),
         pending_nodes=[],  # Will be populated by execute_workflow loop
+        # Kept in the persisted state so the execution can be resumed after a restart
+        metadata={"status": "running", "a2a_context": a2a_context},
     )
 
-    # Store in session
+    # Ensure the session exists; the state itself is persisted through the
+    # workflow state log once execution starts
     session = await component.session_service.get_session(
         app_name=component.workflow_name,
         user_id=a2a_context["user_id"],
         session_id=a2a_context["session_id"],
+        config=GetSessionConfig(num_recent_events=1),
     )
 
     if not session:
-        session = await component.session_service.create_session(
+        await component.session_service.create_session(
             app_name=component.workflow_name,
             user_id=a2a_context["user_id"],
             session_id=a2a_context["session_id"],
         )
 
-    session.state["workflow_execution"] = state.model_dump()
-    # Note: Session state is persisted automatically by the SessionService
-    # when managed through ADK operations (get_session, append_event, etc.)
-
     return state
 
 
@@ -0,0 +1,238 @@
+"""
+Append-only persistence format for workflow execution state.
+
+Rather than re-serializing the whole WorkflowExecutionState into the session
+on every step, each persistence point appends an event holding only what
+changed since the previous one. Every `snapshot_interval` events the log is
+compacted into a snapshot, so the persisted form is one snapshot plus a
+bounded tail of events, and a step writes at most that tail.
+
+Each execution persists under its own snapshot and log keys, so executions
+sharing a session (a user re-running a workflow in the same chat, or the
+sub-workflows of a map node) never replay each other's events.
+
+Node outputs that were loaded from artifacts are not persisted inline; the
+state's `output_refs` already records the artifact they came from, and they
+are reloaded from the artifact service when the state is rebuilt.
+
+A running execution also carries a lease in its metadata, naming the
+workflow instance that owns it and when that claim expires. The owner renews
+it while the execution is active, and an instance restoring interrupted
+executions after a restart only takes over ones whose lease has lapsed.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .workflow_execution_context import WorkflowExecutionState
+
+log = logging.getLogger(__name__)
+
+# Session state key prefixes, followed by the execution ID
+WORKFLOW_SNAPSHOT_KEY_PREFIX = "workflow_execution:"
+WORKFLOW_LOG_KEY_PREFIX = "workflow_execution_log:"
+
+# Metadata key of the execution's ownership lease
+LEASE_METADATA_KEY = "lease"
+
+DEFAULT_STATE_SNAPSHOT_INTERVAL = 20
+DEFAULT_EXECUTION_LEASE_SECONDS = 60
+
+NodeOutputLoader = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+
+
+def workflow_snapshot_key(execution_id: str) -> str:
+    return f"{WORKFLOW_SNAPSHOT_KEY_PREFIX}{execution_id}"
+
+
+def workflow_log_key(execution_id: str) -> str:
+    return f"{WORKFLOW_LOG_KEY_PREFIX}{execution_id}"
+
+
+def persisted_execution_ids(session_state: Dict[str, Any]) -> List[str]:
+    """IDs of the executions whose state is persisted in a session."""
+    return [
+        key[len(WORKFLOW_SNAPSHOT_KEY_PREFIX) :]
+        for key, value in session_state.items()
+        if key.startswith(WORKFLOW_SNAPSHOT_KEY_PREFIX) and value
+    ]
+
+
+def active_lease_owner(metadata: Dict[str, Any], now: float) -> Optional[str]:
+    """The instance holding an unexpired lease on the execution, if any."""
+    lease = metadata.get(LEASE_METADATA_KEY)
+    if not lease or lease["expires_at"] <= now:
+        return None
+    return lease["owner"]
+
+
+def encode_workflow_state(workflow_state: WorkflowExecutionState) -> Dict[str, Any]:
+    """Dump the state in its persisted form, leaving out artifact-backed outputs."""
+    encoded = workflow_state.model_dump(mode="json", exclude={"node_outputs"})
+    encoded["node_outputs"] = {
+        key: value
+        for key, value in workflow_state.node_outputs.items()
+        if key not in workflow_state.output_refs
+    }
+    return encoded
+
+
+def apply_state_event(encoded: Dict[str, Any], event: Dict[str, Any]):
+    """Apply one log event to an encoded state in place."""
+    encoded.update(event.get("fields", {}))
+    for name, entries in event.get("set", {}).items():
+        encoded.setdefault(name, {}).update(entries)
+    for name, keys in event.get("unset", {}).items():
+        for key in keys:
+            encoded.get(name, {}).pop(key, None)
+
+
+def replay_workflow_state(
+    session_state: Dict[str, Any], execution_id: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Rebuild an execution's encoded state from its snapshot and the events after it.
+
+    Returns None if the session holds no snapshot for the execution.
+    """
+    snapshot = session_state.get(workflow_snapshot_key(execution_id))
+    if not snapshot or "state" not in snapshot:
+        return None
+    if snapshot["state"].get("execution_id") != execution_id:
+        log.warning(
+            "Ignoring persisted workflow state under %s: it belongs to execution %s",
+            workflow_snapshot_key(execution_id),
+            snapshot["state"].get("execution_id"),
+        )
+        return None
+
+    encoded = dict(snapshot["state"])
+    for name, value in encoded.items():
+        if isinstance(value, dict):
+            encoded[name] = dict(value)
+
+    for event in session_state.get(workflow_log_key(execution_id)) or []:
+        if event["seq"] > snapshot["seq"]:
+            apply_state_event(encoded, event)
+    return encoded
+
+
+async def restore_workflow_state(
+    session_state: Dict[str, Any], execution_id: str, load_output: NodeOutputLoader
+) -> Optional[WorkflowExecutionState]:
+    """
+    Rebuild an execution's WorkflowExecutionState from its persisted log.
+
+    Outputs stored by reference are reloaded through `load_output`, which is
+    called with the output key and its entry from `output_refs`.
+    """
+    encoded = replay_workflow_state(session_state, execution_id)
+    if encoded is None:
+        return None
+
+    workflow_state = WorkflowExecutionState.model_validate(encoded)
+    for key, ref in workflow_state.output_refs.items():
+        workflow_state.node_outputs[key] = {"output": await load_output(key, ref)}
+    return workflow_state
+
+
+class WorkflowStateLog:
+    """
+    Tracks what has been persisted for one workflow execution and produces
+    the session state delta for each new persistence point.
+    """
+
+    def __init__(self, snapshot_interval: int = DEFAULT_STATE_SNAPSHOT_INTERVAL):
+        self.snapshot_interval = max(1, snapshot_interval)
+        self.seq = 0
+        self.lock = asyncio.Lock()
+        self._persisted: Optional[Dict[str, Any]] = None
+        self._events: List[Dict[str, Any]] = []
+        self._cleared = False
+
+    def record(
+        self, workflow_state: WorkflowExecutionState, force_snapshot: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Return the session state delta that persists `workflow_state`.
+
+        The delta is empty when nothing changed since the last call, or once
+        the execution's state has been cleared.
+        """
+        if self._cleared:
+            return {}
+        encoded = encode_workflow_state(workflow_state)
+        snapshot_key = workflow_snapshot_key(workflow_state.execution_id)
+        log_key = workflow_log_key(workflow_state.execution_id)
+
+        if (
+            self._persisted is None
+            or force_snapshot
+            or len(self._events) >= self.snapshot_interval
+        ):
+            self.seq += 1
+            self._persisted = encoded
+            self._events = []
+            return {
+                snapshot_key: {"seq": self.seq, "state": encoded},
+                log_key: [],
+            }
+
+        event = self._diff(encoded)
+        if event is None:
+            return {}
+
+        self.seq += 1
+        event["seq"] = self.seq
+        self._events.append(event)
+        self._persisted = encoded
+        return {log_key: list(self._events)}
+
+    def clear(self, execution_id: str) -> Dict[str, Any]:
+        """
+        Return the session state delta that drops a finished execution's state.
+
+        Later calls to `record` write nothing, so a write racing with the end
+        of the execution cannot bring its state back.
+        """
+        self._cleared = True
+        if self._persisted is None:
+            return {}
+        self._persisted = None
+        self._events = []
+        return {workflow_snapshot_key(execution_id): None, workflow_log_key(execution_id): None}
+
+    def _diff(self, encoded: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Describe how `encoded` differs from the last persisted state."""
+        fields, set_entries, unset_entries = {}, {}, {}
+
+        for name, value in encoded.items():
+            previous = self._persisted.get(name)
+            if value == previous:
+                continue
+            if isinstance(value, dict) and isinstance(previous, dict):
+                changed = {
+                    key: entry
+                    for key, entry in value.items()
+                    if key not in previous or previous[key] != entry
+                }
+                removed = [key for key in previous if key not in value]
+                if changed:
+                    set_entries[name] = changed
+                if removed:
+                    unset_entries[name] = removed
+            else:
+                fields[name] = value
+
+        if not (fields or set_entries or unset_entries):
+            return None
+
+        event: Dict[str, Any] = {}
+        if fields:
+            event["fields"] = fields
+        if set_entries:
+            event["set"] = set_entries
+        if unset_entries:
+            event["unset"] = unset_entries
+        return event
@@ -3,10 +3,15 @@ Workflow execution context and state management.
 """
 
 import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from .state_log import WorkflowStateLog
+
 
 class WorkflowExecutionState(BaseModel):
     """State stored in ADK session for workflow execution."""
@@ -50,11 +55,21 @@ class WorkflowExecutionState(BaseModel):
     # Error tracking
     error_state: Optional[Dict[str, Any]] = None
 
+    # Dispatched agent/workflow calls awaiting a response
+    # sub_task_id -> node_id; the sub-task ID is the dispatch's idempotency key
+    in_flight_sub_tasks: Dict[str, str] = Field(default_factory=dict)
+
     # Cached node outputs for value resolution
     node_outputs: Dict[str, Dict[str, Any]] = Field(
         default_factory=dict
     )  # node_id -> {"output": data}
 
+    # Artifacts that cached node outputs were loaded from, so persisted state
+    # can reference them instead of carrying the outputs inline
+    output_refs: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict
+    )  # node_id -> {"artifact_name", "artifact_version"}
+
     # Metadata
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
@@ -64,6 +79,66 @@ class WorkflowExecutionState(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
+@dataclass
+class MapNodeRuntime:
+    """
+    In-memory working set of a running map node.
+
+    The items being mapped and the results gathered so far live here rather
+    than in WorkflowExecutionState, which only keeps the map's cursor and
+    counters so that persisting it stays cheap for large maps.
+    """
+
+    items: List[Any]
+    results: List[Any] = field(init=False)
+
+    def __post_init__(self):
+        self.results = [None] * len(self.items)
+
+
+DEFAULT_NODE_OUTPUT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+class NodeOutputCache:
+    """
+    Parsed node output artifacts for one workflow execution.
+
+    Entries are keyed by (artifact name, version) and evicted least recently
+    used first once the raw artifact sizes they were parsed from exceed
+    `max_bytes`. Only explicit versions are cached, as "latest" can change.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_NODE_OUTPUT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[Any, int]]" = OrderedDict()
+
+    def __contains__(self, key: Tuple[str, int]) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, artifact_name: str, artifact_version: int) -> Any:
+        """Return the cached output; callers check membership first."""
+        key = (artifact_name, artifact_version)
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def put(self, artifact_name: str, artifact_version: int, output: Any, size: int):
+        """Cache a parsed output whose artifact was `size` bytes."""
+        if size > self.max_bytes:
+            return
+        key = (artifact_name, artifact_version)
+        if key in self._entries:
+            self.total_bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (output, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+
+
 class WorkflowExecutionContext:
     """Context for tracking a workflow execution."""
 
@@ -76,6 +151,9 @@ class WorkflowExecutionContext:
         self.sub_task_to_node: Dict[str, str] = {}  # sub_task_id -> node_id
         self.node_to_sub_task: Dict[str, str] = {}  # node_id -> sub_task_id
         self.sub_task_timeouts: Dict[str, float] = {}  # sub_task_id -> resolved timeout seconds
+        self.map_runtimes: Dict[str, MapNodeRuntime] = {}  # map_node_id -> items and results
+        self.state_log: Optional["WorkflowStateLog"] = None  # created on first persist
+        self.output_cache: Optional[NodeOutputCache] = None  # created on first load
         self.lock = threading.Lock()
         self.cancellation_event = threading.Event()
 
@@ -88,6 +166,8 @@ class WorkflowExecutionContext:
         with self.lock:
             self.sub_task_to_node[sub_task_id] = node_id
             self.node_to_sub_task[node_id] = sub_task_id
+            if self.workflow_state is not None:
+                self.workflow_state.in_flight_sub_tasks[sub_task_id] = node_id
 
     def get_node_id_for_sub_task(self, sub_task_id: str) -> Optional[str]:
         """Get node ID for a sub-task."""
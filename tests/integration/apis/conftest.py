@@ -198,9 +198,11 @@ def _clean_main_database(engine):
             # PostgreSQL handles FK constraints differently - no need to disable
             pass
 
-        # Delete from all tables except alembic_version
+        # Delete from all tables except alembic_version. The SQLite FTS5 search
+        # index and its shadow tables are maintained by triggers on
+        # session_search_documents and must not be written to directly.
         for table in reversed(metadata.sorted_tables):
-            if table.name == "alembic_version":
+            if table.name == "alembic_version" or table.name.startswith("session_search_fts"):
                 continue
             connection.execute(table.delete())
 
@@ -0,0 +1,121 @@
+"""
+Tests for streamed project export and spooled project import.
+"""
+
+import io
+import json
+import zipfile
+
+from fastapi.testclient import TestClient
+
+KB = 1024
+
+# Use synchronous mode so the import endpoint returns its final status code
+SYNC_PARAMS = {"async": "false"}
+
+
+def _create_project_with_files(client: TestClient, files: dict) -> str:
+    response = client.post(
+        "/api/v1/projects",
+        data={"name": "Exported", "description": "round trip"},
+        files=[
+            ("files", (name, io.BytesIO(content), "text/plain"))
+            for name, content in files.items()
+        ],
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _import(client: TestClient, archive: bytes):
+    return client.post(
+        "/api/v1/projects/import",
+        params=SYNC_PARAMS,
+        files={"file": ("project.zip", io.BytesIO(archive), "application/zip")},
+    )
+
+
+class TestProjectExport:
+
+    def test_export_streams_a_valid_archive(self, both_enabled_client: TestClient):
+        files = {"a.txt": b"a" * (300 * KB), "b.txt": b"hello"}
+        project_id = _create_project_with_files(both_enabled_client, files)
+
+        response = both_enabled_client.get(f"/api/v1/projects/{project_id}/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        assert "content-length" not in response.headers
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            assert archive.testzip() is None
+            project_json = json.loads(archive.read("project.json"))
+            assert project_json["project"]["name"] == "Exported"
+            assert project_json["project"]["metadata"]["artifactCount"] == 2
+            for name, content in files.items():
+                assert archive.read(f"artifacts/{name}") == content
+
+    def test_export_of_unknown_project_is_not_found(self, both_enabled_client: TestClient):
+        response = both_enabled_client.get("/api/v1/projects/missing/export")
+
+        assert response.status_code == 404
+
+    def test_exported_archive_imports_back(self, both_enabled_client: TestClient):
+        files = {f"f{i}.txt": bytes([65 + i]) * (50 * KB) for i in range(6)}
+        project_id = _create_project_with_files(both_enabled_client, files)
+        archive = both_enabled_client.get(f"/api/v1/projects/{project_id}/export").content
+
+        response = _import(both_enabled_client, archive)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["artifactsImported"] == 6
+        assert body["name"] == "Exported (2)"
+        artifacts = both_enabled_client.get(
+            f"/api/v1/projects/{body['projectId']}/artifacts"
+        ).json()
+        assert sorted(a["filename"] for a in artifacts) == sorted(files)
+
+
+class TestProjectImport:
+
+    def _archive(self, entries):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(
+                "project.json",
+                json.dumps(
+                    {
+                        "version": "1.0",
+                        "exportedAt": 1234567890,
+                        "project": {"name": "Imported", "description": ""},
+                        "artifacts": [],
+                    }
+                ),
+            )
+            for name, content in entries:
+                zf.writestr(name, content)
+        return buf.getvalue()
+
+    def test_entries_sharing_a_filename_become_versions_in_archive_order(
+        self, both_enabled_client: TestClient
+    ):
+        archive = self._archive(
+            [("artifacts/one/dup.txt", b"first"), ("artifacts/two/dup.txt", b"second")]
+        )
+
+        response = _import(both_enabled_client, archive)
+
+        assert response.status_code == 200
+        assert response.json()["artifactsImported"] == 2
+        project_id = response.json()["projectId"]
+        [artifact] = both_enabled_client.get(
+            f"/api/v1/projects/{project_id}/artifacts"
+        ).json()
+        assert artifact["filename"] == "dup.txt"
+        assert artifact["version"] == 1
+        assert artifact["size"] == len(b"second")
+
+    def test_invalid_archive_is_rejected(self, both_enabled_client: TestClient):
+        response = _import(both_enabled_client, b"not a zip")
+
+        assert response.status_code == 400
@@ -228,3 +228,37 @@ class TestDataValidation:
         messages = database_inspector.get_session_messages(session.id)
         assert len(messages) == 2
         assert messages[0].user_message == large_message
+
+
+class TestMessageSearch:
+    """Full-text session search over chat task message content."""
+
+    def test_search_finds_session_by_message_text(
+        self, api_client: TestClient, gateway_adapter: GatewayAdapter
+    ):
+        """A session is found by words that only appear in its messages."""
+        session = gateway_adapter.create_session(
+            user_id="sam_dev_user", agent_name="TestAgent"
+        )
+        payload = {
+            "taskId": f"task-search-{uuid.uuid4().hex[:8]}",
+            "userMessage": "Summarize the incident",
+            "messageBubbles": json.dumps([
+                {"type": "user", "text": "Summarize the incident"},
+                {"type": "agent", "text": "The outage was caused by a misconfigured loadbalancer"},
+            ]),
+            "taskMetadata": json.dumps({"status": "completed", "agent_name": "TestAgent"}),
+        }
+        save_response = api_client.post(
+            f"/api/v1/sessions/{session.id}/chat-tasks", json=payload
+        )
+        assert save_response.status_code in [200, 201]
+
+        response = api_client.get(
+            "/api/v1/sessions/search", params={"query": "loadbal misconfigured"}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [s["id"] for s in body["data"]] == [session.id]
+        assert body["meta"]["pagination"]["count"] == 1
@@ -2,7 +2,6 @@
 Integration tests for data retention service.
 """
 
-import pytest
 from sqlalchemy.orm import sessionmaker
 
 from solace_agent_mesh.gateway.http_sse.repository.models import (
@@ -183,11 +182,6 @@ def test_data_retention_deletes_old_tasks(database_manager):
             retention_service.config["task_retention_days"] = original_retention
 
 
-@pytest.mark.xfail(
-    reason="Task deletion does not cascade to task events due to bulk delete implementation "
-    "using synchronize_session=False in TaskRepository.delete_tasks_older_than(). "
-    "This bypasses SQLAlchemy ORM cascading. Needs fix in repository implementation."
-)
 def test_data_retention_cascades_to_task_events(api_client_factory):
     """
     Tests that deleting tasks also deletes their events (cascade).
@@ -543,6 +543,99 @@ def test_get_task_as_stim_file_with_child_tasks(api_client: TestClient, api_clie
     assert child_task_id in task_ids_in_flow
 
 
+def _log_status_events(task_logger_service, task_id: str, count: int):
+    """Logs `count` status-update events for a task through the task logger."""
+    for i in range(count):
+        task_logger_service.log_event({
+            "topic": "test_namespace/a2a/v1/gateway/status/TestAgent",
+            "payload": {
+                "jsonrpc": "2.0",
+                "id": task_id,
+                "result": {
+                    "kind": "status-update",
+                    "taskId": task_id,
+                    "contextId": "ctx",
+                    "final": False,
+                    "status": {"state": "working"},
+                    "metadata": {"agent_name": "TestAgent", "seq": i},
+                },
+            },
+            "user_properties": {"userId": "sam_dev_user"},
+        })
+
+
+def test_get_task_events_paginated(api_client: TestClient, api_client_factory):
+    """
+    Test GET /tasks/{task_id}/events with limit/cursor walks all events page by page.
+    """
+    task_id, _ = _create_task_and_get_ids(api_client, "Paginated events task")
+    task_logger_service = api_client_factory.mock_component.get_task_logger_service()
+    _log_status_events(task_logger_service, task_id, 5)
+
+    unpaginated = api_client.get(f"/api/v1/tasks/{task_id}/events").json()
+    all_event_ids = [e["full_payload"]["result"]["metadata"]["seq"] for e in unpaginated["tasks"][task_id]["events"]]
+    assert "next_cursor" not in unpaginated
+
+    collected = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = api_client.get(f"/api/v1/tasks/{task_id}/events", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        task_data = data["tasks"][task_id]
+        assert "initial_request_text" in task_data
+        assert len(task_data["events"]) <= 2
+        collected.extend(e["full_payload"]["result"]["metadata"]["seq"] for e in task_data["events"])
+        pages += 1
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert collected == all_event_ids
+
+
+def test_get_task_events_invalid_cursor(api_client: TestClient):
+    """
+    Test GET /tasks/{task_id}/events rejects a malformed cursor.
+    """
+    task_id, _ = _create_task_and_get_ids(api_client, "Bad cursor task")
+    response = api_client.get(f"/api/v1/tasks/{task_id}/events", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_get_task_as_stim_stream(api_client: TestClient, api_client_factory):
+    """
+    Test GET /tasks/{task_id}?stream=true returns the export as NDJSON.
+    """
+    import json
+
+    message = "Streamed stim task"
+    task_id, _ = _create_task_and_get_ids(api_client, message)
+    task_logger_service = api_client_factory.mock_component.get_task_logger_service()
+    _log_status_events(task_logger_service, task_id, 3)
+
+    response = api_client.get(f"/api/v1/tasks/{task_id}", params={"stream": "true"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert f"{task_id}.stim.ndjson" in response.headers["content-disposition"]
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    details = lines[0]["invocation_details"]
+    assert details["task_id"] == task_id
+
+    flow = lines[1:]
+    assert len(flow) == 3
+    assert all(entry["task_id"] == task_id for entry in flow)
+    created_times = [entry["created_time"] for entry in flow]
+    assert created_times == sorted(created_times)
+
+
 @pytest.mark.parametrize(
     "config_to_set, file_content, assertion_func",
     [
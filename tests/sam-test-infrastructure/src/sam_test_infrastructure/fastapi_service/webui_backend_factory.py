@@ -158,6 +158,9 @@ class WebUIBackendFactory:
         mock_sse_manager = Mock(spec=SSEManager)
         mock_component.get_sse_manager.return_value = mock_sse_manager
 
+        # Tests swap agent registries per test; don't cache agent card responses
+        mock_component.get_agent_card_response_cache.return_value = None
+
         # Create a test database engine and session factory with database-specific settings
         if db_url.startswith("sqlite"):
             # SQLite-specific configuration
@@ -1,6 +1,15 @@
+import time
 from unittest.mock import MagicMock, call
 
-from solace_agent_mesh.shared.outbox import OutboxEventEntity, OutboxEventPoller
+import pytest
+
+from solace_agent_mesh.shared.outbox import (
+    OutboxEventEntity,
+    OutboxEventPoller,
+    OutboxEventRepository,
+    OutboxProcessingMode,
+    UpdateOutboxEventModel,
+)
 
 
 def _make_event(event_id="evt-1", entity_id="agt-001"):
@@ -107,6 +116,67 @@ class TestPollCycle:
             session.close.assert_called_once()
 
 
+class TestConcurrentPollCycle:
+
+    def test_commits_once_per_chunk(self):
+        events = [_make_event(event_id=f"evt-{i}", entity_id=f"agt-{i}") for i in range(5)]
+        sessions = [MagicMock() for _ in range(4)]
+        session_iter = iter(sessions)
+
+        poller, deps = _make_poller(
+            processing_mode=OutboxProcessingMode.CONCURRENT, commit_batch_size=2
+        )
+        deps["heartbeat_tracker"].is_heartbeat_active.return_value = True
+        deps["db_session_factory"].side_effect = lambda: next(session_iter)
+        deps["outbox_repository"].claim_pending_events.return_value = events
+        deps["outbox_repository"].bulk_deduplicate_events.return_value = set()
+
+        poller._poll_cycle()
+
+        deps["outbox_repository"].get_pending_events.assert_not_called()
+        assert deps["processor"].process_single_event.call_count == 5
+        for session in sessions:
+            session.commit.assert_called_once()
+            session.close.assert_called_once()
+        assert poller.last_cycle_metrics.processed == 5
+        assert poller.last_cycle_metrics.commits == 3
+
+    def test_rejects_unknown_mode(self):
+        with pytest.raises(ValueError):
+            _make_poller(processing_mode="bogus")
+
+    def test_failed_event_rolls_back_only_itself(self, session_factory, outbox_repo, create_event, db_session):
+        ok = create_event(entity_id="agt-ok")
+        bad = create_event(entity_id="agt-bad")
+        db_session.commit()
+
+        def process(db, event):
+            outbox_repo.update_event(db, event.id, UpdateOutboxEventModel(status="completed"))
+            if event.id == bad.id:
+                raise RuntimeError("boom")
+
+        processor = MagicMock()
+        processor.process_single_event.side_effect = process
+        poller, _ = _make_poller(
+            processor=processor,
+            db_session_factory=session_factory,
+            outbox_repository=OutboxEventRepository(),
+            processing_mode=OutboxProcessingMode.CONCURRENT,
+            commit_batch_size=10,
+        )
+        poller._heartbeat_tracker.is_heartbeat_active.return_value = True
+
+        poller._poll_cycle()
+
+        db_session.expire_all()
+        assert outbox_repo.get_event_by_id(db_session, ok.id).status == "completed"
+        failed = outbox_repo.get_event_by_id(db_session, bad.id)
+        assert failed.status == "pending"
+        assert failed.next_retry_at <= int(time.time() * 1000)
+        assert poller.last_cycle_metrics.processed == 1
+        assert poller.last_cycle_metrics.failed == 1
+
+
 class TestCleanup:
 
     def test_cleanup_runs_on_interval(self):
@@ -121,8 +191,6 @@ class TestCleanup:
         mock_session.commit.assert_called_once()
 
     def test_cleanup_skipped_when_interval_not_elapsed(self):
-        import time
-
         poller, deps = _make_poller(cleanup_interval_seconds=3600)
         poller._last_cleanup = time.time()
 
@@ -74,6 +74,33 @@ class TestGetPendingEvents:
         assert events[1].id == second.id
 
 
+class TestClaimPendingEvents:
+
+    def test_claims_due_events_until_lease_expires(self, db_session, outbox_repo, create_event):
+        now_ms = int(time.time() * 1000) + 1000
+        first = create_event(entity_id="agt-1")
+        second = create_event(entity_id="agt-2")
+        db_session.commit()
+
+        claimed = outbox_repo.claim_pending_events(db_session, now_ms, limit=10, lease_ms=30_000)
+        db_session.commit()
+
+        assert [e.id for e in claimed] == [first.id, second.id]
+        assert all(e.next_retry_at == now_ms + 30_000 for e in claimed)
+        assert outbox_repo.claim_pending_events(db_session, now_ms, limit=10, lease_ms=30_000) == []
+        reclaimed = outbox_repo.claim_pending_events(db_session, now_ms + 30_000, limit=10, lease_ms=30_000)
+        assert len(reclaimed) == 2
+
+    def test_respects_limit(self, db_session, outbox_repo, create_event):
+        now_ms = int(time.time() * 1000) + 1000
+        for i in range(5):
+            create_event(entity_id=f"agt-{i}")
+        db_session.commit()
+
+        assert len(outbox_repo.claim_pending_events(db_session, now_ms, limit=2, lease_ms=1000)) == 2
+        assert len(outbox_repo.claim_pending_events(db_session, now_ms, limit=10, lease_ms=1000)) == 3
+
+
 class TestHasPendingEvent:
 
     def test_returns_true_for_existing_pending(self, db_session, outbox_repo, create_event):
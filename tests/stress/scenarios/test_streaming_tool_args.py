@@ -0,0 +1,131 @@
+"""
+Benchmark assembling large streamed tool-call arguments.
+
+Streams a 1MB CSV as the argument of a single tool call through
+LiteLlm.generate_content_async and compares the parsing work with the previous
+approach of re-parsing the whole accumulated buffer after every chunk. Both
+timings go to the metrics report; the assertions are on parse and scan counts.
+"""
+
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from google.adk.models.llm_request import LlmRequest
+from google.genai.types import Content, GenerateContentConfig, Part
+
+from solace_agent_mesh.agent.adk.models.lite_llm import LiteLlm, _StreamedToolArgs
+from tests.stress.metrics.collector import MetricsCollector
+from tests.stress.metrics.reporter import MetricsReporter
+
+pytestmark = [pytest.mark.stress, pytest.mark.asyncio]
+
+ARGS_BYTES = 1_000_000
+
+
+def build_argument_chunks(chunk_size: int) -> list[str]:
+    row = "2024-01-01,widget,42,\"note with, comma\"\n"
+    csv = "date,item,count,note\n" + row * (ARGS_BYTES // len(row))
+    arguments = json.dumps({"filename": "export.csv", "content": csv})
+    return [arguments[i : i + chunk_size] for i in range(0, len(arguments), chunk_size)]
+
+
+def tool_call_delta(args, name=None, call_id=None):
+    tool_call = SimpleNamespace(
+        type="function",
+        id=call_id,
+        index=0,
+        function=SimpleNamespace(name=name, arguments=args),
+    )
+    return {"choices": [{"delta": {"tool_calls": [tool_call]}, "finish_reason": None}]}
+
+
+async def reparse_every_chunk(chunks: list[str], metrics_collector: MetricsCollector):
+    """The previous assembly: string concatenation plus a full json.loads per chunk."""
+    start = time.perf_counter()
+    args = ""
+    for chunk in chunks:
+        args += chunk
+        await metrics_collector.increment_counter("reparse_parse_calls")
+        await metrics_collector.increment_counter("reparse_chars_parsed", len(args))
+        try:
+            json.loads(args)
+        except json.JSONDecodeError:
+            pass
+    await metrics_collector.record_latency(
+        "reparse_every_chunk", (time.perf_counter() - start) * 1000
+    )
+
+
+async def stream_through_lite_llm(chunks: list[str], metrics_collector: MetricsCollector):
+    async def stream():
+        yield tool_call_delta(chunks[0], name="create_artifact", call_id="call-1")
+        for chunk in chunks[1:]:
+            yield tool_call_delta(chunk)
+        yield {"choices": [{"delta": {"content": None}, "finish_reason": "tool_calls"}]}
+
+    request = LlmRequest(
+        contents=[Content(role="user", parts=[Part(text="Export the data")])],
+        config=GenerateContentConfig(),
+    )
+    parses = _StreamedToolArgs._parses
+    scan = _StreamedToolArgs._scan
+    counts = {"parse_calls": 0, "chars_parsed": 0, "chars_scanned": 0}
+
+    def counting_parses(buffer):
+        counts["parse_calls"] += 1
+        counts["chars_parsed"] += len(buffer.text)
+        return parses(buffer)
+
+    def counting_scan(buffer, chunk):
+        counts["chars_scanned"] += len(chunk)
+        return scan(buffer, chunk)
+
+    with (
+        patch("solace_agent_mesh.agent.adk.models.lite_llm.acompletion") as mock_acompletion,
+        patch.object(_StreamedToolArgs, "_parses", counting_parses),
+        patch.object(_StreamedToolArgs, "_scan", counting_scan),
+    ):
+        mock_acompletion.return_value = stream()
+        llm = LiteLlm(model="gpt-4")
+        start = time.perf_counter()
+        responses = [r async for r in llm.generate_content_async(request, stream=True)]
+        await metrics_collector.record_latency(
+            "streamed_assembly", (time.perf_counter() - start) * 1000
+        )
+    for name, value in counts.items():
+        await metrics_collector.increment_counter(f"streamed_{name}", value)
+    return responses
+
+
+@pytest.mark.parametrize("chunk_size", [256, 4096])
+async def test_large_tool_arguments_are_parsed_once(
+    chunk_size,
+    metrics_collector: MetricsCollector,
+    metrics_reporter: MetricsReporter,
+):
+    chunks = build_argument_chunks(chunk_size)
+    arguments = "".join(chunks)
+
+    await metrics_collector.start()
+    responses = await stream_through_lite_llm(chunks, metrics_collector)
+    await reparse_every_chunk(chunks, metrics_collector)
+    await metrics_collector.stop()
+
+    [call] = [
+        part.function_call
+        for response in responses
+        if response.content
+        for part in response.content.parts
+        if part.function_call
+    ]
+    assert call.name == "create_artifact"
+    assert json.dumps(call.args) == arguments
+    # Every character is scanned once and the buffer is parsed once, when the
+    # top-level object closes, instead of once per chunk
+    assert metrics_collector.get_counter("streamed_chars_scanned") == len(arguments)
+    assert metrics_collector.get_counter("streamed_parse_calls") == 1
+    assert metrics_collector.get_counter("streamed_chars_parsed") == len(arguments)
+    assert metrics_collector.get_counter("reparse_parse_calls") == len(chunks)
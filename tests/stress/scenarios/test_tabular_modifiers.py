@@ -0,0 +1,112 @@
+"""
+Benchmark tabular embed modifier chains over large CSV artifacts.
+
+Runs the same chain with the columnar backend disabled (a dict per row) and
+enabled (a pandas table) and checks that both produce identical output and
+which backend executed the modifiers. Timings go to the metrics report; they
+are not asserted on.
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from solace_agent_mesh.common.utils.embeds import (
+    LATE_EMBED_TYPES,
+    evaluate_embed,
+    resolve_embeds_in_string,
+    resolver,
+)
+from solace_agent_mesh.common.utils.embeds.types import ResolutionMode
+from tests.stress.metrics.collector import MetricsCollector
+from tests.stress.metrics.reporter import MetricsReporter
+
+pytestmark = [pytest.mark.stress, pytest.mark.asyncio, pytest.mark.artifacts]
+
+CHAINS = [
+    "filter_rows_eq:region:emea >>> select_cols:id,amount >>> format:csv",
+    "select_cols:id,region >>> slice_rows:-1000: >>> format:json",
+]
+
+
+def generate_csv(rows: int) -> bytes:
+    regions = ["amer", "emea", "apac", "latam"]
+    lines = ["id,region,customer,amount,status"]
+    lines.extend(
+        f"{i},{regions[i % 4]},customer {i % 977},{i * 7 % 10000}.{i % 100:02d},"
+        f"{'open' if i % 3 else 'closed'}"
+        for i in range(rows)
+    )
+    return ("\n".join(lines) + "\n").encode()
+
+
+def artifact_context(data: bytes) -> dict:
+    part = MagicMock()
+    part.inline_data.data = data
+    part.inline_data.mime_type = "text/csv"
+    service = MagicMock(spec=["list_versions", "load_artifact"])
+    service.list_versions = AsyncMock(return_value=[0])
+    service.load_artifact = AsyncMock(return_value=part)
+    return {
+        "artifact_service": service,
+        "session_context": {"app_name": "app", "user_id": "u", "session_id": "s"},
+    }
+
+
+async def resolve_measured(
+    chain: str,
+    data: bytes,
+    columnar_min_bytes: int,
+    backend: str,
+    metrics_collector: MetricsCollector,
+) -> str:
+    """Resolves the chain, recording its latency and the table work it did."""
+    with patch.object(
+        resolver, "parse_csv_table", wraps=resolver.parse_csv_table
+    ) as parse_table, patch.object(
+        resolver, "apply_table_modifier", wraps=resolver.apply_table_modifier
+    ) as table_modifier:
+        start = time.perf_counter()
+        text, _, _ = await resolve_embeds_in_string(
+            f"«artifact_content:sales.csv >>> {chain}»",
+            artifact_context(data),
+            evaluate_embed,
+            LATE_EMBED_TYPES,
+            ResolutionMode.TOOL_PARAMETER,
+            config={"embed_columnar_min_bytes": columnar_min_bytes},
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+    await metrics_collector.record_latency(f"tabular_{backend}", elapsed_ms)
+    await metrics_collector.increment_counter(f"{backend}_tables_parsed", parse_table.call_count)
+    await metrics_collector.increment_counter(
+        f"{backend}_table_modifier_calls", table_modifier.call_count
+    )
+    return text
+
+
+@pytest.mark.parametrize("rows", [100_000, 1_000_000])
+@pytest.mark.parametrize("chain", CHAINS)
+async def test_columnar_matches_row_execution(
+    rows,
+    chain,
+    metrics_collector: MetricsCollector,
+    metrics_reporter: MetricsReporter,
+):
+    data = generate_csv(rows)
+    await metrics_collector.start()
+
+    row_text = await resolve_measured(chain, data, -1, "rows", metrics_collector)
+    columnar_text = await resolve_measured(chain, data, 0, "columnar", metrics_collector)
+
+    await metrics_collector.stop()
+
+    assert not columnar_text.startswith("[Error")
+    assert columnar_text == row_text
+    # The row backend streams the chain row by row; the columnar backend parses
+    # the CSV into one table and runs both table modifiers of the chain on it
+    assert metrics_collector.get_counter("rows_tables_parsed") == 0
+    assert metrics_collector.get_counter("rows_table_modifier_calls") == 0
+    assert metrics_collector.get_counter("columnar_tables_parsed") == 1
+    assert metrics_collector.get_counter("columnar_table_modifier_calls") == 2
@@ -0,0 +1,147 @@
+"""
+Benchmark workflow map nodes over large item lists.
+
+Drives the DAG executor with a stub agent that completes iterations as soon
+as they are launched. Completion latencies and the size of the persisted
+workflow state go to the metrics report; the assertions are on the state size
+and the iteration counts.
+"""
+
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from google.adk.artifacts import InMemoryArtifactService
+
+from solace_agent_mesh.common.data_parts import ArtifactRef, StructuredInvocationResult
+from solace_agent_mesh.workflow.app import AgentNode, MapNode, WorkflowDefinition
+from solace_agent_mesh.workflow.dag_executor import DAGExecutor
+from solace_agent_mesh.workflow.workflow_execution_context import (
+    WorkflowExecutionContext,
+    WorkflowExecutionState,
+)
+from tests.stress.metrics.collector import MetricsCollector
+from tests.stress.metrics.reporter import MetricsReporter
+
+pytestmark = [pytest.mark.stress, pytest.mark.asyncio]
+
+
+class StubHost:
+    """Minimal workflow host; plain coroutines keep mock bookkeeping out of the timings."""
+
+    log_identifier = "[bench]"
+    workflow_name = "large_map"
+
+    def __init__(self):
+        self.artifact_service = InMemoryArtifactService()
+        self.events = 0
+
+    def get_config(self, key, default=None):
+        return default
+
+    async def publish_workflow_event(self, workflow_context, event_data):
+        self.events += 1
+
+    async def _update_workflow_state(self, workflow_context, workflow_state):
+        pass
+
+    async def finalize_workflow_success(self, workflow_context):
+        pass
+
+    async def _load_node_output(self, node_id, artifact_name, **kwargs):
+        return {"done": artifact_name}
+
+
+def build_map_run(item_count: int, concurrency_limit: int):
+    workflow_def = WorkflowDefinition(
+        description="Large map",
+        nodes=[
+            AgentNode(id="prepare", type="agent", agent_name="PrepareAgent"),
+            MapNode(
+                id="fan_out",
+                type="map",
+                node="work",
+                items="{{prepare.output.items}}",
+                max_items=item_count,
+                concurrency_limit=concurrency_limit,
+                depends_on=["prepare"],
+            ),
+            AgentNode(
+                id="work",
+                type="agent",
+                agent_name="StubAgent",
+                input={"item": "{{item}}", "index": "{{_map_index}}"},
+            ),
+        ],
+        output_mapping={"results": "{{fan_out.output}}"},
+    )
+
+    host = StubHost()
+    executor = DAGExecutor(workflow_def, host)
+    context = WorkflowExecutionContext("wf-bench", {"user_id": "u", "session_id": "s"})
+    items = [{"id": i, "payload": f"record {i} " * 8} for i in range(item_count)]
+    state = WorkflowExecutionState(
+        workflow_name="large_map",
+        execution_id="bench",
+        start_time=datetime.now(timezone.utc),
+        completed_nodes={"prepare": "prepare.json"},
+        node_outputs={"prepare": {"output": {"items": items}}},
+    )
+    context.workflow_state = state
+
+    launched = []
+
+    async def stub_agent(node, iteration_state, workflow_context, sub_task_id=None):
+        # Resolve the iteration input the way the real agent caller would
+        executor.resolve_value(node.input, iteration_state)
+        workflow_context.track_agent_call(node.id, sub_task_id)
+        launched.append(sub_task_id)
+        return sub_task_id
+
+    host.agent_caller = SimpleNamespace(call_agent=stub_agent)
+    return executor, context, state, launched
+
+
+@pytest.mark.parametrize("item_count", [1_000, 10_000])
+async def test_large_map_keeps_persisted_state_bounded(
+    item_count,
+    metrics_collector: MetricsCollector,
+    metrics_reporter: MetricsReporter,
+):
+    executor, context, state, launched = build_map_run(item_count, concurrency_limit=50)
+    max_state_bytes = 0
+
+    await metrics_collector.start()
+    await executor.execute_workflow(state, context)
+    completed = 0
+    while completed < len(launched):
+        sub_task_id = launched[completed]
+        completed += 1
+        start = time.perf_counter()
+        await executor.handle_node_completion(
+            context,
+            sub_task_id,
+            StructuredInvocationResult(
+                status="success",
+                output_artifact_ref=ArtifactRef(name=f"out-{completed}", version=0),
+            ),
+        )
+        await metrics_collector.record_latency(
+            "map_iteration_completion", (time.perf_counter() - start) * 1000
+        )
+        if completed % 100 == 0 and "map_state_fan_out" in state.metadata:
+            state_bytes = len(state.model_dump_json(exclude={"node_outputs"}))
+            max_state_bytes = max(max_state_bytes, state_bytes)
+    await metrics_collector.stop()
+
+    await metrics_collector.increment_counter("map_iterations_launched", len(launched))
+    await metrics_collector.increment_counter("map_iterations_completed", completed)
+    await metrics_collector.set_gauge("max_persisted_state_bytes", max_state_bytes)
+
+    results = state.node_outputs["fan_out"]["output"]["results"]
+    assert len(results) == item_count
+    assert results[-1] == {"done": f"out-{item_count}"}
+    assert metrics_collector.get_counter("map_iterations_launched") == item_count
+    # Bookkeeping scales with the concurrency limit, not with the item count
+    assert 0 < max_state_bytes < 16_384
@@ -0,0 +1,88 @@
+"""
+Benchmark persisted workflow state size and per-step write cost.
+
+Simulates a long chain of nodes with large artifact-backed outputs and
+compares writing the full state dump at every step with appending to the
+workflow state log. Per-step write latencies go to the metrics report; the
+assertions are on the bytes written and persisted.
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from solace_agent_mesh.workflow.state_log import (
+    WorkflowStateLog,
+    encode_workflow_state,
+    replay_workflow_state,
+    workflow_log_key,
+)
+from solace_agent_mesh.workflow.workflow_execution_context import WorkflowExecutionState
+from tests.stress.metrics.collector import MetricsCollector
+from tests.stress.metrics.reporter import MetricsReporter
+
+pytestmark = [pytest.mark.stress, pytest.mark.asyncio]
+
+OUTPUT_BYTES = 50_000
+
+
+async def run_steps(
+    node_count: int, write_step, operation: str, metrics_collector: MetricsCollector
+):
+    state = WorkflowExecutionState(
+        workflow_name="long_chain",
+        execution_id="bench",
+        start_time=datetime.now(timezone.utc),
+    )
+    state.node_outputs["workflow_input"] = {"output": {"query": "summarize"}}
+    written = []
+
+    for i in range(node_count):
+        node_id = f"step_{i}"
+        state.completed_nodes[node_id] = f"{node_id}.json"
+        state.node_outputs[node_id] = {"output": {"text": "x" * OUTPUT_BYTES}}
+        state.output_refs[node_id] = {"artifact_name": f"{node_id}.json", "artifact_version": 0}
+        state.current_node_id = node_id
+        start = time.perf_counter()
+        written.append(write_step(state))
+        await metrics_collector.record_latency(operation, (time.perf_counter() - start) * 1000)
+    await metrics_collector.increment_counter(f"{operation}_bytes", sum(written))
+    return state, written
+
+
+@pytest.mark.parametrize("node_count", [100, 250])
+async def test_state_log_write_cost_stays_flat(
+    node_count,
+    metrics_collector: MetricsCollector,
+    metrics_reporter: MetricsReporter,
+):
+    def full_dump(state):
+        return len(json.dumps(state.model_dump(mode="json")))
+
+    state_log = WorkflowStateLog()
+    session_state = {}
+
+    def log_append(state):
+        delta = state_log.record(state)
+        session_state.update(delta)
+        return len(json.dumps(delta))
+
+    await metrics_collector.start()
+    _, full_written = await run_steps(node_count, full_dump, "full_dump", metrics_collector)
+    state, log_written = await run_steps(node_count, log_append, "state_log", metrics_collector)
+    await metrics_collector.stop()
+
+    persisted = len(json.dumps(session_state))
+    await metrics_collector.set_gauge("persisted_log_bytes", persisted)
+
+    assert replay_workflow_state(session_state, "bench") == encode_workflow_state(state)
+    assert len(session_state[workflow_log_key("bench")]) <= state_log.snapshot_interval
+    # Outputs are referenced, so no step writes an output inline
+    assert max(log_written) < OUTPUT_BYTES
+    assert persisted < OUTPUT_BYTES * state_log.snapshot_interval
+    assert (
+        metrics_collector.get_counter("state_log_bytes") * 100
+        < metrics_collector.get_counter("full_dump_bytes")
+    )
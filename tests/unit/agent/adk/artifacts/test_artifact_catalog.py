@@ -0,0 +1,235 @@
+"""Tests for the database-backed artifact metadata catalog."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from alembic import command
+from google.adk.artifacts import InMemoryArtifactService
+from google.genai import types as adk_types
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.dialects import mysql
+from sqlalchemy.schema import CreateTable
+
+from solace_agent_mesh.agent.adk.artifacts.artifact_catalog import (
+    ArtifactCatalog,
+    ArtifactCatalogEntry,
+    artifact_catalog_table,
+)
+from solace_agent_mesh.agent.adk.services import ScopedArtifactServiceWrapper
+from solace_agent_mesh.agent.utils.artifact_helpers import (
+    copy_artifact_with_metadata,
+    get_artifact_counts_batch,
+    get_artifact_info_list,
+    get_artifact_info_list_fast,
+    reconcile_artifact_catalog,
+    save_artifact_with_metadata,
+)
+from solace_agent_mesh.gateway.http_sse.main import _setup_alembic_config
+
+APP = "agent"
+NAMESPACE = "ns"
+USER = "user-1"
+SESSION = "session-1"
+
+
+@pytest.fixture
+def catalog():
+    return ArtifactCatalog.from_config({"database_url": "sqlite://"})
+
+
+@pytest.fixture
+def service(catalog):
+    component = SimpleNamespace(
+        namespace=NAMESPACE,
+        log_identifier="[test]",
+        get_config=lambda key, default=None: default,
+    )
+    return ScopedArtifactServiceWrapper(
+        wrapped_service=InMemoryArtifactService(),
+        component=component,
+        artifact_catalog=catalog,
+    )
+
+
+async def _save(service, filename, content=b"a,b\n1,2\n", session_id=SESSION, **kwargs):
+    return await save_artifact_with_metadata(
+        artifact_service=service,
+        app_name=APP,
+        user_id=USER,
+        session_id=session_id,
+        filename=filename,
+        content_bytes=content,
+        mime_type="text/csv",
+        metadata_dict={"description": f"{filename} data"},
+        timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        **kwargs,
+    )
+
+
+class TestArtifactCatalog:
+    def test_upsert_replaces_the_row(self, catalog):
+        catalog.upsert(APP, USER, SESSION, ArtifactCatalogEntry("a.txt", 0, 1, size_bytes=3))
+        catalog.upsert(APP, USER, SESSION, ArtifactCatalogEntry("a.txt", 1, 2, size_bytes=5))
+
+        [entry] = catalog.list_session(APP, USER, SESSION)
+        assert (entry.latest_version, entry.version_count, entry.size_bytes) == (1, 2, 5)
+
+    def test_counts_exclude_internal_artifacts_and_default_to_zero(self, catalog):
+        catalog.upsert(APP, USER, "s1", ArtifactCatalogEntry("a.txt", 0, 1))
+        catalog.upsert(APP, USER, "s1", ArtifactCatalogEntry("b.txt", 0, 1))
+        catalog.upsert(
+            APP, USER, "s1", ArtifactCatalogEntry("a.converted.txt", 0, 1, is_internal=True)
+        )
+        catalog.upsert(APP, "other-user", "s2", ArtifactCatalogEntry("c.txt", 0, 1))
+
+        assert catalog.count_sessions(APP, USER, ["s1", "s2"]) == {"s1": 2, "s2": 0}
+
+    def test_replace_session_removes_stale_rows(self, catalog):
+        catalog.upsert(APP, USER, SESSION, ArtifactCatalogEntry("gone.txt", 0, 1))
+
+        removed = catalog.replace_session(
+            APP, USER, SESSION, [ArtifactCatalogEntry("kept.txt", 2, 3)]
+        )
+
+        assert removed == 1
+        assert [e.filename for e in catalog.list_session(APP, USER, SESSION)] == ["kept.txt"]
+        assert catalog.list_scopes(APP) == [(USER, SESSION)]
+
+    def test_metadata_round_trip(self):
+        metadata = {
+            "mime_type": "text/csv",
+            "size_bytes": 8,
+            "description": "d",
+            "schema": {"type": "text/csv", "columns": ["a", "b"]},
+            "tags": ["t"],
+            "timestamp_utc": 1700000000.0,
+        }
+        entry = ArtifactCatalogEntry.from_metadata("a.csv", 3, metadata)
+        assert entry.version_count == 4
+        assert entry.to_metadata() == metadata
+
+
+class TestWriteThrough:
+    async def test_save_records_the_latest_version_under_the_scoped_app(self, service, catalog):
+        await _save(service, "data.csv")
+        result = await _save(service, "data.csv", content=b"a,b\n1,2\n3,4\n")
+
+        [entry] = catalog.list_session(NAMESPACE, USER, SESSION)
+        assert entry.latest_version == result["data_version"] == 1
+        assert entry.version_count == 2
+        assert entry.size_bytes == 12
+        assert entry.description == "data.csv data"
+        assert entry.schema_summary["inferred"] is True
+
+    async def test_delete_removes_the_row(self, service, catalog):
+        await _save(service, "data.csv")
+
+        await service.delete_artifact(
+            app_name=APP, user_id=USER, session_id=SESSION, filename="data.csv"
+        )
+
+        assert catalog.list_session(NAMESPACE, USER, SESSION) == []
+
+    async def test_copy_records_the_target_session(self, service, catalog):
+        await _save(service, "data.csv")
+
+        await copy_artifact_with_metadata(
+            artifact_service=service,
+            app_name=APP,
+            source_user_id=USER,
+            source_session_id=SESSION,
+            user_id=USER,
+            session_id="project-p1",
+            filename="data.csv",
+            metadata_updates={"source": "project"},
+        )
+
+        [entry] = catalog.list_session(NAMESPACE, USER, "project-p1")
+        assert entry.source == "project"
+
+
+class TestServeListings:
+    async def test_listings_come_from_storage_unless_enabled(self, service, catalog):
+        await _save(service, "data.csv")
+        catalog.upsert(NAMESPACE, USER, SESSION, ArtifactCatalogEntry("ghost.txt", 0, 1))
+
+        listed = await get_artifact_info_list_fast(service, APP, USER, SESSION)
+        assert [info.filename for info in listed] == ["data.csv"]
+
+        catalog.serve_listings = True
+        listed = await get_artifact_info_list_fast(service, APP, USER, SESSION)
+        assert [info.filename for info in listed] == ["data.csv", "ghost.txt"]
+
+    async def test_catalog_listing_matches_storage_listing(self, service, catalog):
+        await _save(service, "data.csv")
+        await _save(service, "data.csv", content=b"a\n1\n")
+        from_storage = await get_artifact_info_list(service, APP, USER, SESSION)
+
+        catalog.serve_listings = True
+        from_catalog = await get_artifact_info_list(service, APP, USER, SESSION)
+
+        assert from_catalog == from_storage
+
+    async def test_counts(self, service, catalog):
+        await _save(service, "a.csv")
+        await _save(service, "b.csv")
+        catalog.serve_listings = True
+
+        counts = await get_artifact_counts_batch(service, APP, USER, [SESSION, "empty"])
+
+        assert counts == {SESSION: 2, "empty": 0}
+
+
+class TestReconcile:
+    async def test_backfills_artifacts_saved_without_the_catalog(self, service, catalog):
+        service.artifact_catalog = None
+        await _save(service, "old.csv")
+        await service.save_artifact(
+            app_name=APP,
+            user_id=USER,
+            session_id=SESSION,
+            filename="raw.bin",
+            artifact=adk_types.Part.from_bytes(data=b"\x00", mime_type="application/octet-stream"),
+        )
+        service.artifact_catalog = catalog
+        catalog.upsert(NAMESPACE, USER, SESSION, ArtifactCatalogEntry("deleted.csv", 0, 1))
+
+        result = await reconcile_artifact_catalog(service, APP, USER, SESSION)
+
+        assert result == {"upserted": 2, "removed": 1}
+        entries = {e.filename: e for e in catalog.list_session(NAMESPACE, USER, SESSION)}
+        assert set(entries) == {"old.csv", "raw.bin"}
+        assert entries["old.csv"].description == "old.csv data"
+        assert entries["raw.bin"].mime_type is None
+
+    async def test_requires_a_catalog(self, service):
+        service.artifact_catalog = None
+        with pytest.raises(ValueError):
+            await reconcile_artifact_catalog(service, APP, USER, SESSION)
+
+
+def test_gateway_migration_creates_the_catalog_table(tmp_path):
+    url = f"sqlite:///{tmp_path / 'gateway.db'}"
+    command.upgrade(_setup_alembic_config(url), "head")
+
+    engine = create_engine(url)
+    try:
+        inspector = inspect(engine)
+        indexes = {ix["name"] for ix in inspector.get_indexes("artifact_catalog")}
+        assert "ix_artifact_catalog_session_internal" in indexes
+
+        catalog = ArtifactCatalog(engine)
+        catalog.upsert(APP, USER, SESSION, ArtifactCatalogEntry("a.txt", 0, 1))
+        assert [e.filename for e in catalog.list_session(APP, USER, SESSION)] == ["a.txt"]
+    finally:
+        engine.dispose()
+
+
+def test_catalog_table_compiles_for_mysql_within_the_key_limit():
+    ddl = str(CreateTable(artifact_catalog_table).compile(dialect=mysql.dialect()))
+    assert "VARCHAR(255)" in ddl
+
+    # utf8mb4 uses up to 4 bytes per character; InnoDB keys are capped at 3072 bytes
+    key_chars = sum(c.type.length for c in artifact_catalog_table.primary_key.columns)
+    assert key_chars * 4 <= 3072
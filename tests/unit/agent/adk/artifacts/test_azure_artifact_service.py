@@ -464,6 +464,150 @@ class TestAzureArtifactServiceLoadArtifact:
         )
 
 
+class TestAzureArtifactServiceCopyArtifact:
+    """Tests for copy_artifact method"""
+
+    @staticmethod
+    def _blob_clients(azure_service, source_metadata=None):
+        source = Mock()
+        source.url = "https://testaccount.blob.core.windows.net/test-container/source"
+        source.get_blob_properties.return_value = Mock(
+            metadata=source_metadata or {},
+            content_settings=Mock(content_type="text/plain"),
+        )
+        destination = Mock()
+        destination.start_copy_from_url.return_value = {"copy_status": "success"}
+        clients = {}
+
+        def get_blob_client(key):
+            clients.setdefault(key, destination if "/user1/" in key else source)
+            return clients[key]
+
+        azure_service.container_client.get_blob_client.side_effect = get_blob_client
+        return source, destination, clients
+
+    @pytest.mark.asyncio
+    async def test_copy_artifact_starts_server_side_copy(self, azure_service):
+        source, destination, clients = self._blob_clients(azure_service)
+
+        with patch.object(azure_service, "list_versions", side_effect=[[0, 1], []]):
+            version = await azure_service.copy_artifact(
+                app_name="test_app",
+                source_user_id="owner",
+                source_session_id="project-1",
+                source_filename="test.txt",
+                user_id="user1",
+                session_id="session1",
+            )
+
+        assert version == 0
+        assert "test_app/owner/project-1/test.txt/1" in clients
+        assert "test_app/user1/session1/test.txt/0" in clients
+        args, kwargs = destination.start_copy_from_url.call_args
+        assert args == (source.url,)
+        assert kwargs["metadata"]["session_id"] == "session1"
+        destination.upload_blob.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_copy_artifact_waits_for_pending_copy(self, azure_service):
+        _, destination, _ = self._blob_clients(azure_service)
+        destination.start_copy_from_url.return_value = {"copy_status": "pending"}
+        destination.get_blob_properties.side_effect = [
+            Mock(copy=Mock(status="pending")),
+            Mock(copy=Mock(status="failed")),
+        ]
+
+        with patch.object(azure_service, "list_versions", return_value=[]), patch(
+            "src.solace_agent_mesh.agent.adk.artifacts.azure_artifact_service._COPY_POLL_INTERVAL_SECONDS",
+            0,
+        ):
+            with pytest.raises(OSError, match="status 'failed'"):
+                await azure_service.copy_artifact(
+                    app_name="test_app",
+                    source_user_id="owner",
+                    source_session_id="project-1",
+                    source_filename="test.txt",
+                    source_version=0,
+                    user_id="user1",
+                    session_id="session1",
+                )
+
+        assert destination.get_blob_properties.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_copy_artifact_reference_of_reference(self, azure_service):
+        _, destination, _ = self._blob_clients(
+            azure_service,
+            source_metadata={"reference_key": "test_app/owner/project-1/test.txt/4"},
+        )
+
+        with patch.object(azure_service, "list_versions", return_value=[2]):
+            version = await azure_service.copy_artifact(
+                app_name="test_app",
+                source_user_id="owner2",
+                source_session_id="session9",
+                source_filename="test.txt",
+                source_version=0,
+                user_id="user1",
+                session_id="session1",
+                reference=True,
+            )
+
+        assert version == 3
+        destination.start_copy_from_url.assert_not_called()
+        call_kwargs = destination.upload_blob.call_args.kwargs
+        assert call_kwargs["data"] == b""
+        assert call_kwargs["metadata"]["reference_key"] == (
+            "test_app/owner/project-1/test.txt/4"
+        )
+
+    @pytest.mark.asyncio
+    async def test_copy_artifact_missing_source(self, azure_service):
+        source, destination, _ = self._blob_clients(azure_service)
+        source.get_blob_properties.side_effect = ResourceNotFoundError("Not found")
+
+        version = await azure_service.copy_artifact(
+            app_name="test_app",
+            source_user_id="owner",
+            source_session_id="project-1",
+            source_filename="test.txt",
+            source_version=0,
+            user_id="user1",
+            session_id="session1",
+        )
+
+        assert version is None
+        destination.start_copy_from_url.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_load_artifact_follows_reference(self, azure_service):
+        reference = Mock()
+        reference.download_blob.return_value = Mock(
+            properties=Mock(
+                metadata={"reference_key": "test_app/owner/project-1/test.txt/3"}
+            )
+        )
+        target = Mock()
+        target_downloader = Mock()
+        target_downloader.readall.return_value = b"project data"
+        target_downloader.properties.content_settings.content_type = "text/plain"
+        target.download_blob.return_value = target_downloader
+        azure_service.container_client.get_blob_client.side_effect = (
+            lambda key: target if "/owner/" in key else reference
+        )
+
+        loaded = await azure_service.load_artifact(
+            app_name="test_app",
+            user_id="user1",
+            session_id="session1",
+            filename="test.txt",
+            version=0,
+        )
+
+        assert loaded.inline_data.data == b"project data"
+        assert loaded.inline_data.mime_type == "text/plain"
+
+
 class TestAzureArtifactServiceListArtifactKeys:
     """Tests for list_artifact_keys method"""
 
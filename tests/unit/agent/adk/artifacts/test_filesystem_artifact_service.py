@@ -469,6 +469,176 @@ class TestFilesystemArtifactServiceLoadArtifact:
         assert loaded_artifact.inline_data.data == b"Hello, World!"
 
 
+
+class TestFilesystemArtifactServiceLoadArtifactRange:
+    """Tests for load_artifact_range method"""
+
+    @pytest.mark.asyncio
+    async def test_load_artifact_range(self, artifact_service, sample_artifact):
+        """Test forward, open-ended and suffix ranges of one version"""
+        await artifact_service.save_artifact(
+            app_name="test_app",
+            user_id="user1",
+            session_id="session1",
+            filename="test.txt",
+            artifact=sample_artifact
+        )
+
+        async def load_range(offset, length=None):
+            return await artifact_service.load_artifact_range(
+                app_name="test_app",
+                user_id="user1",
+                session_id="session1",
+                filename="test.txt",
+                version=0,
+                offset=offset,
+                length=length,
+            )
+
+        assert await load_range(0, 5) == (b"Hello", 13, "text/plain")
+        assert await load_range(7) == (b"World!", 13, "text/plain")
+        assert await load_range(-6) == (b"World!", 13, "text/plain")
+        assert await load_range(-100) == (b"Hello, World!", 13, "text/plain")
+        assert await load_range(50, 5) == (b"", 13, "text/plain")
+
+    @pytest.mark.asyncio
+    async def test_load_artifact_range_missing_version(self, artifact_service):
+        """Test ranged read of a version that does not exist"""
+        result = await artifact_service.load_artifact_range(
+            app_name="test_app",
+            user_id="user1",
+            session_id="session1",
+            filename="missing.txt",
+            version=0,
+            offset=0,
+            length=10,
+        )
+
+        assert result is None
+
+
+class TestFilesystemArtifactServiceCopyArtifact:
+    """Tests for copy_artifact method"""
+
+    @pytest.mark.asyncio
+    async def test_copy_artifact_links_latest_version(self, artifact_service, sample_artifact):
+        """Test that the latest version is hard linked as the next destination version"""
+        for _ in range(2):
+            await artifact_service.save_artifact(
+                app_name="test_app",
+                user_id="owner",
+                session_id="project-1",
+                filename="test.txt",
+                artifact=sample_artifact
+            )
+        await artifact_service.save_artifact(
+            app_name="test_app",
+            user_id="user1",
+            session_id="session1",
+            filename="test.txt",
+            artifact=adk_types.Part.from_bytes(data=b"old", mime_type="text/plain")
+        )
+
+        version = await artifact_service.copy_artifact(
+            app_name="test_app",
+            source_user_id="owner",
+            source_session_id="project-1",
+            source_filename="test.txt",
+            user_id="user1",
+            session_id="session1",
+        )
+
+        assert version == 1
+        loaded = await artifact_service.load_artifact(
+            app_name="test_app",
+            user_id="user1",
+            session_id="session1",
+            filename="test.txt",
+        )
+        assert loaded.inline_data.data == b"Hello, World!"
+        assert loaded.inline_data.mime_type == "text/plain"
+        source_path = os.path.join(
+            artifact_service._get_artifact_dir("test_app", "owner", "project-1", "test.txt"), "1"
+        )
+        copy_path = os.path.join(
+            artifact_service._get_artifact_dir("test_app", "user1", "session1", "test.txt"), "1"
+        )
+        assert os.path.samefile(source_path, copy_path)
+
+    @pytest.mark.asyncio
+    async def test_copy_artifact_survives_source_deletion(self, artifact_service, sample_artifact):
+        """Test that deleting the source leaves the copy readable"""
+        await artifact_service.save_artifact(
+            app_name="test_app",
+            user_id="owner",
+            session_id="project-1",
+            filename="test.txt",
+            artifact=sample_artifact
+        )
+        await artifact_service.copy_artifact(
+            app_name="test_app",
+            source_user_id="owner",
+            source_session_id="project-1",
+            source_filename="test.txt",
+            user_id="user1",
+            session_id="session1",
+            reference=True,
+        )
+
+        await artifact_service.delete_artifact(
+            app_name="test_app", user_id="owner", session_id="project-1", filename="test.txt"
+        )
+
+        loaded = await artifact_service.load_artifact(
+            app_name="test_app", user_id="user1", session_id="session1", filename="test.txt"
+        )
+        assert loaded.inline_data.data == b"Hello, World!"
+
+    @pytest.mark.asyncio
+    async def test_copy_artifact_falls_back_to_file_copy(self, artifact_service, sample_artifact):
+        """Test that a failed hard link falls back to copying the file"""
+        await artifact_service.save_artifact(
+            app_name="test_app",
+            user_id="owner",
+            session_id="project-1",
+            filename="test.txt",
+            artifact=sample_artifact
+        )
+
+        with patch("os.link", side_effect=OSError("cross-device link")):
+            version = await artifact_service.copy_artifact(
+                app_name="test_app",
+                source_user_id="owner",
+                source_session_id="project-1",
+                source_filename="test.txt",
+                user_id="user1",
+                session_id="session1",
+            )
+
+        assert version == 0
+        loaded = await artifact_service.load_artifact(
+            app_name="test_app", user_id="user1", session_id="session1", filename="test.txt"
+        )
+        assert loaded.inline_data.data == b"Hello, World!"
+
+    @pytest.mark.asyncio
+    async def test_copy_artifact_missing_source(self, artifact_service):
+        """Test copying an artifact that does not exist"""
+        version = await artifact_service.copy_artifact(
+            app_name="test_app",
+            source_user_id="owner",
+            source_session_id="project-1",
+            source_filename="missing.txt",
+            user_id="user1",
+            session_id="session1",
+        )
+
+        assert version is None
+        assert await artifact_service.list_versions(
+            app_name="test_app", user_id="user1", session_id="session1", filename="missing.txt"
+        ) == []
+
+
 class TestFilesystemArtifactServiceListArtifactKeys:
     """Tests for list_artifact_keys method"""
 
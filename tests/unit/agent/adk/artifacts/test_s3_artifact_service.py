@@ -500,6 +500,254 @@ class TestS3ArtifactServiceLoadArtifact:
         )
 
 
+
+class TestS3ArtifactServiceLoadArtifactRange:
+    """Tests for load_artifact_range method"""
+
+    @pytest.mark.asyncio
+    async def test_load_artifact_range_uses_range_header(self, mock_s3_client):
+        """Test that ranged reads send a Range header and parse the total size"""
+        service = S3ArtifactService("test-bucket", s3_client=mock_s3_client)
+        mock_s3_client.get_object.return_value = {
+            'Body': Mock(read=Mock(return_value=b"Hello")),
+            'ContentType': 'text/plain',
+            'ContentRange': 'bytes 0-4/13',
+        }
+
+        result = await service.load_artifact_range(
+            app_name="test_app",
+            user_id="user1",
+            session_id="session1",
+            filename="test.txt",
+            version=2,
+            offset=0,
+            length=5,
+        )
+
+        assert result == (b"Hello", 13, "text/plain")
+        mock_s3_client.get_object.assert_called_once_with(
+            Bucket='test-bucket',
+            Key='test_app/user1/session1/test.txt/2',
+            Range='bytes=0-4',
+        )
+
+    @pytest.mark.asyncio
+    async def test_load_artifact_range_suffix(self, mock_s3_client):
+        """Test that a negative offset requests a suffix range"""
+        service = S3ArtifactService("test-bucket", s3_client=mock_s3_client)
+        mock_s3_client.get_object.return_value = {
+            'Body': Mock(read=Mock(return_value=b"World!")),
+            'ContentType': 'text/plain',
+            'ContentRange': 'bytes 7-12/13',
+        }
+
+        result = await service.load_artifact_range(
+            app_name="test_app",
+            user_id="user1",
+            session_id="session1",
+            filename="test.txt",
+            version=0,
+            offset=-6,
+        )
+
+        assert result == (b"World!", 13, "text/plain")
+        assert mock_s3_client.get_object.call_args.kwargs['Range'] == 'bytes=-6'
+
+    @pytest.mark.asyncio
+    async def test_load_artifact_range_past_end(self, mock_s3_client):
+        """Test that a range past the end of the object reads nothing"""
+        service = S3ArtifactService("test-bucket", s3_client=mock_s3_client)
+        mock_s3_client.get_object.side_effect = ClientError(
+            {'Error': {'Code': 'InvalidRange'}}, 'GetObject'
+        )
+        mock_s3_client.head_object.return_value = {
+            'ContentLength': 13,
+            'ContentType': 'text/plain',
+        }
+
+        result = await service.load_artifact_range(
+            app_name="test_app",
+            user_id="user1",
+            session_id="session1",
+            filename="test.txt",
+            version=0,
+            offset=13,
+            length=5,
+        )
+
+        assert result == (b"", 13, "text/plain")
+
+    @pytest.mark.asyncio
+    async def test_load_artifact_range_not_found(self, mock_s3_client):
+        """Test ranged read of a missing object"""
+        service = S3ArtifactService("test-bucket", s3_client=mock_s3_client)
+        mock_s3_client.get_object.side_effect = ClientError(
+            {'Error': {'Code': 'NoSuchKey'}}, 'GetObject'
+        )
+
+        result = await service.load_artifact_range(
+            app_name="test_app",
+            user_id="user1",
+            session_id="session1",
+            filename="test.txt",
+            version=0,
+            offset=0,
+            length=5,
+        )
+
+        assert result is None
+
+
+class TestS3ArtifactServiceCopyArtifact:
+    """Tests for copy_artifact method"""
+
+    @pytest.mark.asyncio
+    async def test_copy_artifact_uses_copy_object(self, mock_s3_client):
+        """Test that content is copied inside the bucket to the next version"""
+        service = S3ArtifactService("test-bucket", s3_client=mock_s3_client)
+        mock_s3_client.head_object.return_value = {
+            'ContentType': 'text/plain',
+            'ContentLength': 13,
+            'Metadata': {},
+        }
+
+        with patch.object(service, 'list_versions', side_effect=[[0, 1], [0]]):
+            version = await service.copy_artifact(
+                app_name="test_app",
+                source_user_id="owner",
+                source_session_id="project-1",
+                source_filename="test.txt",
+                user_id="user1",
+                session_id="session1",
+            )
+
+        assert version == 1
+        call_kwargs = mock_s3_client.copy_object.call_args.kwargs
+        assert call_kwargs['Key'] == 'test_app/user1/session1/test.txt/1'
+        assert call_kwargs['CopySource'] == {
+            'Bucket': 'test-bucket',
+            'Key': 'test_app/owner/project-1/test.txt/1',
+        }
+        assert call_kwargs['ContentType'] == 'text/plain'
+        assert call_kwargs['MetadataDirective'] == 'REPLACE'
+        assert call_kwargs['Metadata']['session_id'] == 'session1'
+        mock_s3_client.get_object.assert_not_called()
+        mock_s3_client.put_object.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_copy_artifact_reference_writes_empty_object(self, mock_s3_client):
+        """Test that reference mode writes an empty object pointing at the source"""
+        service = S3ArtifactService("test-bucket", s3_client=mock_s3_client)
+        mock_s3_client.head_object.return_value = {
+            'ContentType': 'text/plain',
+            'ContentLength': 13,
+            'Metadata': {},
+        }
+
+        with patch.object(service, 'list_versions', return_value=[]):
+            version = await service.copy_artifact(
+                app_name="test_app",
+                source_user_id="owner",
+                source_session_id="project-1",
+                source_filename="年.txt",
+                source_version=3,
+                user_id="user1",
+                session_id="session1",
+                reference=True,
+            )
+
+        assert version == 0
+        mock_s3_client.copy_object.assert_not_called()
+        call_kwargs = mock_s3_client.put_object.call_args.kwargs
+        assert call_kwargs['Body'] == b""
+        assert call_kwargs['Metadata']['reference_key'] == (
+            'test_app/owner/project-1/%E5%B9%B4.txt/3'
+        )
+
+    @pytest.mark.asyncio
+    async def test_copy_artifact_missing_source(self, mock_s3_client):
+        """Test copying a version that does not exist"""
+        service = S3ArtifactService("test-bucket", s3_client=mock_s3_client)
+        mock_s3_client.head_object.side_effect = ClientError(
+            {'Error': {'Code': '404'}}, 'HeadObject'
+        )
+
+        version = await service.copy_artifact(
+            app_name="test_app",
+            source_user_id="owner",
+            source_session_id="project-1",
+            source_filename="test.txt",
+            source_version=0,
+            user_id="user1",
+            session_id="session1",
+        )
+
+        assert version is None
+        mock_s3_client.copy_object.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_load_artifact_follows_reference(self, mock_s3_client):
+        """Test that loading a reference returns the referenced content"""
+        service = S3ArtifactService("test-bucket", s3_client=mock_s3_client)
+        mock_s3_client.get_object.side_effect = [
+            {
+                'Body': Mock(read=Mock(return_value=b"")),
+                'ContentType': 'text/plain',
+                'Metadata': {'reference_key': 'test_app/owner/project-1/test.txt/3'},
+            },
+            {
+                'Body': Mock(read=Mock(return_value=b"project data")),
+                'ContentType': 'text/plain',
+            },
+        ]
+
+        result = await service.load_artifact(
+            app_name="test_app",
+            user_id="user1",
+            session_id="session1",
+            filename="test.txt",
+            version=0,
+        )
+
+        assert result.inline_data.data == b"project data"
+        assert mock_s3_client.get_object.call_args.kwargs['Key'] == (
+            'test_app/owner/project-1/test.txt/3'
+        )
+
+    @pytest.mark.asyncio
+    async def test_load_artifact_range_follows_reference(self, mock_s3_client):
+        """Test that ranged reads of a reference read the referenced object"""
+        service = S3ArtifactService("test-bucket", s3_client=mock_s3_client)
+        mock_s3_client.get_object.side_effect = [
+            ClientError({'Error': {'Code': 'InvalidRange'}}, 'GetObject'),
+            {
+                'Body': Mock(read=Mock(return_value=b"Hello")),
+                'ContentType': 'text/plain',
+                'ContentRange': 'bytes 0-4/13',
+            },
+        ]
+        mock_s3_client.head_object.return_value = {
+            'ContentLength': 0,
+            'ContentType': 'text/plain',
+            'Metadata': {'reference_key': 'test_app/owner/project-1/test.txt/3'},
+        }
+
+        result = await service.load_artifact_range(
+            app_name="test_app",
+            user_id="user1",
+            session_id="session1",
+            filename="test.txt",
+            version=0,
+            offset=0,
+            length=5,
+        )
+
+        assert result == (b"Hello", 13, "text/plain")
+        assert mock_s3_client.get_object.call_args.kwargs['Key'] == (
+            'test_app/owner/project-1/test.txt/3'
+        )
+
+
 class TestS3ArtifactServiceListArtifactKeys:
     """Tests for list_artifact_keys method"""
 
@@ -0,0 +1,128 @@
+"""Unit tests for assembling streamed tool-call arguments in LiteLlm."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from google.adk.models.llm_request import LlmRequest
+from google.genai.types import Content, GenerateContentConfig, Part
+
+from solace_agent_mesh.agent.adk.models.lite_llm import LiteLlm, _StreamedToolArgs
+
+
+def append_all(chunks):
+    buffer = _StreamedToolArgs()
+    return [buffer.append(chunk) for chunk in chunks], buffer
+
+
+class TestStreamedToolArgs:
+    """Completeness must match what json.loads accepts for the whole buffer."""
+
+    def test_object_completes_on_final_brace(self):
+        results, buffer = append_all(['{"path": "a.csv", ', '"rows": [1, ', "[2]]", "}"])
+
+        assert results == [False, False, False, True]
+        assert json.loads(buffer.text) == {"path": "a.csv", "rows": [1, [2]]}
+
+    def test_brackets_and_escapes_inside_strings_are_ignored(self):
+        results, _ = append_all(['{"csv": "a,{b}', "\\", '"]', '\\\\"', "}"])
+
+        assert results == [False, False, False, False, True]
+
+    def test_trailing_whitespace_keeps_buffer_complete(self):
+        results, _ = append_all(["{}", " \n"])
+
+        assert results == [True, True]
+
+    def test_content_after_a_complete_value_is_invalid(self):
+        results, _ = append_all(["{}", "{", "}"])
+
+        assert results == [True, False, False]
+
+    def test_balanced_but_malformed_json_is_not_complete(self):
+        results, _ = append_all(['{"a": tru', "}", " "])
+
+        assert results == [False, False, False]
+
+    def test_top_level_scalars(self):
+        assert append_all(["12", "3"])[0] == [True, True]
+        assert append_all(['"ab', 'c"'])[0] == [False, True]
+        assert append_all(["tr", "ue"])[0] == [False, True]
+
+
+def tool_call_delta(args, index=None, name=None, call_id=None):
+    return {
+        "choices": [
+            {
+                "delta": {
+                    "tool_calls": [
+                        SimpleNamespace(
+                            type="function",
+                            id=call_id,
+                            index=index,
+                            function=SimpleNamespace(name=name, arguments=args),
+                        )
+                    ]
+                },
+                "finish_reason": None,
+            }
+        ]
+    }
+
+
+def finish(reason="tool_calls"):
+    return {"choices": [{"delta": {"content": None}, "finish_reason": reason}]}
+
+
+async def collect_function_calls(deltas):
+    async def stream():
+        for delta in deltas:
+            yield delta
+
+    request = LlmRequest(
+        contents=[Content(role="user", parts=[Part(text="Save the data")])],
+        config=GenerateContentConfig(),
+    )
+    with patch("solace_agent_mesh.agent.adk.models.lite_llm.acompletion") as mock_acompletion:
+        mock_acompletion.return_value = stream()
+        llm = LiteLlm(model="gpt-4")
+        responses = [r async for r in llm.generate_content_async(request, stream=True)]
+
+    return [
+        part.function_call
+        for response in responses
+        if response.content
+        for part in response.content.parts
+        if part.function_call
+    ]
+
+
+class TestStreamingToolCallAssembly:
+    @pytest.mark.asyncio
+    async def test_arguments_split_across_chunks_are_joined(self):
+        calls = await collect_function_calls(
+            [
+                tool_call_delta('{"filename": "data.csv", ', index=0, name="create_artifact", call_id="c1"),
+                tool_call_delta('"content": "a,b\\n1,2"}', index=0),
+                finish(),
+            ]
+        )
+
+        [call] = calls
+        assert call.name == "create_artifact"
+        assert call.args == {"filename": "data.csv", "content": "a,b\n1,2"}
+
+    @pytest.mark.asyncio
+    async def test_unindexed_chunks_start_a_new_call_after_complete_arguments(self):
+        calls = await collect_function_calls(
+            [
+                tool_call_delta('{"q": ', name="search", call_id="c1"),
+                tool_call_delta('"first"}'),
+                tool_call_delta('{"q": "second"}', name="search", call_id="c2"),
+                finish(),
+            ]
+        )
+
+        assert [call.args for call in calls] == [{"q": "first"}, {"q": "second"}]
+        assert [call.id for call in calls] == ["c1", "c2"]
@@ -83,9 +83,8 @@ class TestSamAgentComponentDeregistration(unittest.TestCase):
             "health_check_interval_seconds": 5
         }
         
-        # Mock the check_ttl_expired method to simulate agent1 being expired
-        self.agent_registry.check_ttl_expired = MagicMock()
-        self.agent_registry.check_ttl_expired.side_effect = lambda agent_name, ttl: (True, 20) if agent_name == "agent1" else (False, 0)
+        # Mock the expiry sweep to simulate agent1 being expired
+        self.agent_registry.get_expired = MagicMock(return_value=[("agent1", 20)])
         
         # Execute
         SamAgentComponent._check_agent_health(self.component)
@@ -153,9 +152,10 @@ class TestSamAgentComponentDeregistration(unittest.TestCase):
         )
         self.agent_registry.add_or_update_agent(own_agent_card)
         
-        # Mock the check_ttl_expired method to simulate all agents being expired
-        self.agent_registry.check_ttl_expired = MagicMock()
-        self.agent_registry.check_ttl_expired.return_value = (True, 20)  # All agents expired
+        # Mock the expiry sweep to simulate all agents being expired
+        self.agent_registry.get_expired = MagicMock(
+            return_value=[(name, 20) for name in self.agent_registry.get_agent_names()]
+        )
         
         # Execute
         SamAgentComponent._check_agent_health(self.component)
@@ -0,0 +1,165 @@
+"""
+Unit tests for the process-pool tool executor and its PythonToolLoader wiring.
+"""
+
+import textwrap
+from unittest.mock import MagicMock
+
+import pytest
+
+from solace_agent_mesh.agent.tools.executors import (
+    ExecutorBasedTool,
+    ProcessToolExecutor,
+    PythonToolLoader,
+    list_executor_types,
+)
+from solace_agent_mesh.agent.tools.executors.base import ToolExecutionResult
+
+TOOL_MODULE = textwrap.dedent(
+    '''
+    import os
+    import time
+
+    def crunch(numbers: list, tool_config: dict = None) -> dict:
+        """Sum numbers in a worker process."""
+        scale = (tool_config or {}).get("scale", 1)
+        return {"total": sum(numbers) * scale, "pid": os.getpid()}
+
+    def slow(seconds: float) -> str:
+        """Sleep for a while."""
+        time.sleep(seconds)
+        return "done"
+
+    def broken(value: str) -> str:
+        """Always fails."""
+        raise RuntimeError("cannot process " + value)
+
+    def reports_error(value: str) -> dict:
+        """Returns an error dict."""
+        return {"status": "error", "message": "bad value", "error_code": "BAD"}
+
+    def needs_context(value: str, tool_context) -> str:
+        """Requires the tool context."""
+        return value
+
+    async def is_async(value: str) -> str:
+        """Async function."""
+        return value
+    '''
+)
+
+
+@pytest.fixture
+def tool_module_path(tmp_path):
+    (tmp_path / "process_tool_module.py").write_text(TOOL_MODULE)
+    return str(tmp_path)
+
+
+@pytest.fixture
+def mock_component():
+    component = MagicMock()
+    component.log_identifier = "[test]"
+    return component
+
+
+async def _load_tool(tool_module_path, mock_component, function_name, **kwargs):
+    loader = PythonToolLoader(
+        module="process_tool_module",
+        function_name=function_name,
+        base_path=tool_module_path,
+        executor={"type": "process", "max_workers": 1, **kwargs.pop("executor", {})},
+        **kwargs,
+    )
+    await loader.initialize(mock_component, {})
+    return loader.get_loaded_tools()[0]
+
+
+def test_process_executor_is_registered():
+    assert "process" in list_executor_types()
+
+
+class TestProcessToolExecutor:
+    async def test_runs_function_out_of_process(self, tool_module_path, mock_component):
+        import os
+
+        tool = await _load_tool(
+            tool_module_path, mock_component, "crunch", tool_config={"scale": 10}
+        )
+        assert isinstance(tool, ExecutorBasedTool)
+        assert isinstance(tool._executor, ProcessToolExecutor)
+
+        await tool.init(mock_component, {})
+        try:
+            result = await tool._executor.execute(
+                args={"numbers": [1, 2, 3]}, tool_context=MagicMock(), tool_config={"scale": 10}
+            )
+        finally:
+            await tool.cleanup(mock_component, {})
+
+        assert result.success
+        assert result.data["total"] == 60
+        assert result.data["pid"] != os.getpid()
+
+    async def test_timeout_returns_failure(self, tool_module_path, mock_component):
+        tool = await _load_tool(
+            tool_module_path, mock_component, "slow", executor={"timeout_seconds": 0.2}
+        )
+        try:
+            result = await tool._executor.execute(
+                args={"seconds": 10}, tool_context=MagicMock(), tool_config={}
+            )
+        finally:
+            await tool.cleanup(mock_component, {})
+
+        assert isinstance(result, ToolExecutionResult)
+        assert not result.success
+        assert result.error_code == "TIMEOUT"
+
+    async def test_exceptions_and_error_dicts_become_failures(
+        self, tool_module_path, mock_component
+    ):
+        broken = await _load_tool(tool_module_path, mock_component, "broken")
+        reports_error = await _load_tool(tool_module_path, mock_component, "reports_error")
+        try:
+            raised = await broken._executor.execute(
+                args={"value": "x"}, tool_context=MagicMock(), tool_config={}
+            )
+            returned = await reports_error._executor.execute(
+                args={"value": "x"}, tool_context=MagicMock(), tool_config={}
+            )
+        finally:
+            await broken.cleanup(mock_component, {})
+            await reports_error.cleanup(mock_component, {})
+
+        assert raised.error_code == "EXECUTION_ERROR"
+        assert "cannot process x" in raised.error
+        assert returned.error_code == "BAD"
+
+
+class TestProcessExecutorValidation:
+    @pytest.mark.parametrize("function_name", ["needs_context", "is_async"])
+    async def test_rejects_functions_that_cannot_run_in_a_process(
+        self, tool_module_path, mock_component, function_name
+    ):
+        with pytest.raises(ValueError, match="process executor"):
+            await _load_tool(tool_module_path, mock_component, function_name)
+
+    async def test_rejects_unknown_executor_type(self, tool_module_path, mock_component):
+        loader = PythonToolLoader(
+            module="process_tool_module",
+            function_name="crunch",
+            base_path=tool_module_path,
+            executor={"type": "gpu"},
+        )
+        with pytest.raises(ValueError, match="Unsupported executor type"):
+            await loader.initialize(mock_component, {})
+
+    async def test_default_executor_is_unchanged(self, tool_module_path, mock_component):
+        loader = PythonToolLoader(
+            module="process_tool_module",
+            function_name="crunch",
+            base_path=tool_module_path,
+        )
+        await loader.initialize(mock_component, {})
+
+        assert loader.get_loaded_tools()[0]._executor.executor_type == "function"
@@ -23,6 +23,7 @@ from solace_agent_mesh.agent.utils.artifact_helpers import (
     _infer_schema,
     _metadata_to_artifact_info,
     save_artifact_with_metadata,
+    copy_artifact_with_metadata,
     process_artifact_upload,
     format_metadata_for_llm,
     decode_and_get_bytes,
@@ -616,6 +617,104 @@ class TestSaveArtifactWithMetadata:
         assert "failed to save metadata" in result["message"]
 
 
+class TestCopyArtifactWithMetadata:
+    """Test the copy_artifact_with_metadata function."""
+
+    async def _save_source(self, service):
+        return await save_artifact_with_metadata(
+            artifact_service=service,
+            app_name="testapp",
+            user_id="owner",
+            session_id="project-1",
+            filename="data.csv",
+            content_bytes=b"a,b\n1,2\n",
+            mime_type="text/csv",
+            metadata_dict={"description": "Source"},
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+
+    async def _load_copy(self, service):
+        content = await load_artifact_content_or_metadata(
+            artifact_service=service,
+            app_name="testapp",
+            user_id="user123",
+            session_id="session456",
+            filename="data.csv",
+            version="latest",
+            return_raw_bytes=True,
+        )
+        metadata = await load_artifact_content_or_metadata(
+            artifact_service=service,
+            app_name="testapp",
+            user_id="user123",
+            session_id="session456",
+            filename="data.csv",
+            version="latest",
+            load_metadata_only=True,
+        )
+        return content["raw_bytes"], metadata["metadata"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("native_copy", [True, False])
+    async def test_copy_preserves_content_and_metadata(self, tmp_path, native_copy):
+        """Test that native and load-and-save copies produce the same artifact."""
+        from solace_agent_mesh.agent.adk.artifacts.filesystem_artifact_service import (
+            FilesystemArtifactService,
+        )
+
+        service = FilesystemArtifactService(str(tmp_path))
+        await self._save_source(service)
+        copy_spy = AsyncMock(wraps=service.copy_artifact)
+        service.copy_artifact = (
+            copy_spy if native_copy else AsyncMock(side_effect=NotImplementedError)
+        )
+
+        result = await copy_artifact_with_metadata(
+            artifact_service=service,
+            app_name="testapp",
+            source_user_id="owner",
+            source_session_id="project-1",
+            user_id="user123",
+            session_id="session456",
+            filename="data.csv",
+            metadata_updates={"project_context_pending": True},
+        )
+
+        assert result["status"] == "success"
+        assert result["data_version"] == 0
+        content, metadata = await self._load_copy(service)
+        assert content == b"a,b\n1,2\n"
+        assert metadata["description"] == "Source"
+        assert metadata["mime_type"] == "text/csv"
+        assert metadata["project_context_pending"] is True
+        assert metadata["schema"]["columns"] == ["a", "b"]
+        assert copy_spy.await_count == (1 if native_copy else 0)
+
+    @pytest.mark.asyncio
+    async def test_copy_missing_source(self):
+        """Test that a missing source artifact is reported as an error."""
+        service = Mock(spec=BaseArtifactService)
+        service.copy_artifact = AsyncMock(return_value=None)
+        service.save_artifact = AsyncMock()
+
+        with patch(
+            "solace_agent_mesh.agent.utils.artifact_helpers.load_artifact_content_or_metadata",
+            AsyncMock(return_value={"status": "success", "metadata": {}}),
+        ):
+            result = await copy_artifact_with_metadata(
+                artifact_service=service,
+                app_name="testapp",
+                source_user_id="owner",
+                source_session_id="project-1",
+                user_id="user123",
+                session_id="session456",
+                filename="gone.txt",
+            )
+
+        assert result["status"] == "error"
+        service.save_artifact.assert_not_called()
+
+
 class TestProcessArtifactUpload:
     """Test the process_artifact_upload function."""
 
@@ -0,0 +1,87 @@
+"""
+Unit tests for cli/commands/artifacts_cmd.py
+"""
+import asyncio
+from datetime import datetime, timezone
+
+import yaml
+from click.testing import CliRunner
+
+from cli.commands.artifacts_cmd import artifacts
+from solace_agent_mesh.agent.adk.artifacts.artifact_catalog import ArtifactCatalog
+from solace_agent_mesh.agent.adk.artifacts.filesystem_artifact_service import (
+    FilesystemArtifactService,
+)
+from solace_agent_mesh.agent.utils.artifact_helpers import save_artifact_with_metadata
+
+
+def _write_config(tmp_path, catalog_url, app_name="my-agent"):
+    config = {
+        "apps": [
+            {
+                "name": app_name,
+                "app_config": {
+                    "namespace": "ns",
+                    "agent_name": "MyAgent",
+                    "artifact_service": {
+                        "type": "filesystem",
+                        "base_path": str(tmp_path / "artifacts"),
+                    },
+                },
+            }
+        ]
+    }
+    if catalog_url:
+        artifact_service = config["apps"][0]["app_config"]["artifact_service"]
+        artifact_service["catalog"] = {"database_url": catalog_url}
+    path = tmp_path / "agent.yaml"
+    path.write_text(yaml.safe_dump(config))
+    return str(path)
+
+
+def test_reconcile_backfills_sessions(tmp_path):
+    catalog_url = f"sqlite:///{tmp_path / 'catalog.db'}"
+    config_path = _write_config(tmp_path, catalog_url)
+    asyncio.run(
+        save_artifact_with_metadata(
+            artifact_service=FilesystemArtifactService(str(tmp_path / "artifacts")),
+            app_name="ns",
+            user_id="u1",
+            session_id="s1",
+            filename="a.txt",
+            content_bytes=b"hello",
+            mime_type="text/plain",
+            metadata_dict={},
+            timestamp=datetime.now(timezone.utc),
+        )
+    )
+
+    result = CliRunner().invoke(
+        artifacts, ["reconcile", config_path, "--app", "my-agent", "--session", "u1/s1"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "1 artifacts cataloged" in result.output
+    catalog = ArtifactCatalog.from_config({"database_url": catalog_url})
+    [entry] = catalog.list_session("ns", "u1", "s1")
+    assert (entry.filename, entry.size_bytes) == ("a.txt", 5)
+
+
+def test_reconcile_requires_a_catalog(tmp_path):
+    config_path = _write_config(tmp_path, None)
+
+    result = CliRunner().invoke(
+        artifacts, ["reconcile", config_path, "--app", "my-agent"]
+    )
+
+    assert result.exit_code != 0
+    assert "no artifact_service.catalog" in result.output
+
+
+def test_reconcile_rejects_unknown_app(tmp_path):
+    config_path = _write_config(tmp_path, "sqlite://")
+
+    result = CliRunner().invoke(artifacts, ["reconcile", config_path, "--app", "missing"])
+
+    assert result.exit_code != 0
+    assert "not found" in result.output
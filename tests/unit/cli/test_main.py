@@ -147,16 +147,21 @@ class TestCommandRegistration:
         assert 'task' in cli.commands
         assert cli.commands['task'] is not None
 
+    def test_artifacts_command_registered(self):
+        """Test that artifacts command is registered"""
+        assert 'artifacts' in cli.commands
+        assert cli.commands['artifacts'] is not None
+
     def test_all_expected_commands_registered(self):
         """Test that all expected commands are registered"""
-        expected_commands = ['add', 'docs', 'eval', 'init', 'plugin', 'run', 'task', 'tools']
+        expected_commands = ['add', 'artifacts', 'docs', 'eval', 'init', 'plugin', 'run', 'task', 'tools']
         for cmd in expected_commands:
             assert cmd in cli.commands, f"Command '{cmd}' not registered"
 
     def test_command_count(self):
         """Test that the expected number of commands are registered"""
-        # Should have exactly 8 commands
-        assert len(cli.commands) == 8
+        # Should have exactly 9 commands
+        assert len(cli.commands) == 9
 
 
 class TestHelpText:
@@ -6,10 +6,11 @@ Tests the BaseRegistry base class for managing discovered A2A entities.
 import pytest
 import time
 import threading
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from a2a.types import AgentCard, AgentSkill
 
 from solace_agent_mesh.common.base_registry import BaseRegistry
+from solace_agent_mesh.common.constants import EXTENSION_URI_TOOLS
 
 
 @pytest.fixture
@@ -416,6 +417,117 @@ class TestBaseRegistryCallbacks:
         assert len(removed_entities) == 1
 
 
+class TestBaseRegistryGeneration:
+    """Test the generation counter that registry-derived caches key on."""
+
+    def test_add_and_remove_bump_generation(self, base_registry, sample_card):
+        assert base_registry.generation == 0
+        base_registry.add_or_update(sample_card)
+        assert base_registry.generation == 1
+        base_registry.remove(sample_card.name)
+        assert base_registry.generation == 2
+
+    def test_unchanged_heartbeat_keeps_generation(self, base_registry, sample_card):
+        base_registry.add_or_update(sample_card)
+        base_registry.add_or_update(sample_card.model_copy(deep=True))
+        assert base_registry.generation == 1
+
+    def test_changed_card_bumps_generation(self, base_registry, sample_card):
+        base_registry.add_or_update(sample_card)
+        base_registry.add_or_update(sample_card.model_copy(update={"version": "2.0.0"}))
+        assert base_registry.generation == 2
+
+    def test_clear_and_noop_remove(self, base_registry, sample_card):
+        base_registry.clear()
+        base_registry.remove("missing")
+        assert base_registry.generation == 0
+        base_registry.add_or_update(sample_card)
+        base_registry.clear()
+        assert base_registry.generation == 2
+
+
+def _card(name, skills=(), tools=None):
+    extensions = []
+    if tools is not None:
+        extensions.append(
+            {"uri": EXTENSION_URI_TOOLS, "params": {"tools": [{"name": t} for t in tools]}}
+        )
+    return AgentCard(
+        name=name,
+        description=name,
+        url=f"https://{name}.example.com",
+        version="1.0.0",
+        capabilities={"extensions": extensions},
+        defaultInputModes=["text/plain"],
+        defaultOutputModes=["text/plain"],
+        skills=[
+            AgentSkill(id=skill_id, name=skill_id.title(), description="", tags=list(tags))
+            for skill_id, tags in skills
+        ],
+    )
+
+
+class TestBaseRegistryExpiry:
+    """Test the heap-based TTL sweep."""
+
+    def test_reports_only_expired_entities(self, base_registry):
+        with patch("solace_agent_mesh.common.base_registry.time.time", return_value=1000.0):
+            base_registry.add_or_update(_card("old"))
+        with patch("solace_agent_mesh.common.base_registry.time.time", return_value=1050.0):
+            base_registry.add_or_update(_card("fresh"))
+
+        with patch("solace_agent_mesh.common.base_registry.time.time", return_value=1070.0):
+            assert base_registry.get_expired(60) == [("old", 70)]
+            # Still registered, so it is reported again
+            assert base_registry.get_expired(60) == [("old", 70)]
+
+    def test_heartbeat_and_removal_supersede_heap_entries(self, base_registry):
+        with patch("solace_agent_mesh.common.base_registry.time.time", return_value=1000.0):
+            base_registry.add_or_update(_card("a"))
+            base_registry.add_or_update(_card("b"))
+        with patch("solace_agent_mesh.common.base_registry.time.time", return_value=1100.0):
+            base_registry.add_or_update(_card("a"))
+        base_registry.remove("b")
+
+        with patch("solace_agent_mesh.common.base_registry.time.time", return_value=1120.0):
+            assert base_registry.get_expired(60) == []
+
+    def test_heap_stays_bounded(self, base_registry):
+        card = _card("a")
+        for _ in range(1000):
+            base_registry.add_or_update(card)
+        assert len(base_registry._expiry_heap) <= 4 * len(base_registry) + 65
+
+
+class TestBaseRegistryCapabilityIndex:
+    """Test lookups by skill, tag, tool and extension."""
+
+    def test_lookups(self, base_registry):
+        base_registry.add_or_update(
+            _card("a", skills=[("search", ["web"])], tools=["fetch_url"])
+        )
+        base_registry.add_or_update(_card("b", skills=[("summarize", ["web", "text"])]))
+
+        assert base_registry.find_by_skill("search") == ["a"]
+        assert base_registry.find_by_skill("Summarize") == ["b"]
+        assert base_registry.find_by_tag("web") == ["a", "b"]
+        assert base_registry.find_by_tool("fetch_url") == ["a"]
+        assert base_registry.find_by_extension(EXTENSION_URI_TOOLS) == ["a"]
+        assert base_registry.find_by_tag("missing") == []
+
+    def test_updates_and_removals_reindex(self, base_registry):
+        base_registry.add_or_update(_card("a", skills=[("search", ["web"])]))
+        base_registry.add_or_update(_card("a", skills=[("translate", [])]))
+
+        assert base_registry.find_by_skill("search") == []
+        assert base_registry.find_by_tag("web") == []
+        assert base_registry.find_by_skill("translate") == ["a"]
+
+        base_registry.remove("a")
+        assert base_registry.find_by_skill("translate") == []
+        assert base_registry._capability_index == {}
+
+
 class TestBaseRegistryEntityName:
     """Test entity name customization for logging."""
 
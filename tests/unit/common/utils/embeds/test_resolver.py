@@ -0,0 +1,157 @@
+"""
+Unit tests for common/utils/embeds/resolver.py
+Tests concurrent embed resolution and the per-pass artifact memo.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from solace_agent_mesh.common.utils.embeds import (
+    LATE_EMBED_TYPES,
+    evaluate_embed,
+    resolve_embeds_in_string,
+)
+from solace_agent_mesh.common.utils.embeds.types import ResolutionMode
+
+
+def _artifact_context(files):
+    """Context whose artifact service serves {filename: {version: bytes}}."""
+
+    async def list_versions(app_name, user_id, session_id, filename):
+        await asyncio.sleep(0.01)
+        return sorted(files.get(filename, {}))
+
+    async def load_artifact(app_name, user_id, session_id, filename, version):
+        await asyncio.sleep(0.01)
+        part = MagicMock()
+        part.inline_data.data = files[filename][version]
+        part.inline_data.mime_type = "text/plain"
+        return part
+
+    service = MagicMock()
+    service.list_versions = AsyncMock(side_effect=list_versions)
+    service.load_artifact = AsyncMock(side_effect=load_artifact)
+    return {
+        "artifact_service": service,
+        "session_context": {"app_name": "app", "user_id": "u", "session_id": "s"},
+    }
+
+
+class TestConcurrentResolution:
+    async def test_output_order_is_preserved(self):
+        delays = {"a": 0.05, "b": 0.0, "c": 0.02}
+        running = 0
+        peak = 0
+
+        async def resolver(embed_type, expression, *args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(delays[expression])
+            running -= 1
+            return expression.upper(), None, 1
+
+        text, processed, signals = await resolve_embeds_in_string(
+            "1«math:a» 2«math:b» 3«math:c» «uuid:skip»",
+            {},
+            resolver,
+            {"math"},
+            ResolutionMode.A2A_MESSAGE_TO_USER,
+        )
+
+        assert text == "1A 2B 3C «uuid:skip»"
+        assert peak == 3
+        assert signals == []
+
+    async def test_concurrency_is_bounded(self):
+        running = 0
+        peak = 0
+
+        async def resolver(*args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "x", None, 1
+
+        await resolve_embeds_in_string(
+            "«math:1»" * 6,
+            {},
+            resolver,
+            {"math"},
+            ResolutionMode.A2A_MESSAGE_TO_USER,
+            config={"embed_resolution_concurrency": 2},
+        )
+
+        assert peak == 2
+
+    async def test_signals_and_buffering_are_unchanged(self):
+        text, processed, signals = await resolve_embeds_in_string(
+            "a«status_update:working»b«math:1+1» tail «artifact_",
+            {},
+            evaluate_embed,
+            {"status_update", "math"},
+            ResolutionMode.A2A_MESSAGE_TO_USER,
+        )
+
+        assert len(signals) == 1
+        start, signal, placeholder = signals[0]
+        assert start == 1
+        assert signal == (None, "SIGNAL_STATUS_UPDATE", "working")
+        assert text == f"a{placeholder}b2 tail "
+        assert processed == len("a«status_update:working»b«math:1+1» tail ")
+
+    async def test_errors_propagate(self):
+        async def resolver(embed_type, expression, *args):
+            if expression == "bad":
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.01)
+            return "x", None, 1
+
+        with pytest.raises(RuntimeError):
+            await resolve_embeds_in_string(
+                "«math:ok»«math:bad»",
+                {},
+                resolver,
+                {"math"},
+                ResolutionMode.A2A_MESSAGE_TO_USER,
+            )
+
+
+class TestArtifactMemo:
+    async def test_repeated_artifact_is_loaded_once(self):
+        context = _artifact_context({"data.txt": {0: b"old", 1: b"new"}})
+        service = context["artifact_service"]
+
+        text, _, _ = await resolve_embeds_in_string(
+            "«artifact_content:data.txt» «artifact_content:data.txt» "
+            "«artifact_content:data.txt:1» «artifact_content:data.txt:0»",
+            context,
+            evaluate_embed,
+            LATE_EMBED_TYPES,
+            ResolutionMode.TOOL_PARAMETER,
+            config={},
+        )
+
+        assert text == "new new new old"
+        assert service.list_versions.await_count == 1
+        assert service.load_artifact.await_count == 2
+
+    async def test_memo_does_not_outlive_the_pass(self):
+        context = _artifact_context({"data.txt": {0: b"v0"}})
+        service = context["artifact_service"]
+
+        for _ in range(2):
+            await resolve_embeds_in_string(
+                "«artifact_content:data.txt»",
+                context,
+                evaluate_embed,
+                LATE_EMBED_TYPES,
+                ResolutionMode.TOOL_PARAMETER,
+                config={},
+            )
+
+        assert service.load_artifact.await_count == 2
+        assert set(context) == {"artifact_service", "session_context"}
@@ -0,0 +1,199 @@
+"""
+Unit tests for common/utils/embeds/streaming.py
+Tests that streamed modifier prefixes match the materialized chain while
+reading only the parts of the artifact they need.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from solace_agent_mesh.common.utils.embeds import (
+    LATE_EMBED_TYPES,
+    evaluate_embed,
+    resolve_embeds_in_string,
+)
+from solace_agent_mesh.common.utils.embeds.types import ResolutionMode
+
+LOG_LINES = "".join(f"{i} {'error' if i % 7 == 0 else 'info'} event\r\n" for i in range(2000))
+CSV_ROWS = "id,name,group\n" + "".join(
+    f'{i},"name\n{i}",{i % 3}\n' for i in range(500)
+)
+
+
+def _artifact_context(data: bytes, mime_type: str, ranged: bool = True):
+    """Context serving one artifact; records every read made through the service."""
+    reads = []
+
+    async def list_versions(**kwargs):
+        return [0]
+
+    async def load_artifact(**kwargs):
+        reads.append("full")
+        part = MagicMock()
+        part.inline_data.data = data
+        part.inline_data.mime_type = mime_type
+        return part
+
+    async def load_artifact_range(*, offset, length=None, **kwargs):
+        reads.append((offset, length))
+        if offset < 0:
+            return data[offset:], len(data), mime_type
+        return data[offset : None if length is None else offset + length], len(data), mime_type
+
+    methods = ["list_versions", "load_artifact"]
+    if ranged:
+        methods.append("load_artifact_range")
+    service = MagicMock(spec=methods)
+    service.list_versions = AsyncMock(side_effect=list_versions)
+    service.load_artifact = AsyncMock(side_effect=load_artifact)
+    if ranged:
+        service.load_artifact_range = AsyncMock(side_effect=load_artifact_range)
+    context = {
+        "artifact_service": service,
+        "session_context": {"app_name": "app", "user_id": "u", "session_id": "s"},
+    }
+    return context, reads
+
+
+async def _resolve(chain, data, mime_type, ranged=True, streaming=True, **config):
+    context, reads = _artifact_context(data, mime_type, ranged)
+    config.setdefault("embed_stream_chunk_bytes", 256)
+    embed = f"«artifact_content:data{chain}»"
+    if streaming:
+        text, _, _ = await resolve_embeds_in_string(
+            embed, context, evaluate_embed, LATE_EMBED_TYPES,
+            ResolutionMode.TOOL_PARAMETER, config=config,
+        )
+    else:
+        with patch(
+            "solace_agent_mesh.common.utils.embeds.resolver.stream_modifier_prefix",
+            AsyncMock(return_value=None),
+        ):
+            text, _, _ = await resolve_embeds_in_string(
+                embed, context, evaluate_embed, LATE_EMBED_TYPES,
+                ResolutionMode.TOOL_PARAMETER, config=config,
+            )
+    return text, reads
+
+
+@pytest.mark.parametrize(
+    "chain",
+    [
+        " >>> head:5 >>> format:text",
+        " >>> head:0 >>> format:text",
+        " >>> tail:3 >>> format:text",
+        " >>> slice_lines:10:13 >>> format:text",
+        " >>> grep:error >>> head:4 >>> format:text",
+        " >>> grep:error >>> tail:2 >>> format:text",
+        " >>> head:50 >>> grep:^4 >>> format:text",
+        " >>> slice_lines:-3: >>> format:text",
+    ],
+)
+async def test_text_chains_match_materialized(chain):
+    data = LOG_LINES.encode()
+    streamed, _ = await _resolve(chain, data, "text/plain")
+    materialized, _ = await _resolve(chain, data, "text/plain", streaming=False)
+    assert streamed == materialized
+
+
+@pytest.mark.parametrize(
+    "chain",
+    [
+        " >>> slice_rows:0:3 >>> format:json",
+        " >>> filter_rows_eq:group:1 >>> slice_rows:2:4 >>> select_cols:id,name >>> format:json",
+        " >>> select_cols:id >>> slice_rows:0:2 >>> format:csv",
+        " >>> select_cols:missing >>> format:json",
+    ],
+)
+async def test_csv_chains_match_materialized(chain):
+    data = CSV_ROWS.encode()
+    streamed, _ = await _resolve(chain, data, "text/csv")
+    materialized, _ = await _resolve(chain, data, "text/csv", streaming=False)
+    assert streamed == materialized
+
+
+class TestPushdown:
+    async def test_head_reads_only_the_first_chunk(self):
+        text, reads = await _resolve(" >>> head:2 >>> format:text", LOG_LINES.encode(), "text/plain")
+
+        assert text == "0 error event\r\n1 info event\r\n"
+        assert reads == [(0, 256)]
+
+    async def test_tail_reads_from_the_end(self):
+        data = LOG_LINES.encode()
+        text, reads = await _resolve(" >>> tail:1 >>> format:text", data, "text/plain")
+
+        assert text == "1999 info event\r\n"
+        assert reads == [(-256, 256)]
+
+    async def test_multibyte_characters_across_chunks(self):
+        data = ("é" * 300 + "\n" + "ü" * 300 + "\n").encode()
+        head, _ = await _resolve(" >>> head:1 >>> format:text", data, "text/plain")
+        tail, _ = await _resolve(" >>> tail:1 >>> format:text", data, "text/plain")
+
+        assert head == "é" * 300 + "\n"
+        assert tail == "ü" * 300 + "\n"
+
+    async def test_scans_without_ranged_reads(self):
+        text, reads = await _resolve(
+            " >>> head:1 >>> format:text", LOG_LINES.encode(), "text/plain", ranged=False
+        )
+
+        assert text == "0 error event\r\n"
+        assert reads == ["full"]
+
+    async def test_size_limit_applies_to_bytes_read(self):
+        data = LOG_LINES.encode()
+        head, _ = await _resolve(
+            " >>> head:2 >>> format:text", data, "text/plain",
+            gateway_max_artifact_resolve_size_bytes=100,
+        )
+        grep, _ = await _resolve(
+            " >>> grep:error >>> format:text", data, "text/plain",
+            gateway_max_artifact_resolve_size_bytes=100,
+        )
+
+        assert head == "0 error event\r\n1 info event\r\n"
+        assert "exceeds maximum size limit" in grep
+
+
+class TestFallback:
+    async def test_embeds_in_consumed_lines_are_resolved(self):
+        data = b"total: \xc2\xabmath:1+1\xc2\xbb\nsecond\n"
+        text, reads = await _resolve(" >>> head:1 >>> format:text", data, "text/plain")
+
+        assert text == "total: 2\n"
+        assert "full" in reads
+
+    async def test_json_is_materialized(self):
+        data = b'{"a": [1, 2]}\n'
+        text, reads = await _resolve(" >>> head:1 >>> format:text", data, "application/json")
+        materialized, _ = await _resolve(
+            " >>> head:1 >>> format:text", data, "application/json", streaming=False
+        )
+
+        assert text == materialized
+        assert "full" in reads
+
+    async def test_invalid_arguments_report_the_modifier_error(self):
+        text, _ = await _resolve(" >>> head:-1 >>> format:text", b"a\n", "text/plain")
+
+        assert "Head count N cannot be negative" in text
+
+    @pytest.mark.parametrize("ranged", [True, False])
+    async def test_storage_errors_are_reported_inline(self, ranged):
+        context, _ = _artifact_context(b"a\nb\nc\n", "text/plain", ranged)
+        context["artifact_service"].load_artifact.side_effect = OSError("S3 down")
+        if ranged:
+            context["artifact_service"].load_artifact_range.side_effect = OSError("S3 down")
+
+        text, _, _ = await resolve_embeds_in_string(
+            "«artifact_content:data >>> head:2» and «artifact_content:data»",
+            context, evaluate_embed, LATE_EMBED_TYPES,
+            ResolutionMode.TOOL_PARAMETER, config={},
+        )
+
+        streamed_error, plain_error = text.split(" and ")
+        assert streamed_error.startswith("[Error loading artifact 'data'")
+        assert "S3 down" in streamed_error
+        assert streamed_error == plain_error
@@ -0,0 +1,139 @@
+"""
+Unit tests for common/utils/embeds/tabular.py
+Tests that tabular modifier chains executed on a columnar table produce the
+same output as the row-oriented modifiers, and that CSV the row parser would
+read differently stays on the row path.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from solace_agent_mesh.common.utils.embeds import (
+    LATE_EMBED_TYPES,
+    evaluate_embed,
+    resolve_embeds_in_string,
+)
+from solace_agent_mesh.common.utils.embeds.tabular import (
+    apply_table_modifier,
+    parse_csv_table,
+    table_to_csv_string,
+    table_to_rows,
+)
+from solace_agent_mesh.common.utils.embeds.types import ResolutionMode
+
+QUOTED_NOTE = '"quoted ""x"""'
+CSV_ROWS = "id,name,group,note\r\n" + "".join(
+    f'{i},"name, {i}",{i % 3},{QUOTED_NOTE if i % 5 == 0 else "plain"}\r\n'
+    for i in range(200)
+)
+
+
+def _artifact_context(data: bytes, mime_type: str):
+    async def load_artifact(**kwargs):
+        part = MagicMock()
+        part.inline_data.data = data
+        part.inline_data.mime_type = mime_type
+        return part
+
+    service = MagicMock(spec=["list_versions", "load_artifact"])
+    service.list_versions = AsyncMock(return_value=[0])
+    service.load_artifact = AsyncMock(side_effect=load_artifact)
+    return {
+        "artifact_service": service,
+        "session_context": {"app_name": "app", "user_id": "u", "session_id": "s"},
+    }
+
+
+async def _resolve(chain, data, columnar):
+    config = {"embed_columnar_min_bytes": 0 if columnar else -1}
+    with patch(
+        "solace_agent_mesh.common.utils.embeds.resolver.stream_modifier_prefix",
+        AsyncMock(return_value=None),
+    ), patch(
+        "solace_agent_mesh.common.utils.embeds.resolver.parse_csv_table",
+        wraps=parse_csv_table,
+    ) as parse:
+        text, _, _ = await resolve_embeds_in_string(
+            f"«artifact_content:data.csv{chain}»",
+            _artifact_context(data, "text/csv"),
+            evaluate_embed,
+            LATE_EMBED_TYPES,
+            ResolutionMode.TOOL_PARAMETER,
+            config=config,
+        )
+    return text, parse.call_count > 0
+
+
+@pytest.mark.parametrize(
+    "chain",
+    [
+        " >>> filter_rows_eq:group:1 >>> format:json",
+        " >>> filter_rows_eq:group:2 >>> select_cols:note,id >>> format:csv",
+        " >>> select_cols:id,name,id >>> slice_rows:5:9 >>> format:json_pretty",
+        " >>> select_fields:name,missing >>> slice_rows:-3: >>> format:csv",
+        " >>> select_fields:missing >>> format:json",
+        " >>> slice_rows:10:12 >>> format:text",
+        " >>> filter_rows_eq:group:9 >>> format:csv",
+        " >>> filter_rows_eq:group:0 >>> jsonpath:$[0].name >>> format:json",
+        " >>> select_cols:missing >>> format:json",
+        " >>> filter_rows_eq:group >>> format:json",
+        " >>> slice_rows:a:b >>> format:json",
+    ],
+)
+async def test_columnar_chains_match_row_chains(chain):
+    data = CSV_ROWS.encode()
+    columnar, parsed = await _resolve(chain, data, columnar=True)
+    rows, _ = await _resolve(chain, data, columnar=False)
+
+    assert parsed
+    assert columnar == rows
+
+
+async def test_chain_not_starting_with_a_tabular_modifier_uses_rows():
+    _, parsed = await _resolve(" >>> jsonpath:$[0] >>> format:json", CSV_ROWS.encode(), True)
+
+    assert not parsed
+
+
+class TestParseCsvTable:
+    def test_round_trips_rows_and_csv(self):
+        table = parse_csv_table(CSV_ROWS)
+
+        assert table_to_rows(table)[5] == {
+            "id": "5",
+            "name": "name, 5",
+            "group": "2",
+            "note": 'quoted "x"',
+        }
+        assert table_to_csv_string(table) == CSV_ROWS.rstrip("\r\n")
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "a,b\n1\n",  # short row
+            "a,b\n1,2,3\n",  # extra field
+            "a,a\n1,2\n",  # duplicate header
+            "﻿a,b\n1,2\n",  # BOM
+            "a,b\n1,2\n  \n",  # whitespace-only line
+            "",
+        ],
+    )
+    def test_returns_none_when_rows_would_differ(self, text):
+        assert parse_csv_table(text) is None
+
+
+class TestApplyTableModifier:
+    def test_returns_none_for_arguments_the_row_modifier_rejects(self):
+        table = parse_csv_table(CSV_ROWS)
+
+        assert apply_table_modifier(table, "select_cols", "id,missing") is None
+        assert apply_table_modifier(table, "filter_rows_eq", "group") is None
+        assert apply_table_modifier(table, "slice_rows", "3") is None
+        assert apply_table_modifier(table, "grep", "x") is None
+
+    def test_empty_table_passes_through(self):
+        table = parse_csv_table(CSV_ROWS)
+        empty = apply_table_modifier(table, "filter_rows_eq", "group:9")
+
+        assert apply_table_modifier(empty, "select_cols", "missing") is empty
+        assert table_to_rows(empty) == []
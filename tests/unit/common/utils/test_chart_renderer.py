@@ -0,0 +1,97 @@
+"""
+Unit tests for common/utils/chart_renderer.py
+Tests rendering Plotly figures in the warm Kaleido worker pool.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("plotly")
+pytest.importorskip("kaleido")
+
+from solace_agent_mesh.common.utils.chart_renderer import (
+    ChartRenderError,
+    ChartRenderer,
+    get_chart_renderer,
+)
+
+BAR_FIGURE = {"data": [{"type": "bar", "x": ["a", "b"], "y": [1, 2]}]}
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.fixture
+async def renderer():
+    renderer = ChartRenderer(workers=1, timeout_seconds=60)
+    yield renderer
+    await renderer.shutdown()
+
+
+class TestChartRenderer:
+    async def test_render_png(self, renderer):
+        image = await renderer.render(BAR_FIGURE, "png")
+
+        assert image.startswith(PNG_SIGNATURE)
+
+    async def test_worker_stays_warm_between_renders(self, renderer):
+        await renderer.render(BAR_FIGURE, "png")
+        await renderer.render(BAR_FIGURE, "svg")
+
+        assert renderer.stats["started"] == 1
+
+    async def test_render_batch_keeps_order(self, renderer):
+        renderer.workers = 2
+        results = await renderer.render_batch([BAR_FIGURE, BAR_FIGURE, BAR_FIGURE], "svg")
+
+        assert len(results) == 3
+        assert all(isinstance(result, bytes) and b"<svg" in result for result in results)
+
+    async def test_unsupported_format_raises(self, renderer):
+        with pytest.raises(ChartRenderError, match="gif"):
+            await renderer.render(BAR_FIGURE, "gif")
+
+        # The worker remains usable after a failed render
+        assert (await renderer.render(BAR_FIGURE, "png")).startswith(PNG_SIGNATURE)
+
+    async def test_empty_batch(self, renderer):
+        assert await renderer.render_batch([], "png") == []
+        assert renderer.stats["started"] == 0
+
+
+class TestGetChartRenderer:
+    async def test_disabled_returns_none(self):
+        assert get_chart_renderer({"enabled": False}) is None
+
+    async def test_shared_per_configuration(self):
+        first = get_chart_renderer({"workers": 3})
+        assert get_chart_renderer({"workers": 3}) is first
+        assert get_chart_renderer({"workers": 1}) is not first
+
+    def test_each_event_loop_renders_with_its_own_renderer(self):
+        async def render_on_this_loop():
+            renderer = get_chart_renderer({"workers": 1})
+            try:
+                return renderer, await renderer.render(BAR_FIGURE, "png")
+            finally:
+                await renderer.shutdown()
+
+        # Like SAM components, each thread runs its own event loop
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(asyncio.run(render_on_this_loop())),
+                daemon=True,
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=120)
+
+        assert len(results) == 2
+        (first, first_image), (second, second_image) = results
+        assert first is not second
+        assert first_image.startswith(PNG_SIGNATURE)
+        assert second_image.startswith(PNG_SIGNATURE)
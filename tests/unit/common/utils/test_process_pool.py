@@ -0,0 +1,134 @@
+"""
+Unit tests for common/utils/process_pool.py
+Tests the WarmProcessPool worker lifecycle, timeouts and shared memory transfer.
+"""
+
+import asyncio
+import textwrap
+
+import pytest
+
+from solace_agent_mesh.common.utils.process_pool import (
+    WarmProcessPool,
+    WorkerCallError,
+    WorkerCrashedError,
+)
+
+WORKER_MODULE = textwrap.dedent(
+    '''
+    import os
+    import time
+
+    def work(n=0, data=None, sleep=0, fail=False):
+        if fail:
+            raise ValueError("bad input")
+        if sleep:
+            time.sleep(sleep)
+        return {"pid": os.getpid(), "double": n * 2, "data": data}
+    '''
+)
+
+
+@pytest.fixture
+def worker_module(tmp_path):
+    (tmp_path / "pool_worker_module.py").write_text(WORKER_MODULE)
+    return str(tmp_path)
+
+
+@pytest.fixture
+async def pool(worker_module):
+    pool = WarmProcessPool(
+        "pool_worker_module:work",
+        max_workers=1,
+        base_path=worker_module,
+        shared_memory_threshold_bytes=1024,
+    )
+    await pool.start()
+    yield pool
+    await pool.shutdown()
+
+
+class TestWarmProcessPool:
+    async def test_call_runs_in_worker_process(self, pool):
+        import os
+
+        result = await pool.call({"n": 21})
+
+        assert result["double"] == 42
+        assert result["pid"] != os.getpid()
+
+    async def test_worker_is_reused(self, pool):
+        first = await pool.call({})
+        second = await pool.call({})
+
+        assert first["pid"] == second["pid"]
+        assert pool.stats["started"] == 1
+
+    async def test_large_bytes_round_trip_through_shared_memory(self, pool):
+        payload = bytes(range(256)) * 64
+
+        result = await pool.call({"data": {"blob": payload, "items": [bytearray(payload)]}})
+
+        assert result["data"]["blob"] == payload
+        assert isinstance(result["data"]["items"][0], bytearray)
+        assert result["data"]["items"][0] == payload
+
+    async def test_function_error_keeps_worker(self, pool):
+        with pytest.raises(WorkerCallError, match="bad input") as exc_info:
+            await pool.call({"fail": True})
+        assert "ValueError" in exc_info.value.remote_traceback
+
+        await pool.call({})
+        assert pool.stats["started"] == 1
+
+    async def test_timeout_replaces_worker(self, pool):
+        before = (await pool.call({}))["pid"]
+
+        with pytest.raises(TimeoutError):
+            await pool.call({"sleep": 10}, timeout=0.2)
+
+        after = (await pool.call({}))["pid"]
+        assert after != before
+        assert pool.stats["timeouts"] == 1
+
+    async def test_cancellation_replaces_worker(self, pool):
+        before = (await pool.call({}))["pid"]
+
+        task = asyncio.create_task(pool.call({"sleep": 10}))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert (await pool.call({}))["pid"] != before
+
+    async def test_recycles_after_max_calls(self, worker_module):
+        pool = WarmProcessPool(
+            "pool_worker_module:work",
+            max_workers=1,
+            base_path=worker_module,
+            max_calls_per_worker=2,
+        )
+        try:
+            pids = [(await pool.call({}))["pid"] for _ in range(4)]
+        finally:
+            await pool.shutdown()
+
+        assert pids[0] == pids[1]
+        assert pids[2] == pids[3]
+        assert pids[1] != pids[2]
+        assert pool.stats["recycled"] == 2
+
+    async def test_unknown_target_fails_to_start(self, worker_module):
+        pool = WarmProcessPool("pool_worker_module:missing", base_path=worker_module)
+        try:
+            with pytest.raises(WorkerCrashedError, match="AttributeError"):
+                await pool.call({})
+        finally:
+            await pool.shutdown()
+
+    def test_rejects_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            WarmProcessPool("no_function_separator")
+        with pytest.raises(ValueError):
+            WarmProcessPool("module:func", max_workers=0)
@@ -0,0 +1,62 @@
+"""
+Unit tests for exposing the inbound A2A message's publish time while
+BaseGatewayComponent handles an agent event.
+"""
+
+import asyncio
+import queue
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from solace_agent_mesh.common import a2a
+from solace_agent_mesh.gateway.base.component import (
+    BaseGatewayComponent,
+    get_inbound_message_timestamp,
+)
+
+NAMESPACE = "ns"
+GATEWAY_ID = "gw"
+
+
+def _build_component(seen):
+    component = Mock(spec=BaseGatewayComponent)
+    component.log_identifier = "[TestGateway]"
+    component.namespace = NAMESPACE
+    component.gateway_id = GATEWAY_ID
+    component.trust_manager = None
+    component.stop_signal = threading.Event()
+    component.internal_event_queue = queue.Queue()
+    component.get_async_loop = asyncio.get_running_loop
+
+    async def handle_agent_event(topic, payload, task_id):
+        seen.append((task_id, get_inbound_message_timestamp()))
+        return True
+
+    component._handle_agent_event = handle_agent_event
+    return component
+
+
+def _status_item(task_id, user_properties):
+    topic = a2a.get_gateway_status_topic(NAMESPACE, GATEWAY_ID, task_id)
+    return {
+        "topic": topic,
+        "payload": {},
+        "user_properties": user_properties,
+        "_original_broker_message": Mock(),
+    }
+
+
+@pytest.mark.asyncio
+async def test_publish_time_is_visible_only_while_handling_the_event():
+    seen = []
+    component = _build_component(seen)
+    component.internal_event_queue.put(_status_item("task-1", {"timestamp": 1234}))
+    component.internal_event_queue.put(_status_item("task-2", {}))
+    component.internal_event_queue.put(None)
+
+    await BaseGatewayComponent._message_processor_loop(component)
+
+    assert seen == [("task-1", 1234), ("task-2", None)]
+    assert get_inbound_message_timestamp() is None
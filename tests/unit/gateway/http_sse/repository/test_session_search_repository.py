@@ -0,0 +1,277 @@
+"""Unit tests for the session full-text search index.
+
+The FTS5 tests run the real Alembic migrations against a temporary SQLite
+file so the virtual table and its sync triggers match production.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from alembic import command
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable
+
+from solace_agent_mesh.gateway.http_sse.main import _setup_alembic_config
+from solace_agent_mesh.gateway.http_sse.repository.chat_task_repository import ChatTaskRepository
+from solace_agent_mesh.gateway.http_sse.repository.entities import ChatTask, Session
+from solace_agent_mesh.gateway.http_sse.repository.models import (
+    ExecutionStatus,
+    ScheduledTaskExecutionModel,
+    ScheduledTaskModel,
+    ScheduleType,
+    SessionSearchDocumentModel,
+)
+from solace_agent_mesh.gateway.http_sse.repository.models.base import Base
+from solace_agent_mesh.gateway.http_sse.repository.session_repository import SessionRepository
+from solace_agent_mesh.gateway.http_sse.repository.session_search_repository import (
+    BACKEND_FTS5,
+    BACKEND_NONE,
+    SessionSearchRepository,
+    extract_chat_task_text,
+)
+from solace_agent_mesh.gateway.http_sse.services.scheduler.result_handler import ResultHandler
+from solace_agent_mesh.shared.api.pagination import PaginationParams
+
+USER_ID = "user-1"
+
+
+@pytest.fixture()
+def migrated_session(tmp_path):
+    url = f"sqlite:///{tmp_path / 'search.db'}"
+    command.upgrade(_setup_alembic_config(url), "head")
+    engine = create_engine(url)
+    sess = sessionmaker(bind=engine)()
+    yield sess
+    sess.close()
+    engine.dispose()
+
+
+@pytest.fixture()
+def plain_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    sess = sessionmaker(bind=engine)()
+    yield sess
+    sess.close()
+
+
+def _save_session(db, session_id, name, user_id=USER_ID, project_id=None, updated=1):
+    SessionRepository().save(
+        db,
+        Session(
+            id=session_id,
+            name=name,
+            user_id=user_id,
+            project_id=project_id,
+            created_time=updated,
+            updated_time=updated,
+        ),
+    )
+
+
+def _save_chat_task(db, task_id, session_id, user_message, agent_text, user_id=USER_ID):
+    bubbles = [
+        {"type": "user", "text": user_message},
+        {"type": "agent", "text": agent_text},
+    ]
+    ChatTaskRepository().save(
+        db,
+        ChatTask(
+            id=task_id,
+            session_id=session_id,
+            user_id=user_id,
+            user_message=user_message,
+            message_bubbles=json.dumps(bubbles),
+            task_metadata=None,
+            created_time=1,
+            updated_time=None,
+        ),
+    )
+
+
+class TestExtractChatTaskText:
+    def test_combines_user_message_and_bubbles(self):
+        bubbles = json.dumps([
+            {"type": "user", "text": "question"},
+            {"type": "agent", "text": "answer"},
+        ])
+        assert extract_chat_task_text("question", bubbles) == "question\nanswer"
+
+    def test_tolerates_malformed_bubbles(self):
+        assert extract_chat_task_text("hi", "not json") == "hi"
+        assert extract_chat_task_text(None, [{"no_text": 1}, "junk"]) == ""
+
+
+class TestBackendDetection:
+    def test_fts5_after_migrations(self, migrated_session):
+        assert SessionSearchRepository().get_backend(migrated_session) == BACKEND_FTS5
+
+    def test_none_without_native_index(self, plain_session):
+        assert SessionSearchRepository().get_backend(plain_session) == BACKEND_NONE
+
+    def test_documents_table_compiles_for_mysql(self):
+        table = SessionSearchDocumentModel.__table__
+        ddl = str(CreateTable(table).compile(dialect=mysql.dialect()))
+        assert "session_id VARCHAR(64)" in ddl
+        assert "user_id VARCHAR(255)" in ddl
+
+
+class TestFullTextSearch:
+    def test_matches_session_names_by_prefix(self, migrated_session):
+        _save_session(migrated_session, "s1", "Quarterly budget review")
+        _save_session(migrated_session, "s2", "Holiday plans")
+
+        results = SessionRepository().search(migrated_session, USER_ID, "budg")
+
+        assert [s.id for s in results] == ["s1"]
+
+    def test_matches_message_content(self, migrated_session):
+        _save_session(migrated_session, "s1", "Untitled")
+        _save_chat_task(migrated_session, "t1", "s1", "How is the cluster?", "Kubernetes nodes are healthy")
+
+        results = SessionRepository().search(migrated_session, USER_ID, "kubernetes healthy")
+
+        assert [s.id for s in results] == ["s1"]
+
+    def test_ranks_better_matches_first(self, migrated_session):
+        _save_session(migrated_session, "weak", "Notes", updated=2)
+        _save_chat_task(
+            migrated_session, "t-weak", "weak", "misc",
+            "lots of unrelated words " * 50 + "invoice",
+        )
+        _save_session(migrated_session, "strong", "Invoice invoice", updated=1)
+
+        ranked = SessionSearchRepository().search_session_ids(migrated_session, USER_ID, "invoice")
+
+        assert [sid for sid, _ in ranked] == ["strong", "weak"]
+        assert ranked[0][1] >= ranked[1][1]
+
+    def test_scoped_to_user_project_and_not_deleted(self, migrated_session):
+        _save_session(migrated_session, "mine", "Budget", project_id=None)
+        _save_session(migrated_session, "other-user", "Budget", user_id="user-2")
+        _save_session(migrated_session, "deleted", "Budget")
+        SessionRepository().soft_delete(migrated_session, "deleted", USER_ID)
+
+        repo = SessionRepository()
+        assert [s.id for s in repo.search(migrated_session, USER_ID, "budget")] == ["mine"]
+        assert repo.count_search_results(migrated_session, USER_ID, "budget") == 1
+        assert repo.search(migrated_session, USER_ID, "budget", project_id="p-1") == []
+
+    def test_pagination_and_count(self, migrated_session):
+        for i in range(5):
+            _save_session(migrated_session, f"s{i}", f"Report {i}", updated=i)
+
+        repo = SessionRepository()
+        page = repo.search(
+            migrated_session, USER_ID, "report",
+            pagination=PaginationParams(page_number=2, page_size=2),
+        )
+
+        assert len(page) == 2
+        assert repo.count_search_results(migrated_session, USER_ID, "report") == 5
+
+    def test_reindexes_on_update_and_rename(self, migrated_session):
+        _save_session(migrated_session, "s1", "Alpha")
+        _save_chat_task(migrated_session, "t1", "s1", "first", "zebra")
+        _save_chat_task(migrated_session, "t1", "s1", "first", "giraffe")
+        _save_session(migrated_session, "s1", "Beta", updated=2)
+
+        repo = SessionRepository()
+        assert repo.search(migrated_session, USER_ID, "zebra") == []
+        assert [s.id for s in repo.search(migrated_session, USER_ID, "giraffe")] == ["s1"]
+        assert repo.search(migrated_session, USER_ID, "alpha") == []
+        assert [s.id for s in repo.search(migrated_session, USER_ID, "beta")] == ["s1"]
+
+    def test_delete_by_session_removes_message_documents(self, migrated_session):
+        _save_session(migrated_session, "s1", "Kept name")
+        _save_chat_task(migrated_session, "t1", "s1", "q", "ephemeral")
+
+        ChatTaskRepository().delete_by_session(migrated_session, "s1")
+
+        repo = SessionRepository()
+        assert repo.search(migrated_session, USER_ID, "ephemeral") == []
+        assert [s.id for s in repo.search(migrated_session, USER_ID, "kept")] == ["s1"]
+
+    def test_query_without_tokens_returns_nothing(self, migrated_session):
+        _save_session(migrated_session, "s1", "Anything")
+        assert SessionRepository().search(migrated_session, USER_ID, "*** ???") == []
+
+
+class TestSchedulerSessions:
+    """Sessions and chat tasks written by the scheduler reach the index."""
+
+    @pytest.mark.asyncio
+    async def test_scheduled_run_is_searchable_by_name_and_result(self, migrated_session):
+        from solace_agent_mesh.gateway.http_sse.services.scheduler.scheduler_service import (
+            SchedulerService,
+        )
+
+        migrated_session.add(
+            ScheduledTaskModel(
+                id="sched-1",
+                name="Nightly inventory digest",
+                namespace="ns1",
+                user_id=USER_ID,
+                created_by=USER_ID,
+                schedule_type=ScheduleType.CRON,
+                schedule_expression="0 3 * * *",
+                timezone="UTC",
+                target_agent_name="agent-a",
+                task_message=[{"type": "text", "text": "Summarise stock levels"}],
+            )
+        )
+        migrated_session.add(
+            ScheduledTaskExecutionModel(
+                id="exec-1",
+                scheduled_task_id="sched-1",
+                status=ExecutionStatus.PENDING,
+                scheduled_for=1,
+            )
+        )
+        migrated_session.commit()
+
+        session_factory = sessionmaker(bind=migrated_session.get_bind())
+        with patch(
+            "solace_agent_mesh.gateway.http_sse.services.scheduler.scheduler_service.ResultHandler"
+        ), patch(
+            "solace_agent_mesh.gateway.http_sse.services.scheduler.scheduler_service.NotificationService"
+        ):
+            service = SchedulerService(
+                session_factory=session_factory,
+                namespace="ns1",
+                instance_id="inst-1",
+                publish_func=MagicMock(),
+                core_a2a_service=MagicMock(),
+                config={},
+            )
+        service.notification_service.sse_manager = None
+        service.result_handler.register_execution = AsyncMock()
+        service.result_handler.wait_for_completion = AsyncMock()
+        service._resolve_user_config_for_task = AsyncMock(return_value=None)
+
+        await service._submit_task_to_agent_mesh("sched-1", "exec-1")
+
+        handler = ResultHandler(session_factory=session_factory, namespace="ns1", instance_id="inst-1")
+        with session_factory() as db:
+            execution = db.get(ScheduledTaskExecutionModel, "exec-1")
+            handler._save_chat_task(
+                db, execution, [{"role": "agent", "text": "Warehouse shelves are restocked"}]
+            )
+            db.commit()
+
+        repo = SessionRepository()
+        migrated_session.expire_all()
+        assert [s.id for s in repo.search(migrated_session, USER_ID, "inventory")] == ["scheduled_exec-1"]
+        assert [s.id for s in repo.search(migrated_session, USER_ID, "restocked")] == ["scheduled_exec-1"]
+
+
+class TestFallbackSearch:
+    def test_uses_name_ilike_without_native_index(self, plain_session):
+        _save_session(plain_session, "s1", "Quarterly budget review")
+
+        results = SessionRepository().search(plain_session, USER_ID, "udget rev")
+
+        assert [s.id for s in results] == ["s1"]
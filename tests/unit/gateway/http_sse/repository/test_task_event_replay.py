@@ -0,0 +1,250 @@
+"""Unit tests for sequence-based task event replay.
+
+The migration tests run the real Alembic migrations against a temporary
+SQLite file so the backfill and the unique (task_id, sequence) index match
+production.
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from alembic import command
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from solace_agent_mesh.gateway.http_sse.event_sequence import (
+    SEQUENCE_PER_MS,
+    next_event_sequence,
+    parse_last_event_id,
+    sequence_after_timestamp,
+)
+from solace_agent_mesh.gateway.http_sse.main import _setup_alembic_config
+from solace_agent_mesh.gateway.http_sse.repository.entities import Task, TaskEvent
+from solace_agent_mesh.gateway.http_sse.repository.models.base import Base
+from solace_agent_mesh.gateway.http_sse.repository.task_repository import TaskRepository
+from solace_agent_mesh.gateway.http_sse.services.task_logger_service import TaskLoggerService
+from solace_agent_mesh.gateway.http_sse.sse_event_buffer import SSEEventBuffer
+from solace_agent_mesh.gateway.http_sse.sse_manager import SSEManager
+
+TASK_ID = "task-1"
+SEQUENCE_MIGRATION = (
+    Path(__file__).parents[5]
+    / "src/solace_agent_mesh/gateway/http_sse/alembic/versions/20261018_add_task_event_sequence.py"
+)
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    sess = sessionmaker(bind=engine)()
+    TaskRepository().save_task(sess, Task(id=TASK_ID, user_id="u", start_time=1))
+    yield sess
+    sess.close()
+
+
+def _response(kind):
+    return {"jsonrpc": "2.0", "id": "r", "result": {"kind": kind}}
+
+
+def _save(db, event_id, created_time, payload, direction="response", task_id=TASK_ID):
+    return TaskRepository().save_event(
+        db,
+        TaskEvent(
+            id=event_id,
+            task_id=task_id,
+            created_time=created_time,
+            topic="t",
+            direction=direction,
+            payload=payload,
+        ),
+    )
+
+
+class TestEventSequence:
+    def test_uses_time_floor_and_bumps_within_a_millisecond(self):
+        first = next_event_sequence(None, 5)
+        assert first == 5 * SEQUENCE_PER_MS
+        assert next_event_sequence(first, 5) == first + 1
+        assert next_event_sequence(first + 1, 6) == 6 * SEQUENCE_PER_MS
+
+    def test_stays_monotonic_when_clock_goes_backwards(self):
+        assert next_event_sequence(9000, 3) == 9001
+
+    def test_timestamp_bound_excludes_events_of_that_millisecond(self):
+        bound = sequence_after_timestamp(5)
+        assert next_event_sequence(None, 5) <= bound < next_event_sequence(None, 6)
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [(None, None), ("", None), ("42", 42), (" 7 ", 7), ("abc", None), ("-1", None)],
+    )
+    def test_parse_last_event_id(self, header, expected):
+        assert parse_last_event_id(header) == expected
+
+
+class TestSaveEvent:
+    def test_assigns_increasing_sequences_and_kinds(self, db):
+        first = _save(db, "e1", 10, {"method": "message/send"}, direction="request")
+        second = _save(db, "e2", 10, _response("status-update"))
+        third = _save(db, "e3", 11, _response("task"))
+
+        assert first.sequence < second.sequence < third.sequence
+        assert (first.kind, second.kind, third.kind) == (None, "status-update", "task")
+
+    def test_retries_when_a_concurrent_writer_takes_the_sequence(self, db):
+        taken = _save(db, "e1", 10, _response("status-update"))
+        with patch(
+            "solace_agent_mesh.gateway.http_sse.repository.task_repository.next_event_sequence",
+            side_effect=[taken.sequence, taken.sequence + 1],
+        ):
+            second = _save(db, "e2", 10, _response("status-update"))
+
+        assert second.sequence == taken.sequence + 1
+        page = TaskRepository().find_replay_events_page(db, TASK_ID)
+        assert [(e.id, e.sequence) for e in page] == [("e1", 10_000), ("e2", 10_001)]
+
+    def test_sequences_are_per_task(self, db):
+        TaskRepository().save_task(db, Task(id="task-2", user_id="u", start_time=1))
+        _save(db, "e1", 10, _response("status-update"))
+        _save(db, "e2", 10, _response("status-update"))
+        other = _save(db, "e3", 10, _response("status-update"), task_id="task-2")
+
+        assert other.sequence == 10 * SEQUENCE_PER_MS
+
+
+class TestFindReplayEventsPage:
+    def test_pages_after_sequence(self, db):
+        saved = [_save(db, f"e{i}", 100 + i, _response("status-update")) for i in range(5)]
+        repo = TaskRepository()
+
+        page = repo.find_replay_events_page(db, TASK_ID, after_sequence=0, limit=2)
+        assert [e.id for e in page] == ["e0", "e1"]
+
+        page = repo.find_replay_events_page(db, TASK_ID, after_sequence=page[-1].sequence, limit=2)
+        assert [e.id for e in page] == ["e2", "e3"]
+
+        page = repo.find_replay_events_page(db, TASK_ID, after_sequence=saved[-1].sequence)
+        assert page == []
+
+    def test_skips_artifact_updates_once_final_response_exists(self, db):
+        _save(db, "e1", 1, _response("artifact-update"))
+        _save(db, "e2", 2, _response("status-update"))
+        repo = TaskRepository()
+
+        page = repo.find_replay_events_page(db, TASK_ID, skip_superseded_artifact_updates=True)
+        assert [e.id for e in page] == ["e1", "e2"]
+
+        _save(db, "e3", 3, _response("task"))
+        page = repo.find_replay_events_page(db, TASK_ID, skip_superseded_artifact_updates=True)
+        assert [e.id for e in page] == ["e2", "e3"]
+
+        page = repo.find_replay_events_page(db, TASK_ID)
+        assert [e.id for e in page] == ["e1", "e2", "e3"]
+
+
+class TestLiveEventIds:
+    """Live SSE IDs and stored sequences both derive from the publish time."""
+
+    @staticmethod
+    def _status_update(text):
+        return {
+            "jsonrpc": "2.0",
+            "id": TASK_ID,
+            "result": {
+                "kind": "status-update",
+                "taskId": TASK_ID,
+                "contextId": "ctx",
+                "final": False,
+                "status": {"state": "working"},
+                "metadata": {"text": text},
+            },
+        }
+
+    @pytest.mark.asyncio
+    async def test_resuming_from_a_live_id_replays_only_later_events(self, db):
+        logger = TaskLoggerService(lambda: db, {"enabled": True})
+        # The logger closes its session after each event; keep the fixture's open
+        db.close = lambda: None
+        manager = SSEManager(100, MagicMock(spec=SSEEventBuffer))
+        queue = await manager.create_sse_connection(TASK_ID)
+
+        for published in (500, 500, 501):
+            payload = self._status_update(f"at {published}")
+            logger.log_event({
+                "topic": "ns/a2a/v1/gateway/status/gw/task-1",
+                "payload": payload,
+                "user_properties": {"timestamp": published},
+            })
+            await manager.send_event(TASK_ID, payload, "status_update", published_time=published)
+
+        live_ids = [int((await queue.get())["id"]) for _ in range(3)]
+        stored = TaskRepository().find_replay_events_page(db, TASK_ID)
+        assert live_ids == [e.sequence for e in stored] == [500_000, 500_001, 501_000]
+
+        replay = TaskRepository().find_replay_events_page(
+            db, TASK_ID, after_sequence=live_ids[1]
+        )
+        assert [e.payload["result"]["metadata"]["text"] for e in replay] == ["at 501"]
+
+
+class TestMigration:
+    def test_backfills_sequences_and_kinds(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'events.db'}"
+        config = _setup_alembic_config(url)
+        command.upgrade(config, "20261018_scheduler_instances")
+
+        engine = create_engine(url)
+        with engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO tasks (id, user_id, start_time) VALUES ('task-1', 'u', 1)"
+            ))
+            for event_id, created, direction, payload in [
+                ("b", 10, "response", _response("artifact-update")),
+                ("a", 10, "request", {"method": "message/send"}),
+                ("c", 11, "response", _response("task")),
+            ]:
+                conn.execute(
+                    text(
+                        "INSERT INTO task_events "
+                        "(id, task_id, created_time, topic, direction, payload) "
+                        "VALUES (:id, 'task-1', :created, 't', :direction, :payload)"
+                    ),
+                    {"id": event_id, "created": created, "direction": direction,
+                     "payload": json.dumps(payload)},
+                )
+
+        command.upgrade(config, "head")
+
+        indexes = {ix["name"]: ix for ix in inspect(engine).get_indexes("task_events")}
+        assert indexes["ix_task_events_task_id_sequence"]["unique"]
+
+        db = sessionmaker(bind=engine)()
+        try:
+            page = TaskRepository().find_replay_events_page(db, TASK_ID)
+            assert [(e.id, e.sequence, e.kind) for e in page] == [
+                ("a", 10_000, None),
+                ("b", 10_001, "artifact-update"),
+                ("c", 11_000, "task"),
+            ]
+            assert _save(db, "d", 11, _response("status-update")).sequence == 11_001
+        finally:
+            db.close()
+            engine.dispose()
+
+    def test_mysql_backfill_uses_update_join(self):
+        spec = importlib.util.spec_from_file_location("task_event_sequence", SEQUENCE_MIGRATION)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+
+        bind = MagicMock()
+        bind.dialect.name = "mysql"
+        migration._backfill_sequences(bind)
+
+        statement = str(bind.execute.call_args.args[0])
+        assert statement.startswith("UPDATE task_events JOIN (")
+        assert "SET task_events.sequence = ranked.sequence" in statement
+        assert " FROM (" not in statement
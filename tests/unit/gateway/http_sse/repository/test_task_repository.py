@@ -557,3 +557,78 @@ class TestSQLNullHandlingFix:
         
         # We check that the pattern is correct by verifying or_ is used
         assert "or_(" in source, "Should use or_() to combine NULL check with IN clause"
+
+
+class TestEventPaginationAndStreaming:
+    """Tests for keyset pagination and cursor-based streaming of task events."""
+
+    @pytest.fixture
+    def session(self):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
+        from solace_agent_mesh.gateway.http_sse.repository.models.base import Base
+
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        sess = sessionmaker(bind=engine)()
+        yield sess
+        sess.close()
+
+    @pytest.fixture
+    def repository(self):
+        from solace_agent_mesh.gateway.http_sse.repository.task_repository import TaskRepository
+        return TaskRepository()
+
+    @pytest.fixture
+    def populated(self, session):
+        from solace_agent_mesh.gateway.http_sse.repository.models import TaskEventModel, TaskModel
+
+        session.add(TaskModel(id="parent", user_id="u1", start_time=1))
+        session.add(TaskModel(id="child", user_id="u1", parent_task_id="parent", start_time=2))
+        # Interleave events between tasks and include duplicate timestamps
+        for i in range(10):
+            session.add(
+                TaskEventModel(
+                    id=f"e{i:02d}",
+                    task_id="parent" if i % 2 == 0 else "child",
+                    user_id="u1",
+                    created_time=100 + i // 2,
+                    topic="t",
+                    direction="status",
+                    payload={"n": i},
+                )
+            )
+        session.commit()
+        return session
+
+    def test_find_by_ids(self, repository, populated):
+        tasks = repository.find_by_ids(populated, ["parent", "child", "missing"])
+        assert sorted(t.id for t in tasks) == ["child", "parent"]
+        assert repository.find_by_ids(populated, []) == []
+
+    def test_pages_cover_all_events_in_order(self, repository, populated):
+        seen = []
+        after = None
+        while True:
+            page = repository.find_events_page(
+                populated, ["parent", "child"], after=after, limit=3
+            )
+            if not page:
+                break
+            seen.extend(e.id for e in page)
+            after = (page[-1].created_time, page[-1].id)
+
+        assert seen == [f"e{i:02d}" for i in range(10)]
+
+    def test_page_filters_by_task(self, repository, populated):
+        page = repository.find_events_page(populated, ["child"], limit=100)
+        assert [e.id for e in page] == ["e01", "e03", "e05", "e07", "e09"]
+
+    def test_iter_events_streams_in_order(self, repository, populated):
+        events = list(repository.iter_events(populated, ["parent", "child"], batch_size=2))
+        assert [e.id for e in events] == [f"e{i:02d}" for i in range(10)]
+        assert events[0].payload == {"n": 0}
+
+    def test_iter_events_empty_ids(self, repository, populated):
+        assert list(repository.iter_events(populated, [])) == []
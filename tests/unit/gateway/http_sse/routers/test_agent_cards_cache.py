@@ -0,0 +1,191 @@
+"""
+Unit tests for cached, ETag-aware agent card responses.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from a2a.types import AgentCapabilities, AgentCard, AgentExtension
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+from solace_agent_mesh.common.agent_registry import AgentRegistry
+from solace_agent_mesh.common.middleware.config_resolver import ConfigResolver
+from solace_agent_mesh.gateway.http_sse.agent_card_cache import (
+    AgentCardResponseCache,
+    etag_matches,
+)
+from solace_agent_mesh.gateway.http_sse.dependencies import (
+    get_agent_card_response_cache,
+    get_agent_registry,
+    get_user_config,
+)
+from solace_agent_mesh.gateway.http_sse.routers import agent_cards
+from solace_agent_mesh.gateway.http_sse.routers.agent_cards import TOOLS_EXTENSION_URI
+
+
+def _card(name, tools=None, version="1.0.0"):
+    extensions = []
+    if tools is not None:
+        extensions.append(AgentExtension(uri=TOOLS_EXTENSION_URI, params={"tools": tools}))
+    return AgentCard(
+        name=name,
+        description=f"{name} agent",
+        url=f"https://{name}.example.com",
+        version=version,
+        capabilities=AgentCapabilities(extensions=extensions),
+        default_input_modes=["text/plain"],
+        default_output_modes=["text/plain"],
+        skills=[],
+    )
+
+
+class CountingResolver(ConfigResolver):
+    """Grants tools whose required scopes are all in user_config['scopes']."""
+
+    calls = 0
+
+    @classmethod
+    def validate_operation_config(cls, user_config, operation_spec, validation_context):
+        cls.calls += 1
+        required = operation_spec.get("required_scopes") or []
+        return {"valid": set(required) <= set(user_config.get("scopes", []))}
+
+
+@pytest.fixture
+def env():
+    registry = AgentRegistry()
+    cache = AgentCardResponseCache()
+    state = {"user_config": {"scopes": []}}
+
+    app = FastAPI()
+    app.include_router(agent_cards.router)
+    app.dependency_overrides[get_agent_registry] = lambda: registry
+    app.dependency_overrides[get_agent_card_response_cache] = lambda: cache
+    app.dependency_overrides[get_user_config] = lambda: state["user_config"]
+
+    CountingResolver.calls = 0
+    with patch.object(
+        agent_cards.MiddlewareRegistry, "get_config_resolver", return_value=CountingResolver
+    ):
+        yield TestClient(app), registry, cache, state
+
+
+class TestCachedEndpoint:
+    def test_repeated_requests_are_served_from_cache(self, env):
+        client, registry, cache, _ = env
+        registry.add_or_update_agent(_card("alpha"))
+
+        first = client.get("/agentCards")
+        calls_after_first = CountingResolver.calls
+        second = client.get("/agentCards")
+
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["cache-control"] == "private, no-cache"
+        assert CountingResolver.calls == calls_after_first
+        assert len(cache) == 1
+
+    def test_if_none_match_returns_not_modified(self, env):
+        client, registry, _, _ = env
+        registry.add_or_update_agent(_card("alpha"))
+        etag = client.get("/agentCards").headers["etag"]
+
+        response = client.get("/agentCards", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_registry_changes_produce_a_new_etag(self, env):
+        client, registry, cache, _ = env
+        registry.add_or_update_agent(_card("alpha"))
+        etag = client.get("/agentCards").headers["etag"]
+
+        registry.add_or_update_agent(_card("alpha", version="2.0.0"))
+        updated = client.get("/agentCards", headers={"If-None-Match": etag})
+        assert updated.status_code == 200
+        assert updated.json()[0]["version"] == "2.0.0"
+
+        registry.add_or_update_agent(_card("beta"))
+        names = [card["name"] for card in client.get("/agentCards").json()]
+        assert names == ["alpha", "beta"]
+        # Entries of the older generations were dropped when the new one was stored
+        assert len(cache) == 1
+
+    def test_users_with_different_scopes_get_their_own_responses(self, env):
+        client, registry, cache, state = env
+        registry.add_or_update_agent(
+            _card("alpha", tools=[{"name": "secret", "requiredScopes": ["tool:secret"]}])
+        )
+
+        without_scope = client.get("/agentCards").json()
+        state["user_config"] = {"scopes": ["tool:secret"]}
+        with_scope = client.get("/agentCards").json()
+
+        assert without_scope[0]["capabilities"]["extensions"][0]["params"]["tools"] == []
+        assert with_scope[0]["capabilities"]["extensions"][0]["params"]["tools"] == [
+            {"name": "secret", "requiredScopes": ["tool:secret"]}
+        ]
+        assert len(cache) == 2
+
+    def test_body_matches_response_model_serialization(self, env):
+        client, registry, _, _ = env
+        card = _card("alpha", tools=[{"name": "t"}])
+        registry.add_or_update_agent(card)
+
+        assert client.get("/agentCards").json() == [jsonable_encoder(card, by_alias=True)]
+
+    def test_works_without_a_cache(self, env):
+        client, registry, _, _ = env
+        client.app.dependency_overrides[get_agent_card_response_cache] = lambda: None
+        registry.add_or_update_agent(_card("alpha"))
+
+        first = client.get("/agentCards")
+        response = client.get("/agentCards", headers={"If-None-Match": first.headers["etag"]})
+
+        assert response.status_code == 304
+
+
+class TestAgentCardResponseCache:
+    def test_older_generations_are_not_cached(self):
+        cache = AgentCardResponseCache()
+        cache.put(2, "fp", b"[]")
+        cache.put(1, "fp", b"[1]")
+
+        assert cache.get(1, "fp") is None
+        assert cache.get(2, "fp").body == b"[]"
+
+    def test_lru_bound(self):
+        cache = AgentCardResponseCache(max_entries=2)
+        cache.put(1, "a", b"a")
+        cache.put(1, "b", b"b")
+        cache.get(1, "a")
+        cache.put(1, "c", b"c")
+
+        assert cache.get(1, "b") is None
+        assert cache.get(1, "a") is not None
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"x", "abc"', True),
+        ("*", True),
+        ('"abcd"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"abc"') is expected
+
+
+def test_default_fingerprint_is_stable_and_scope_sensitive():
+    fingerprint = ConfigResolver.get_user_config_fingerprint
+    assert fingerprint({"scopes": ["a"], "x": 1}) == fingerprint({"x": 1, "scopes": ["a"]})
+    assert fingerprint({"scopes": ["a"]}) != fingerprint({"scopes": ["b"]})
+    assert fingerprint({1: "a", "b": 2}) is None
@@ -0,0 +1,80 @@
+"""Unit tests for paged, sequence-based SSE replay in the SSE router."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from solace_agent_mesh.gateway.http_sse.event_sequence import sequence_after_timestamp
+from solace_agent_mesh.gateway.http_sse.repository.entities import TaskEvent
+from solace_agent_mesh.gateway.http_sse.routers import sse
+
+
+def _event(sequence, kind="status-update", direction="response"):
+    return TaskEvent(
+        id=f"e{sequence}",
+        task_id="task-1",
+        created_time=1,
+        topic="t",
+        direction=direction,
+        payload={"result": {"kind": kind}},
+        sequence=sequence,
+        kind=kind,
+    )
+
+
+class TestToSseEvent:
+    @pytest.mark.parametrize(
+        "kind, expected",
+        [
+            ("task", "final_response"),
+            ("status-update", "status_update"),
+            ("artifact-update", "artifact_update"),
+            (None, "status_update"),
+        ],
+    )
+    def test_maps_kind_and_carries_sequence_as_id(self, kind, expected):
+        sse_event = sse._to_sse_event(_event(7, kind))
+        assert sse_event["event"] == expected
+        assert sse_event["id"] == "7"
+        assert json.loads(sse_event["data"]) == {"result": {"kind": kind}}
+
+    def test_requests_are_status_updates(self):
+        assert sse._to_sse_event(_event(1, "task", direction="request"))["event"] == "status_update"
+
+
+class TestResolveReplayStart:
+    def test_last_event_id_wins(self):
+        assert sse._resolve_replay_start(True, 42, 5, "") == 42
+
+    def test_background_task_replays_everything(self):
+        assert sse._resolve_replay_start(True, None, 5, "") == 0
+
+    def test_timestamp_fallback(self):
+        assert sse._resolve_replay_start(False, None, 5, "") == sequence_after_timestamp(5)
+        assert sse._resolve_replay_start(False, None, 0, "") == 0
+
+
+class TestStreamReplayEvents:
+    @pytest.mark.asyncio
+    async def test_streams_pages_from_the_last_sequence(self):
+        pages = [[_event(1), _event(2)], [_event(3), _event(4)], [_event(5)]]
+        calls = []
+
+        def fetch(task_id, after_sequence, skip, log_prefix):
+            calls.append((after_sequence, skip))
+            return pages[len(calls) - 1]
+
+        with patch.object(sse, "REPLAY_PAGE_SIZE", 2), patch.object(
+            sse, "_fetch_replay_page", side_effect=fetch
+        ):
+            ids = [e["id"] async for e in sse._stream_replay_events("task-1", True, 0, "")]
+
+        assert ids == ["1", "2", "3", "4", "5"]
+        assert calls == [(0, True), (2, True), (4, True)]
+
+    @pytest.mark.asyncio
+    async def test_stops_quietly_on_database_errors(self):
+        with patch.object(sse, "_fetch_replay_page", side_effect=RuntimeError("db down")):
+            events = [e async for e in sse._stream_replay_events("task-1", False, 0, "")]
+        assert events == []
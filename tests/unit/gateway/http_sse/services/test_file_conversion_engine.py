@@ -0,0 +1,168 @@
+"""
+Unit tests for the process-pool document conversion engine.
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from solace_agent_mesh.gateway.http_sse.services.file_converter_service import (
+    DocumentConversionEngine,
+    configure_conversion_engine,
+    convert_pdf_to_text,
+    get_conversion_engine,
+    shutdown_conversion_engine,
+)
+
+PDF = "application/pdf"
+
+
+def _make_pdf(page_texts):
+    """Builds a minimal PDF with one line of Helvetica text per page."""
+    page_count = len(page_texts)
+    font_id = 3 + 2 * page_count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(f"{3 + 2 * i} 0 R".encode() for i in range(page_count))
+        + f"] /Count {page_count} >>".encode(),
+    ]
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> "
+            f"/Contents {4 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(
+            f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream"
+        )
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    return bytes(out)
+
+
+def _without_timestamp(metadata):
+    return {k: v for k, v in metadata.items() if k != "timestamp"}
+
+
+class TestProcessConversion:
+    def test_sharded_pdf_matches_single_pass(self):
+        engine = DocumentConversionEngine(process_workers=3, pages_per_shard=2)
+        pdf = _make_pdf([f"Page number {n}" for n in range(1, 8)])
+        expected_text, expected_metadata = convert_pdf_to_text(pdf)
+
+        async def run():
+            try:
+                return await engine.convert(pdf, PDF)
+            finally:
+                await engine.shutdown()
+
+        text, metadata = asyncio.run(run())
+
+        assert "Page number 7" in text
+        assert text == expected_text
+        assert _without_timestamp(metadata) == _without_timestamp(expected_metadata)
+        assert metadata["citation_map"][-1]["location"] == "physical_page_7"
+        # One page-count pass in the parent, three page-range shards in workers
+        assert engine.stats()["pool"]["calls"] == 3
+
+    def test_worker_errors_surface_as_value_error(self):
+        engine = DocumentConversionEngine(process_workers=1)
+
+        async def run():
+            try:
+                await engine.convert(b"not a pdf", PDF)
+            finally:
+                await engine.shutdown()
+
+        with pytest.raises(ValueError, match="Failed to convert PDF"):
+            asyncio.run(run())
+
+
+class TestContentCache:
+    async def test_identical_content_is_converted_once(self):
+        engine = DocumentConversionEngine(process_workers=0)
+        pdf = _make_pdf(["Alpha", "Beta"])
+
+        first_text, first_metadata = await engine.convert(pdf, PDF)
+        second_text, second_metadata = await engine.convert(pdf, PDF)
+
+        assert first_text == second_text
+        assert first_metadata["citation_map"] == second_metadata["citation_map"]
+        stats = engine.stats()
+        assert (stats["misses"], stats["hits"]) == (1, 1)
+
+    async def test_concurrent_conversions_share_one_run(self):
+        engine = DocumentConversionEngine(process_workers=0)
+        calls = 0
+        release = asyncio.Event()
+
+        async def convert(content, mime_type):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "text", {"citation_map": []}
+
+        with patch.object(engine, "_convert_uncached", side_effect=convert):
+            waiters = [asyncio.create_task(engine.convert(b"x", PDF)) for _ in range(4)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*waiters)
+
+        assert [text for text, _ in results] == ["text"] * 4
+        assert calls == 1
+        assert engine.stats()["shared"] == 3
+
+    async def test_failures_are_not_cached(self):
+        engine = DocumentConversionEngine(process_workers=0)
+
+        with pytest.raises(ValueError):
+            await engine.convert(b"corrupt", PDF)
+        with pytest.raises(ValueError):
+            await engine.convert(b"corrupt", PDF)
+        assert engine.stats()["misses"] == 2
+
+    async def test_cache_is_byte_bounded(self):
+        engine = DocumentConversionEngine(process_workers=0, cache_max_bytes=10)
+        engine._put("a", "123456", {})
+        engine._put("b", "123456", {})
+
+        assert engine._get("a") is None
+        assert engine._get("b")[0] == "123456"
+
+    async def test_mime_type_is_part_of_the_key(self):
+        assert DocumentConversionEngine.content_key(b"x", PDF) != (
+            DocumentConversionEngine.content_key(b"x", "application/other")
+        )
+
+    async def test_unsupported_mime_type(self):
+        engine = DocumentConversionEngine(process_workers=0)
+        with pytest.raises(ValueError, match="Unsupported MIME type"):
+            await engine.convert(b"x", "text/plain")
+
+
+class TestConfiguration:
+    async def test_configure_and_shutdown(self):
+        engine = configure_conversion_engine({"process_workers": 0, "cache_max_mb": 1})
+        assert get_conversion_engine() is engine
+        assert engine.cache_max_bytes == 1024 * 1024
+
+        await shutdown_conversion_engine()
+        assert get_conversion_engine() is None
+
+    def test_disabled(self):
+        assert configure_conversion_engine({"enabled": False}) is None
+        assert get_conversion_engine() is None
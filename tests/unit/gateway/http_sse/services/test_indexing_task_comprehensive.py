@@ -427,3 +427,41 @@ class TestIndexingTaskServiceComprehensive:
                     assert "file2.pdf" in result["indexed_files"]  # .converted.txt removed
                     # Should only list each file once
                     assert result["indexed_files"].count("file1.txt") == 1
+
+    @pytest.mark.asyncio
+    async def test_conversions_run_concurrently_up_to_the_limit(self):
+        """Test that conversions overlap but never exceed max_concurrency."""
+        service = IndexingTaskService(
+            self.mock_sse_manager, self.mock_project_service, max_concurrency=2
+        )
+        mock_project = MagicMock(id="proj-123", user_id="user-456")
+        files_to_convert = [(f"doc{i}.pdf", 0, "application/pdf") for i in range(5)]
+        in_flight = 0
+        peak = 0
+
+        async def mock_convert(project, filename, version, mime_type):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"status": "success", "data_version": 1}
+
+        with patch.object(service, '_convert_file_async', side_effect=mock_convert):
+            with patch.object(service, '_rebuild_index_async') as mock_rebuild:
+                mock_rebuild.return_value = {"status": "success", "indexed_files": []}
+                with patch.object(service, '_get_files_for_indexing', return_value=[]):
+                    await service.convert_and_index_upload_async(
+                        "task-123", mock_project, files_to_convert, is_text_based=[]
+                    )
+
+        assert peak == 2
+        mock_rebuild.assert_called_once_with(mock_project)
+        events = [
+            call_args[1]["event_data"]
+            for call_args in self.mock_sse_manager.send_event.call_args_list
+        ]
+        progress = [e["current"] for e in events if e["type"] == "conversion_file_progress"]
+        assert sorted(progress) == [1, 2, 3, 4, 5]
+        [summary] = [e for e in events if e["type"] == "conversion_completed"]
+        assert summary["converted_file_success_count"] == 5
@@ -0,0 +1,190 @@
+"""
+Unit tests for pooled LibreOffice conversion in DocumentConversionService.
+
+A stand-in worker speaking the libreoffice_worker.py protocol replaces
+LibreOffice, so these tests run without it installed.
+"""
+
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+from solace_agent_mesh.gateway.http_sse.services.document_conversion_service import (
+    DocumentConversionService,
+    configure_document_conversion_service,
+)
+
+STAND_IN_WORKER = textwrap.dedent(
+    """
+    import json, os, sys, time
+
+    print(json.dumps({"ready": True}), flush=True)
+    for line in sys.stdin:
+        request = json.loads(line)
+        with open(request["input"], "rb") as f:
+            data = f.read()
+        if data == b"hang":
+            time.sleep(60)
+        if data == b"crash":
+            sys.exit(3)
+        if data == b"bad":
+            print(json.dumps({"ok": False, "error": "cannot load"}), flush=True)
+            continue
+        with open(request["output"], "wb") as f:
+            f.write(b"%PDF pid=" + str(os.getpid()).encode())
+        print(json.dumps({"ok": True}), flush=True)
+    """
+)
+
+UNAVAILABLE_WORKER = textwrap.dedent(
+    """
+    import json
+    print(json.dumps({"ready": False, "error": "no UNO"}), flush=True)
+    """
+)
+
+# Stand-in soffice for the per-conversion fallback path
+STAND_IN_SOFFICE = textwrap.dedent(
+    """
+    import sys
+    args = sys.argv[1:]
+    outdir = args[args.index("--outdir") + 1]
+    with open(outdir + "/input.pdf", "wb") as f:
+        f.write(b"%PDF per-call")
+    """
+)
+
+
+@pytest.fixture
+def worker_command(tmp_path):
+    script = tmp_path / "stand_in_worker.py"
+    script.write_text(STAND_IN_WORKER)
+    return [sys.executable, str(script)]
+
+
+def _service(worker_command, **kwargs):
+    kwargs.setdefault("pool_size", 1)
+    return DocumentConversionService(
+        libreoffice_path=kwargs.pop("libreoffice_path", None),
+        worker_command=worker_command,
+        **kwargs,
+    )
+
+
+class TestPooledConversion:
+    async def test_worker_is_reused(self, worker_command):
+        service = _service(worker_command)
+        try:
+            first, error = await service.convert_binary_to_pdf(b"doc", "a.docx")
+            second, _ = await service.convert_binary_to_pdf(b"doc", "b.pptx")
+        finally:
+            await service.shutdown()
+
+        assert error is None
+        assert first.startswith(b"%PDF")
+        assert first == second
+        assert service._pool.stats["started"] == 1
+        assert service._pool.stats["conversions"] == 2
+
+    async def test_worker_is_recycled_after_max_jobs(self, worker_command):
+        service = _service(worker_command, max_jobs_per_worker=1)
+        try:
+            first, _ = await service.convert_binary_to_pdf(b"doc", "a.docx")
+            second, _ = await service.convert_binary_to_pdf(b"doc", "a.docx")
+        finally:
+            await service.shutdown()
+
+        assert first != second
+        assert service._pool.stats["recycled"] == 2
+
+    async def test_concurrent_conversions_use_separate_workers(self, worker_command):
+        service = _service(worker_command, pool_size=2)
+        try:
+            results = await asyncio.gather(
+                service.convert_binary_to_pdf(b"doc", "a.docx"),
+                service.convert_binary_to_pdf(b"doc", "b.docx"),
+            )
+        finally:
+            await service.shutdown()
+
+        # Each stand-in worker stamps its own pid into the output
+        assert results[0][0] != results[1][0]
+        assert service._pool.stats["started"] == 2
+
+    async def test_hung_worker_is_killed_and_replaced(self, worker_command):
+        service = _service(worker_command, timeout_seconds=1)
+        try:
+            pdf, error = await service.convert_binary_to_pdf(b"hang", "a.docx")
+            assert pdf is None
+            assert "timed out" in error
+
+            pdf, error = await service.convert_binary_to_pdf(b"doc", "a.docx")
+            assert error is None and pdf.startswith(b"%PDF")
+        finally:
+            await service.shutdown()
+
+        assert service._pool.stats["killed"] == 1
+        assert service._pool.stats["started"] == 2
+
+    async def test_crashed_worker_is_replaced(self, worker_command):
+        service = _service(worker_command)
+        try:
+            pdf, error = await service.convert_binary_to_pdf(b"crash", "a.docx")
+            assert pdf is None
+            assert error == "LibreOffice conversion failed"
+
+            pdf, error = await service.convert_binary_to_pdf(b"doc", "a.docx")
+            assert error is None
+        finally:
+            await service.shutdown()
+
+    async def test_conversion_error_keeps_worker(self, worker_command):
+        service = _service(worker_command)
+        try:
+            pdf, error = await service.convert_binary_to_pdf(b"bad", "a.docx")
+            await service.convert_binary_to_pdf(b"doc", "a.docx")
+        finally:
+            await service.shutdown()
+
+        assert pdf is None
+        assert error == "LibreOffice conversion failed"
+        assert service._pool.stats["started"] == 1
+
+    async def test_falls_back_when_worker_cannot_start(self, tmp_path):
+        worker = tmp_path / "unavailable_worker.py"
+        worker.write_text(UNAVAILABLE_WORKER)
+        soffice = tmp_path / "soffice"
+        soffice.write_text(f"#!{sys.executable}\n{STAND_IN_SOFFICE}")
+        soffice.chmod(0o755)
+
+        service = _service(
+            [sys.executable, str(worker)], libreoffice_path=str(soffice)
+        )
+        pdf, error = await service.convert_binary_to_pdf(b"doc", "a.docx")
+
+        assert error is None
+        assert pdf == b"%PDF per-call"
+        assert service.is_pooled is False
+
+
+class TestConfiguration:
+    def setup_method(self):
+        import solace_agent_mesh.gateway.http_sse.services.document_conversion_service as module
+        module._conversion_service = None
+
+    def teardown_method(self):
+        self.setup_method()
+
+    def test_pool_disabled_by_default(self, worker_command):
+        service = configure_document_conversion_service({"worker_command": worker_command})
+        assert service.is_pooled is False
+
+    def test_pool_from_config(self, worker_command):
+        service = configure_document_conversion_service(
+            {"worker_command": worker_command, "pool_size": 2, "max_jobs_per_worker": 5}
+        )
+        assert service.is_pooled is True
+        assert service._pool.size == 2
+        assert service._pool.max_jobs_per_worker == 5
@@ -596,6 +596,11 @@ class TestCompletionEventSignaledOnError:
 # _save_chat_task
 # ===========================================================================
 
+_CHAT_TASK_SAVE = (
+    "solace_agent_mesh.gateway.http_sse.repository.chat_task_repository.ChatTaskRepository.save"
+)
+
+
 class TestSaveChatTask:
     """Tests for ``ResultHandler._save_chat_task``."""
 
@@ -620,11 +625,12 @@ class TestSaveChatTask:
         with patch(
             "solace_agent_mesh.gateway.http_sse.services.scheduler.result_handler.now_epoch_ms",
             return_value=9000,
-        ):
+        ), patch(_CHAT_TASK_SAVE) as mock_save:
             handler._save_chat_task(mock_session, execution, messages)
 
-        mock_session.add.assert_called_once()
-        chat_task = mock_session.add.call_args[0][0]
+        mock_save.assert_called_once()
+        saved_session, chat_task = mock_save.call_args[0]
+        assert saved_session is mock_session
 
         assert chat_task.id == "a2a-70"
         assert chat_task.session_id == "scheduled_exec-70"
@@ -674,10 +680,10 @@ class TestSaveChatTask:
         with patch(
             "solace_agent_mesh.gateway.http_sse.services.scheduler.result_handler.now_epoch_ms",
             return_value=9001,
-        ):
+        ), patch(_CHAT_TASK_SAVE) as mock_save:
             handler._save_chat_task(mock_session, execution, messages, artifacts=artifacts)
 
-        chat_task = mock_session.add.call_args[0][0]
+        chat_task = mock_save.call_args[0][1]
         bubbles = _json.loads(chat_task.message_bubbles)
 
         # Agent bubble should contain artifact marker text and artifact part
@@ -687,7 +693,7 @@ class TestSaveChatTask:
         assert agent_bubble["parts"][1]["kind"] == "artifact"
         assert agent_bubble["parts"][1]["name"] == "report.pdf"
 
-    def test_no_bubbles_does_not_add_chat_task(self):
+    def test_no_bubbles_does_not_save_chat_task(self):
         handler, mock_session = _build_result_handler()
 
         mock_task = MagicMock()
@@ -702,10 +708,10 @@ class TestSaveChatTask:
         with patch(
             "solace_agent_mesh.gateway.http_sse.services.scheduler.result_handler.now_epoch_ms",
             return_value=9002,
-        ):
+        ), patch(_CHAT_TASK_SAVE) as mock_save:
             handler._save_chat_task(mock_session, execution, messages=[])
 
-        mock_session.add.assert_not_called()
+        mock_save.assert_not_called()
 
     def test_is_error_flag_propagated_to_agent_bubble(self):
         import json as _json
@@ -727,10 +733,10 @@ class TestSaveChatTask:
         with patch(
             "solace_agent_mesh.gateway.http_sse.services.scheduler.result_handler.now_epoch_ms",
             return_value=9003,
-        ):
+        ), patch(_CHAT_TASK_SAVE) as mock_save:
             handler._save_chat_task(mock_session, execution, messages, is_error=True)
 
-        chat_task = mock_session.add.call_args[0][0]
+        chat_task = mock_save.call_args[0][1]
         bubbles = _json.loads(chat_task.message_bubbles)
         assert bubbles[1]["isError"] is True
 
@@ -0,0 +1,271 @@
+"""Tests for multi-instance SchedulerService coordination.
+
+Runs several in-process SchedulerService instances against one SQLite
+database to check lease-based sharding, failover and orphan recovery.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable
+
+from solace_agent_mesh.gateway.http_sse.repository.models import (
+    ExecutionStatus,
+    ScheduledTaskExecutionModel,
+    ScheduledTaskModel,
+    SchedulerInstanceModel,
+    ScheduleType,
+)
+from solace_agent_mesh.gateway.http_sse.repository.models.base import Base
+from solace_agent_mesh.gateway.http_sse.services.scheduler.coordinator import (
+    SchedulerCoordinator,
+)
+from solace_agent_mesh.gateway.http_sse.shared import now_epoch_ms
+
+NAMESPACE = "ns1"
+COORDINATED_CONFIG = {"multi_instance_enabled": True, "lease_ttl_seconds": 15}
+
+
+@pytest.fixture()
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scheduler.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _add_tasks(session_factory, count):
+    with session_factory() as session:
+        for i in range(count):
+            session.add(
+                ScheduledTaskModel(
+                    id=f"task-{i:02d}",
+                    name=f"Task {i}",
+                    namespace=NAMESPACE,
+                    created_by="user-1",
+                    schedule_type=ScheduleType.CRON,
+                    schedule_expression="0 3 * * *",
+                    timezone="UTC",
+                    target_agent_name="agent-a",
+                    task_message=[{"type": "text", "text": "hello"}],
+                )
+            )
+        session.commit()
+
+
+def _build_service(session_factory, instance_id, config=COORDINATED_CONFIG):
+    from solace_agent_mesh.gateway.http_sse.services.scheduler.scheduler_service import (
+        SchedulerService,
+    )
+
+    with patch(
+        "solace_agent_mesh.gateway.http_sse.services.scheduler.scheduler_service.ResultHandler"
+    ), patch(
+        "solace_agent_mesh.gateway.http_sse.services.scheduler.scheduler_service.NotificationService"
+    ) as MockNotificationService:
+        MockNotificationService.return_value.cleanup = MagicMock(side_effect=_noop_async)
+        return SchedulerService(
+            session_factory=session_factory,
+            namespace=NAMESPACE,
+            instance_id=instance_id,
+            publish_func=MagicMock(),
+            core_a2a_service=MagicMock(),
+            config=dict(config),
+        )
+
+
+async def _noop_async(*args, **kwargs):
+    return None
+
+
+def _expire_lease(session_factory, instance_id):
+    with session_factory() as session:
+        row = session.get(SchedulerInstanceModel, instance_id)
+        row.lease_expires_at = now_epoch_ms() - 1
+        session.commit()
+
+
+class TestSchedulerCoordinator:
+
+    def test_rendezvous_ownership_is_stable_and_minimal(self, session_factory):
+        coordinators = [
+            SchedulerCoordinator(session_factory, NAMESPACE, iid) for iid in ("a", "b", "c")
+        ]
+        for coordinator in coordinators:
+            coordinator.renew_lease()
+        coordinators[0].renew_lease()
+
+        keys = [f"task-{i}" for i in range(200)]
+        before = {key: coordinators[0].owner_of(key) for key in keys}
+        assert set(before.values()) == {"a", "b", "c"}
+
+        coordinators[2].release_lease()
+        coordinators[0].renew_lease()
+        after = {key: coordinators[0].owner_of(key) for key in keys}
+
+        # Only the tasks owned by the departed instance move
+        moved = [key for key in keys if before[key] != after[key]]
+        assert moved and all(before[key] == "c" for key in moved)
+
+    def test_expired_leases_leave_live_set(self, session_factory):
+        first = SchedulerCoordinator(session_factory, NAMESPACE, "a")
+        second = SchedulerCoordinator(session_factory, NAMESPACE, "b")
+        first.renew_lease()
+        second.renew_lease()
+        assert second.live_instances == ["a", "b"]
+
+        _expire_lease(session_factory, "a")
+
+        assert second.renew_lease() == ["b"]
+        assert second.is_leader() is True
+
+    def test_lease_table_compiles_for_mysql(self):
+        ddl = str(CreateTable(SchedulerInstanceModel.__table__).compile(dialect=mysql.dialect()))
+        assert "instance_id VARCHAR(64)" in ddl
+        assert "namespace VARCHAR(255)" in ddl
+
+
+class TestMultiInstanceScheduling:
+
+    @pytest.mark.asyncio
+    async def test_instances_shard_tasks_without_overlap(self, session_factory):
+        _add_tasks(session_factory, 20)
+        first = _build_service(session_factory, "inst-a")
+        second = _build_service(session_factory, "inst-b")
+
+        await first.start()
+        await second.start()
+        await first._coordination_tick()
+        try:
+            owned_a = set(first.active_tasks)
+            owned_b = set(second.active_tasks)
+            assert owned_a and owned_b
+            assert owned_a.isdisjoint(owned_b)
+            assert owned_a | owned_b == {f"task-{i:02d}" for i in range(20)}
+            assert [await first.is_leader(), await second.is_leader()] == [True, False]
+        finally:
+            await first.stop()
+            await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_survivor_takes_over_after_graceful_stop(self, session_factory):
+        _add_tasks(session_factory, 10)
+        first = _build_service(session_factory, "inst-a")
+        second = _build_service(session_factory, "inst-b")
+        await first.start()
+        await second.start()
+        await first._coordination_tick()
+
+        await second.stop()
+        await first._coordination_tick()
+        try:
+            assert len(first.active_tasks) == 10
+        finally:
+            await first.stop()
+
+    @pytest.mark.asyncio
+    async def test_failover_recovers_orphaned_executions(self, session_factory):
+        _add_tasks(session_factory, 1)
+        survivor = _build_service(session_factory, "inst-a")
+        crashed = SchedulerCoordinator(session_factory, NAMESPACE, "inst-b")
+        crashed.renew_lease()
+        with session_factory() as session:
+            for execution_id, owner in (("exec-crashed", "inst-b"), ("exec-previous-run", "inst-a")):
+                session.add(
+                    ScheduledTaskExecutionModel(
+                        id=execution_id,
+                        scheduled_task_id="task-00",
+                        status=ExecutionStatus.RUNNING,
+                        scheduled_for=now_epoch_ms(),
+                        instance_id=owner,
+                    )
+                )
+            session.commit()
+
+        await survivor.start()
+        try:
+            with session_factory() as session:
+                statuses = dict(session.execute(
+                    select(ScheduledTaskExecutionModel.id, ScheduledTaskExecutionModel.status)
+                ).all())
+            # inst-b is still live, and inst-a's own row predates this start
+            assert statuses == {
+                "exec-crashed": ExecutionStatus.RUNNING,
+                "exec-previous-run": ExecutionStatus.FAILED,
+            }
+
+            _expire_lease(session_factory, "inst-b")
+            await survivor._coordination_tick()
+
+            with session_factory() as session:
+                crashed_execution = session.get(ScheduledTaskExecutionModel, "exec-crashed")
+                assert crashed_execution.status == ExecutionStatus.FAILED
+            assert survivor.coordinator.live_instances == ["inst-a"]
+            assert set(survivor.active_tasks) == {"task-00"}
+        finally:
+            await survivor.stop()
+
+    @pytest.mark.asyncio
+    async def test_non_owner_skips_scheduled_fire(self, session_factory):
+        _add_tasks(session_factory, 10)
+        first = _build_service(session_factory, "inst-a")
+        second = _build_service(session_factory, "inst-b")
+        await first.start()
+        await second.start()
+        await first._coordination_tick()
+        try:
+            foreign_task = next(iter(second.active_tasks))
+            await first._execute_scheduled_task(foreign_task)
+
+            with session_factory() as session:
+                assert session.execute(select(ScheduledTaskExecutionModel)).first() is None
+        finally:
+            await first.stop()
+            await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_disagreeing_views_fire_a_run_once(self, session_factory):
+        _add_tasks(session_factory, 1)
+        first = _build_service(session_factory, "inst-a")
+        second = _build_service(session_factory, "inst-b")
+        await first.start()
+        await second.start()
+        try:
+            # Mid-rebalance both instances believe they own the task
+            for service in (first, second):
+                service.coordinator.owns = lambda task_id: True
+                with session_factory() as session:
+                    await service.schedule_task(session.get(ScheduledTaskModel, "task-00"))
+            with session_factory() as session:
+                session.get(ScheduledTaskModel, "task-00").next_run_at = now_epoch_ms() - 1
+                session.commit()
+
+            fired = []
+            for service in (first, second):
+                service._execute_scheduled_task_inner = AsyncMock(
+                    side_effect=lambda *args, service=service: fired.append(service.instance_id)
+                )
+                await service._execute_scheduled_task("task-00")
+
+            assert fired == ["inst-a"]
+            with session_factory() as session:
+                assert session.get(ScheduledTaskModel, "task-00").next_run_at > now_epoch_ms()
+        finally:
+            await first.stop()
+            await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_single_instance_mode_has_no_leases(self, session_factory):
+        _add_tasks(session_factory, 3)
+        service = _build_service(session_factory, "inst-a", config={})
+        await service.start()
+        try:
+            assert len(service.active_tasks) == 3
+            assert await service.is_leader() is True
+            with session_factory() as session:
+                assert session.execute(select(SchedulerInstanceModel)).first() is None
+        finally:
+            await service.stop()
@@ -0,0 +1,151 @@
+"""
+Unit tests for the TTS audio cache and its use by AudioService.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from solace_agent_mesh.gateway.http_sse.services.audio_service import AudioService
+from solace_agent_mesh.gateway.http_sse.services.tts_cache import (
+    TTSAudioCache,
+    get_shared_tts_cache,
+    make_tts_cache_key,
+)
+
+
+def _service(cache_config=None):
+    tts_config = {"provider": "gemini", "gemini": {"api_key": "k"}}
+    tts_config["cache"] = cache_config or {}
+    service = AudioService(config={"speech": {"tts": tts_config}})
+    # Isolate each test from the process-wide cache
+    service.tts_cache = TTSAudioCache()
+    return service
+
+
+class TestCacheKey:
+    def test_key_depends_on_every_component(self):
+        base = make_tts_cache_key("hello", "Kore", "gemini", "mp3")
+        assert base == make_tts_cache_key("hello", "Kore", "gemini", "mp3")
+        assert base != make_tts_cache_key("hello!", "Kore", "gemini", "mp3")
+        assert base != make_tts_cache_key("hello", "Puck", "gemini", "mp3")
+        assert base != make_tts_cache_key("hello", "Kore", "azure", "mp3")
+        assert base != make_tts_cache_key("hello", "Kore", "gemini", "wav")
+
+    def test_field_boundaries_are_unambiguous(self):
+        assert make_tts_cache_key("b", "a", "x") != make_tts_cache_key("", "ab", "x")
+
+
+class TestTTSAudioCache:
+    def test_lru_eviction_by_bytes(self):
+        cache = TTSAudioCache(max_entries=10, max_bytes=10)
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")
+        cache.get("a")
+        cache.put("c", b"12345")
+
+        assert cache.get("a") == b"12345"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"12345"
+
+    def test_lru_eviction_by_entries(self):
+        cache = TTSAudioCache(max_entries=2, max_bytes=1000)
+        for key in ("a", "b", "c"):
+            cache.put(key, b"x")
+        assert cache.get("a") is None
+        assert cache.stats()["memory_entries"] == 2
+
+    def test_disk_spill_survives_new_instance(self, tmp_path):
+        cache = TTSAudioCache(max_entries=1, disk_dir=str(tmp_path))
+        cache.put("a", b"audio-a")
+        cache.put("b", b"audio-b")
+
+        # "a" was evicted from memory but is still on disk
+        assert cache.get("a") == b"audio-a"
+
+        reopened = TTSAudioCache(disk_dir=str(tmp_path))
+        assert reopened.get("b") == b"audio-b"
+
+    def test_disk_is_bounded(self, tmp_path):
+        cache = TTSAudioCache(disk_dir=str(tmp_path), disk_max_bytes=10)
+        cache.put("a", b"123456")
+        cache.put("b", b"123456")
+
+        assert cache.stats()["disk_entries"] == 1
+        assert not (tmp_path / "a.audio").exists()
+
+    async def test_concurrent_requests_share_one_synthesis(self):
+        cache = TTSAudioCache()
+        calls = 0
+        release = asyncio.Event()
+
+        async def synthesize():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return b"audio"
+
+        waiters = [asyncio.create_task(cache.get_or_create("k", synthesize)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == [b"audio"] * 5
+        assert calls == 1
+        assert cache.stats()["shared"] == 4
+
+    async def test_failures_are_not_cached(self):
+        cache = TTSAudioCache()
+        synthesize = AsyncMock(side_effect=[RuntimeError("boom"), b"audio"])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_create("k", synthesize)
+        assert await cache.get_or_create("k", synthesize) == b"audio"
+        assert synthesize.await_count == 2
+
+    def test_shared_cache_disabled(self):
+        assert get_shared_tts_cache({"enabled": False}) is None
+        assert get_shared_tts_cache({"max_entries": 7}) is get_shared_tts_cache(
+            {"max_entries": 7}
+        )
+
+
+class TestAudioServiceCaching:
+    async def test_generate_speech_reuses_cached_audio(self):
+        service = _service()
+        with patch.object(
+            service, "generate_speech_gemini", AsyncMock(return_value=b"mp3")
+        ) as gemini:
+            first = await service.generate_speech("**Hello**", None, "u", "s1")
+            second = await service.generate_speech("Hello", "Kore", "u", "s2")
+
+        assert first == second == b"mp3"
+        gemini.assert_awaited_once()
+
+    async def test_generate_speech_without_cache(self):
+        service = _service({"enabled": False})
+        service.tts_cache = None
+        with patch.object(
+            service, "generate_speech_gemini", AsyncMock(return_value=b"mp3")
+        ) as gemini:
+            await service.generate_speech("Hello", None, "u", "s")
+            await service.generate_speech("Hello", None, "u", "s")
+
+        assert gemini.await_count == 2
+
+    async def test_stream_speech_serves_cached_chunks(self):
+        service = _service()
+        # Each sentence is long enough to become its own chunk
+        first = "First " + "a" * 250 + "."
+        second = "Second " + "b" * 250 + "."
+
+        async def fake_gemini(text, *args):
+            return text[:5].encode()
+
+        with patch.object(
+            service, "generate_speech_gemini", AsyncMock(side_effect=fake_gemini)
+        ) as gemini:
+            initial = [c async for c in service.stream_speech(first, None, "u", "s")]
+            replay = [c async for c in service.stream_speech(first + " " + second, None, "u", "s")]
+
+        assert initial == [b"First"]
+        assert replay == [b"First", b"Secon"]
+        assert gemini.await_count == 2
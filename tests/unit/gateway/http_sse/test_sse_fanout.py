@@ -0,0 +1,224 @@
+"""Tests for cross-replica SSE fan-out.
+
+Several in-process SSEManager instances, each standing in for one WebUI
+gateway replica, are connected through the in-repo DevBroker.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sam_test_infrastructure.dev_broker import DevBroker
+
+from solace_agent_mesh.gateway.http_sse.app import WebUIBackendApp
+from solace_agent_mesh.gateway.http_sse.component import WebUIBackendComponent
+from solace_agent_mesh.gateway.http_sse.sse_event_buffer import SSEEventBuffer
+from solace_agent_mesh.gateway.http_sse.sse_fanout import BrokerSSEFanout, SSEFanout
+from solace_agent_mesh.gateway.http_sse.sse_manager import SSEManager
+
+NAMESPACE = "test_ns"
+GROUP = "webui"
+APP_NAME = "webui_app"
+TASK_ID = "task-1"
+
+
+class Cluster:
+    """A DevBroker plus gateway replicas whose SSE managers share one group."""
+
+    def __init__(self, broker: DevBroker):
+        self.broker = broker
+        self.pending: list[asyncio.Task] = []
+
+    def add_replica(self, group: str = GROUP) -> SSEManager:
+        manager = SSEManager(100, SSEEventBuffer(100, 600), persistent_buffer_enabled=False)
+        fanout = BrokerSSEFanout(
+            publish=lambda payload, topic: self.broker.publish_message(topic, payload),
+            namespace=NAMESPACE,
+            group=group,
+        )
+        manager.set_fanout(fanout)
+
+        def on_message(topic, message):
+            self.pending.append(
+                asyncio.get_running_loop().create_task(
+                    manager.handle_fanout_message(message.payload)
+                )
+            )
+
+        self.broker.subscribe(fanout.instance_id, fanout.subscription_topic, on_message)
+        return manager
+
+    def add_gateway(self, gateway_id: str, app_config: dict) -> SSEManager:
+        """
+        Adds a replica the way a deployed WebUI gateway is wired: its queue is
+        named after its gateway ID and carries the app's subscriptions, and the
+        component publishes on the group the app resolved into its config.
+        """
+        app = SimpleNamespace(
+            namespace=NAMESPACE, gateway_id=gateway_id, _sse_fanout_default_group=APP_NAME
+        )
+        subscriptions = WebUIBackendApp._get_gateway_specific_subscriptions(app, app_config)
+
+        manager = SSEManager(100, SSEEventBuffer(100, 600), persistent_buffer_enabled=False)
+        fanout = BrokerSSEFanout(
+            publish=lambda payload, topic: self.broker.publish_message(topic, payload),
+            namespace=NAMESPACE,
+            group=app_config["sse_fanout_group"],
+        )
+        manager.set_fanout(fanout)
+
+        def on_message(topic, message):
+            self.pending.append(
+                asyncio.get_running_loop().create_task(
+                    manager.handle_fanout_message(message.payload)
+                )
+            )
+
+        for subscription in subscriptions:
+            self.broker.subscribe(gateway_id, subscription["topic"], on_message)
+        return manager
+
+    async def settle(self):
+        while self.pending:
+            await self.pending.pop(0)
+
+
+@pytest.fixture
+async def cluster():
+    broker = DevBroker()
+    await broker.start()
+    yield Cluster(broker)
+    await broker.stop()
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+class TestCrossReplicaFanout:
+    async def test_event_reaches_connection_on_another_replica(self, cluster):
+        origin, other = cluster.add_replica(), cluster.add_replica()
+        local_queue = await origin.create_sse_connection(TASK_ID)
+        remote_queue = await other.create_sse_connection(TASK_ID)
+
+        await origin.send_event(TASK_ID, {"n": 1}, "status_update")
+        await cluster.settle()
+
+        local, remote = _drain(local_queue), _drain(remote_queue)
+        assert len(local) == 1, "origin must not receive its own re-published event"
+        assert remote == local
+        assert json.loads(remote[0]["data"]) == {"n": 1}
+
+    async def test_replica_without_connection_ignores_events(self, cluster):
+        origin, other = cluster.add_replica(), cluster.add_replica()
+
+        await origin.send_event(TASK_ID, {"n": 1}, "status_update")
+        await cluster.settle()
+
+        queue = await other.create_sse_connection(TASK_ID)
+        assert _drain(queue) == []
+
+    async def test_other_groups_are_isolated(self, cluster):
+        origin, other = cluster.add_replica(), cluster.add_replica(group="other")
+        remote_queue = await other.create_sse_connection(TASK_ID)
+
+        await origin.send_event(TASK_ID, {"n": 1}, "status_update")
+        await cluster.settle()
+
+        assert _drain(remote_queue) == []
+
+    async def test_redelivered_events_are_deduplicated_by_sequence(self, cluster):
+        origin, other = cluster.add_replica(), cluster.add_replica()
+        remote_queue = await other.create_sse_connection(TASK_ID)
+        published = []
+        cluster.broker.add_message_listener(published.append)
+
+        for n in range(3):
+            await origin.send_event(TASK_ID, {"n": n}, "status_update")
+        await cluster.settle()
+        for message in published:
+            await other.handle_fanout_message(message.payload)
+
+        received = [json.loads(e["data"])["n"] for e in _drain(remote_queue)]
+        assert received == [0, 1, 2]
+
+    async def test_close_on_origin_closes_remote_connections(self, cluster):
+        origin, other = cluster.add_replica(), cluster.add_replica()
+        await origin.create_sse_connection(TASK_ID)
+        remote_queue = await other.create_sse_connection(TASK_ID)
+
+        await origin.send_event(TASK_ID, {"n": 1}, "final_response")
+        await origin.close_all_for_task(TASK_ID)
+        await cluster.settle()
+
+        events = _drain(remote_queue)
+        assert events[-1] is None
+        assert json.loads(events[0]["data"]) == {"n": 1}
+
+    async def test_publish_failure_does_not_break_local_stream(self):
+        manager = SSEManager(100, SSEEventBuffer(100, 600), persistent_buffer_enabled=False)
+        manager.set_fanout(
+            BrokerSSEFanout(
+                publish=MagicMock(side_effect=RuntimeError("broker down")),
+                namespace=NAMESPACE,
+                group=GROUP,
+            )
+        )
+        queue = await manager.create_sse_connection(TASK_ID)
+
+        await manager.send_event(TASK_ID, {"n": 1}, "status_update")
+
+        assert len(_drain(queue)) == 1
+
+
+class TestGatewayQueues:
+    async def test_gateways_with_distinct_ids_share_events_by_default(self, cluster):
+        origin = cluster.add_gateway("gw-1", {"sse_fanout_enabled": True})
+        other = cluster.add_gateway("gw-2", {"sse_fanout_enabled": True})
+        remote_queue = await other.create_sse_connection(TASK_ID)
+
+        await origin.send_event(TASK_ID, {"n": 1}, "status_update")
+        await cluster.settle()
+
+        assert [json.loads(e["data"]) for e in _drain(remote_queue)] == [{"n": 1}]
+
+
+class TestFanoutWiring:
+    def test_subscription_only_when_enabled(self):
+        app = SimpleNamespace(
+            namespace=NAMESPACE, gateway_id="gw-1", _sse_fanout_default_group=APP_NAME
+        )
+
+        assert WebUIBackendApp._get_gateway_specific_subscriptions(app, {}) == []
+        app_config = {"sse_fanout_enabled": True}
+        assert WebUIBackendApp._get_gateway_specific_subscriptions(app, app_config) == [
+            {"topic": f"{NAMESPACE}/a2a/v1/gateway/sse/{APP_NAME}/>"}
+        ]
+        assert app_config["sse_fanout_group"] == APP_NAME
+        assert WebUIBackendApp._get_gateway_specific_subscriptions(
+            app, {"sse_fanout_enabled": True, "sse_fanout_group": GROUP}
+        ) == [{"topic": f"{NAMESPACE}/a2a/v1/gateway/sse/{GROUP}/>"}]
+
+    def test_backends_must_implement_publish(self):
+        with pytest.raises(TypeError):
+            SSEFanout()
+
+    async def test_component_forwards_fanout_topics_only(self):
+        fanout = BrokerSSEFanout(publish=MagicMock(), namespace=NAMESPACE, group=GROUP)
+        component = SimpleNamespace(
+            sse_fanout=fanout, sse_manager=SimpleNamespace(handle_fanout_message=AsyncMock())
+        )
+        handle = WebUIBackendComponent._handle_gateway_specific_message
+
+        topic = f"{NAMESPACE}/a2a/v1/gateway/sse/{GROUP}/{TASK_ID}"
+        assert await handle(component, topic, {"kind": "event"}) is True
+        component.sse_manager.handle_fanout_message.assert_awaited_once_with({"kind": "event"})
+
+        assert await handle(component, f"{NAMESPACE}/a2a/v1/other", {}) is False
+        component.sse_fanout = None
+        assert await handle(component, topic, {}) is False
@@ -19,7 +19,7 @@ import threading
 import json
 import math
 import datetime
-from unittest.mock import MagicMock, AsyncMock, patch, call
+from unittest.mock import ANY, MagicMock, AsyncMock, patch, call
 from typing import Dict, Any
 
 from solace_agent_mesh.gateway.http_sse.sse_manager import SSEManager
@@ -426,6 +426,7 @@ class TestSSEManagerEventDistribution:
         event2 = await queue2.get()
         
         expected_payload = {
+            "id": ANY,
             "event": "message",
             "data": json.dumps(event_data, allow_nan=False)
         }
@@ -433,6 +434,25 @@ class TestSSEManagerEventDistribution:
         assert event1 == expected_payload
         assert event2 == expected_payload
 
+    @pytest.mark.asyncio
+    async def test_send_event_assigns_increasing_ids(self):
+        """Test consecutive events for a task carry strictly increasing SSE IDs."""
+        event_buffer = MagicMock(spec=SSEEventBuffer)
+        event_buffer.get_and_remove_buffer.return_value = None
+        manager = SSEManager(100, event_buffer)
+        task_id = "test-task-123"
+
+        queue = await manager.create_sse_connection(task_id)
+        with patch(
+            "solace_agent_mesh.gateway.http_sse.sse_manager.now_epoch_ms",
+            return_value=5,
+        ):
+            for i in range(3):
+                await manager.send_event(task_id, {"n": i}, "message")
+
+        ids = [int((await queue.get())["id"]) for _ in range(3)]
+        assert ids == [5000, 5001, 5002]
+
     @pytest.mark.asyncio
     async def test_send_event_no_connections_buffers_event(self):
         """Test sending event when no connections exist buffers the event."""
@@ -448,6 +468,7 @@ class TestSSEManagerEventDistribution:
         
         # Verify
         expected_payload = {
+            "id": ANY,
             "event": "message",
             "data": json.dumps(event_data, allow_nan=False)
         }
@@ -607,6 +628,7 @@ class TestSSEManagerBackgroundTaskBuffering:
 
         # Verify - event should be buffered, not dropped
         expected_payload = {
+            "id": ANY,
             "event": "message",
             "data": json.dumps(event_data, allow_nan=False)
         }
@@ -924,6 +946,7 @@ class TestSSEManagerEdgeCases:
         
         # Verify
         expected_payload = {
+            "id": ANY,
             "event": "message",
             "data": json.dumps(event_data, allow_nan=False)
         }
@@ -180,24 +180,12 @@ class TestCopyProjectArtifactsToSession:
         with patch(
             "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.get_artifact_info_list"
         ) as mock_get_list, patch(
-            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.load_artifact_content_or_metadata"
-        ) as mock_load, patch(
-            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.save_artifact_with_metadata"
-        ) as mock_save:
+            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.copy_artifact_with_metadata"
+        ) as mock_copy:
             # First call returns project artifacts, second returns empty session
             mock_get_list.side_effect = [[artifact_info1, artifact_info2], []]
 
-            # Mock loading artifact content and metadata
-            mock_load.side_effect = [
-                # file1.txt content
-                {"status": "success", "raw_bytes": b"content1", "mime_type": "text/plain"},
-                # file1.txt metadata
-                {"status": "success", "metadata": {"original": "metadata1"}},
-                # file2.txt content
-                {"status": "success", "raw_bytes": b"content2", "mime_type": "text/plain"},
-                # file2.txt metadata
-                {"status": "success", "metadata": {"original": "metadata2"}},
-            ]
+            mock_copy.return_value = {"status": "success", "data_version": 0}
 
             count, names = await copy_project_artifacts_to_session(
                 project_id="project123",
@@ -209,20 +197,21 @@ class TestCopyProjectArtifactsToSession:
             )
 
             # Verify artifacts were saved
-            assert mock_save.call_count == 2
+            assert mock_copy.call_count == 2
             assert count == 2
             assert names == ["file1.txt", "file2.txt"]
 
-            # Verify each saved artifact has project_context_pending=True
-            for call in mock_save.call_args_list:
-                metadata = call[1]["metadata_dict"]
+            # Verify each copied artifact gets project_context_pending=True
+            for call in mock_copy.call_args_list:
+                metadata = call[1]["metadata_updates"]
                 assert metadata["project_context_pending"] is True
+                assert call[1]["reference"] is False
 
     @pytest.mark.asyncio
     async def test_copy_project_artifacts_creates_single_version_per_artifact(
         self, mock_project_service, mock_component, mock_db, mock_project
     ):
-        """CRITICAL REGRESSION TEST: Verify save_artifact_with_metadata is called exactly once per artifact."""
+        """CRITICAL REGRESSION TEST: Verify copy_artifact_with_metadata is called exactly once per artifact."""
         mock_artifact_service = Mock()
         mock_component.get_shared_artifact_service.return_value = mock_artifact_service
         mock_project_service.get_project.return_value = mock_project
@@ -238,28 +227,15 @@ class TestCopyProjectArtifactsToSession:
         with patch(
             "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.get_artifact_info_list"
         ) as mock_get_list, patch(
-            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.load_artifact_content_or_metadata"
-        ) as mock_load, patch(
-            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.save_artifact_with_metadata"
-        ) as mock_save:
+            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.copy_artifact_with_metadata"
+        ) as mock_copy:
             # First call returns project artifacts, second returns empty session
             mock_get_list.side_effect = [
                 [artifact_info1, artifact_info2, artifact_info3],
                 [],
             ]
 
-            # Mock loading artifact content and metadata for 3 artifacts
-            mock_load.side_effect = [
-                # file1
-                {"status": "success", "raw_bytes": b"content1", "mime_type": "text/plain"},
-                {"status": "success", "metadata": {}},
-                # file2
-                {"status": "success", "raw_bytes": b"content2", "mime_type": "text/plain"},
-                {"status": "success", "metadata": {}},
-                # file3
-                {"status": "success", "raw_bytes": b"content3", "mime_type": "text/plain"},
-                {"status": "success", "metadata": {}},
-            ]
+            mock_copy.return_value = {"status": "success", "data_version": 0}
 
             count, names = await copy_project_artifacts_to_session(
                 project_id="project123",
@@ -271,15 +247,15 @@ class TestCopyProjectArtifactsToSession:
             )
 
             # CRITICAL: Verify each artifact is saved exactly once (not twice)
-            assert mock_save.call_count == 3, (
-                f"Expected save_artifact_with_metadata to be called exactly 3 times "
-                f"(once per artifact), but was called {mock_save.call_count} times"
+            assert mock_copy.call_count == 3, (
+                f"Expected copy_artifact_with_metadata to be called exactly 3 times "
+                f"(once per artifact), but was called {mock_copy.call_count} times"
             )
             assert count == 3
             assert names == ["file1.txt", "file2.txt", "file3.txt"]
 
             # Verify the filenames match
-            saved_filenames = [call[1]["filename"] for call in mock_save.call_args_list]
+            saved_filenames = [call[1]["filename"] for call in mock_copy.call_args_list]
             assert saved_filenames == ["file1.txt", "file2.txt", "file3.txt"]
 
     @pytest.mark.asyncio
@@ -308,21 +284,15 @@ class TestCopyProjectArtifactsToSession:
         with patch(
             "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.get_artifact_info_list"
         ) as mock_get_list, patch(
-            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.load_artifact_content_or_metadata"
-        ) as mock_load, patch(
-            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.save_artifact_with_metadata"
-        ) as mock_save:
+            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.copy_artifact_with_metadata"
+        ) as mock_copy:
             # First call returns project artifacts, second returns existing session artifacts
             mock_get_list.side_effect = [
                 [project_artifact1, project_artifact2, project_artifact3],
                 [session_artifact1, session_artifact2],
             ]
 
-            # Mock loading only for file3 (the new one)
-            mock_load.side_effect = [
-                {"status": "success", "raw_bytes": b"content3", "mime_type": "text/plain"},
-                {"status": "success", "metadata": {}},
-            ]
+            mock_copy.return_value = {"status": "success", "data_version": 0}
 
             count, names = await copy_project_artifacts_to_session(
                 project_id="project123",
@@ -334,12 +304,12 @@ class TestCopyProjectArtifactsToSession:
             )
 
             # Verify only file3.txt was copied
-            assert mock_save.call_count == 1
+            assert mock_copy.call_count == 1
             assert count == 1
             assert names == ["file3.txt"]
 
             # Verify it was file3.txt that was saved
-            saved_filename = mock_save.call_args_list[0][1]["filename"]
+            saved_filename = mock_copy.call_args_list[0][1]["filename"]
             assert saved_filename == "file3.txt"
 
     @pytest.mark.asyncio
@@ -360,24 +330,12 @@ class TestCopyProjectArtifactsToSession:
         with patch(
             "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.get_artifact_info_list"
         ) as mock_get_list, patch(
-            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.load_artifact_content_or_metadata"
-        ) as mock_load, patch(
-            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.save_artifact_with_metadata"
-        ) as mock_save:
+            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.copy_artifact_with_metadata"
+        ) as mock_copy:
             # First call returns project artifacts, second returns empty session
             mock_get_list.side_effect = [[artifact_info1, artifact_info2], []]
 
-            # Mock loading artifact content and metadata
-            mock_load.side_effect = [
-                # new_file1.txt content
-                {"status": "success", "raw_bytes": b"content1", "mime_type": "text/plain"},
-                # new_file1.txt metadata
-                {"status": "success", "metadata": {}},
-                # new_file2.txt content
-                {"status": "success", "raw_bytes": b"content2", "mime_type": "text/plain"},
-                # new_file2.txt metadata
-                {"status": "success", "metadata": {}},
-            ]
+            mock_copy.return_value = {"status": "success", "data_version": 0}
 
             count, names = await copy_project_artifacts_to_session(
                 project_id="project123",
@@ -407,16 +365,11 @@ class TestCopyProjectArtifactsToSession:
         with patch(
             "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.get_artifact_info_list"
         ) as mock_get_list, patch(
-            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.load_artifact_content_or_metadata"
-        ) as mock_load, patch(
-            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.save_artifact_with_metadata"
-        ) as mock_save:
+            "solace_agent_mesh.gateway.http_sse.utils.artifact_copy_utils.copy_artifact_with_metadata"
+        ) as mock_copy:
             # Project has file1.txt, session already has file1.txt
             mock_get_list.side_effect = [[project_artifact], [session_artifact]]
-            mock_load.side_effect = [
-                {"status": "success", "raw_bytes": b"updated", "mime_type": "text/plain"},
-                {"status": "success", "metadata": {"existing_key": "val"}},
-            ]
+            mock_copy.return_value = {"status": "success", "data_version": 0}
 
             count, names = await copy_project_artifacts_to_session(
                 project_id="project123",
@@ -430,10 +383,9 @@ class TestCopyProjectArtifactsToSession:
 
             assert count == 1
             assert names == ["file1.txt"]
-            assert mock_save.call_count == 1
-            saved_metadata = mock_save.call_args[1]["metadata_dict"]
+            assert mock_copy.call_count == 1
+            saved_metadata = mock_copy.call_args[1]["metadata_updates"]
             assert saved_metadata["project_context_pending"] is True
-            assert saved_metadata["existing_key"] == "val"
 
     @pytest.mark.asyncio
     async def test_copy_project_artifacts_no_project(
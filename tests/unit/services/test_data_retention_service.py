@@ -5,11 +5,21 @@ Tests configuration validation, cleanup logic, and error handling
 for the automatic data retention service that removes old tasks and feedback.
 """
 
+import itertools
 from unittest.mock import Mock, patch
 
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from solace_agent_mesh.gateway.http_sse.repository.models import TaskEventModel, TaskModel
+from solace_agent_mesh.gateway.http_sse.repository.models.base import Base
 from solace_agent_mesh.gateway.http_sse.services.data_retention_service import (
     DataRetentionService,
 )
+from solace_agent_mesh.shared.utils.timestamp_utils import now_epoch_ms
+
+DAY_MS = 24 * 60 * 60 * 1000
 
 
 class TestConfigurationValidation:
@@ -178,3 +188,121 @@ class TestCleanupLogic:
         # Assert
         assert "no database session factory" in caplog.text.lower()
 
+
+@pytest.fixture()
+def session_factory():
+    engine = create_engine("sqlite:///:memory:")
+
+    # Leave foreign keys off (SQLite's default) so events are only removed
+    # if the service deletes them explicitly
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    yield factory
+    engine.dispose()
+
+
+def _add_tasks(session_factory, count, start_time, events_per_task=2, prefix="task"):
+    db = session_factory()
+    for i in range(count):
+        task_id = f"{prefix}-{i:03d}"
+        db.add(TaskModel(id=task_id, user_id="u1", start_time=start_time + i))
+        for j in range(events_per_task):
+            db.add(
+                TaskEventModel(
+                    id=f"{task_id}-evt-{j}",
+                    task_id=task_id,
+                    user_id="u1",
+                    created_time=start_time + i,
+                    topic="t",
+                    direction="request",
+                    payload={},
+                )
+            )
+    db.commit()
+    db.close()
+
+
+def _counts(session_factory):
+    db = session_factory()
+    try:
+        return db.query(TaskModel).count(), db.query(TaskEventModel).count()
+    finally:
+        db.close()
+
+
+class TestChunkedTaskRetention:
+    """Tests for keyset-chunked, child-first task deletion."""
+
+    def _service(self, session_factory, **overrides):
+        config = {
+            "task_retention_days": 30,
+            "cleanup_feedback": False,
+            "cleanup_sse_events": False,
+            "batch_size": 2,
+        }
+        config.update(overrides)
+        return DataRetentionService(session_factory=session_factory, config=config)
+
+    def test_deletes_old_tasks_and_their_events(self, session_factory):
+        _add_tasks(session_factory, 5, now_epoch_ms() - 60 * DAY_MS, prefix="old")
+        _add_tasks(session_factory, 2, now_epoch_ms(), prefix="new")
+        service = self._service(session_factory)
+
+        service.cleanup_old_data()
+
+        assert _counts(session_factory) == (2, 4)
+        stats = service.last_run_stats[DataRetentionService.TASKS]
+        assert stats.deleted == 5
+        assert stats.rows_deleted == 15
+        assert stats.completed is True
+        assert stats.lag_ms == 0
+
+    def test_resumes_from_checkpoint_after_time_budget(self, session_factory):
+        _add_tasks(session_factory, 6, now_epoch_ms() - 60 * DAY_MS, events_per_task=0)
+        service = self._service(session_factory, max_run_seconds=1)
+
+        # The clock jumps past the deadline right after the run starts, so the
+        # pass stops after its first committed chunk
+        clock = itertools.chain([0], itertools.repeat(5))
+        with patch(
+            "solace_agent_mesh.gateway.http_sse.services.data_retention_service.time.monotonic",
+            side_effect=lambda: next(clock),
+        ):
+            service.cleanup_old_data()
+
+        stats = service.last_run_stats[DataRetentionService.TASKS]
+        assert stats.deleted == 2
+        assert stats.completed is False
+        assert stats.lag_ms > 0
+        assert service._checkpoints[DataRetentionService.TASKS][1] == "task-001"
+
+        service.config["max_run_seconds"] = 0
+        service.cleanup_old_data()
+
+        assert _counts(session_factory) == (0, 0)
+        assert service.last_run_stats[DataRetentionService.TASKS].deleted == 4
+        assert DataRetentionService.TASKS not in service._checkpoints
+
+    def test_throttles_to_rows_per_second_budget(self, session_factory):
+        _add_tasks(session_factory, 4, now_epoch_ms() - 60 * DAY_MS, events_per_task=0)
+        service = self._service(session_factory, max_rows_per_second=10)
+
+        with patch(
+            "solace_agent_mesh.gateway.http_sse.services.data_retention_service.time.sleep"
+        ) as mock_sleep:
+            service.cleanup_old_data()
+
+        assert _counts(session_factory) == (0, 0)
+        # Two chunks of two rows at 10 rows/s need ~0.2s and ~0.4s of budget
+        assert mock_sleep.call_count == 2
+        assert 0 < mock_sleep.call_args_list[0].args[0] <= 0.2
+        assert 0 < mock_sleep.call_args_list[1].args[0] <= 0.4
+
+    def test_negative_budget_settings_disable_limits(self, caplog):
+        with caplog.at_level("WARNING"):
+            service = DataRetentionService(
+                session_factory=None, config={"max_rows_per_second": -5}
+            )
+
+        assert service.config["max_rows_per_second"] == 0
+        assert "max_rows_per_second" in caplog.text
@@ -12,6 +12,8 @@ from solace_agent_mesh.workflow.flow_control.conditional import (
     evaluate_condition,
     ConditionalEvaluationError,
     _apply_template_aliases,
+    _parse_expression,
+    compile_condition,
 )
 from solace_agent_mesh.workflow.workflow_execution_context import WorkflowExecutionState
 
@@ -364,3 +366,38 @@ class TestFieldNotFoundError:
 
         with pytest.raises(ConditionalEvaluationError, match="Field 'nonexistent' not found"):
             evaluate_condition("'{{step1.output.nonexistent}}' == 'value'", state)
+
+
+class TestCompiledConditions:
+    """Tests for conditions being compiled once and reused."""
+
+    def test_condition_is_split_into_literals_and_references(self):
+        """Aliases are applied and references located at compile time."""
+        compiled = compile_condition("'{{item.status}}' == 'done' and {{ step1.output.n }} > 2")
+
+        assert compiled.segments == (
+            "'",
+            ("_map_item.status", ("_map_item", "status")),
+            "' == 'done' and ",
+            ("step1.output.n", ("step1", "output", "n")),
+            " > 2",
+        )
+
+    def test_repeated_evaluations_reuse_compiled_condition(self):
+        """Loop-style re-evaluation compiles the condition once, keyed on its definition."""
+        condition = "{{poll.output.attempts_reuse_marker}} < 3"
+        compile_condition.cache_clear()
+
+        results = []
+        for attempts in [0, 1, 2, 3, 3, 3]:
+            state = create_workflow_state({
+                "poll": {"output": {"attempts_reuse_marker": attempts}}
+            })
+            results.append(evaluate_condition(condition, state))
+
+        assert results == [True, True, True, False, False, False]
+        assert compile_condition.cache_info().misses == 1
+
+    def test_substituted_expressions_are_not_memoized(self):
+        """Runtime outputs substituted into a condition must not be kept by a process-wide cache."""
+        assert not hasattr(_parse_expression, "cache_info")
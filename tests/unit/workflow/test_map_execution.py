@@ -0,0 +1,145 @@
+"""
+Unit tests for map node execution in the DAG executor.
+
+Drives a map over a stub agent caller and checks concurrency, result
+ordering, iteration contexts and what is kept in the persisted state.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+from google.adk.artifacts import InMemoryArtifactService
+
+from solace_agent_mesh.common.data_parts import ArtifactRef, StructuredInvocationResult
+from solace_agent_mesh.workflow.app import AgentNode, MapNode, WorkflowDefinition
+from solace_agent_mesh.workflow.dag_executor import DAGExecutor
+from solace_agent_mesh.workflow.workflow_execution_context import (
+    WorkflowExecutionContext,
+    WorkflowExecutionState,
+)
+
+
+def create_map_executor(item_count: int, concurrency_limit=None):
+    workflow_def = WorkflowDefinition(
+        description="Map workflow",
+        nodes=[
+            AgentNode(id="prepare", type="agent", agent_name="PrepareAgent"),
+            MapNode(
+                id="process_all",
+                type="map",
+                node="process_item",
+                items="{{prepare.output.items}}",
+                max_items=item_count,
+                concurrency_limit=concurrency_limit,
+                depends_on=["prepare"],
+            ),
+            AgentNode(id="process_item", type="agent", agent_name="ProcessAgent"),
+        ],
+        output_mapping={"results": "{{process_all.output}}"},
+    )
+
+    host = Mock()
+    host.log_identifier = "[test]"
+    host.workflow_name = "map_workflow"
+    host.artifact_service = InMemoryArtifactService()
+    host.get_config = lambda key, default=None: default
+    host.publish_workflow_event = AsyncMock()
+    host._update_workflow_state = AsyncMock()
+    host.finalize_workflow_success = AsyncMock()
+    host._load_node_output = AsyncMock(
+        side_effect=lambda node_id, artifact_name, **kwargs: {"name": artifact_name}
+    )
+
+    executor = DAGExecutor(workflow_def, host)
+    context = WorkflowExecutionContext("wf-task", {"user_id": "u", "session_id": "s"})
+    state = WorkflowExecutionState(
+        workflow_name="map_workflow",
+        execution_id="exec-1",
+        start_time=datetime.now(timezone.utc),
+        completed_nodes={"prepare": "prepare.json"},
+        node_outputs={"prepare": {"output": {"items": [f"item-{i}" for i in range(item_count)]}}},
+    )
+    context.workflow_state = state
+
+    launched = []
+
+    async def call_agent(node, iteration_state, workflow_context, sub_task_id=None):
+        workflow_context.track_agent_call(node.id, sub_task_id)
+        launched.append((sub_task_id, iteration_state))
+        return sub_task_id
+
+    host.agent_caller.call_agent = AsyncMock(side_effect=call_agent)
+    return executor, host, context, state, launched
+
+
+def success(name: str) -> StructuredInvocationResult:
+    return StructuredInvocationResult(
+        status="success", output_artifact_ref=ArtifactRef(name=name, version=0)
+    )
+
+
+async def complete(executor, context, sub_task_id):
+    index = int(context.get_node_id_for_sub_task(sub_task_id).rsplit("_", 1)[1])
+    await executor.handle_node_completion(context, sub_task_id, success(f"out-{index}"))
+
+
+class TestMapExecution:
+    async def test_respects_concurrency_and_keeps_results_in_item_order(self):
+        executor, host, context, state, launched = create_map_executor(10, concurrency_limit=3)
+
+        await executor.execute_workflow(state, context)
+        assert len(state.active_branches["process_all"]) == 3
+
+        # Complete iterations newest first to scramble completion order
+        while state.active_branches.get("process_all"):
+            assert len(state.active_branches["process_all"]) <= 3
+            await complete(executor, context, state.active_branches["process_all"][-1]["sub_task_id"])
+
+        assert len(launched) == 10
+        assert state.node_outputs["process_all"]["output"]["results"] == [
+            {"name": f"out-{i}"} for i in range(10)
+        ]
+        assert "map_state_process_all" not in state.metadata
+        assert state.output_refs["process_all"] == {
+            "artifact_name": "map_process_all_results.json",
+            "artifact_version": 0,
+        }
+        assert context.map_runtimes == {}
+        host.finalize_workflow_success.assert_awaited_once()
+
+    async def test_iteration_state_overlays_the_workflow_outputs(self):
+        executor, _, context, state, launched = create_map_executor(2)
+
+        await executor.execute_workflow(state, context)
+
+        _, iteration_state = launched[1]
+        assert executor.resolve_value("{{item}}", iteration_state) == "item-1"
+        assert executor.resolve_value("{{_map_index}}", iteration_state) == 1
+        assert executor.resolve_value("{{prepare.output.items}}", iteration_state)[0] == "item-0"
+        assert "_map_item" not in state.node_outputs
+
+    async def test_persisted_state_keeps_a_cursor_instead_of_the_items(self):
+        executor, _, context, state, _ = create_map_executor(50, concurrency_limit=5)
+
+        await executor.execute_workflow(state, context)
+
+        map_state = state.metadata["map_state_process_all"]
+        assert map_state["next_index"] == 5
+        assert map_state["total_items"] == 50
+        assert "items" not in map_state and "results" not in map_state
+        state.model_dump_json()
+
+    async def test_duplicate_iteration_response_is_ignored(self):
+        executor, host, context, state, _ = create_map_executor(3, concurrency_limit=1)
+        await executor.execute_workflow(state, context)
+        first = state.active_branches["process_all"][0]["sub_task_id"]
+
+        await complete(executor, context, first)
+        await complete(executor, context, first)
+
+        progress = [
+            call.args[1] for call in host.publish_workflow_event.await_args_list
+            if call.args[1].type == "workflow_map_progress"
+        ]
+        assert [p.completed_items for p in progress] == [1]
+        assert "process_all_0" not in state.completed_nodes
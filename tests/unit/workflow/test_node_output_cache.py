@@ -0,0 +1,104 @@
+"""
+Unit tests for memoized node output loading.
+"""
+
+import json
+
+import pytest
+from google.adk.artifacts import InMemoryArtifactService
+from google.genai import types as adk_types
+
+from solace_agent_mesh.workflow.component import WorkflowExecutorComponent
+from solace_agent_mesh.workflow.workflow_execution_context import (
+    NodeOutputCache,
+    WorkflowExecutionContext,
+)
+
+
+class CountingArtifactService(InMemoryArtifactService):
+    loads: int = 0
+
+    async def load_artifact(self, **kwargs):
+        self.loads += 1
+        return await super().load_artifact(**kwargs)
+
+
+class TestNodeOutputCache:
+    def test_evicts_least_recently_used_beyond_size_bound(self):
+        cache = NodeOutputCache(max_bytes=10)
+        cache.put("a", 0, {"a": 1}, 4)
+        cache.put("b", 0, {"b": 1}, 4)
+        cache.get("a", 0)
+        cache.put("c", 0, {"c": 1}, 4)
+
+        assert ("a", 0) in cache and ("c", 0) in cache
+        assert ("b", 0) not in cache
+        assert cache.total_bytes == 8
+
+    def test_oversized_outputs_are_not_cached(self):
+        cache = NodeOutputCache(max_bytes=10)
+        cache.put("big", 0, "x" * 20, 20)
+
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+
+    def test_replacing_an_entry_keeps_size_accounting(self):
+        cache = NodeOutputCache(max_bytes=10)
+        cache.put("a", 0, 1, 6)
+        cache.put("a", 0, 2, 3)
+
+        assert cache.get("a", 0) == 2
+        assert cache.total_bytes == 3
+
+
+@pytest.fixture
+def component():
+    component = object.__new__(WorkflowExecutorComponent)
+    component.workflow_name = "wf"
+    component.log_identifier = "[test]"
+    component.get_config = lambda key, default=None: default
+    component.artifact_service = CountingArtifactService()
+    return component
+
+
+async def save_output(component, name, data):
+    return await component.artifact_service.save_artifact(
+        app_name="wf",
+        user_id="u",
+        session_id="s",
+        filename=name,
+        artifact=adk_types.Part.from_bytes(
+            data=json.dumps(data).encode("utf-8"), mime_type="application/json"
+        ),
+    )
+
+
+class TestLoadNodeOutput:
+    async def test_versioned_outputs_are_loaded_once(self, component):
+        context = WorkflowExecutionContext("task", {"user_id": "u", "session_id": "s"})
+        context.track_agent_call("step", "sub-1")
+        version = await save_output(component, "out.json", {"rows": [1, 2]})
+
+        for _ in range(3):
+            output = await component._load_node_output("step", "out.json", version, context)
+
+        assert output == {"rows": [1, 2]}
+        assert component.artifact_service.loads == 1
+
+    async def test_latest_version_is_always_reloaded(self, component):
+        context = WorkflowExecutionContext("task", {"user_id": "u", "session_id": "s"})
+        await save_output(component, "out.json", {"v": 0})
+        first = await component._load_artifact_json(context, "out.json", None)
+        await save_output(component, "out.json", {"v": 1})
+
+        assert first == {"v": 0}
+        assert await component._load_artifact_json(context, "out.json", None) == {"v": 1}
+        assert component.artifact_service.loads == 2
+
+    async def test_caches_are_per_execution(self, component):
+        version = await save_output(component, "out.json", {"v": 0})
+        for task_id in ("t1", "t2"):
+            context = WorkflowExecutionContext(task_id, {"user_id": "u", "session_id": "s"})
+            await component._load_artifact_json(context, "out.json", version)
+
+        assert component.artifact_service.loads == 2
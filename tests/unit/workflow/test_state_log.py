@@ -0,0 +1,194 @@
+"""
+Unit tests for the append-only workflow state log.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from solace_agent_mesh.workflow.state_log import (
+    WorkflowStateLog,
+    active_lease_owner,
+    encode_workflow_state,
+    persisted_execution_ids,
+    replay_workflow_state,
+    restore_workflow_state,
+    workflow_log_key,
+    workflow_snapshot_key,
+)
+from solace_agent_mesh.workflow.workflow_execution_context import WorkflowExecutionState
+
+SNAPSHOT_KEY = workflow_snapshot_key("exec-1")
+LOG_KEY = workflow_log_key("exec-1")
+
+
+def create_state(execution_id: str = "exec-1") -> WorkflowExecutionState:
+    state = WorkflowExecutionState(
+        workflow_name="wf",
+        execution_id=execution_id,
+        start_time=datetime.now(timezone.utc),
+    )
+    state.node_outputs["workflow_input"] = {"output": {"topic": "logs"}}
+    return state
+
+
+def complete_node(state: WorkflowExecutionState, node_id: str, output):
+    state.completed_nodes[node_id] = f"{node_id}.json"
+    state.node_outputs[node_id] = {"output": output}
+    state.output_refs[node_id] = {"artifact_name": f"{node_id}.json", "artifact_version": 0}
+
+
+def persist(session_state: dict, state_log: WorkflowStateLog, state, **kwargs):
+    delta = state_log.record(state, **kwargs)
+    session_state.update(delta)
+    return delta
+
+
+class TestWorkflowStateLog:
+    def test_first_record_is_a_snapshot_and_later_ones_are_deltas(self):
+        state = create_state()
+        state_log = WorkflowStateLog(snapshot_interval=10)
+
+        first = state_log.record(state)
+        complete_node(state, "a", {"big": "x" * 10_000})
+        second = state_log.record(state)
+
+        assert first[SNAPSHOT_KEY]["seq"] == 1
+        assert first[LOG_KEY] == []
+        assert SNAPSHOT_KEY not in second
+        [event] = second[LOG_KEY]
+        assert event["seq"] == 2
+        assert event["set"]["completed_nodes"] == {"a": "a.json"}
+        assert "node_outputs" not in event.get("set", {})
+
+    def test_unchanged_state_writes_nothing(self):
+        state = create_state()
+        state_log = WorkflowStateLog()
+        state_log.record(state)
+
+        assert state_log.record(state) == {}
+
+    def test_snapshots_bound_the_log(self):
+        state = create_state()
+        state_log = WorkflowStateLog(snapshot_interval=3)
+        session_state = {}
+
+        for i in range(10):
+            state.pending_nodes = [f"n{i}"]
+            persist(session_state, state_log, state)
+            assert len(session_state[LOG_KEY]) <= 3
+
+        assert session_state[SNAPSHOT_KEY]["seq"] == 9
+        assert replay_workflow_state(session_state, "exec-1") == encode_workflow_state(state)
+
+    def test_replay_rebuilds_additions_changes_and_removals(self):
+        state = create_state()
+        state_log = WorkflowStateLog(snapshot_interval=100)
+        session_state = {}
+        persist(session_state, state_log, state)
+
+        state.metadata["map_state_m"] = {"next_index": 1}
+        state.active_branches["m"] = [{"sub_task_id": "t1"}]
+        persist(session_state, state_log, state)
+        state.metadata["map_state_m"]["next_index"] = 2
+        state.current_node_id = "m"
+        persist(session_state, state_log, state)
+        del state.metadata["map_state_m"]
+        del state.active_branches["m"]
+        state.error_state = {"failed_node_id": "m"}
+        persist(session_state, state_log, state)
+
+        replayed = replay_workflow_state(session_state, "exec-1")
+        assert replayed == encode_workflow_state(state)
+        assert replayed["metadata"] == {}
+        assert replayed["error_state"] == {"failed_node_id": "m"}
+
+    def test_replay_ignores_events_older_than_the_snapshot(self):
+        state = create_state()
+        state_log = WorkflowStateLog()
+        session_state = {}
+        persist(session_state, state_log, state)
+        state.current_node_id = "stale"
+        stale_tail = persist(session_state, state_log, state)[LOG_KEY]
+        state.current_node_id = "fresh"
+        persist(session_state, state_log, state, force_snapshot=True)
+
+        session_state[LOG_KEY] = stale_tail
+
+        assert replay_workflow_state(session_state, "exec-1")["current_node_id"] == "fresh"
+
+    def test_replay_without_snapshot(self):
+        assert replay_workflow_state({}, "exec-1") is None
+
+    def test_executions_sharing_a_session_replay_independently(self):
+        first, second = create_state("A"), create_state("B")
+        first_log, second_log = WorkflowStateLog(), WorkflowStateLog()
+        session_state = {}
+        persist(session_state, first_log, first)
+        persist(session_state, second_log, second)
+        complete_node(first, "a", {"rows": 1})
+        first.pending_nodes = ["b"]
+        persist(session_state, first_log, first)
+
+        assert sorted(persisted_execution_ids(session_state)) == ["A", "B"]
+        assert replay_workflow_state(session_state, "A") == encode_workflow_state(first)
+        assert replay_workflow_state(session_state, "B") == encode_workflow_state(second)
+
+    def test_snapshot_of_another_execution_is_rejected(self):
+        state_log = WorkflowStateLog()
+        session_state = {SNAPSHOT_KEY: state_log.record(create_state("B"))[workflow_snapshot_key("B")]}
+
+        assert replay_workflow_state(session_state, "exec-1") is None
+
+    def test_cleared_execution_is_no_longer_persisted(self):
+        state = create_state()
+        state_log = WorkflowStateLog()
+        session_state = {}
+        persist(session_state, state_log, state)
+
+        session_state.update(state_log.clear(state.execution_id))
+        state.current_node_id = "late"
+
+        assert state_log.record(state) == {}
+        assert persisted_execution_ids(session_state) == []
+        assert replay_workflow_state(session_state, "exec-1") is None
+
+
+class TestActiveLeaseOwner:
+    def test_unexpired_lease_names_its_owner(self):
+        metadata = {"lease": {"owner": "instance-1", "expires_at": 100.0}}
+
+        assert active_lease_owner(metadata, now=99.0) == "instance-1"
+        assert active_lease_owner(metadata, now=100.0) is None
+        assert active_lease_owner({}, now=0.0) is None
+
+
+class TestRestoreWorkflowState:
+    async def test_outputs_are_reloaded_from_their_artifacts(self):
+        state = create_state()
+        state.skipped_nodes["b"] = "when_clause_false"
+        state.node_outputs["b"] = {"output": None}
+        complete_node(state, "a", {"rows": [1, 2, 3]})
+        state_log = WorkflowStateLog(snapshot_interval=1)
+        session_state = {}
+        persist(session_state, state_log, state)
+        state.current_node_id = "c"
+        persist(session_state, state_log, state)
+
+        artifacts = {("a.json", 0): {"rows": [1, 2, 3]}}
+        loaded = []
+
+        async def load_output(key, ref):
+            loaded.append(key)
+            return artifacts[(ref["artifact_name"], ref["artifact_version"])]
+
+        restored = await restore_workflow_state(session_state, "exec-1", load_output)
+
+        assert loaded == ["a"]
+        assert restored.model_dump() == state.model_dump()
+
+    async def test_returns_none_without_persisted_state(self):
+        async def load_output(key, ref):
+            pytest.fail("nothing to load")
+
+        assert await restore_workflow_state({}, "exec-1", load_output) is None
@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 from unittest.mock import Mock
 
 from solace_agent_mesh.workflow.dag_executor import DAGExecutor
+from solace_agent_mesh.workflow.flow_control.conditional import compile_template
 from solace_agent_mesh.workflow.workflow_execution_context import WorkflowExecutionState
 from solace_agent_mesh.workflow.app import WorkflowDefinition, AgentNode
 
@@ -336,3 +337,37 @@ class TestArgoParametersAlias:
 
         result = executor.resolve_value("{{workflow.parameters.x}}", state)
         assert result == "argo_style_value"
+
+
+class TestCompiledTemplates:
+    """Tests for templates being compiled once and reused."""
+
+    def test_template_is_compiled_once_across_resolutions(self):
+        """Resolving the same template repeatedly reuses its compiled form."""
+        executor = create_minimal_dag_executor()
+        template = "{{ _map_item.payload.compiled_once_marker }}"
+        compile_template.cache_clear()
+
+        for i in range(50):
+            state = create_workflow_state({
+                "_map_item": {"output": {"payload": {"compiled_once_marker": i}}}
+            })
+            assert executor.resolve_value(template, state) == i
+
+        info = compile_template.cache_info()
+        assert info.misses == 1
+        assert info.hits == 49
+
+    def test_partial_template_returns_aliased_text(self):
+        """A string that starts with a template but is not one is returned aliased."""
+        executor = create_minimal_dag_executor()
+        state = create_workflow_state({})
+
+        assert executor.resolve_value("{{item}} and more", state) == "{{_map_item}} and more"
+
+    def test_compiled_template_parts(self):
+        """Compilation applies aliases and splits the reference path."""
+        compiled = compile_template("{{ workflow.parameters.x }}")
+
+        assert compiled.path == "workflow.input.x"
+        assert compiled.parts == ("workflow", "input", "x")
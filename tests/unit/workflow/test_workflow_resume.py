@@ -0,0 +1,355 @@
+"""
+Unit tests for resuming workflow executions after a restart.
+
+Runs a workflow part way on one component, then restores and resumes it on a
+fresh component sharing the same session and artifact services.
+"""
+
+import json
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.sessions import InMemorySessionService
+from google.genai import types as adk_types
+
+from solace_agent_mesh.common.data_parts import ArtifactRef, StructuredInvocationResult
+from solace_agent_mesh.workflow.app import (
+    AgentNode,
+    LoopNode,
+    MapNode,
+    WorkflowDefinition,
+)
+from solace_agent_mesh.workflow.component import WorkflowExecutorComponent
+from solace_agent_mesh.workflow.dag_executor import DAGExecutor
+from solace_agent_mesh.workflow.state_log import DEFAULT_EXECUTION_LEASE_SECONDS
+from solace_agent_mesh.workflow.workflow_execution_context import (
+    WorkflowExecutionContext,
+    WorkflowExecutionState,
+)
+
+A2A_CONTEXT = {
+    "logical_task_id": "task-1",
+    "session_id": "session-1",
+    "user_id": "user-1",
+    "client_id": "client-1",
+    "jsonrpc_request_id": "task-1",
+    "replyToTopic": "reply/topic",
+}
+
+
+def chain_definition() -> WorkflowDefinition:
+    return WorkflowDefinition(
+        description="Chain",
+        nodes=[
+            AgentNode(id="first", type="agent", agent_name="FirstAgent"),
+            AgentNode(
+                id="second",
+                type="agent",
+                agent_name="SecondAgent",
+                depends_on=["first"],
+            ),
+        ],
+        output_mapping={"result": "{{second.output}}"},
+    )
+
+
+def create_component(workflow_definition, session_service, artifact_service):
+    """Build a component with only what execution and recovery touch."""
+    component = object.__new__(WorkflowExecutorComponent)
+    component.workflow_name = "resumable"
+    component.log_identifier = "[test]"
+    component.get_config = lambda key, default=None: default
+    component.session_service = session_service
+    component.artifact_service = artifact_service
+    component.cache_service = Mock()
+    component.active_workflows = {}
+    component.active_workflows_lock = threading.Lock()
+    component.instance_id = uuid.uuid4().hex
+    component.publish_workflow_event = AsyncMock()
+    component.finalize_workflow_success = AsyncMock()
+    component.finalize_workflow_failure = AsyncMock()
+    component.dag_executor = DAGExecutor(workflow_definition, component)
+
+    component.launched = []
+
+    async def call_agent(node, workflow_state, workflow_context, sub_task_id=None):
+        sub_task_id = sub_task_id or f"sub-{node.id}-{len(component.launched)}"
+        workflow_context.track_agent_call(node.id, sub_task_id)
+        component.launched.append((node.id, sub_task_id))
+        return sub_task_id
+
+    component.agent_caller = Mock()
+    component.agent_caller.call_agent = AsyncMock(side_effect=call_agent)
+    return component
+
+
+async def start_workflow(component, task_id: str = "task-1") -> WorkflowExecutionContext:
+    a2a_context = {**A2A_CONTEXT, "logical_task_id": task_id, "jsonrpc_request_id": task_id}
+    if not await component.session_service.get_session(
+        app_name=component.workflow_name,
+        user_id=A2A_CONTEXT["user_id"],
+        session_id=A2A_CONTEXT["session_id"],
+    ):
+        await component.session_service.create_session(
+            app_name=component.workflow_name,
+            user_id=A2A_CONTEXT["user_id"],
+            session_id=A2A_CONTEXT["session_id"],
+        )
+    state = WorkflowExecutionState(
+        workflow_name=component.workflow_name,
+        execution_id=task_id,
+        start_time=datetime.now(timezone.utc),
+        metadata={"status": "running", "a2a_context": a2a_context},
+    )
+    state.node_outputs["workflow_input"] = {"output": {"topic": "resume"}}
+    context = WorkflowExecutionContext(task_id, a2a_context)
+    context.workflow_state = state
+    component.active_workflows[context.workflow_task_id] = context
+    await component.dag_executor.execute_workflow(state, context)
+    return context
+
+
+async def complete(component, context, sub_task_id, name, data):
+    version = await component.artifact_service.save_artifact(
+        app_name=component.workflow_name,
+        user_id=A2A_CONTEXT["user_id"],
+        session_id=A2A_CONTEXT["session_id"],
+        filename=name,
+        artifact=adk_types.Part.from_bytes(
+            data=json.dumps(data).encode("utf-8"), mime_type="application/json"
+        ),
+    )
+    await component.dag_executor.handle_node_completion(
+        context,
+        sub_task_id,
+        StructuredInvocationResult(
+            status="success", output_artifact_ref=ArtifactRef(name=name, version=version)
+        ),
+    )
+
+
+def after_lease_expiry():
+    """Restart as if the previous owner stopped renewing its leases a lease period ago."""
+    return patch(
+        "solace_agent_mesh.workflow.component.time.time",
+        return_value=time.time() + DEFAULT_EXECUTION_LEASE_SECONDS + 1,
+    )
+
+
+async def restart(workflow_definition, services):
+    component = create_component(workflow_definition, *services)
+    with after_lease_expiry():
+        restored = await component._restore_interrupted_workflows()
+    return component, restored
+
+
+@pytest.fixture
+def services():
+    return InMemorySessionService(), InMemoryArtifactService()
+
+
+class TestWorkflowResume:
+    async def test_completed_nodes_are_kept_and_in_flight_nodes_redispatched(self, services):
+        before = create_component(chain_definition(), *services)
+        context = await start_workflow(before)
+        await complete(before, context, before.launched[0][1], "first.json", {"rows": 3})
+        [(_, old_second)] = before.launched[1:]
+
+        after, [restored] = await restart(chain_definition(), services)
+
+        state = restored.workflow_state
+        assert after.active_workflows == {"task-1": restored}
+        assert state.completed_nodes == {"first": "first.json"}
+        assert state.node_outputs["first"] == {"output": {"rows": 3}}
+        assert state.node_outputs["workflow_input"] == {"output": {"topic": "resume"}}
+        assert state.pending_nodes == [] and state.in_flight_sub_tasks == {}
+
+        await after._resume_workflow(restored)
+
+        [(node_id, new_second)] = after.launched
+        assert node_id == "second"
+        assert state.in_flight_sub_tasks == {new_second: "second"}
+
+        # A late response to the dispatch from before the restart is dropped
+        await complete(after, restored, old_second, "stale.json", {"stale": True})
+        assert "second" not in state.completed_nodes
+
+        await complete(after, restored, new_second, "second.json", {"done": True})
+        await complete(after, restored, new_second, "second.json", {"done": True})
+        assert state.node_outputs["second"] == {"output": {"done": True}}
+        after.finalize_workflow_success.assert_awaited_once()
+
+    async def test_finished_workflows_are_not_restored(self, services):
+        before = create_component(chain_definition(), *services)
+        context = await start_workflow(before)
+        await before._cleanup_workflow_state(context)
+
+        after, restored = await restart(chain_definition(), services)
+
+        assert restored == []
+        assert after.active_workflows == {}
+
+    async def test_already_active_workflows_are_left_alone(self, services):
+        before = create_component(chain_definition(), *services)
+        await start_workflow(before)
+
+        assert await before._restore_interrupted_workflows() == []
+
+    async def test_resume_failure_fails_the_workflow(self, services):
+        before = create_component(chain_definition(), *services)
+        await start_workflow(before)
+        after, [restored] = await restart(chain_definition(), services)
+        after.agent_caller.call_agent.side_effect = ValueError("Agent 'FirstAgent' not found")
+
+        await after._resume_workflow(restored)
+
+        after.finalize_workflow_failure.assert_awaited_once()
+
+    async def test_executions_sharing_a_session_are_resumed_separately(self, services):
+        before = create_component(chain_definition(), *services)
+        first = await start_workflow(before, "task-A")
+        await start_workflow(before, "task-B")
+        await complete(before, first, before.launched[0][1], "first.json", {"rows": 3})
+
+        after, restored = await restart(chain_definition(), services)
+
+        states = {context.workflow_task_id: context.workflow_state for context in restored}
+        assert sorted(states) == ["task-A", "task-B"]
+        assert states["task-A"].execution_id == "task-A"
+        assert states["task-A"].completed_nodes == {"first": "first.json"}
+        assert states["task-B"].execution_id == "task-B"
+        assert states["task-B"].completed_nodes == {}
+        assert states["task-B"].metadata["a2a_context"]["logical_task_id"] == "task-B"
+
+        for context in restored:
+            await after._resume_workflow(context)
+        assert sorted(node_id for node_id, _ in after.launched) == ["first", "second"]
+
+
+class TestExecutionLeases:
+    async def test_executions_owned_by_a_live_instance_are_left_alone(self, services):
+        live = create_component(chain_definition(), *services)
+        await start_workflow(live)
+
+        other = create_component(chain_definition(), *services)
+        leased_execution_ids = []
+
+        assert await other._restore_interrupted_workflows(leased_execution_ids) == []
+        assert other.active_workflows == {}
+        # Checked again once the lease has had time to lapse
+        assert leased_execution_ids == ["task-1"]
+
+    async def test_renewed_leases_keep_executions_owned(self, services):
+        live = create_component(chain_definition(), *services)
+        context = await start_workflow(live)
+        with after_lease_expiry():
+            await live._renew_workflow_leases()
+            other = create_component(chain_definition(), *services)
+
+            assert await other._restore_interrupted_workflows() == []
+
+        lease = context.workflow_state.metadata["lease"]
+        assert lease["owner"] == live.instance_id
+
+    async def test_only_one_instance_claims_an_interrupted_execution(self, services):
+        before = create_component(chain_definition(), *services)
+        await start_workflow(before)
+
+        first, first_restored = await restart(chain_definition(), services)
+        second, second_restored = await restart(chain_definition(), services)
+
+        assert [context.workflow_task_id for context in first_restored] == ["task-1"]
+        assert second_restored == []
+        assert second.active_workflows == {}
+        lease = first_restored[0].workflow_state.metadata["lease"]
+        assert lease["owner"] == first.instance_id
+
+    async def test_claim_rejected_as_stale_rechecks_the_lease(self, services):
+        session_service, artifact_service = services
+        before = create_component(chain_definition(), *services)
+        await start_workflow(before)
+        rival = create_component(chain_definition(), *services)
+
+        class RacingSessionService:
+            """Lets the rival claim first, then rejects the stale append as the database would."""
+
+            def __getattr__(self, name):
+                return getattr(session_service, name)
+
+            async def append_event(self, session, event):
+                await rival._restore_interrupted_workflows()
+                raise ValueError(
+                    "The last_update_time provided in the session object is earlier "
+                    "than the update_time in the storage_session"
+                )
+
+        loser = create_component(chain_definition(), RacingSessionService(), artifact_service)
+        with after_lease_expiry():
+            assert await loser._restore_interrupted_workflows() == []
+
+        assert list(rival.active_workflows) == ["task-1"]
+        assert loser.active_workflows == {}
+
+
+class TestResetInFlightNodes:
+    def create_state(self, **kwargs):
+        return WorkflowExecutionState(
+            workflow_name="wf",
+            execution_id="exec-1",
+            start_time=datetime.now(timezone.utc),
+            **kwargs,
+        )
+
+    def test_in_flight_map_restarts_its_iterations(self):
+        executor = DAGExecutor(
+            WorkflowDefinition(
+                description="Map",
+                nodes=[
+                    MapNode(id="fan_out", type="map", node="work", items="{{workflow.input.items}}"),
+                    AgentNode(id="work", type="agent", agent_name="Worker"),
+                ],
+                output_mapping={"results": "{{fan_out.output}}"},
+            ),
+            Mock(),
+        )
+        state = self.create_state(
+            pending_nodes=["fan_out"],
+            active_branches={"fan_out": [{"index": 4, "sub_task_id": "sub-4"}]},
+            in_flight_sub_tasks={"sub-4": "fan_out_4"},
+            metadata={"map_state_fan_out": {"next_index": 5}, "status": "running"},
+        )
+
+        assert executor.reset_in_flight_nodes(state) == ["fan_out"]
+        assert state.pending_nodes == []
+        assert state.active_branches == {}
+        assert state.in_flight_sub_tasks == {}
+        assert state.metadata == {"status": "running"}
+        assert executor.get_next_nodes(state) == ["fan_out"]
+
+    def test_in_flight_loop_iteration_runs_again(self):
+        executor = DAGExecutor(
+            WorkflowDefinition(
+                description="Loop",
+                nodes=[
+                    LoopNode(id="poll", type="loop", node="check", condition="true", max_iterations=5),
+                    AgentNode(id="check", type="agent", agent_name="Checker"),
+                ],
+                output_mapping={"done": "{{check.output}}"},
+            ),
+            Mock(),
+        )
+        state = self.create_state(
+            pending_nodes=["poll"],
+            loop_iterations={"poll": 3},
+            active_branches={"poll": [{"iteration": 2, "sub_task_id": "sub-2", "type": "loop"}]},
+        )
+
+        executor.reset_in_flight_nodes(state)
+
+        assert state.loop_iterations == {"poll": 2}
+        assert state.active_branches == {}